@@ -1,34 +1,67 @@
-from db_drift.cli.cli import cli_arg_parse
+import logging
+from argparse import Namespace
+from datetime import datetime, timezone
+
+from db_drift.cli.cli import SNAPSHOT_COMMAND, cli_arg_parse
+from db_drift.cli.utils import get_connector_options, get_object_filter
+from db_drift.db.connectors.base_connector import BaseDBConnector
 from db_drift.db.factory import get_connector
+from db_drift.db.fetch import fetch_schema_structures, restrict_to_common_object_types, snapshot_schema_structure
+from db_drift.diff import StructureFingerprint
 from db_drift.report.generate import generate_drift_report
+from db_drift.report.records import write_drift_records
 from db_drift.utils import custom_logging
-from db_drift.utils.constants import ExitCode
-from db_drift.utils.exceptions import CliError, ConfigError, DatabaseError, DbDriftError, DbDriftInterruptError
+from db_drift.utils.constants import ExitCode, ReportFormat
+from db_drift.utils.exceptions import CliArgumentError, CliError, CliUsageError, ConfigError, DatabaseError, DbDriftError, DbDriftInterruptError
 from db_drift.utils.exceptions.base import DbDriftSystemError
 from db_drift.utils.exceptions.formatting import handle_error_and_exit
 
-logger = custom_logging.setup_logger("db-drift")
+logger = logging.getLogger("db-drift")
 
 
 def main() -> None:
     """Entry point for the db-drift package."""
+    # Set up in here rather than at import, so that importing db-drift creates no log files
+    custom_logging.setup_logger("db-drift")
     try:
         logger.debug("Starting db-drift CLI")
         args = cli_arg_parse()
 
-        connector = get_connector(args.dbms)
+        if args.command == SNAPSHOT_COMMAND:
+            connector = _create_connector(args, args.dbms, args.source)
+            snapshot_schema_structure(
+                connector,
+                args.output,
+                jobs=args.jobs,
+                metadata={
+                    "dbms": args.dbms,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "skipped_object_types": _select_object_types(connector, args),
+                },
+            )
+            return
 
-        db_structure_source = connector(args.source).fetch_schema_structure()
-        logger.info("Fetched source database schema structure.")
+        source_connector = _create_connector(args, args.source_dbms or args.dbms, args.source)
+        target_connector = _create_connector(args, args.target_dbms or args.dbms, args.target)
+        skipped_object_types = dict.fromkeys([*_select_object_types(source_connector, args), *_select_object_types(target_connector, args)])
 
-        db_structure_target = connector(args.target).fetch_schema_structure()
-        logger.info("Fetched target database schema structure.")
+        db_structure_source, db_structure_target = fetch_schema_structures(
+            source_connector,
+            target_connector,
+            concurrent=args.concurrent,
+            jobs=args.jobs,
+        )
+        _check_hash_algorithms(source_connector, target_connector)
+        db_structure_source, db_structure_target, one_sided_object_types = restrict_to_common_object_types(db_structure_source, db_structure_target)
+        skipped_object_types.update(dict.fromkeys(one_sided_object_types))
 
         logger.info("Generating drift report...")
-        generate_drift_report(
+        _write_drift(
+            args,
             db_structure_source,
             db_structure_target,
-            args.output,
+            list(skipped_object_types),
+            (_common_fingerprint(source_connector, db_structure_source), _common_fingerprint(target_connector, db_structure_target)),
         )
 
     except KeyboardInterrupt:
@@ -116,5 +149,124 @@ def main() -> None:
         )
 
 
+def _create_connector(args: Namespace, dbms: str, connection_string: str) -> BaseDBConnector:
+    """
+    Create the connector of one database, with the object filters and the command-line options of its DBMS.
+
+    Args:
+        args (Namespace): The parsed command-line arguments.
+        dbms (str): The DBMS of the database.
+        connection_string (str): The connection string of the database.
+
+    Returns:
+        BaseDBConnector: The connector.
+
+    Raises:
+        CliArgumentError: If the connector cannot hash with the chosen algorithm.
+    """
+    try:
+        return get_connector(dbms)(
+            connection_string,
+            object_filter=get_object_filter(args),
+            hash_algorithm=args.hash_algorithm,
+            **get_connector_options(args, dbms),
+        )
+    except ValueError as e:  # The only option the connectors check is the hash algorithm, the others are checked by argparse
+        raise CliArgumentError(str(e), argument="--hash-algorithm") from e
+
+
+def _select_object_types(connector: BaseDBConnector, args: Namespace) -> list[str]:
+    """
+    Prune the registry of a connector to the object types chosen with --types and --skip-types.
+
+    Args:
+        connector (BaseDBConnector): The connector.
+        args (Namespace): The parsed command-line arguments.
+
+    Returns:
+        list[str]: The object types of the connector that will not be fetched.
+
+    Raises:
+        CliArgumentError: If an object type is not supported by the connector.
+    """
+    supported_object_types = list(connector.SUPPORTED_OBJECTS_REGISTRY)
+    try:
+        connector.select_object_types(args.types, args.skip_types or ())
+    except ValueError as e:
+        raise CliArgumentError(str(e), argument="--types/--skip-types") from e
+
+    return [obj_type for obj_type in supported_object_types if obj_type not in connector.SUPPORTED_OBJECTS_REGISTRY]
+
+
+def _check_hash_algorithms(source_connector: BaseDBConnector, target_connector: BaseDBConnector) -> None:
+    """
+    Check that the bodies and definitions of both sides were hashed with the same algorithm, as digests of different ones always differ.
+
+    Args:
+        source_connector (BaseDBConnector): The connector of the source database, once fetched.
+        target_connector (BaseDBConnector): The connector of the target database, once fetched.
+
+    Raises:
+        CliUsageError: If the algorithms differ (e.g. with a snapshot taken with another --hash-algorithm).
+    """
+    if source_connector.hash_algorithm is not target_connector.hash_algorithm:
+        msg = (
+            f"The source was hashed with {source_connector.hash_algorithm.value} and the target with {target_connector.hash_algorithm.value}, "
+            "so every body and definition would look changed."
+        )
+        raise CliUsageError(msg, suggestion="Hash both sides with the same --hash-algorithm, taking any snapshot again with it.")
+
+
+def _write_drift(
+    args: Namespace,
+    db_structure_source: dict,
+    db_structure_target: dict,
+    skipped_object_types: list[str],
+    fingerprints: tuple[StructureFingerprint | None, StructureFingerprint | None],
+) -> None:
+    """
+    Write the drift between the two structures to --output, in the --format chosen.
+
+    Args:
+        args (Namespace): The parsed command-line arguments.
+        db_structure_source (dict): Schema structure of the source database.
+        db_structure_target (dict): Schema structure of the target database.
+        skipped_object_types (list[str]): Object types that were not compared.
+        fingerprints (tuple[StructureFingerprint | None, StructureFingerprint | None]): The fingerprints of both structures, if known.
+    """
+    report_format = ReportFormat(args.format)
+    if report_format is ReportFormat.HTML:
+        generate_drift_report(
+            db_structure_source,
+            db_structure_target,
+            args.output,
+            skipped_object_types=skipped_object_types,
+            fingerprints=fingerprints,
+        )
+    else:
+        write_drift_records(
+            db_structure_source,
+            db_structure_target,
+            args.output,
+            report_format,
+            skipped_object_types=skipped_object_types,
+            fingerprints=fingerprints,
+        )
+
+
+def _common_fingerprint(connector: BaseDBConnector, schema_structure: dict) -> StructureFingerprint | None:
+    """
+    Find the fingerprint of the structure of a connector, once restricted to the object types both sides were fetched with.
+
+    Args:
+        connector (BaseDBConnector): The connector.
+        schema_structure (dict): Its schema structure, restricted to the common object types.
+
+    Returns:
+        StructureFingerprint | None: The fingerprint, or None if the connector has none (e.g. a live database).
+    """
+    return None if connector.schema_fingerprint is None else connector.schema_fingerprint.restricted_to(schema_structure)
+
+
 if __name__ == "__main__":
     main()
@@ -1,26 +1,69 @@
 import argparse
 import logging
+import sys
 
-from db_drift.cli.utils import check_args_validity, get_version
-from db_drift.utils.constants import get_supported_dbms_registry
+from db_drift.cli.utils import check_args_validity, get_version, positive_int
+from db_drift.utils.constants import HashAlgorithm, OracleDDLSource, ReportFormat, get_supported_dbms_registry
 from db_drift.utils.custom_logging import handle_verbose_logging
 from db_drift.utils.exceptions import CliArgumentError, CliUsageError
 
 logger = logging.getLogger("db-drift")
 
+COMPARE_COMMAND = "compare"
+SNAPSHOT_COMMAND = "snapshot"
+
 
 def cli_arg_parse() -> argparse.Namespace:
     """
     Parse command-line arguments for the db-drift tool.
 
+    `db-drift snapshot ...` saves the schema structure of a single database to a file,
+    any other command line compares two databases.
+
     Returns:
-        argparse.Namespace: The parsed command-line arguments.
+        argparse.Namespace: The parsed command-line arguments, with the command to run in `command`.
+    """
+    take_snapshot = sys.argv[1:2] == [SNAPSHOT_COMMAND]
+    parser = _create_snapshot_parser() if take_snapshot else _create_compare_parser()
+
+    try:
+        args = parser.parse_args(sys.argv[2:] if take_snapshot else None)
+        args.command = SNAPSHOT_COMMAND if take_snapshot else COMPARE_COMMAND
+
+        if args.verbose:
+            handle_verbose_logging()
+            logger.debug("Verbose mode enabled.")
+
+        logger.debug(f"Parsed arguments: {args}")
+
+        if not take_snapshot:
+            check_args_validity(args)
+
+    except argparse.ArgumentError as e:
+        msg = f"Invalid argument: {e}"
+        raise CliArgumentError(msg) from e
+    except SystemExit as e:
+        # argparse calls sys.exit() on error, convert to our exception
+        if e.code != 0:
+            msg = "Invalid command line arguments. Use --help for usage information."
+            raise CliUsageError(msg) from e
+        # Re-raise if it's a successful exit (like --help)
+        raise
+
+    return args
+
+
+def _create_compare_parser() -> argparse.ArgumentParser:
     """
-    supported_dbms_registry = get_supported_dbms_registry()
+    Create the parser of the default command, which compares a source and a target database.
 
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
     parser = argparse.ArgumentParser(
         prog="db-drift",
         description="A command-line tool to visualize the differences between two DB states.",
+        epilog=f"Run 'db-drift {SNAPSHOT_COMMAND} --help' to save the schema of a database to a file, to compare against later with --dbms snapshot.",
         exit_on_error=False,  # We'll handle errors ourselves
     )
 
@@ -31,20 +74,25 @@ def cli_arg_parse() -> argparse.Namespace:
         version=f"db-drift {get_version()}",
     )
 
-    parser.add_argument(
-        "--dbms",
-        choices=supported_dbms_registry.keys(),
-        help="Specify the type of DBMS for both source and target databases (default: sqlite)",
-        default="sqlite",
-    )
+    _add_dbms_argument(parser, help_text="Specify the type of DBMS for both source and target databases (default: sqlite)")
 
     parser.add_argument(
         "-o",
         "--output",
-        help="Output filename for the drift report (default: drift_report.html)",
+        help="Output filename for the drift report, or - for standard output with --format json or ndjson (default: drift_report.html)",
         default="drift_report.html",
     )
 
+    parser.add_argument(
+        "--format",
+        choices=[report_format.value for report_format in ReportFormat],
+        help="Format of the drift report: an HTML page, or a JSON record per drifted object (with its object type, key, change "
+        "and changed fields) streamed as the comparison goes, in a JSON document or one per line. Both start with the compared "
+        "and skipped object types and the fingerprints of both sides, as the first line of ndjson "
+        '(with "record_type": "metadata") (default: html)',
+        default=ReportFormat.HTML.value,
+    )
+
     parser.add_argument(
         "--source",
         required=True,
@@ -57,32 +105,198 @@ def cli_arg_parse() -> argparse.Namespace:
         help="Connection string for the target database",
     )
 
+    parser.add_argument(
+        "--source-dbms",
+        choices=get_supported_dbms_registry().keys(),
+        help="Type of the source database, if it differs from --dbms (e.g. snapshot, to compare a saved snapshot with a live database)",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--target-dbms",
+        choices=get_supported_dbms_registry().keys(),
+        help="Type of the target database, if it differs from --dbms",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Connect to and introspect the source and target databases at the same time",
+    )
+
+    _add_fetch_arguments(parser)
+    return parser
+
+
+def _create_snapshot_parser() -> argparse.ArgumentParser:
+    """
+    Create the parser of the snapshot command, which saves the schema structure of a database to a file.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog=f"db-drift {SNAPSHOT_COMMAND}",
+        description="Save the schema structure of a database to a file, to compare against later with --dbms snapshot.",
+        exit_on_error=False,  # We'll handle errors ourselves
+    )
+
+    _add_dbms_argument(parser, help_text="Specify the type of DBMS of the database (default: sqlite)")
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Output filename for the snapshot (default: schema_snapshot.json.gz)",
+        default="schema_snapshot.json.gz",
+    )
+
+    parser.add_argument(
+        "--source",
+        required=True,
+        help="Connection string for the database",
+    )
+
+    _add_fetch_arguments(parser)
+    return parser
+
+
+def _add_dbms_argument(parser: argparse.ArgumentParser, help_text: str) -> None:
+    """
+    Add the --dbms argument to a parser.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser.
+        help_text (str): The help of the argument.
+    """
+    parser.add_argument(
+        "--dbms",
+        choices=get_supported_dbms_registry().keys(),
+        help=help_text,
+        default="sqlite",
+    )
+
+
+def _add_fetch_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments that tune how schema structures are fetched, shared by all commands.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser.
+    """
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        help="Number of object types to fetch at the same time from each database, each over its own connection (default: 1)",
+        default=1,
+    )
+
+    parser.add_argument(
+        "--hash-algorithm",
+        choices=[hash_algorithm.value for hash_algorithm in HashAlgorithm],
+        help="Algorithm to hash the bodies and definitions of triggers, routines, packages and types with. "
+        "MySQL, PostgreSQL and Oracle with --oracle-server-side-hashing hash in the database, with sha256 only. "
+        "Both sides of a comparison must be hashed with the same algorithm (default: sha256)",
+        default=HashAlgorithm.SHA256.value,
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Enable verbose logging output",
     )
 
-    try:
-        args = parser.parse_args()
+    parser.add_argument(
+        "--types",
+        metavar="TYPE",
+        nargs="+",
+        help="Only fetch these object types (e.g. tables indexes constraints). "
+        "Every object type is fetched on its own, so e.g. indexes can be compared without their tables",
+        default=None,
+    )
 
-        if args.verbose:
-            handle_verbose_logging()
-            logger.debug("Verbose mode enabled.")
+    parser.add_argument(
+        "--skip-types",
+        metavar="TYPE",
+        nargs="+",
+        help="Do not fetch these object types (e.g. packages types mining_models)",
+        default=None,
+    )
 
-        logger.debug(f"Parsed arguments: {args}")
+    filter_options = parser.add_argument_group(
+        "Object filters",
+        "Only fetch some of the objects, by schema and by name. The filters are applied by the catalog queries, "
+        "so that the databases only read and send the chosen objects. Every option can be repeated.",
+    )
 
-        check_args_validity(args)
+    filter_options.add_argument(
+        "--include-schema",
+        metavar="SCHEMA",
+        action="append",
+        help="Only fetch the objects of SCHEMA (as stored in the catalog, e.g. in upper case for Oracle)",
+    )
 
-    except argparse.ArgumentError as e:
-        msg = f"Invalid argument: {e}"
-        raise CliArgumentError(msg) from e
-    except SystemExit as e:
-        # argparse calls sys.exit() on error, convert to our exception
-        if e.code != 0:
-            msg = "Invalid command line arguments. Use --help for usage information."
-            raise CliUsageError(msg) from e
-        # Re-raise if it's a successful exit (like --help)
-        raise
+    filter_options.add_argument(
+        "--exclude-schema",
+        metavar="SCHEMA",
+        action="append",
+        help="Do not fetch the objects of SCHEMA",
+    )
 
-    return args
+    filter_options.add_argument(
+        "--include-object",
+        metavar="GLOB",
+        action="append",
+        help="Only fetch the objects whose name matches GLOB (* matches any characters, ? a single one)",
+    )
+
+    filter_options.add_argument(
+        "--exclude-object",
+        metavar="GLOB",
+        action="append",
+        help="Do not fetch the objects whose name matches GLOB",
+    )
+
+    oracle_options = parser.add_argument_group(
+        "Oracle options",
+        "Only used for Oracle databases.",
+    )
+
+    oracle_options.add_argument(
+        "--oracle-server-side-hashing",
+        action="store_true",
+        help="Hash the DDL of functions, procedures, packages and types in the database (requires EXECUTE on DBMS_CRYPTO), "
+        "so that only the digests cross the network",
+    )
+
+    oracle_options.add_argument(
+        "--oracle-ddl-source",
+        choices=[ddl_source.value for ddl_source in OracleDDLSource],
+        help="Where to read the source of functions, procedures, packages and types from: one dbms_metadata.get_ddl call per object, "
+        "or a single ordered scan of ALL_SOURCE. Both databases are read the same way, "
+        "but digests from different sources are not comparable (default: dbms_metadata)",
+        default=OracleDDLSource.DBMS_METADATA.value,
+    )
+
+    oracle_options.add_argument(
+        "--oracle-owner-cache",
+        metavar="FILE",
+        help="Keep the list of Oracle-maintained users in FILE for a day, so that later runs against the same databases do not look it up again",
+        default=None,
+    )
+
+    oracle_options.add_argument(
+        "--oracle-pipeline",
+        action="store_true",
+        help="Send the catalog queries of all object types together in pipelines over a single connection, "
+        "so that a fetch takes a handful of round-trips on high-latency links (ignores --jobs)",
+    )
+
+    oracle_options.add_argument(
+        "--oracle-incremental-dir",
+        metavar="DIR",
+        help="Keep the structure of every fetched database in DIR, so that later runs only fetch the objects "
+        "created, dropped or altered since (judged by their last DDL time; everything is fetched again once a day)",
+        default=None,
+    )
@@ -1,6 +1,8 @@
-from argparse import Namespace
+from argparse import ArgumentTypeError, Namespace
 from importlib import metadata
+from typing import Any
 
+from db_drift.db.filters import ObjectFilter
 from db_drift.utils.exceptions import CliArgumentError
 
 
@@ -12,6 +14,68 @@ def get_version() -> str:
         return "unknown"
 
 
+def positive_int(value: str) -> int:
+    """
+    Parse a strictly positive integer CLI argument.
+
+    Args:
+        value: The raw argument value
+
+    Returns:
+        int: The parsed integer
+
+    Raises:
+        ArgumentTypeError: If the value is not an integer greater than zero
+    """
+    try:
+        number = int(value)
+    except ValueError as e:
+        msg = f"'{value}' is not an integer"
+        raise ArgumentTypeError(msg) from e
+
+    if number < 1:
+        msg = f"'{value}' must be greater than zero"
+        raise ArgumentTypeError(msg)
+
+    return number
+
+
+def get_connector_options(args: Namespace, dbms: str | None = None) -> dict[str, Any]:
+    """
+    Collect the DBMS-specific options of a DBMS as connector keyword arguments.
+
+    DBMS-specific options are prefixed with the DBMS name (e.g. `--oracle-server-side-hashing`
+    becomes the `server_side_hashing` argument of the Oracle connector). Options of other DBMSs are ignored.
+
+    Args:
+        args: Parsed argparse Namespace
+        dbms: The DBMS to collect the options of (default: the chosen DBMS, `args.dbms`)
+
+    Returns:
+        dict[str, Any]: The keyword arguments for the connector of that DBMS
+    """
+    prefix = f"{dbms or args.dbms}_"
+    return {name.removeprefix(prefix): value for name, value in vars(args).items() if name.startswith(prefix)}
+
+
+def get_object_filter(args: Namespace) -> ObjectFilter:
+    """
+    Collect the object filter options as the object filter of the connectors.
+
+    Args:
+        args: Parsed argparse Namespace
+
+    Returns:
+        ObjectFilter: The schemas and object names to fetch
+    """
+    return ObjectFilter(
+        include_schemas=tuple(args.include_schema or ()),
+        exclude_schemas=tuple(args.exclude_schema or ()),
+        include_names=tuple(args.include_object or ()),
+        exclude_names=tuple(args.exclude_object or ()),
+    )
+
+
 def check_args_validity(args: Namespace) -> None:
     """
     Check validity of CLI arguments.
@@ -1,23 +1,204 @@
+import asyncio
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, closing, contextmanager
+from typing import TYPE_CHECKING, Any
+
+from db_drift.db.filters import ObjectFilter
+from db_drift.utils.constants import HashAlgorithm
+
+if TYPE_CHECKING:
+    from db_drift.diff import StructureFingerprint
+
+
 class BaseDBConnector:
     """Abstract base class for database connectors."""
 
-    def __init__(self, connection_string: str) -> None:
+    # The algorithms bodies and definitions can be hashed with. Connectors that hash them in the database only support SHA-256
+    SUPPORTED_HASH_ALGORITHMS: tuple[HashAlgorithm, ...] = tuple(HashAlgorithm)
+
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        object_filter: ObjectFilter | None = None,
+        hash_algorithm: HashAlgorithm | str = HashAlgorithm.SHA256,
+    ) -> None:
+        """
+        Initialize the connector.
+
+        Args:
+            connection_string (str): The connection string of the database.
+            object_filter (ObjectFilter | None): The schemas and object names to fetch.
+            hash_algorithm (HashAlgorithm | str): The algorithm to hash bodies and definitions with.
+
+        Raises:
+            ValueError: If the connector cannot hash with that algorithm.
+        """
         self.connection_string = connection_string
+        self.object_filter = object_filter or ObjectFilter()
+        self.hash_algorithm = HashAlgorithm(hash_algorithm)
+        if self.hash_algorithm not in self.SUPPORTED_HASH_ALGORITHMS:
+            msg = (
+                f"{type(self).__name__} hashes in the database, with {', '.join(algorithm.value for algorithm in self.SUPPORTED_HASH_ALGORITHMS)} only, "
+                f"not {self.hash_algorithm.value}."
+            )
+            raise ValueError(msg)
         self.SUPPORTED_OBJECTS_REGISTRY = {}
         self.schema_structure: dict = {}
+        # The fingerprint of the fetched structure, for connectors that have one without hashing every object (snapshots)
+        self.schema_fingerprint: StructureFingerprint | None = None
         self.connection_library = None  # This will be set in subclasses
 
-    def fetch_schema_structure(self) -> dict:
+    def select_object_types(self, object_types: Iterable[str] | None = None, skip_object_types: Iterable[str] = ()) -> None:
+        """
+        Only fetch some of the object types of the registry.
+
+        Every object type is read by catalog queries of its own, so any subset of the registry can be fetched:
+        e.g. the constraints or indexes of tables can be fetched without the tables themselves.
+
+        Args:
+            object_types (Iterable[str] | None): The object types to fetch, or None for all of them.
+            skip_object_types (Iterable[str]): The object types not to fetch.
+
+        Raises:
+            ValueError: If an object type is not supported by the connector.
+        """
+        object_types = list(self.SUPPORTED_OBJECTS_REGISTRY) if object_types is None else list(object_types)
+        skip_object_types = set(skip_object_types)
+
+        unknown_object_types = [obj_type for obj_type in [*object_types, *skip_object_types] if obj_type not in self.SUPPORTED_OBJECTS_REGISTRY]
+        if unknown_object_types:
+            msg = f"Unknown object type(s) {', '.join(unknown_object_types)}. Supported object types: {', '.join(self.SUPPORTED_OBJECTS_REGISTRY)}."
+            raise ValueError(msg)
+
+        # The registry order is kept, so that partial structures list their object types in the same order as full ones
+        self.SUPPORTED_OBJECTS_REGISTRY = {
+            obj_type: fetch_function
+            for obj_type, fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.items()
+            if obj_type in object_types and obj_type not in skip_object_types
+        }
+
+    def fetch_schema_structure(self, jobs: int = 1) -> dict:
         """
         Fetch the database schema structure for the specific DBMS.
 
+        Args:
+            jobs (int): How many object types to fetch at the same time, each over its own connection.
+                With the default of 1, every object type is fetched one after another on a single cursor.
+
         Returns:
             dict: A dictionary representing the database schema structure.
         """
-        with self.connection_library.connect(self.connection_string) as connection:
-            cursor = connection.cursor()
+        if jobs > 1:
+            schema_structure = self._fetch_schema_structure_in_parallel(jobs)
+        else:
+            schema_structure = {}
+            with self._connect() as connection:
+                cursor = connection.cursor()
+                self._prepare_fetch(cursor)
 
-            for obj_type, fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.items():
-                self.schema_structure[obj_type] = fetch_function(cursor)
+                for obj_type, fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.items():
+                    schema_structure[obj_type] = fetch_function(cursor)
 
+        # A fresh dict on every call keeps the connector safe to reuse
+        self.schema_structure = schema_structure
         return self.schema_structure
+
+    async def fetch_schema_structure_async(self, jobs: int = 1) -> dict:
+        """
+        Fetch the database schema structure without blocking the event loop.
+
+        By default the blocking `fetch_schema_structure` runs in a worker thread.
+        Connectors built on an asyncio-native driver override this to fetch on the event loop itself.
+
+        Args:
+            jobs (int): How many object types to fetch at the same time.
+
+        Returns:
+            dict: A dictionary representing the database schema structure.
+        """
+        return await asyncio.to_thread(self.fetch_schema_structure, jobs)
+
+    def _fetch_schema_structure_in_parallel(self, jobs: int) -> dict:
+        """
+        Run the fetch functions of the registry concurrently, each on a connection of its own.
+
+        Args:
+            jobs (int): The maximum number of object types fetched at the same time.
+
+        Returns:
+            dict: The schema structure, with the object types in registry order (same as a serial run).
+        """
+        workers = max(1, min(jobs, len(self.SUPPORTED_OBJECTS_REGISTRY)))
+
+        with self._open_connection_pool(workers) as acquire_connection:
+            with acquire_connection() as connection:
+                self._prepare_fetch(connection.cursor())
+
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-drift-fetch-objects")
+            try:
+                futures = {
+                    obj_type: executor.submit(self._fetch_object_type, acquire_connection, fetch_function)
+                    for obj_type, fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.items()
+                }
+                return {obj_type: future.result() for obj_type, future in futures.items()}
+            finally:
+                # Don't start the remaining object types if one of them failed
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _connect(self) -> Any:  # noqa: ANN401
+        """
+        Open a connection to the database.
+
+        By default the connection string is handed to the `connect` function of the driver as is.
+        Connectors whose driver takes the connection details as keyword arguments override this.
+
+        Returns:
+            Any: A DB-API connection, usable as a context manager.
+        """
+        return self.connection_library.connect(self.connection_string)
+
+    def _prepare_fetch(self, cursor: Any) -> None:  # noqa: ANN401
+        """
+        Resolve any per-session state the fetch functions share, before the first object type is fetched.
+
+        Runs once per `fetch_schema_structure` call. Does nothing by default.
+
+        Args:
+            cursor (Any): A cursor on the database being fetched.
+        """
+
+    @staticmethod
+    def _fetch_object_type(
+        acquire_connection: Callable[[], AbstractContextManager[Any]],
+        fetch_function: Callable[[Any], dict],
+    ) -> dict:
+        """
+        Fetch a single object type on a connection acquired for it alone.
+
+        Args:
+            acquire_connection (Callable[[], AbstractContextManager[Any]]): Returns a context manager that yields a connection.
+            fetch_function (Callable[[Any], dict]): The registry fetch function to run.
+
+        Returns:
+            dict: The fetched objects of that type.
+        """
+        with acquire_connection() as connection:
+            return fetch_function(connection.cursor())
+
+    @contextmanager
+    def _open_connection_pool(self, size: int) -> Iterator[Callable[[], AbstractContextManager[Any]]]:  # noqa: ARG002
+        """
+        Provide connections for parallel fetching.
+
+        By default every fetch opens (and closes) a separate connection.
+        Subclasses can override this to hand out connections from a session pool of `size` connections instead.
+
+        Args:
+            size (int): The maximum number of connections in use at the same time.
+
+        Yields:
+            Callable[[], AbstractContextManager[Any]]: Returns a context manager that yields a connection.
+        """
+        yield lambda: closing(self._connect())
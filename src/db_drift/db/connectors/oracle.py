@@ -1,12 +1,24 @@
+import asyncio
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import oracledb
 
 from db_drift.db.connectors.base_connector import BaseDBConnector
+from db_drift.db.connectors.oracle_incremental import FULL_FETCH_INTERVAL, INCREMENTAL_OBJECT_TYPES, find_changed_objects, merge_structures
+from db_drift.db.filters import ObjectFilter
 from db_drift.db.mappers.constraint_types.oracle import ORACLE_CONSTRAINT_MAPPER
 from db_drift.db.strategies.oracle import (
+    OracleDDLSource,
+    OracleOwnerScope,
     fetch_oracle_constraints,
+    fetch_oracle_ddl_times,
     fetch_oracle_directories,
     fetch_oracle_editions,
     fetch_oracle_functions,
@@ -23,43 +35,327 @@ from db_drift.db.strategies.oracle import (
     fetch_oracle_triggers,
     fetch_oracle_types,
     fetch_oracle_views,
+    resolve_oracle_excluded_owners,
 )
+from db_drift.db.strategies.oracle_async import AsyncCatalogSession
+from db_drift.db.strategies.utils import create_catalog_plan
+from db_drift.snapshot import Snapshot, read_snapshot, write_snapshot
+from db_drift.utils.cache import load_cached_value, store_cached_value
+from db_drift.utils.constants import HashAlgorithm
+from db_drift.utils.string import hash_body
 
 if TYPE_CHECKING:
     from db_drift.db.mappers.constraint_types.base import DictConstraintTypeMapper
 
+logger = logging.getLogger("db-drift")
+
+# Oracle-maintained users only change with database upgrades and options being installed
+OWNER_CACHE_MAX_AGE = timedelta(days=1)
+
 
 class OracleConnector(BaseDBConnector):
-    def __init__(self, connection_string: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        connection_string: str,
+        *,
+        server_side_hashing: bool = False,
+        hash_algorithm: HashAlgorithm | str = HashAlgorithm.SHA256,
+        ddl_source: OracleDDLSource | str = OracleDDLSource.DBMS_METADATA,
+        owner_cache: str | Path | None = None,
+        pipeline: bool = False,
+        incremental_dir: str | Path | None = None,
+        object_filter: ObjectFilter | None = None,
+    ) -> None:
         """
         Initialize the OracleConnector with a connection string.
 
         Args:
             connection_string (str): The connection string for the Oracle database.
+            server_side_hashing (bool): Whether to hash the DDL of PL/SQL units and types in the database,
+                so that only the digests cross the network. Requires the EXECUTE privilege on DBMS_CRYPTO.
+            hash_algorithm (HashAlgorithm | str): The algorithm to hash trigger bodies and the DDL of PL/SQL units and types with.
+                Only SHA-256 is supported with server-side hashing.
+            ddl_source (OracleDDLSource | str): Where to read the source of PL/SQL units and types from
+                ("dbms_metadata" or "all_source"). Digests are only comparable between runs that use the same source.
+            owner_cache (str | Path | None): A file to keep the Oracle-maintained users in across runs,
+                so that they are not looked up again for a day. They are looked up once per run without it.
+            pipeline (bool): Whether to send the catalog queries of all object types together, in python-oracledb pipelines
+                over a single asyncio connection, so that a fetch costs a handful of round-trips instead of one or more per query.
+            incremental_dir (str | Path | None): A directory to keep the structure of every fetched database in, with the
+                last DDL time of its objects. Later fetches only query the objects created, dropped or altered since.
+            object_filter (ObjectFilter | None): The schemas and object names to fetch, bound into every catalog query.
+                Constraints are matched on the name of their table.
+
+        Raises:
+            ValueError: If server-side hashing is combined with another hash algorithm than SHA-256.
         """
-        super().__init__(connection_string)
+        super().__init__(connection_string, object_filter=object_filter, hash_algorithm=hash_algorithm)
+        if server_side_hashing and self.hash_algorithm is not HashAlgorithm.SHA256:
+            msg = f"Server-side hashing only hashes with {HashAlgorithm.SHA256.value}, not {self.hash_algorithm.value}."
+            raise ValueError(msg)
+
+        self.server_side_hashing = server_side_hashing
+        self.ddl_source = OracleDDLSource(ddl_source)
+        self.owner_cache = Path(owner_cache) if owner_cache else None
+        self.pipeline = pipeline
+        self.incremental_dir = Path(incremental_dir) if incremental_dir else None
+        self._incremental_fetch: _IncrementalFetch | None = None
+        self.owner_scope = OracleOwnerScope(object_filter=self.object_filter)
+        scope_options = {"owner_scope": self.owner_scope}
+        ddl_options = {
+            "server_side_hashing": self.server_side_hashing,
+            "hash_algorithm": self.hash_algorithm,
+            "ddl_source": self.ddl_source,
+            **scope_options,
+        }
 
         self.constraint_type_mapper: DictConstraintTypeMapper = ORACLE_CONSTRAINT_MAPPER
 
         self.SUPPORTED_OBJECTS_REGISTRY = {
-            "tables": fetch_oracle_tables,
-            "views": fetch_oracle_views,
-            "materialized_views": fetch_oracle_materialized_views,
+            "tables": partial(fetch_oracle_tables, **scope_options),
+            "views": partial(fetch_oracle_views, **scope_options),
+            "materialized_views": partial(fetch_oracle_materialized_views, **scope_options),
             "editions": fetch_oracle_editions,
-            "mining_models": fetch_oracle_mining_models,
-            "indextypes": fetch_oracle_indextypes,
-            "operators": fetch_oracle_operators,
-            "triggers": fetch_oracle_triggers,
-            "indexes": fetch_oracle_indexes,
-            "constraints": partial(fetch_oracle_constraints, constraint_type_mapper=self.constraint_type_mapper),
-            "sequences": fetch_oracle_sequences,
-            "synonyms": fetch_oracle_synonyms,
-            "functions": fetch_oracle_functions,
-            "procedures": fetch_oracle_stored_procedures,
-            "packages": fetch_oracle_packages,
-            "types": fetch_oracle_types,
+            "mining_models": partial(fetch_oracle_mining_models, **scope_options),
+            "indextypes": partial(fetch_oracle_indextypes, **scope_options),
+            "operators": partial(fetch_oracle_operators, **scope_options),
+            "triggers": partial(fetch_oracle_triggers, hash_algorithm=self.hash_algorithm, **scope_options),
+            "indexes": partial(fetch_oracle_indexes, **scope_options),
+            "constraints": partial(fetch_oracle_constraints, constraint_type_mapper=self.constraint_type_mapper, **scope_options),
+            "sequences": partial(fetch_oracle_sequences, **scope_options),
+            "synonyms": partial(fetch_oracle_synonyms, **scope_options),
+            "functions": partial(fetch_oracle_functions, **ddl_options),
+            "procedures": partial(fetch_oracle_stored_procedures, **ddl_options),
+            "packages": partial(fetch_oracle_packages, **ddl_options),
+            "types": partial(fetch_oracle_types, **ddl_options),
             # "jobs": fetch_oracle_jobs,  # noqa: ERA001
-            "directories": fetch_oracle_directories,
+            "directories": partial(fetch_oracle_directories, **scope_options),
         }
 
         self.connection_library = oracledb
+
+    def fetch_schema_structure(self, jobs: int = 1) -> dict:
+        """
+        Fetch the database schema structure.
+
+        Args:
+            jobs (int): How many object types to fetch at the same time, each over its own session of a pool.
+                Ignored in pipeline mode, which fetches every object type over a single connection.
+
+        Returns:
+            dict: A dictionary representing the database schema structure.
+        """
+        # python-oracledb only pipelines on asyncio connections
+        schema_structure = asyncio.run(self._fetch_schema_structure_pipelined()) if self.pipeline else super().fetch_schema_structure(jobs)
+
+        self.schema_structure = self._finish_fetch(schema_structure)
+        return self.schema_structure
+
+    async def _fetch_schema_structure_pipelined(self) -> dict:
+        """
+        Run the catalog plans of the registry side by side, with the next query of every plan sent in a single pipeline.
+
+        Returns:
+            dict: The schema structure, with the object types in registry order (same as a serial run).
+        """
+        async with self.connection_library.connect_async(self.connection_string) as connection:
+            await self._prepare_fetch_async(connection)
+
+            plans = [create_catalog_plan(fetch_function) for fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.values()]
+            results = await AsyncCatalogSession(connection).run_pipelined(plans)
+
+        return dict(zip(self.SUPPORTED_OBJECTS_REGISTRY, results, strict=True))
+
+    def _prepare_fetch(self, cursor: oracledb.Cursor) -> None:
+        """
+        Resolve the Oracle-maintained users once, so that every catalog query binds them instead of looking them up again.
+
+        In incremental mode, also resolve the objects that changed since the previous fetch.
+
+        Args:
+            cursor (oracledb.Cursor): A cursor on the database being fetched.
+        """
+        excluded_owners = self._load_cached_excluded_owners()
+        if excluded_owners is None:
+            excluded_owners = resolve_oracle_excluded_owners(cursor)
+            self._store_excluded_owners(excluded_owners)
+
+        self.owner_scope.excluded_owners = excluded_owners
+        self.owner_scope.changed_objects = None
+
+        if self.incremental_dir:
+            self._start_incremental_fetch(fetch_oracle_ddl_times(cursor, self._incremental_object_types(), owner_scope=self.owner_scope))
+
+    async def _prepare_fetch_async(self, connection: oracledb.AsyncConnection) -> None:
+        """
+        Resolve the Oracle-maintained users once, so that every catalog query binds them instead of looking them up again.
+
+        Args:
+            connection (oracledb.AsyncConnection): A connection to the database being fetched.
+        """
+        excluded_owners = self._load_cached_excluded_owners()
+        if excluded_owners is None:
+            excluded_owners = await AsyncCatalogSession(connection).run(create_catalog_plan(resolve_oracle_excluded_owners))
+            self._store_excluded_owners(excluded_owners)
+
+        self.owner_scope.excluded_owners = excluded_owners
+        self.owner_scope.changed_objects = None
+
+        if self.incremental_dir:
+            ddl_times_plan = create_catalog_plan(partial(fetch_oracle_ddl_times, self._incremental_object_types(), owner_scope=self.owner_scope))
+            self._start_incremental_fetch(await AsyncCatalogSession(connection).run(ddl_times_plan))
+
+    def _incremental_object_types(self) -> list[str]:
+        # The ALL_OBJECTS object types of the registry entries that can be fetched incrementally
+        return sorted({object_type for obj_type in self.SUPPORTED_OBJECTS_REGISTRY for object_type in INCREMENTAL_OBJECT_TYPES.get(obj_type, ())})
+
+    def _start_incremental_fetch(self, ddl_times: dict[str, dict[str, str]]) -> None:
+        """
+        Restrict the catalog queries to the objects that changed since the previous fetch, if it can be built upon.
+
+        Args:
+            ddl_times (dict[str, dict[str, str]]): The current last DDL time of every object, by object type and "owner.object_name".
+        """
+        previous = self._read_incremental_snapshot()
+        now = datetime.now(timezone.utc)
+
+        if previous is None:
+            self._incremental_fetch = _IncrementalFetch(previous=None, ddl_times=ddl_times, changed_objects=None, full_fetch_at=now)
+            return
+
+        changed_objects = find_changed_objects(previous.metadata["ddl_times"], ddl_times)
+        self._incremental_fetch = _IncrementalFetch(
+            previous=previous,
+            ddl_times=ddl_times,
+            changed_objects=changed_objects,
+            full_fetch_at=datetime.fromisoformat(previous.metadata["full_fetch_at"]),
+        )
+        self.owner_scope.changed_objects = sorted(set().union(*changed_objects.values()))
+        logger.debug(f"Fetching the {len(self.owner_scope.changed_objects)} objects changed since the previous fetch.")
+
+    def _read_incremental_snapshot(self) -> Snapshot | None:
+        """
+        Read the snapshot of the previous fetch of this database, if a fetch can be built upon it.
+
+        Returns:
+            Snapshot | None: The snapshot, or None if there is none, or it was fetched differently or too long ago.
+        """
+        path = self._incremental_snapshot_path()
+        try:
+            snapshot = read_snapshot(path)
+        except FileNotFoundError:
+            logger.debug(f"No previous snapshot in {path}, fetching everything.")
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+            return None
+
+        if snapshot.metadata.get("fetch_options") != self._incremental_fetch_options():
+            logger.debug(f"The snapshot in {path} was fetched with other options, fetching everything.")
+            return None
+
+        if datetime.now(timezone.utc) - datetime.fromisoformat(snapshot.metadata["full_fetch_at"]) > FULL_FETCH_INTERVAL:
+            logger.debug(f"The snapshot in {path} was fully fetched more than {FULL_FETCH_INTERVAL} ago, fetching everything.")
+            return None
+
+        return snapshot
+
+    def _incremental_fetch_options(self) -> dict:
+        # A snapshot is only built upon by fetches that would have fetched every unchanged object the same way
+        return {
+            "object_types": list(self.SUPPORTED_OBJECTS_REGISTRY),
+            "server_side_hashing": self.server_side_hashing,
+            "hash_algorithm": self.hash_algorithm.value,
+            "ddl_source": self.ddl_source.value,
+            "excluded_owners": self.owner_scope.excluded_owners,
+            "object_filter": {name: list(values) for name, values in asdict(self.object_filter).items()},
+        }
+
+    def _incremental_snapshot_path(self) -> Path:
+        # The password is part of the connection string, so only a digest of it names the snapshot
+        return self.incremental_dir / f"{hash_body(self.connection_string)}.json.gz"
+
+    def _finish_fetch(self, schema_structure: dict) -> dict:
+        """
+        In incremental mode, merge the fetched objects into the previous structure and keep the result for the next fetch.
+
+        Args:
+            schema_structure (dict): The fetched structure.
+
+        Returns:
+            dict: The full structure.
+        """
+        incremental_fetch, self._incremental_fetch = self._incremental_fetch, None
+        self.owner_scope.changed_objects = None
+        if incremental_fetch is None:
+            return schema_structure
+
+        if incremental_fetch.previous is not None:
+            schema_structure = merge_structures(incremental_fetch.previous.structure, schema_structure, incremental_fetch.changed_objects)
+
+        metadata = {
+            "fetch_options": self._incremental_fetch_options(),
+            "ddl_times": incremental_fetch.ddl_times,
+            "full_fetch_at": incremental_fetch.full_fetch_at.isoformat(),
+        }
+        write_snapshot(
+            self._incremental_snapshot_path(),
+            Snapshot(structure=schema_structure, metadata=metadata, hash_algorithm=self.hash_algorithm),
+        )
+        return schema_structure
+
+    def _load_cached_excluded_owners(self) -> list[str] | None:
+        """
+        Load the Oracle-maintained users of this database from the owner cache, if there is one.
+
+        Returns:
+            list[str] | None: The cached users, or None if they are not cached (or have expired).
+        """
+        if not self.owner_cache:
+            return None
+
+        excluded_owners = load_cached_value(self.owner_cache, self._owner_cache_key(), OWNER_CACHE_MAX_AGE)
+        if excluded_owners is not None:
+            logger.debug(f"Using {len(excluded_owners)} Oracle-maintained users cached in {self.owner_cache}.")
+        return excluded_owners
+
+    def _store_excluded_owners(self, excluded_owners: list[str]) -> None:
+        """
+        Store the Oracle-maintained users of this database in the owner cache, if there is one.
+
+        Args:
+            excluded_owners (list[str]): The users to store.
+        """
+        if self.owner_cache:
+            store_cached_value(self.owner_cache, self._owner_cache_key(), excluded_owners)
+
+    def _owner_cache_key(self) -> str:
+        # The password is part of the connection string, so only a digest of it is written to the cache
+        return f"excluded_owners:{hash_body(self.connection_string)}"
+
+    @contextmanager
+    def _open_connection_pool(self, size: int) -> Iterator[Callable[[], AbstractContextManager[oracledb.Connection]]]:
+        """
+        Provide connections for parallel fetching from an oracledb session pool.
+
+        Args:
+            size (int): The maximum number of sessions in the pool.
+
+        Yields:
+            Callable[[], AbstractContextManager[oracledb.Connection]]: Acquires a session that is released back to the pool on exit.
+        """
+        pool = self.connection_library.create_pool(self.connection_string, min=1, max=size, increment=1)
+        try:
+            yield pool.acquire
+        finally:
+            pool.close(force=True)
+
+
+@dataclass
+class _IncrementalFetch:
+    """The state of an incremental fetch, from resolving the changed objects to merging the fetched ones."""
+
+    previous: Snapshot | None  # None for a full fetch
+    ddl_times: dict[str, dict[str, str]]
+    changed_objects: dict[str, set[str]] | None
+    full_fetch_at: datetime
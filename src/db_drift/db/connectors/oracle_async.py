@@ -0,0 +1,94 @@
+import asyncio
+from collections.abc import Callable
+
+import oracledb
+
+from db_drift.db.connectors.oracle import OracleConnector
+from db_drift.db.strategies.oracle_async import AsyncCatalogSession
+from db_drift.db.strategies.utils import create_catalog_plan
+
+
+class AsyncOracleConnector(OracleConnector):
+    """
+    An Oracle connector that fetches on an asyncio event loop, with the asyncio API of python-oracledb.
+
+    It runs the same catalog queries as `OracleConnector`, so both produce the same schema structure,
+    and it can still be used as a blocking connector (`fetch_schema_structure`).
+    """
+
+    async def fetch_schema_structure_async(self, jobs: int = 1) -> dict:
+        """
+        Fetch the database schema structure without blocking the event loop.
+
+        Args:
+            jobs (int): How many object types to fetch at the same time, each over its own session of an asyncio pool.
+                With the default of 1, every object type is fetched one after another over a single connection.
+                Ignored in pipeline mode, which fetches every object type over a single connection.
+
+        Returns:
+            dict: A dictionary representing the database schema structure, with the object types in registry order.
+        """
+        if self.pipeline:
+            schema_structure = await self._fetch_schema_structure_pipelined()
+        elif jobs > 1:
+            schema_structure = await self._fetch_schema_structure_in_parallel_async(jobs)
+        else:
+            async with self.connection_library.connect_async(self.connection_string) as connection:
+                await self._prepare_fetch_async(connection)
+
+                session = AsyncCatalogSession(connection)
+                schema_structure = {}
+                for obj_type, fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.items():
+                    schema_structure[obj_type] = await session.run(create_catalog_plan(fetch_function))
+
+        # A fresh dict on every call keeps the connector safe to reuse
+        self.schema_structure = self._finish_fetch(schema_structure)
+        return self.schema_structure
+
+    async def _fetch_schema_structure_in_parallel_async(self, jobs: int) -> dict:
+        """
+        Run the catalog plans of the registry concurrently, each on a session of its own.
+
+        Args:
+            jobs (int): The maximum number of object types fetched at the same time.
+
+        Returns:
+            dict: The schema structure, with the object types in registry order (same as a serial run).
+        """
+        workers = max(1, min(jobs, len(self.SUPPORTED_OBJECTS_REGISTRY)))
+        pool = self.connection_library.create_pool_async(self.connection_string, min=1, max=workers, increment=1)
+        try:
+            async with pool.acquire() as connection:
+                await self._prepare_fetch_async(connection)
+
+            # The pool makes the object types wait for a free session, so at most `workers` of them run at once
+            tasks = [
+                asyncio.ensure_future(self._fetch_object_type_async(pool, fetch_function))
+                for fetch_function in self.SUPPORTED_OBJECTS_REGISTRY.values()
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # Don't leave the remaining object types running if one of them failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            return dict(zip(self.SUPPORTED_OBJECTS_REGISTRY, results, strict=True))
+        finally:
+            await pool.close(force=True)
+
+    async def _fetch_object_type_async(self, pool: oracledb.AsyncConnectionPool, fetch_function: Callable[..., dict]) -> dict:
+        """
+        Fetch a single object type on a session acquired for it alone.
+
+        Args:
+            pool (oracledb.AsyncConnectionPool): The pool to acquire the session from.
+            fetch_function (Callable[..., dict]): The registry fetch function to run the catalog plan of.
+
+        Returns:
+            dict: The fetched objects of that type.
+        """
+        async with pool.acquire() as connection:
+            return await AsyncCatalogSession(connection).run(create_catalog_plan(fetch_function))
@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from db_drift.models import Constraint, DatabaseObject
+
+# The ALL_OBJECTS object types whose LAST_DDL_TIME tells whether the objects of each registry entry changed.
+# The other entries (editions, sequences and directories) are always fetched in full: they are few,
+# or change without DDL (the last number of a sequence).
+INCREMENTAL_OBJECT_TYPES: dict[str, tuple[str, ...]] = {
+    "tables": ("TABLE",),
+    "views": ("VIEW",),
+    "materialized_views": ("MATERIALIZED VIEW",),
+    "mining_models": ("MINING MODEL",),
+    "indextypes": ("INDEXTYPE",),
+    "operators": ("OPERATOR",),
+    "triggers": ("TRIGGER",),
+    "indexes": ("INDEX",),
+    "constraints": ("TABLE", "VIEW"),  # Adding or dropping a constraint is DDL on its table (or view)
+    "synonyms": ("SYNONYM",),
+    "functions": ("FUNCTION",),
+    "procedures": ("PROCEDURE",),
+    "packages": ("PACKAGE", "PACKAGE BODY"),
+    "types": ("TYPE", "TYPE BODY"),
+}
+
+# Changes that do not update LAST_DDL_TIME are caught up by a full fetch at least this often
+FULL_FETCH_INTERVAL = timedelta(days=1)
+
+
+def find_changed_objects(previous_ddl_times: dict[str, dict[str, str]], ddl_times: dict[str, dict[str, str]]) -> dict[str, set[str]]:
+    """
+    Find the objects created, dropped or altered since the previous fetch, from their last DDL times.
+
+    LAST_DDL_TIME only has a precision of one second, so an object altered again within the second the previous
+    DDL times were read in would look unchanged. The objects with the newest previous DDL time are therefore always
+    treated as changed.
+
+    Args:
+        previous_ddl_times (dict[str, dict[str, str]]): The DDL times of the previous fetch, by object type and "owner.object_name".
+        ddl_times (dict[str, dict[str, str]]): The current DDL times, by object type and "owner.object_name".
+
+    Returns:
+        dict[str, set[str]]: The "owner.object_name" of the changed objects of every object type.
+    """
+    newest_previous_ddl_time = max((ddl_time for times in previous_ddl_times.values() for ddl_time in times.values()), default=None)
+
+    changed_objects: dict[str, set[str]] = {}
+    for object_type in previous_ddl_times.keys() | ddl_times.keys():
+        previous_times = previous_ddl_times.get(object_type, {})
+        current_times = ddl_times.get(object_type, {})
+        changed_objects[object_type] = {
+            name
+            for name in previous_times.keys() | current_times.keys()
+            if previous_times.get(name) != current_times.get(name) or previous_times[name] == newest_previous_ddl_time
+        }
+    return changed_objects
+
+
+def merge_structures(
+    previous_structure: dict[str, dict[str, DatabaseObject]],
+    fetched_structure: dict[str, dict[str, DatabaseObject]],
+    changed_objects: dict[str, set[str]],
+) -> dict[str, dict[str, DatabaseObject]]:
+    """
+    Merge the objects fetched for the changed objects into the structure of the previous fetch.
+
+    Args:
+        previous_structure (dict[str, dict[str, DatabaseObject]]): The full structure of the previous fetch.
+        fetched_structure (dict[str, dict[str, DatabaseObject]]): The structure fetched for the changed objects only
+            (and in full for the object types not listed in `INCREMENTAL_OBJECT_TYPES`).
+        changed_objects (dict[str, set[str]]): The "owner.object_name" of the changed objects of every ALL_OBJECTS object type.
+
+    Returns:
+        dict[str, dict[str, DatabaseObject]]: The full structure, with the object types in the order of the fetched structure.
+    """
+    merged_structure: dict[str, dict[str, DatabaseObject]] = {}
+    for obj_type, fetched_objects in fetched_structure.items():
+        if obj_type not in INCREMENTAL_OBJECT_TYPES:
+            merged_structure[obj_type] = fetched_objects
+            continue
+
+        changed_names = set().union(*(changed_objects.get(object_type, set()) for object_type in INCREMENTAL_OBJECT_TYPES[obj_type]))
+        # Changed objects that were not fetched again have been dropped
+        merged_structure[obj_type] = {
+            name: obj for name, obj in previous_structure[obj_type].items() if _ddl_object_name(name, obj) not in changed_names
+        }
+        merged_structure[obj_type].update(fetched_objects)
+
+    return merged_structure
+
+
+def _ddl_object_name(name: str, obj: DatabaseObject) -> str:
+    """
+    Get the "owner.object_name" of the ALL_OBJECTS object whose DDL time covers a fetched object.
+
+    Args:
+        name (str): The name of the object in the structure ("owner.object_name").
+        obj (DatabaseObject): The object.
+
+    Returns:
+        str: The name itself, or the name of its table for a constraint.
+    """
+    if isinstance(obj, Constraint):
+        owner, _ = name.split(".", 1)
+        return f"{owner}.{obj.table_name}"
+    return name
@@ -0,0 +1,109 @@
+from collections.abc import Iterable
+from pathlib import Path
+
+from db_drift.db.connectors.base_connector import BaseDBConnector
+from db_drift.db.filters import ObjectFilter
+from db_drift.db.strategies.sqlite import SQLITE_SCHEMA
+from db_drift.models import Constraint, DatabaseObject
+from db_drift.snapshot import read_snapshot
+from db_drift.utils.constants import HashAlgorithm
+from db_drift.utils.exceptions import DatabaseSchemaError
+
+
+class SnapshotConnector(BaseDBConnector):
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        object_filter: ObjectFilter | None = None,
+        hash_algorithm: HashAlgorithm | str = HashAlgorithm.SHA256,  # noqa: ARG002
+    ) -> None:
+        """
+        Initialize the SnapshotConnector with the path of a snapshot file.
+
+        Args:
+            connection_string (str): The path of a file written by `db-drift snapshot`.
+            object_filter (ObjectFilter | None): The schemas and object names to load. There is no database to filter in,
+                so the loaded objects are matched by the schema and object name of their key (or just their name, in the "main" schema).
+            hash_algorithm (HashAlgorithm | str): Ignored, the digests of a snapshot keep the algorithm it was taken with,
+                which is known once it is loaded.
+        """
+        super().__init__(connection_string, object_filter=object_filter)
+        self.object_types: list[str] | None = None  # None for every object type of the snapshot
+        self.skip_object_types: set[str] = set()
+
+    def select_object_types(self, object_types: Iterable[str] | None = None, skip_object_types: Iterable[str] = ()) -> None:
+        """
+        Only load some of the object types of the snapshot.
+
+        The object types of a snapshot are only known once it is loaded, so they are checked by `fetch_schema_structure`.
+
+        Args:
+            object_types (Iterable[str] | None): The object types to load, or None for all of them.
+            skip_object_types (Iterable[str]): The object types not to load.
+        """
+        self.object_types = None if object_types is None else list(object_types)
+        self.skip_object_types = set(skip_object_types)
+
+    def fetch_schema_structure(self, jobs: int = 1) -> dict:  # noqa: ARG002
+        """
+        Load the schema structure saved in the snapshot file, without connecting to any database.
+
+        Args:
+            jobs (int): Ignored, the whole file is read at once.
+
+        Returns:
+            dict: A dictionary representing the database schema structure.
+
+        Raises:
+            DatabaseSchemaError: If the file is not a snapshot, was written by an incompatible version of db-drift,
+                or does not contain the selected object types.
+        """
+        try:
+            snapshot = read_snapshot(Path(self.connection_string))
+        except ValueError as e:
+            raise DatabaseSchemaError(str(e), connection_string=self.connection_string) from e
+
+        missing_object_types = [obj_type for obj_type in self.object_types or () if obj_type not in snapshot.structure]
+        if missing_object_types:
+            msg = (
+                f"The snapshot does not contain the {', '.join(missing_object_types)} object type(s), "
+                f"only {', '.join(snapshot.structure) or 'none'}. Take the snapshot again with these object types."
+            )
+            raise DatabaseSchemaError(msg, connection_string=self.connection_string)
+
+        self.hash_algorithm = snapshot.hash_algorithm
+        self.schema_structure = {
+            obj_type: {name: obj for name, obj in objects.items() if self._matches_object_filter(name, obj)}
+            for obj_type, objects in snapshot.structure.items()
+            if (self.object_types is None or obj_type in self.object_types) and obj_type not in self.skip_object_types
+        }
+        # Leaving out object types keeps the digests of the others valid, leaving out objects does not
+        self.schema_fingerprint = (
+            snapshot.fingerprint.restricted_to(self.schema_structure)
+            if snapshot.fingerprint is not None and self.object_filter == ObjectFilter()
+            else None
+        )
+        return self.schema_structure
+
+    def _matches_object_filter(self, name: str, obj: DatabaseObject) -> bool:
+        """
+        Check whether a loaded object passes the object filter, the way the connectors match it in their catalog queries.
+
+        Args:
+            name (str): The key of the object in the structure.
+            obj (DatabaseObject): The object.
+
+        Returns:
+            bool: Whether the object is kept.
+        """
+        if self.object_filter == ObjectFilter():
+            return True
+
+        # Keys are "name" (SQLite), "schema.name", "schema.table.name" (PostgreSQL triggers, MySQL indexes, and constraints)
+        # or "schema.name(argument types)" (PostgreSQL functions and procedures)
+        schema, _, qualified_name = name.partition(".") if "." in name.split("(")[0] else ("", "", name)
+        object_name = qualified_name.split("(")[0].rpartition(".")[2]
+        if isinstance(obj, Constraint):  # Constraints are matched on the name of their table
+            object_name = obj.table_name
+        return self.object_filter.matches(schema or SQLITE_SCHEMA, object_name)
@@ -1,24 +1,36 @@
 import sqlite3
+from functools import partial
 
 from db_drift.db.connectors.base_connector import BaseDBConnector
+from db_drift.db.filters import ObjectFilter
 from db_drift.db.strategies.sqlite import fetch_sqlite_indexes, fetch_sqlite_tables, fetch_sqlite_triggers, fetch_sqlite_views
+from db_drift.utils.constants import HashAlgorithm
 
 
 class SQLiteConnector(BaseDBConnector):
-    def __init__(self, connection_string: str) -> None:
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        object_filter: ObjectFilter | None = None,
+        hash_algorithm: HashAlgorithm | str = HashAlgorithm.SHA256,
+    ) -> None:
         """
         Initialize the SQLiteConnector with a connection string.
 
         Args:
             connection_string (str): The connection string for the SQLite database.
+            object_filter (ObjectFilter | None): The schemas and object names to fetch (the schema of the database is "main").
+            hash_algorithm (HashAlgorithm | str): The algorithm to hash the trigger bodies with.
         """
-        super().__init__(connection_string)
+        super().__init__(connection_string, object_filter=object_filter, hash_algorithm=hash_algorithm)
+        filter_options = {"object_filter": self.object_filter}
 
         self.SUPPORTED_OBJECTS_REGISTRY = {
-            "tables": fetch_sqlite_tables,
-            "views": fetch_sqlite_views,
-            "indexes": fetch_sqlite_indexes,
-            "triggers": fetch_sqlite_triggers,
+            "tables": partial(fetch_sqlite_tables, **filter_options),
+            "views": partial(fetch_sqlite_views, **filter_options),
+            "indexes": partial(fetch_sqlite_indexes, **filter_options),
+            "triggers": partial(fetch_sqlite_triggers, hash_algorithm=self.hash_algorithm, **filter_options),
         }
 
         self.connection_library = sqlite3
@@ -0,0 +1,237 @@
+import asyncio
+import logging
+from collections.abc import Iterator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from db_drift.db.connectors.base_connector import BaseDBConnector
+from db_drift.snapshot import Snapshot, write_snapshot
+from db_drift.utils.exceptions import DatabaseError, DbDriftError
+
+logger = logging.getLogger("db-drift")
+
+
+def fetch_schema_structures(
+    source_connector: BaseDBConnector,
+    target_connector: BaseDBConnector,
+    *,
+    concurrent: bool = False,
+    jobs: int = 1,
+) -> tuple[dict, dict]:
+    """
+    Fetch the schema structures of the source and target databases.
+
+    Args:
+        source_connector (BaseDBConnector): The connector for the source database.
+        target_connector (BaseDBConnector): The connector for the target database.
+        concurrent (bool): Whether to connect to and introspect both databases at the same time.
+        jobs (int): How many object types to fetch at the same time within each database.
+
+    Returns:
+        tuple[dict, dict]: The source and target schema structures.
+
+    Raises:
+        DbDriftError: If fetching either side fails. The message names the side that failed.
+    """
+    sides = {
+        "source": source_connector,
+        "target": target_connector,
+    }
+
+    if not concurrent:
+        source_structure, target_structure = (_fetch_side(side, connector, jobs) for side, connector in sides.items())
+        return source_structure, target_structure
+
+    # Every side gets its own thread (and therefore its own connection), so the connection
+    # handshakes and the catalog scans of the two databases overlap.
+    executor = ThreadPoolExecutor(max_workers=len(sides), thread_name_prefix="db-drift-fetch")
+    try:
+        futures = [executor.submit(_fetch_side, side, connector, jobs) for side, connector in sides.items()]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+
+        # Report failures in a stable order (source first) if both sides failed
+        for future in futures:
+            if future in done and future.exception() is not None:
+                raise future.exception()
+
+        source_structure, target_structure = (future.result() for future in futures)
+        return source_structure, target_structure
+    finally:
+        # Hand the failure to the caller right away instead of waiting for the other side here.
+        # This does not stop the other side: its worker thread is not a daemon, so the interpreter
+        # still joins it (and lets its catalog scan finish) before the process exits.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def restrict_to_common_object_types(source_structure: dict, target_structure: dict) -> tuple[dict, dict, list[str]]:
+    """
+    Leave out the object types that only one side fetched (e.g. a snapshot taken with fewer object types).
+
+    Otherwise all the objects of such a type would look created (or dropped), instead of not compared.
+
+    Args:
+        source_structure (dict): The schema structure of the source database.
+        target_structure (dict): The schema structure of the target database.
+
+    Returns:
+        tuple[dict, dict, list[str]]: The source and target schema structures, and the object types that were left out.
+    """
+    one_sided_object_types = [
+        obj_type for obj_type in [*source_structure, *target_structure] if (obj_type in source_structure) != (obj_type in target_structure)
+    ]
+    if not one_sided_object_types:
+        return source_structure, target_structure, []
+
+    logger.warning(f"Not comparing the object types only one database was fetched with: {', '.join(one_sided_object_types)}.")
+    return (
+        {obj_type: objects for obj_type, objects in source_structure.items() if obj_type in target_structure},
+        {obj_type: objects for obj_type, objects in target_structure.items() if obj_type in source_structure},
+        one_sided_object_types,
+    )
+
+
+def snapshot_schema_structure(
+    connector: BaseDBConnector,
+    path: str | Path,
+    *,
+    jobs: int = 1,
+    metadata: dict[str, Any] | None = None,
+) -> Snapshot:
+    """
+    Fetch the schema structure of a database and save it to a snapshot file, to be loaded with `SnapshotConnector`.
+
+    Args:
+        connector (BaseDBConnector): The connector for the database.
+        path (str | Path): The snapshot file. It is replaced if it exists.
+        jobs (int): How many object types to fetch at the same time.
+        metadata (dict[str, Any] | None): Anything to save alongside the structure (e.g. the DBMS of the database).
+
+    Returns:
+        Snapshot: The saved snapshot.
+
+    Raises:
+        DbDriftError: If fetching the database fails.
+    """
+    snapshot = Snapshot(structure=_fetch_side("source", connector, jobs), metadata=metadata or {}, hash_algorithm=connector.hash_algorithm)
+    write_snapshot(Path(path), snapshot)
+    logger.info(f"Saved the schema structure snapshot to {path}.")
+    return snapshot
+
+
+def _fetch_side(side: str, connector: BaseDBConnector, jobs: int) -> dict:
+    """
+    Fetch the schema structure of one side of the comparison.
+
+    Args:
+        side (str): The side being fetched ("source" or "target").
+        connector (BaseDBConnector): The connector for that side.
+        jobs (int): How many object types to fetch at the same time.
+
+    Returns:
+        dict: The schema structure of the database.
+
+    Raises:
+        DbDriftError: If the connector raises one, with the side prepended to its message.
+        DatabaseError: If the underlying DB-API driver raises an error.
+    """
+    logger.debug(f"Fetching {side} database schema structure...")
+
+    with _name_failing_side(side, connector):
+        schema_structure = connector.fetch_schema_structure(jobs=jobs)
+
+    logger.info(f"Fetched {side} database schema structure.")
+    return schema_structure
+
+
+async def fetch_schema_structures_async(
+    source_connector: BaseDBConnector,
+    target_connector: BaseDBConnector,
+    *,
+    jobs: int = 1,
+) -> tuple[dict, dict]:
+    """
+    Fetch the schema structures of the source and target databases at the same time, on the running event loop.
+
+    Connectors built on an asyncio-native driver (e.g. `AsyncOracleConnector`) fetch on the event loop itself,
+    the others fetch in a worker thread, so many comparisons can share one event loop.
+
+    Args:
+        source_connector (BaseDBConnector): The connector for the source database.
+        target_connector (BaseDBConnector): The connector for the target database.
+        jobs (int): How many object types to fetch at the same time within each database.
+
+    Returns:
+        tuple[dict, dict]: The source and target schema structures.
+
+    Raises:
+        DbDriftError: If fetching either side fails. The message names the side that failed.
+    """
+    sides = {
+        "source": source_connector,
+        "target": target_connector,
+    }
+
+    results = await asyncio.gather(
+        *(_fetch_side_async(side, connector, jobs) for side, connector in sides.items()),
+        return_exceptions=True,
+    )
+
+    # Report failures in a stable order (source first) if both sides failed
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    source_structure, target_structure = results
+    return source_structure, target_structure
+
+
+async def _fetch_side_async(side: str, connector: BaseDBConnector, jobs: int) -> dict:
+    """
+    Fetch the schema structure of one side of the comparison on the running event loop.
+
+    Args:
+        side (str): The side being fetched ("source" or "target").
+        connector (BaseDBConnector): The connector for that side.
+        jobs (int): How many object types to fetch at the same time.
+
+    Returns:
+        dict: The schema structure of the database.
+    """
+    logger.debug(f"Fetching {side} database schema structure...")
+
+    with _name_failing_side(side, connector):
+        schema_structure = await connector.fetch_schema_structure_async(jobs=jobs)
+
+    logger.info(f"Fetched {side} database schema structure.")
+    return schema_structure
+
+
+@contextmanager
+def _name_failing_side(side: str, connector: BaseDBConnector) -> Iterator[None]:
+    """
+    Name the side of the comparison in the errors raised while fetching it.
+
+    Args:
+        side (str): The side being fetched ("source" or "target").
+        connector (BaseDBConnector): The connector for that side.
+
+    Raises:
+        DbDriftError: If the connector raises one, with the side prepended to its message.
+        DatabaseError: If the underlying DB-API driver raises an error.
+    """
+    try:
+        yield
+    except DbDriftError as e:
+        # Keep the original exception type (and thus its exit code and suggestions)
+        e.message = f"{side.capitalize()} database: {e.message}"
+        raise
+    except Exception as e:
+        driver_error = getattr(connector.connection_library, "Error", None)
+        if isinstance(driver_error, type) and isinstance(e, driver_error):
+            msg = f"{side.capitalize()} database: {e}"
+            raise DatabaseError(msg, connection_string=connector.connection_string) from e
+
+        logger.error(f"Failed to fetch {side} database schema structure.")  # noqa: TRY400 # The stacktrace is logged in handle_error_and_exit
+        raise
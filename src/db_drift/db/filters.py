@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
+# The escape character of the LIKE patterns built by `glob_to_like`
+LIKE_ESCAPE = "\\"
+
+
+@dataclass(frozen=True)
+class ObjectFilter:
+    """
+    The schemas and object names to compare.
+
+    Connectors turn the filter into conditions of their catalog queries, so that the database only reads
+    and sends the rows of the chosen objects. Names are matched as stored in the catalog (e.g. in upper case
+    for unquoted Oracle identifiers), and object names against glob patterns: `*` matches any characters, `?` a single one.
+    """
+
+    include_schemas: tuple[str, ...] = ()  # Empty to include every schema
+    exclude_schemas: tuple[str, ...] = ()
+    include_names: tuple[str, ...] = ()  # Empty to include every object name
+    exclude_names: tuple[str, ...] = ()
+
+    def matches(self, schema: str, name: str) -> bool:
+        """
+        Check whether an object passes the filter, for objects that are not read with a catalog query.
+
+        Args:
+            schema (str): The schema of the object.
+            name (str): The name of the object.
+
+        Returns:
+            bool: Whether the object is compared.
+        """
+        return (
+            (not self.include_schemas or schema in self.include_schemas)
+            and schema not in self.exclude_schemas
+            and (not self.include_names or any(fnmatchcase(name, escape_glob_classes(pattern)) for pattern in self.include_names))
+            and not any(fnmatchcase(name, escape_glob_classes(pattern)) for pattern in self.exclude_names)
+        )
+
+
+def escape_glob_classes(pattern: str) -> str:
+    """
+    Make the brackets of a glob pattern match literally, for glob implementations that support `[...]` character classes.
+
+    Args:
+        pattern (str): The glob pattern.
+
+    Returns:
+        str: The pattern, with every `[` turned into the single character class `[[]`.
+    """
+    return pattern.replace("[", "[[]")
+
+
+def glob_to_like(pattern: str) -> str:
+    """
+    Translate a glob pattern into a LIKE pattern that uses `LIKE_ESCAPE` as its escape character.
+
+    Args:
+        pattern (str): The glob pattern (`*` for any characters, `?` for a single one).
+
+    Returns:
+        str: The LIKE pattern, with the LIKE wildcards of the glob (`%` and `_`) matched literally.
+    """
+    like_pattern = []
+    for character in pattern:
+        if character in ("%", "_", LIKE_ESCAPE):
+            like_pattern.append(LIKE_ESCAPE + character)
+        elif character == "*":
+            like_pattern.append("%")
+        elif character == "?":
+            like_pattern.append("_")
+        else:
+            like_pattern.append(character)
+    return "".join(like_pattern)
@@ -1,10 +1,14 @@
 from db_drift.db.mappers.constraint_types.base import ConstraintTypeMapper
+from db_drift.db.mappers.constraint_types.mysql import MYSQL_CONSTRAINT_MAPPER
 from db_drift.db.mappers.constraint_types.oracle import ORACLE_CONSTRAINT_MAPPER
+from db_drift.db.mappers.constraint_types.postgresql import POSTGRESQL_CONSTRAINT_MAPPER
 from db_drift.db.mappers.constraint_types.sqlite import SQLITE_CONSTRAINT_MAPPER
 from db_drift.utils.constants import DBConstraintTypeEnum
 
 CONSTRAINT_MAPPER_REGISTRY: dict[str, ConstraintTypeMapper] = {
+    "mysql": MYSQL_CONSTRAINT_MAPPER,
     "oracle": ORACLE_CONSTRAINT_MAPPER,
+    "postgresql": POSTGRESQL_CONSTRAINT_MAPPER,
     "sqlite": SQLITE_CONSTRAINT_MAPPER,
 }
 
@@ -0,0 +1,12 @@
+from db_drift.db.mappers.constraint_types.base import DictConstraintTypeMapper
+from db_drift.utils.constants import DBConstraintTypeEnum
+
+POSTGRESQL_CONSTRAINT_MAPPER = DictConstraintTypeMapper(
+    mapping={
+        "P": DBConstraintTypeEnum.PRIMARY_KEY,
+        "F": DBConstraintTypeEnum.FOREIGN_KEY,
+        "U": DBConstraintTypeEnum.UNIQUE,
+        "C": DBConstraintTypeEnum.CHECK,
+        "X": DBConstraintTypeEnum.EXCLUSION,
+    },
+)
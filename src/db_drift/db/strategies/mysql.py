@@ -0,0 +1,451 @@
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from db_drift.db.filters import ObjectFilter, glob_to_like
+from db_drift.db.mappers.constraint_types.base import ConstraintTypeMapper
+from db_drift.db.strategies.utils import CatalogFetcher, CatalogPlan, CatalogQuery, ExpectedRows
+from db_drift.models import Column, Constraint, Function, Index, StoredProcedure, Table, Trigger, View
+from db_drift.utils.string import intern_identifier
+
+T = TypeVar("T")
+
+# The schemas that come with the server, whose objects are never compared
+SYSTEM_SCHEMAS = ("information_schema", "mysql", "performance_schema", "sys")
+
+# The information_schema.TABLES types of the relations behind each table-like model
+TABLE_TYPE = "BASE TABLE"
+VIEW_TYPE = "VIEW"
+
+# The SHA-256 digest of a text, the same as `hash_body` computes with its default algorithm, so that only digests cross the network
+SQL_DIGEST = "SHA2({}, 256)"
+
+# Turns a catalog plan function into a fetch function that runs on a PyMySQL cursor
+mysql_catalog_plan = CatalogFetcher
+
+
+@dataclass
+class MySQLSchemaScope:
+    """
+    The schemas (databases) whose objects every catalog query reads, and the object names to fetch from them.
+
+    The schemas are resolved once per session and bound into every query, since on MySQL 8 the information_schema
+    views are built from the data dictionary on the fly: without a schema predicate, a query reads the definition of
+    every object on the server, including the system schemas, before filtering any of it out.
+    """
+
+    schemas: list[str] | None = None  # None until resolved
+    object_filter: ObjectFilter = field(default_factory=ObjectFilter)
+
+
+def _resolve_schema_scope(schema_scope: MySQLSchemaScope | None) -> CatalogPlan[MySQLSchemaScope]:
+    """
+    Resolve the schemas of a scope that has not been resolved yet, by reading every schema the object filter lets through.
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        MySQLSchemaScope: The scope, with its schemas resolved.
+    """
+    schema_scope = schema_scope or MySQLSchemaScope()
+    if schema_scope.schemas is None:
+        schema_scope.schemas = yield from fetch_mysql_schemas.plan(object_filter=schema_scope.object_filter)
+    return schema_scope
+
+
+def _schema_filter(schema_scope: MySQLSchemaScope, schema_column: str, name_column: str) -> tuple[str, dict[str, tuple[str, ...] | str]]:
+    """
+    Build the conditions that restrict a catalog query to the schemas of the scope and the object names of its filter.
+
+    Args:
+        schema_scope (MySQLSchemaScope): The resolved schemas to read.
+        schema_column (str): The schema name column.
+        name_column (str): The object name column.
+
+    Returns:
+        tuple[str, dict[str, tuple[str, ...] | str]]: The conditions, joined with AND, and their parameters.
+            The schemas are bound as a tuple, which PyMySQL renders as a list of values. Names are matched with LIKE,
+            whose default escape character is `LIKE_ESCAPE`.
+    """
+    conditions = [f"{schema_column} IN %(schemas)s"]
+    parameters: dict[str, tuple[str, ...] | str] = {"schemas": tuple(schema_scope.schemas or ())}
+    object_filter = schema_scope.object_filter
+
+    # MySQL has no LIKE ANY, so every pattern is bound on its own
+    for bind, patterns, template in (
+        ("included_name", object_filter.include_names, "({})"),
+        ("excluded_name", object_filter.exclude_names, "NOT ({})"),
+    ):
+        if not patterns:
+            continue
+        matches = []
+        for position, pattern in enumerate(patterns):
+            matches.append(f"{name_column} LIKE %({bind}_{position})s")
+            parameters[f"{bind}_{position}"] = glob_to_like(pattern)
+        conditions.append(template.format(" OR ".join(matches)))
+
+    return "\n            AND ".join(conditions), parameters
+
+
+@mysql_catalog_plan
+def fetch_mysql_schemas(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[list[str]]:
+    """
+    Fetch the names of the user schemas (databases) of the MySQL server that the object filter lets through.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas to fetch, or None to fetch all.
+
+    Returns:
+        list[str]: The schema names, in alphabetical order.
+    """
+    object_filter = object_filter or ObjectFilter()
+    parameters: dict[str, tuple[str, ...]] = {"system_schemas": SYSTEM_SCHEMAS}
+    conditions = ["SCHEMA_NAME NOT IN %(system_schemas)s"]
+
+    if object_filter.include_schemas:
+        conditions.append("SCHEMA_NAME IN %(included_schemas)s")
+        parameters["included_schemas"] = object_filter.include_schemas
+    if object_filter.exclude_schemas:
+        conditions.append("SCHEMA_NAME NOT IN %(excluded_schemas)s")
+        parameters["excluded_schemas"] = object_filter.exclude_schemas
+
+    filter_condition = "\n            AND ".join(conditions)
+    select_schemas = f"""
+        SELECT SCHEMA_NAME
+        FROM information_schema.SCHEMATA
+        WHERE {filter_condition}
+        ORDER BY SCHEMA_NAME
+    """
+    schema_rows = yield CatalogQuery(select_schemas, parameters, ExpectedRows.FEW)
+    return [schema for (schema,) in schema_rows]
+
+
+@mysql_catalog_plan
+def fetch_mysql_tables(*, schema_scope: MySQLSchemaScope | None = None) -> CatalogPlan[dict[str, Table]]:
+    """
+    Fetch the tables of the MySQL database, with their columns.
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, Table]: A dictionary of Table objects keyed by "schema.table_name".
+    """
+    return (yield from _fetch_mysql_relations(TABLE_TYPE, Table, schema_scope))
+
+
+@mysql_catalog_plan
+def fetch_mysql_views(*, schema_scope: MySQLSchemaScope | None = None) -> CatalogPlan[dict[str, View]]:
+    """
+    Fetch the views of the MySQL database, with their columns.
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, View]: A dictionary of View objects keyed by "schema.view_name".
+    """
+    return (yield from _fetch_mysql_relations(VIEW_TYPE, View, schema_scope))
+
+
+def _fetch_mysql_relations(table_type: str, model_factory: type[T], schema_scope: MySQLSchemaScope | None) -> CatalogPlan[dict[str, T]]:
+    """
+    Fetch table-like relations and their columns in a single query over information_schema.TABLES and COLUMNS.
+
+    Args:
+        table_type (str): The information_schema.TABLES type of the relations to fetch.
+        model_factory (type[T]): The model of the relations (Table or View).
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, T]: The relations keyed by "schema.relation_name", with their columns in column order.
+    """
+    schema_scope = yield from _resolve_schema_scope(schema_scope)
+    if not schema_scope.schemas:
+        return {}
+
+    filter_condition, filter_parameters = _schema_filter(schema_scope, "t.TABLE_SCHEMA", "t.TABLE_NAME")
+    select_relations = f"""
+        SELECT
+            t.TABLE_SCHEMA,
+            t.TABLE_NAME,
+            -- The comment of every view is "VIEW"
+            CASE WHEN t.TABLE_TYPE = 'BASE TABLE' THEN NULLIF(t.TABLE_COMMENT, '') END,
+            c.COLUMN_NAME,
+            c.COLUMN_TYPE,
+            c.IS_NULLABLE,
+            NULLIF(c.COLUMN_COMMENT, '')
+        FROM information_schema.TABLES t
+            LEFT JOIN information_schema.COLUMNS c
+                ON c.TABLE_SCHEMA = t.TABLE_SCHEMA
+                AND c.TABLE_NAME = t.TABLE_NAME
+                AND c.TABLE_SCHEMA IN %(schemas)s
+        WHERE t.TABLE_TYPE = '{table_type}'
+            AND {filter_condition}
+        ORDER BY t.TABLE_SCHEMA, t.TABLE_NAME, c.ORDINAL_POSITION
+    """
+    relation_rows = yield CatalogQuery(select_relations, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    relations: dict[str, T] = {}
+
+    for schema, relation_name, doc, column_name, data_type, is_nullable, column_doc in relation_rows:
+        key = f"{schema}.{relation_name}"
+        if key not in relations:
+            relations[key] = model_factory(doc=doc, columns={})
+
+        if column_name is not None:  # Relations without columns still get one row
+            relations[key].columns[intern_identifier(column_name)] = Column(
+                doc=column_doc,
+                data_type=intern_identifier(data_type),
+                is_nullable=is_nullable == "YES",
+            )
+
+    return relations
+
+
+@mysql_catalog_plan
+def fetch_mysql_indexes(*, schema_scope: MySQLSchemaScope | None = None) -> CatalogPlan[dict[str, Index]]:
+    """
+    Fetch the indexes of the MySQL database, with their columns.
+
+    Index names are only unique per table in MySQL (every primary key is named PRIMARY),
+    so the indexes are keyed by "schema.table_name.index_name".
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, Index]: A dictionary of Index objects. Functional key parts are named by their expression.
+    """
+    schema_scope = yield from _resolve_schema_scope(schema_scope)
+    if not schema_scope.schemas:
+        return {}
+
+    filter_condition, filter_parameters = _schema_filter(schema_scope, "TABLE_SCHEMA", "INDEX_NAME")
+    select_indexes = f"""
+        SELECT
+            TABLE_SCHEMA,
+            TABLE_NAME,
+            INDEX_NAME,
+            NON_UNIQUE,
+            COALESCE(COLUMN_NAME, EXPRESSION)
+        FROM information_schema.STATISTICS
+        WHERE {filter_condition}
+        ORDER BY TABLE_SCHEMA, TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+    """
+    index_rows = yield CatalogQuery(select_indexes, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    indexes: dict[str, Index] = {}
+
+    for schema, table_name, index_name, non_unique, column in index_rows:
+        # The above query returns one row per indexed column,
+        # so we need to aggregate them into a single Index object.
+        key = f"{schema}.{table_name}.{index_name}"
+        if key not in indexes:
+            indexes[key] = Index(
+                table_name=intern_identifier(table_name),
+                uniqueness="NONUNIQUE" if int(non_unique) else "UNIQUE",
+                columns=set(),
+            )
+
+        indexes[key].columns.add(intern_identifier(column))
+
+    return indexes
+
+
+@mysql_catalog_plan
+def fetch_mysql_constraints(
+    constraint_type_mapper: ConstraintTypeMapper,
+    *,
+    schema_scope: MySQLSchemaScope | None = None,
+) -> CatalogPlan[dict[str, Constraint]]:
+    """
+    Fetch the table constraints of the MySQL database (MySQL 8.0.16 or later, for the conditions of CHECK constraints).
+
+    Primary key and unique constraint names are only unique per table in MySQL,
+    so the constraints are keyed by "schema.table_name.constraint_name".
+
+    Args:
+        constraint_type_mapper (ConstraintTypeMapper): The mapper to convert native constraint types to DBConstraintType.
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+            Constraints are matched on the name of their table.
+
+    Returns:
+        dict[str, Constraint]: A dictionary of Constraint objects representing the constraints in the database.
+    """
+    schema_scope = yield from _resolve_schema_scope(schema_scope)
+    if not schema_scope.schemas:
+        return {}
+
+    filter_condition, filter_parameters = _schema_filter(schema_scope, "tc.TABLE_SCHEMA", "tc.TABLE_NAME")
+    select_constraints = f"""
+        SELECT
+            tc.TABLE_SCHEMA,
+            tc.TABLE_NAME,
+            tc.CONSTRAINT_NAME,
+            tc.CONSTRAINT_TYPE,
+            rc.DELETE_RULE,
+            cc.CHECK_CLAUSE,
+            kcu.COLUMN_NAME
+        FROM information_schema.TABLE_CONSTRAINTS tc
+            LEFT JOIN information_schema.KEY_COLUMN_USAGE kcu
+                ON kcu.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+                AND kcu.TABLE_NAME = tc.TABLE_NAME
+                AND kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+                AND kcu.CONSTRAINT_SCHEMA IN %(schemas)s
+            LEFT JOIN information_schema.REFERENTIAL_CONSTRAINTS rc
+                ON rc.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+                AND rc.TABLE_NAME = tc.TABLE_NAME
+                AND rc.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+                AND rc.CONSTRAINT_SCHEMA IN %(schemas)s
+            LEFT JOIN information_schema.CHECK_CONSTRAINTS cc
+                ON cc.CONSTRAINT_SCHEMA = tc.CONSTRAINT_SCHEMA
+                AND cc.CONSTRAINT_NAME = tc.CONSTRAINT_NAME
+                AND tc.CONSTRAINT_TYPE = 'CHECK'
+                AND cc.CONSTRAINT_SCHEMA IN %(schemas)s
+        WHERE {filter_condition}
+        ORDER BY tc.TABLE_SCHEMA, tc.TABLE_NAME, tc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+    """
+    constraint_rows = yield CatalogQuery(select_constraints, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    constraints: dict[str, Constraint] = {}
+
+    for schema, table_name, constraint_name, constraint_type, delete_rule, condition, column_name in constraint_rows:
+        # The above query returns multiple rows per constraint (one per column),
+        # so we need to aggregate them into a single Constraint object.
+        key = f"{schema}.{table_name}.{constraint_name}"
+        if key not in constraints:
+            constraints[key] = Constraint(
+                table_name=intern_identifier(table_name),
+                constraint_type=constraint_type_mapper.map(constraint_type),
+                rule=delete_rule,
+                condition=condition,
+                columns=set(),
+            )
+
+        if column_name:  # CHECK constraints list no columns
+            constraints[key].columns.add(intern_identifier(column_name))
+
+    return constraints
+
+
+@mysql_catalog_plan
+def fetch_mysql_triggers(*, schema_scope: MySQLSchemaScope | None = None) -> CatalogPlan[dict[str, Trigger]]:
+    """
+    Fetch the triggers of the MySQL database.
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, Trigger]: A dictionary of Trigger objects keyed by "schema.trigger_name", whose body is the digest of the trigger statement.
+    """
+    schema_scope = yield from _resolve_schema_scope(schema_scope)
+    if not schema_scope.schemas:
+        return {}
+
+    filter_condition, filter_parameters = _schema_filter(schema_scope, "TRIGGER_SCHEMA", "TRIGGER_NAME")
+    select_triggers = f"""
+        SELECT
+            TRIGGER_SCHEMA,
+            TRIGGER_NAME,
+            EVENT_OBJECT_TABLE,
+            ACTION_TIMING,
+            EVENT_MANIPULATION,
+            {SQL_DIGEST.format("ACTION_STATEMENT")}
+        FROM information_schema.TRIGGERS
+        WHERE {filter_condition}
+        ORDER BY TRIGGER_SCHEMA, TRIGGER_NAME
+    """
+    trigger_rows = yield CatalogQuery(select_triggers, filter_parameters, ExpectedRows.ONE_PER_OBJECT)
+    return {
+        f"{schema}.{trigger_name}": Trigger(body=digest, definition=f"{timing} {event} ON {table_name}")
+        for schema, trigger_name, table_name, timing, event, digest in trigger_rows
+    }
+
+
+@mysql_catalog_plan
+def fetch_mysql_functions(*, schema_scope: MySQLSchemaScope | None = None) -> CatalogPlan[dict[str, Function]]:
+    """
+    Fetch the stored functions of the MySQL database.
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, Function]: A dictionary of Function objects keyed by "schema.function_name".
+    """
+    return (yield from _fetch_mysql_routines("FUNCTION", Function, schema_scope))
+
+
+@mysql_catalog_plan
+def fetch_mysql_stored_procedures(*, schema_scope: MySQLSchemaScope | None = None) -> CatalogPlan[dict[str, StoredProcedure]]:
+    """
+    Fetch the stored procedures of the MySQL database.
+
+    Args:
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, StoredProcedure]: A dictionary of StoredProcedure objects keyed by "schema.procedure_name".
+    """
+    return (yield from _fetch_mysql_routines("PROCEDURE", StoredProcedure, schema_scope))
+
+
+def _fetch_mysql_routines(routine_type: str, model_factory: type[T], schema_scope: MySQLSchemaScope | None) -> CatalogPlan[dict[str, T]]:
+    """
+    Fetch the functions or procedures of the database and their parameters in a single query over ROUTINES and PARAMETERS.
+
+    The routine body is hashed in the database, so only its digest crosses the network.
+
+    Args:
+        routine_type (str): The ROUTINES type of the routines to fetch ("FUNCTION" or "PROCEDURE").
+        model_factory (type[T]): The model of the routines (Function or StoredProcedure).
+        schema_scope (MySQLSchemaScope | None): The schemas to read, if already resolved for this session.
+
+    Returns:
+        dict[str, T]: The routines keyed by "schema.routine_name", as MySQL routines cannot be overloaded.
+    """
+    schema_scope = yield from _resolve_schema_scope(schema_scope)
+    if not schema_scope.schemas:
+        return {}
+
+    filter_condition, filter_parameters = _schema_filter(schema_scope, "r.ROUTINE_SCHEMA", "r.ROUTINE_NAME")
+    select_routines = f"""
+        SELECT
+            r.ROUTINE_SCHEMA,
+            r.ROUTINE_NAME,
+            r.DTD_IDENTIFIER,
+            {SQL_DIGEST.format("r.ROUTINE_DEFINITION")},
+            p.PARAMETER_MODE,
+            p.PARAMETER_NAME,
+            p.DTD_IDENTIFIER
+        FROM information_schema.ROUTINES r
+            LEFT JOIN information_schema.PARAMETERS p
+                ON p.SPECIFIC_SCHEMA = r.ROUTINE_SCHEMA
+                AND p.SPECIFIC_NAME = r.SPECIFIC_NAME
+                AND p.ROUTINE_TYPE = r.ROUTINE_TYPE
+                AND p.ORDINAL_POSITION > 0 -- Position 0 is the return value of a function
+                AND p.SPECIFIC_SCHEMA IN %(schemas)s
+        WHERE r.ROUTINE_TYPE = '{routine_type}'
+            AND {filter_condition}
+        ORDER BY r.ROUTINE_SCHEMA, r.ROUTINE_NAME, p.ORDINAL_POSITION
+    """
+    routine_rows = yield CatalogQuery(select_routines, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    routines: dict[str, tuple[str | None, str, list[str]]] = {}
+
+    for schema, routine_name, result, digest, parameter_mode, parameter_name, parameter_type in routine_rows:
+        # The above query returns one row per parameter,
+        # so we need to aggregate them before building the routine.
+        key = f"{schema}.{routine_name}"
+        if key not in routines:
+            routines[key] = (result, digest, [])
+
+        if parameter_name is not None:  # Routines without parameters still get one row
+            mode = f"{parameter_mode} " if parameter_mode else ""  # Function parameters have no mode
+            routines[key][2].append(f"{mode}{parameter_name} {parameter_type}")
+
+    return {
+        key: model_factory(
+            body=digest,
+            definition=f"({', '.join(parameters)})" + (f" RETURNS {result}" if result else ""),  # Procedures return nothing
+        )
+        for key, (result, digest, parameters) in routines.items()
+    }
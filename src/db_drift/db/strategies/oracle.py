@@ -1,7 +1,14 @@
-from oracledb import cursor
-from sqlalchemy import Row
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
 
+from oracledb import LOB, DbObjectType, cursor
+
+from db_drift.db.filters import LIKE_ESCAPE, ObjectFilter, glob_to_like
 from db_drift.db.mappers.constraint_types.base import ConstraintTypeMapper
+from db_drift.db.strategies.utils import CatalogFetcher, CatalogPlan, CatalogQuery, ExpectedRows
 from db_drift.models import (
     Column,
     Constraint,
@@ -23,20 +30,365 @@ from db_drift.models import (
     Type,
     View,
 )
-from db_drift.utils.string import hash_body
+from db_drift.utils.constants import HashAlgorithm, OracleDDLSource
+from db_drift.utils.string import hash_bodies, hash_body, intern_identifier
+
+if TYPE_CHECKING:
+    from sqlalchemy import Row
+
+# PL/SQL helpers declared in the WITH clause of a query (Oracle 12c+) to hash DDL on the server.
+# DBMS_CRYPTO hashes CLOBs in AL32UTF8, which matches `hash_body` with SHA-256 (over the UTF-8 encoded DDL), the only algorithm used here.
+# They require the EXECUTE privilege on SYS.DBMS_CRYPTO.
+SERVER_SIDE_DDL_DIGEST_FUNCTIONS = """
+    WITH
+        FUNCTION ddl_digest(p_ddl CLOB) RETURN VARCHAR2 IS
+        BEGIN
+            IF p_ddl IS NULL OR dbms_lob.getlength(p_ddl) = 0 THEN
+                RETURN NULL;
+            END IF;
+            RETURN LOWER(RAWTOHEX(dbms_crypto.hash(p_ddl, dbms_crypto.hash_sh256)));
+        END;
+        FUNCTION package_ddl_digests(p_ddl CLOB, p_package_name VARCHAR2) RETURN VARCHAR2 IS
+            -- Same split as the client-side path: the package specification ends with "END package_name;"
+            l_splitter VARCHAR2(300) := 'END ' || LOWER(p_package_name) || ';';
+            l_split_at INTEGER := dbms_lob.instr(p_ddl, l_splitter);
+            l_spec_length INTEGER;
+            l_spec CLOB;
+            l_body CLOB;
+        BEGIN
+            IF l_split_at IS NULL OR l_split_at = 0 THEN
+                RETURN ddl_digest(p_ddl) || ',';
+            END IF;
+            l_spec_length := l_split_at + LENGTH(l_splitter) - 1;
+            dbms_lob.createtemporary(l_spec, TRUE, dbms_lob.call);
+            dbms_lob.createtemporary(l_body, TRUE, dbms_lob.call);
+            dbms_lob.copy(l_spec, p_ddl, l_spec_length, 1, 1);
+            IF dbms_lob.getlength(p_ddl) > l_spec_length THEN
+                dbms_lob.copy(l_body, p_ddl, dbms_lob.getlength(p_ddl) - l_spec_length, 1, l_spec_length + 1);
+            END IF;
+            RETURN ddl_digest(l_spec) || ',' || ddl_digest(l_body);
+        END;
+        FUNCTION source_digest(p_owner VARCHAR2, p_name VARCHAR2, p_type VARCHAR2, p_other_type VARCHAR2 DEFAULT NULL) RETURN VARCHAR2 IS
+            -- Rebuilds the source of a unit from ALL_SOURCE (e.g. 'TYPE' followed by 'TYPE BODY') and hashes it
+            l_source CLOB;
+        BEGIN
+            dbms_lob.createtemporary(l_source, TRUE, dbms_lob.call);
+            FOR source_line IN (
+                SELECT text
+                FROM all_source
+                WHERE owner = p_owner
+                    AND name = p_name
+                    AND type IN (p_type, p_other_type)
+                ORDER BY type, line
+            ) LOOP
+                IF source_line.text IS NOT NULL THEN
+                    dbms_lob.writeappend(l_source, LENGTH(source_line.text), source_line.text);
+                END IF;
+            END LOOP;
+            RETURN ddl_digest(l_source);
+        END;
+"""
+
+
+# Largest value a PL/SQL function can return to SQL as a VARCHAR2 with the default MAX_STRING_SIZE = STANDARD
+MAX_SQL_VARCHAR2_BYTES = 4000
+
+# LONG columns (such as ALL_TRIGGERS.TRIGGER_BODY) are fetched one row per round-trip, without array prefetch.
+# PL/SQL can read a LONG into a VARCHAR2, so this helper (declared in the WITH clause of a query, Oracle 12c+)
+# hands the trigger body back to SQL as a VARCHAR2, which is array fetched like any other column.
+# It returns NULL for bodies that do not fit in a SQL VARCHAR2; only those are fetched as LONG.
+# The array fetch is not free on the server: every trigger row costs a switch to PL/SQL and a lookup of its row
+# in ALL_TRIGGERS. The LONG fallback is therefore fetched by name, without calling the function again.
+TRIGGER_BODY_AS_VARCHAR2_FUNCTION = f"""
+    WITH
+        FUNCTION trigger_body_vc(p_owner VARCHAR2, p_trigger_name VARCHAR2) RETURN VARCHAR2 IS
+            l_body VARCHAR2(32767);
+        BEGIN
+            SELECT trigger_body
+            INTO l_body
+            FROM all_triggers
+            WHERE owner = p_owner
+                AND trigger_name = p_trigger_name;
+            IF LENGTHB(l_body) > {MAX_SQL_VARCHAR2_BYTES} THEN
+                RETURN NULL;
+            END IF;
+            RETURN l_body;
+        EXCEPTION
+            WHEN VALUE_ERROR THEN  -- Longer than a PL/SQL VARCHAR2
+                RETURN NULL;
+        END;
+"""
+
+
+# DDL is returned as a CLOB, and every CLOB fetched as a LOB locator costs a round-trip (or more) to read.
+# This helper (declared in the WITH clause of a query, Oracle 12c+) hands DDL that fits in a SQL VARCHAR2 back as one,
+# which is fetched inline with its row. It returns NULL for longer DDL; only that is fetched as a LOB, and read in chunks.
+DDL_AS_VARCHAR2_FUNCTION = f"""
+    WITH
+        FUNCTION ddl_vc(p_ddl CLOB) RETURN VARCHAR2 IS
+            l_ddl VARCHAR2(32767);
+        BEGIN
+            IF p_ddl IS NULL OR dbms_lob.getlength(p_ddl) > {MAX_SQL_VARCHAR2_BYTES} THEN
+                RETURN NULL;
+            END IF;
+            l_ddl := dbms_lob.substr(p_ddl, {MAX_SQL_VARCHAR2_BYTES}, 1);
+            IF LENGTHB(l_ddl) > {MAX_SQL_VARCHAR2_BYTES} THEN
+                RETURN NULL;
+            END IF;
+            RETURN l_ddl;
+        END;
+"""
+
+# LOBs are read in pieces of at most this many characters, in a whole number of their chunks, and hashed piece by piece.
+# The DDL of a generated package can run to tens of MB, which would otherwise be held in memory twice (as text and as UTF-8).
+LOB_READ_LENGTH = 256 * 1024
+
+
+# The ALL_SOURCE types that make up each hashed part of an object, per object type.
+# Parts are hashed over the concatenated source of their types, in this order.
+ALL_SOURCE_PARTS: dict[str, dict[str, tuple[str, ...]]] = {
+    "FUNCTION": {"body": ("FUNCTION",)},
+    "PROCEDURE": {"body": ("PROCEDURE",)},
+    "TYPE": {"body": ("TYPE", "TYPE BODY")},
+    "PACKAGE": {"definition": ("PACKAGE",), "body": ("PACKAGE BODY",)},
+}
+
+
+# The collection type that lists of names (e.g. the excluded owners) are bound as. It is available in every Oracle database.
+NAME_LIST_TYPE = "SYS.ODCIVARCHAR2LIST"
+EXCLUDED_OWNERS_BIND = "excluded_owners"
+CHANGED_OBJECTS_BIND = "changed_objects"
+INCLUDED_SCHEMAS_BIND = "included_schemas"
+EXCLUDED_SCHEMAS_BIND = "excluded_schemas"
+INCLUDED_NAMES_BIND = "included_names"
+EXCLUDED_NAMES_BIND = "excluded_names"
+LONG_TRIGGERS_BIND = "long_triggers"
+
+
+@dataclass
+class OracleOwnerScope:
+    """
+    The owners (schemas) whose objects are left out of every catalog query, and optionally the only objects to fetch.
+
+    Besides the Oracle-maintained users, the queries only read the schemas and object names chosen by `object_filter`.
+
+    The owners are resolved once per session and bound into every query as a collection,
+    instead of every query filtering out the Oracle-maintained users with a subquery of its own.
+    The excluded (rather than the included) owners are bound, since objects can belong to owners
+    that are not listed in ALL_USERS (e.g. PUBLIC synonyms).
+    """
+
+    excluded_owners: list[str] | None = None  # None until resolved
+    # "owner.object_name" of the only objects to fetch (e.g. those whose DDL changed since the last run), None to fetch all.
+    # Only applies to the object types whose catalog views can be matched with ALL_OBJECTS.
+    changed_objects: list[str] | None = None
+    object_filter: ObjectFilter = field(default_factory=ObjectFilter)
+
+
+@dataclass(frozen=True)
+class NameList:
+    """A list of names to bind into a catalog query, as a `NAME_LIST_TYPE` collection."""
+
+    names: tuple[str, ...]
+
+
+def _owner_filter(
+    owner_scope: OracleOwnerScope | None,
+    column: str,
+    name_column: str | None = None,
+    *,
+    incremental: bool = True,
+) -> str:
+    """
+    Build the condition that leaves the objects of the excluded owners, and those left out by the object filter, out of a query.
+
+    Args:
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the query, if already resolved for this session.
+        column (str): The owner column to filter on.
+        name_column (str | None): The object name column, to match the object name patterns of the filter on
+            and to restrict the query to the changed objects of the scope (if any).
+        incremental (bool): Whether the query can be restricted to the changed objects. False for the object types
+            that are always fetched in full.
+
+    Returns:
+        str: The condition, which uses the bind variables of `_owner_binds` once the owners are resolved.
+    """
+    condition = _excluded_owners_filter(owner_scope, column)
+    if owner_scope is None:
+        return condition
+
+    object_filter = owner_scope.object_filter
+    if object_filter.include_schemas:
+        condition += f"\n            AND {column} IN (SELECT column_value FROM TABLE(:{INCLUDED_SCHEMAS_BIND}))"
+    if object_filter.exclude_schemas:
+        condition += f"\n            AND {column} NOT IN (SELECT column_value FROM TABLE(:{EXCLUDED_SCHEMAS_BIND}))"
+
+    if name_column and object_filter.include_names:
+        condition += (
+            f"\n            AND EXISTS (SELECT 1 FROM TABLE(:{INCLUDED_NAMES_BIND}) WHERE {name_column} LIKE column_value ESCAPE '{LIKE_ESCAPE}')"
+        )
+    if name_column and object_filter.exclude_names:
+        condition += (
+            f"\n            AND NOT EXISTS (SELECT 1 FROM TABLE(:{EXCLUDED_NAMES_BIND}) WHERE {name_column} LIKE column_value ESCAPE '{LIKE_ESCAPE}')"
+        )
+
+    if name_column and incremental and owner_scope.changed_objects is not None:
+        condition += f"\n            AND {column} || '.' || {name_column} IN (SELECT column_value FROM TABLE(:{CHANGED_OBJECTS_BIND}))"
+
+    return condition
+
+
+def _excluded_owners_filter(owner_scope: OracleOwnerScope | None, column: str) -> str:
+    """
+    Build the condition that leaves the objects of the Oracle-maintained users out of a query.
+
+    Used on its own for the owners of the objects that other objects refer to (e.g. the table of a trigger),
+    which the object filter does not apply to.
+
+    Args:
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the query, if already resolved for this session.
+        column (str): The owner column to filter on.
+
+    Returns:
+        str: The condition, which uses the excluded owners bind variable once the owners are resolved.
+    """
+    if owner_scope is None or owner_scope.excluded_owners is None:
+        return f"""{column} NOT IN (
+                SELECT DISTINCT username
+                FROM all_users
+                WHERE ORACLE_MAINTAINED = 'Y'
+            )"""
+    return f"{column} NOT IN (SELECT column_value FROM TABLE(:{EXCLUDED_OWNERS_BIND}))"
+
+
+def _owner_binds(owner_scope: OracleOwnerScope | None, statement: str) -> dict[str, NameList] | None:
+    """
+    Build the bind parameters for the conditions of `_owner_filter`.
+
+    Args:
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the query, if already resolved for this session.
+        statement (str): The query, since only the bind variables it uses can be bound.
+
+    Returns:
+        dict[str, NameList] | None: The owners, object name patterns and changed objects used by the query, or None if it uses none.
+    """
+    if owner_scope is None:
+        return None
+
+    object_filter = owner_scope.object_filter
+    names = {
+        EXCLUDED_OWNERS_BIND: owner_scope.excluded_owners,
+        CHANGED_OBJECTS_BIND: owner_scope.changed_objects,
+        INCLUDED_SCHEMAS_BIND: object_filter.include_schemas,
+        EXCLUDED_SCHEMAS_BIND: object_filter.exclude_schemas,
+        INCLUDED_NAMES_BIND: [glob_to_like(pattern) for pattern in object_filter.include_names],
+        EXCLUDED_NAMES_BIND: [glob_to_like(pattern) for pattern in object_filter.exclude_names],
+    }
+    binds = {bind: NameList(tuple(values)) for bind, values in names.items() if values is not None and f":{bind}" in statement}
+    return binds or None
+
+
+def bind_name_lists(parameters: tuple | dict | None, name_list_type: DbObjectType) -> tuple | dict | None:
+    """
+    Turn the owner lists in the parameters of a catalog query into collections the driver can bind.
+
+    Args:
+        parameters (tuple | dict | None): The parameters of the query.
+        name_list_type (DbObjectType): The `NAME_LIST_TYPE` collection type, as looked up on the connection of the query.
+
+    Returns:
+        tuple | dict | None: The parameters, with every `NameList` replaced by a collection.
+    """
+    if not isinstance(parameters, dict):
+        return parameters
+
+    return {name: name_list_type.newobject(list(value.names)) if isinstance(value, NameList) else value for name, value in parameters.items()}
+
+
+def _bind_parameters(cursor: cursor.Cursor, parameters: tuple | dict | None) -> tuple | dict | None:
+    """
+    Turn the owner lists in the parameters of a catalog query into collections, on the connection of a blocking cursor.
+
+    Args:
+        cursor (cursor.Cursor): The Oracle database cursor the query runs on.
+        parameters (tuple | dict | None): The parameters of the query.
+
+    Returns:
+        tuple | dict | None: The parameters, with every `NameList` replaced by a collection.
+    """
+    if not isinstance(parameters, dict) or not any(isinstance(value, NameList) for value in parameters.values()):
+        return parameters
+
+    # The driver caches the type per connection, so only the first lookup costs a round-trip
+    return bind_name_lists(parameters, cursor.connection.gettype(NAME_LIST_TYPE))
+
+
+# Turns a catalog plan function into a fetch function that runs on an Oracle cursor
+oracle_catalog_plan = partial(CatalogFetcher, bind_parameters=_bind_parameters)
 
 
-def fetch_oracle_tables(cursor: cursor.Cursor) -> dict[str, Table]:
+@oracle_catalog_plan
+def resolve_oracle_excluded_owners() -> CatalogPlan[list[str]]:
+    """
+    Fetch the Oracle-maintained users, whose objects are left out of the comparison.
+
+    Returns:
+        list[str]: The names of the Oracle-maintained users.
+    """
+    select_excluded_owners = """
+        SELECT username
+        FROM all_users
+        WHERE ORACLE_MAINTAINED = 'Y'
+        ORDER BY username
+    """
+    owner_rows = yield CatalogQuery(select_excluded_owners, expected_rows=ExpectedRows.FEW)
+    return [row[0] for row in owner_rows]
+
+
+@oracle_catalog_plan
+def fetch_oracle_ddl_times(object_types: Iterable[str], *, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, dict[str, str]]]:
+    """
+    Fetch when the DDL of every object of the given types last changed, from ALL_OBJECTS.LAST_DDL_TIME.
+
+    Args:
+        object_types (Iterable[str]): The ALL_OBJECTS object types to fetch (e.g. "TABLE", "PACKAGE BODY").
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the query, if already resolved for this session.
+
+    Returns:
+        dict[str, dict[str, str]]: The last DDL time of every object (as "YYYY-MM-DDTHH24:MI:SS"), keyed by object type
+            and then by "owner.object_name".
+    """
+    select_ddl_times = f"""
+        SELECT
+            object_type,
+            owner,
+            object_name,
+            TO_CHAR(last_ddl_time, 'YYYY-MM-DD"T"HH24:MI:SS')
+        FROM all_objects
+        WHERE object_type IN ({", ".join(f"'{object_type}'" for object_type in object_types)})
+            AND object_name NOT LIKE '%$%'
+            AND {_owner_filter(owner_scope, "owner", "object_name", incremental=False)}
+    """
+    ddl_time_rows = yield CatalogQuery(select_ddl_times, _owner_binds(owner_scope, select_ddl_times), ExpectedRows.ONE_PER_OBJECT)
+
+    ddl_times: dict[str, dict[str, str]] = defaultdict(dict)
+    for object_type, owner, object_name, last_ddl_time in ddl_time_rows:
+        ddl_times[object_type][f"{owner}.{object_name}"] = last_ddl_time
+    return dict(ddl_times)
+
+
+@oracle_catalog_plan
+def fetch_oracle_tables(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, Table]]:
     """
     Fetch the list of tables from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Table]: A dictionary of Table objects representing the tables in the database, keyed by "owner.table_name".
     """
-    table_rows = _get_table_like_obj_list("TABLE", cursor)
+    table_rows = yield from _get_table_like_obj_list("TABLE", owner_scope)
     tables: dict[str, Table] = {
         f"{row[2]}.{row[0]}": Table(
             doc=row[1],
@@ -45,31 +397,32 @@ def fetch_oracle_tables(cursor: cursor.Cursor) -> dict[str, Table]:
         for row in table_rows
     }
 
-    column_rows = _get_column_list("TABLE", cursor)
+    column_rows = yield from _get_column_list("TABLE", owner_scope)
     for col in column_rows:
         table_name = f"{col[3]}.{col[0]}"
         # This assumes that all columns belong to fetched tables and skips others
         if table_name in tables:
-            tables[table_name].columns[col[1]] = Column(
+            tables[table_name].columns[intern_identifier(col[1])] = Column(
                 doc=col[2],
-                data_type=col[4],  # TODO @dyka3773: Add length/precision info from col[6] if needed  # noqa: FIX002
+                data_type=intern_identifier(col[4]),  # TODO @dyka3773: Add length/precision info from col[6] if needed  # noqa: FIX002
                 is_nullable=(col[5] == "Y"),  # Oracle uses 'Y'/'N' for nullable
             )
 
     return tables
 
 
-def fetch_oracle_views(cursor: cursor.Cursor) -> dict[str, View]:
+@oracle_catalog_plan
+def fetch_oracle_views(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, View]]:
     """
     Fetch the list of views from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, View]: A dictionary of View objects representing the views in the database, keyed by "owner.view_name".
     """
-    view_rows = _get_table_like_obj_list("VIEW", cursor)
+    view_rows = yield from _get_table_like_obj_list("VIEW", owner_scope)
     views: dict[str, View] = {
         f"{row[2]}.{row[0]}": View(
             doc=row[1],
@@ -78,30 +431,30 @@ def fetch_oracle_views(cursor: cursor.Cursor) -> dict[str, View]:
         for row in view_rows
     }
 
-    column_rows = _get_column_list("VIEW", cursor)
+    column_rows = yield from _get_column_list("VIEW", owner_scope)
     for col in column_rows:
         view_name = f"{col[3]}.{col[0]}"
         # This assumes that all columns belong to fetched views and skips others
         if view_name in views:
-            views[view_name].columns[col[1]] = Column(
+            views[view_name].columns[intern_identifier(col[1])] = Column(
                 doc=col[2],
-                data_type=col[4],  # TODO @dyka3773: Add length/precision info from col[6] if needed  # noqa: FIX002
+                data_type=intern_identifier(col[4]),  # TODO @dyka3773: Add length/precision info from col[6] if needed  # noqa: FIX002
                 is_nullable=(col[5] == "Y"),  # Oracle uses 'Y'/'N' for nullable
             )
 
     return views
 
 
-def _get_table_like_obj_list(obj: str, cursor: cursor.Cursor) -> list[Row]:
+def _get_table_like_obj_list(obj: str, owner_scope: OracleOwnerScope | None) -> CatalogPlan[Iterable["Row"]]:
     """
     Fetch table-like objects (tables, views) from the Oracle database.
 
     Args:
         obj (str): The type of object to fetch ("TABLE" or "VIEW").
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
-        list[Row]: A list of rows representing the table or view objects.
+        Iterable[Row]: The rows representing the table or view objects.
     """
     select_obj = f"""
         SELECT
@@ -111,27 +464,22 @@ def _get_table_like_obj_list(obj: str, cursor: cursor.Cursor) -> list[Row]:
         FROM all_tab_comments
         WHERE table_name NOT LIKE '%$%'
             AND table_type = '{obj}'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "table_name")}
         ORDER BY owner, table_name
     """
-    cursor.execute(select_obj)
-    return cursor.fetchall()
+    return (yield CatalogQuery(select_obj, _owner_binds(owner_scope, select_obj), ExpectedRows.ONE_PER_OBJECT))
 
 
-def _get_column_list(object_type: str, cursor: cursor.Cursor) -> list[Row]:
+def _get_column_list(object_type: str, owner_scope: OracleOwnerScope | None) -> CatalogPlan[Iterable["Row"]]:
     """
     Fetch columns for a given object type from the Oracle database.
 
     Args:
         object_type (str): The type of object to fetch columns for ("TABLE" or "VIEW").
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
-        list[Row]: A list of rows representing the columns for the specified object type.
+        Iterable[Row]: The rows representing the columns for the specified object type.
     """
     select_columns = f"""
         SELECT
@@ -152,44 +500,35 @@ def _get_column_list(object_type: str, cursor: cursor.Cursor) -> list[Row]:
             FROM all_catalog
             WHERE table_type = '{object_type}'
                 AND table_name NOT LIKE '%$%'
-                AND owner NOT IN (
-                    SELECT DISTINCT username
-                    FROM all_users
-                    WHERE ORACLE_MAINTAINED = 'Y'
-                )
+                AND {_owner_filter(owner_scope, "owner", "table_name")}
         )
         ORDER BY atcc.owner, atcc.table_name, atcc.column_name
     """
-    cursor.execute(select_columns)
-    return cursor.fetchall()
+    return (yield CatalogQuery(select_columns, _owner_binds(owner_scope, select_columns), ExpectedRows.MANY_PER_OBJECT))
 
 
-def fetch_oracle_materialized_views(cursor: cursor.Cursor) -> dict[str, MaterializedView]:
+@oracle_catalog_plan
+def fetch_oracle_materialized_views(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, MaterializedView]]:
     """
     Fetch the list of materialized views from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, MaterializedView]: A dictionary of MaterializedView objects representing the materialized views in the database.
     """
-    select_mv = """
+    select_mv = f"""
         SELECT
             mview_name,
             comments,
             owner
         FROM all_mview_comments
         WHERE mview_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "mview_name")}
         ORDER BY owner, mview_name
     """
-    cursor.execute(select_mv)
-    mv_rows = cursor.fetchall()
+    mv_rows = yield CatalogQuery(select_mv, _owner_binds(owner_scope, select_mv), ExpectedRows.ONE_PER_OBJECT)
     mviews: dict[str, MaterializedView] = {
         f"{row[2]}.{row[0]}": MaterializedView(
             doc=row[1],
@@ -198,7 +537,7 @@ def fetch_oracle_materialized_views(cursor: cursor.Cursor) -> dict[str, Material
         for row in mv_rows
     }
 
-    select_mv_columns = """
+    select_mv_columns = f"""
         SELECT
             table_name,
             column_name,
@@ -209,23 +548,18 @@ def fetch_oracle_materialized_views(cursor: cursor.Cursor) -> dict[str, Material
             SELECT mview_name
             FROM all_mviews
             WHERE mview_name NOT LIKE '%$%'
-                AND owner NOT IN (
-                    SELECT DISTINCT username
-                    FROM all_users
-                    WHERE ORACLE_MAINTAINED = 'Y'
-                )
+                AND {_owner_filter(owner_scope, "owner", "mview_name")}
         )
         ORDER BY owner, table_name, column_name
     """
 
-    cursor.execute(select_mv_columns)
-    mv_column_rows = cursor.fetchall()
+    mv_column_rows = yield CatalogQuery(select_mv_columns, _owner_binds(owner_scope, select_mv_columns), ExpectedRows.MANY_PER_OBJECT)
 
     for col in mv_column_rows:
         mv_name = f"{col[3]}.{col[0]}"
         # This assumes that all columns belong to fetched materialized views and skips others
         if mv_name in mviews:
-            mviews[mv_name].columns[col[1]] = Column(
+            mviews[mv_name].columns[intern_identifier(col[1])] = Column(
                 doc=col[2],
                 data_type="",  # Data type info not fetched here
                 is_nullable=None,  # Nullability info not fetched here
@@ -234,13 +568,11 @@ def fetch_oracle_materialized_views(cursor: cursor.Cursor) -> dict[str, Material
     return mviews
 
 
-def fetch_oracle_editions(cursor: cursor.Cursor) -> dict[str, Edition]:
+@oracle_catalog_plan
+def fetch_oracle_editions() -> CatalogPlan[dict[str, Edition]]:
     """
     Fetch all editions stored in the database available to the user.
 
-    Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
-
     Returns:
         dict[str, Edition]: A dictionary of Edition objects representing the editions in the database.
     """
@@ -254,8 +586,7 @@ def fetch_oracle_editions(cursor: cursor.Cursor) -> dict[str, Edition]:
         WHERE aec.edition_name NOT LIKE '%$%'
         ORDER BY aec.edition_name
     """
-    cursor.execute(select_editions)
-    edition_rows = cursor.fetchall()
+    edition_rows = yield CatalogQuery(select_editions, expected_rows=ExpectedRows.FEW)
     editions: dict[str, Edition] = {
         row[0]: Edition(
             doc=row[1],
@@ -267,17 +598,18 @@ def fetch_oracle_editions(cursor: cursor.Cursor) -> dict[str, Edition]:
     return editions
 
 
-def fetch_oracle_mining_models(cursor: cursor.Cursor) -> dict[str, MiningModel]:
+@oracle_catalog_plan
+def fetch_oracle_mining_models(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, MiningModel]]:
     """
     Fetch the list of mining models from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, MiningModel]: A dictionary of MiningModel objects representing the mining models in the database.
     """
-    select_models = """
+    select_models = f"""
         SELECT
             owner,
             model_name,
@@ -286,15 +618,10 @@ def fetch_oracle_mining_models(cursor: cursor.Cursor) -> dict[str, MiningModel]:
             model_size
         FROM all_mining_models
         WHERE model_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "model_name")}
         ORDER BY owner, model_name
     """
-    cursor.execute(select_models)
-    model_rows = cursor.fetchall()
+    model_rows = yield CatalogQuery(select_models, _owner_binds(owner_scope, select_models), ExpectedRows.FEW)
     mining_models: dict[str, MiningModel] = {
         f"{row[0]}.{row[1]}": MiningModel(
             doc=row[2],
@@ -305,33 +632,29 @@ def fetch_oracle_mining_models(cursor: cursor.Cursor) -> dict[str, MiningModel]:
     return mining_models
 
 
-def fetch_oracle_indextypes(cursor: cursor.Cursor) -> dict[str, IndexType]:
+@oracle_catalog_plan
+def fetch_oracle_indextypes(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, IndexType]]:
     """
     Fetch the list of indextypes from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, IndexType]: A dictionary of IndexType objects representing the indextypes in the database.
     """
-    select_indextypes = """
+    select_indextypes = f"""
         SELECT
             aitc.owner,
             aitc.indextype_name,
             aitc.comments
         FROM all_indextype_comments aitc
         WHERE aitc.indextype_name NOT LIKE '%$%'
-            AND aitc.owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "aitc.owner", "aitc.indextype_name")}
         ORDER BY aitc.owner, aitc.indextype_name
     """
 
-    cursor.execute(select_indextypes)
-    indextype_rows = cursor.fetchall()
+    indextype_rows = yield CatalogQuery(select_indextypes, _owner_binds(owner_scope, select_indextypes), ExpectedRows.FEW)
     indextypes: dict[str, IndexType] = {
         f"{row[0]}.{row[1]}": IndexType(
             doc=row[2],
@@ -342,33 +665,29 @@ def fetch_oracle_indextypes(cursor: cursor.Cursor) -> dict[str, IndexType]:
     return indextypes
 
 
-def fetch_oracle_operators(cursor: cursor.Cursor) -> dict[str, Operator]:
+@oracle_catalog_plan
+def fetch_oracle_operators(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, Operator]]:
     """
     Fetch the list of operators from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Operator]: A dictionary of Operator objects representing the operators in the database.
     """
-    select_operators = """
+    select_operators = f"""
         SELECT
             owner,
             operator_name,
             comments
         FROM all_operator_comments
         WHERE operator_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "operator_name")}
         ORDER BY owner, operator_name
     """
 
-    cursor.execute(select_operators)
-    operator_rows = cursor.fetchall()
+    operator_rows = yield CatalogQuery(select_operators, _owner_binds(owner_scope, select_operators), ExpectedRows.FEW)
     operators: dict[str, Operator] = {
         f"{row[0]}.{row[1]}": Operator(
             doc=row[2],
@@ -379,63 +698,84 @@ def fetch_oracle_operators(cursor: cursor.Cursor) -> dict[str, Operator]:
     return operators
 
 
-def fetch_oracle_triggers(cursor: cursor.Cursor) -> dict[str, Trigger]:
+@oracle_catalog_plan
+def fetch_oracle_triggers(
+    *,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, Trigger]]:
     """
     Fetch the list of triggers from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the trigger bodies with.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Trigger]: A dictionary of Trigger objects representing the triggers in the database.
     """
-    select_triggers = """
+    trigger_filter = f"""
+        trigger_name NOT LIKE '%$%'
+            AND {_owner_filter(owner_scope, "owner", "trigger_name")}
+            AND table_name NOT LIKE '%$%'
+            AND {_excluded_owners_filter(owner_scope, "table_owner")}
+    """
+    select_triggers = f"""
+        {TRIGGER_BODY_AS_VARCHAR2_FUNCTION}
         SELECT
             trigger_name,
             trigger_type,
             table_name,
             column_name,
-            trigger_body,
+            trigger_body_vc(owner, trigger_name),
             owner
         FROM all_triggers
-        WHERE trigger_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
-            AND table_name NOT LIKE '%$%'
-            AND table_owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+        WHERE {trigger_filter}
         ORDER BY table_name, trigger_name
     """
-    cursor.execute(select_triggers)
-    trigger_rows = cursor.fetchall()
-    triggers: dict[str, Trigger] = {
-        f"{row[5]}.{row[0]}": Trigger(
-            body=hash_body(row[4]),
+    trigger_rows = yield CatalogQuery(select_triggers, _owner_binds(owner_scope, select_triggers), ExpectedRows.ONE_PER_OBJECT)
+    triggers: dict[str, Trigger] = {}
+    long_trigger_names: list[str] = []
+
+    for row in trigger_rows:
+        trigger_key = f"{row[5]}.{row[0]}"
+        if row[4] is None:
+            long_trigger_names.append(trigger_key)
+        triggers[trigger_key] = Trigger(
+            body=hash_body(row[4] or "", hash_algorithm),
             definition=f"{row[1]} ({row[2]}{'.' + row[3] if row[3] else ''})",
         )
-        for row in trigger_rows
-    }
+
+    # Only the bodies that are too long for a VARCHAR2 are fetched as LONG, one row per round-trip
+    if long_trigger_names:
+        select_long_trigger_bodies = f"""
+            SELECT
+                owner,
+                trigger_name,
+                trigger_body
+            FROM all_triggers
+            WHERE owner || '.' || trigger_name IN (SELECT column_value FROM TABLE(:{LONG_TRIGGERS_BIND}))
+        """
+        long_trigger_binds = {LONG_TRIGGERS_BIND: NameList(tuple(long_trigger_names))}
+        long_trigger_rows = yield CatalogQuery(select_long_trigger_bodies, long_trigger_binds, ExpectedRows.FEW)
+        for owner, trigger_name, trigger_body in long_trigger_rows:
+            triggers[f"{owner}.{trigger_name}"].body = hash_body(trigger_body, hash_algorithm)
 
     return triggers
 
 
-def fetch_oracle_indexes(cursor: cursor.Cursor) -> dict[str, Index]:
+@oracle_catalog_plan
+def fetch_oracle_indexes(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, Index]]:
     """
     Fetch the list of indexes from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Index]: A dictionary of Index objects representing the indexes in the database.
     """
-    select_indexes = """
+    select_indexes = f"""
         SELECT
             ai.index_name,
             ai.table_name,
@@ -449,17 +789,12 @@ def fetch_oracle_indexes(cursor: cursor.Cursor) -> dict[str, Index]:
                 AND ai.table_name = aic.table_name
                 AND ai.owner = aic.index_owner -- Different owners can have indexes with the same name
         WHERE ai.index_name NOT LIKE '%$%'
-            AND ai.owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "ai.owner", "ai.index_name")}
             AND ai.table_name NOT LIKE '%$%'
             AND ai.index_name NOT LIKE '%SYS_%'
             ORDER BY ai.table_name, ai.index_name, aic.column_position
     """
-    cursor.execute(select_indexes)
-    index_rows = cursor.fetchall()
+    index_rows = yield CatalogQuery(select_indexes, _owner_binds(owner_scope, select_indexes), ExpectedRows.MANY_PER_OBJECT)
     indexes: dict[str, Index] = {}
 
     for row in index_rows:
@@ -470,35 +805,40 @@ def fetch_oracle_indexes(cursor: cursor.Cursor) -> dict[str, Index]:
         # so we need to aggregate them into a single Index object.
         if index_name not in indexes:
             indexes[index_name] = Index(
-                table_name=row[1],
-                uniqueness=row[2],
-                tablespace=row[3],
+                table_name=intern_identifier(row[1]),
+                uniqueness=intern_identifier(row[2]),
+                tablespace=intern_identifier(row[3]),
                 columns=set(),
             )
 
-        indexes[index_name].columns.add(row[4])
+        indexes[index_name].columns.add(intern_identifier(row[4]))
 
     return indexes
 
 
-def fetch_oracle_constraints(cursor: cursor.Cursor, constraint_type_mapper: ConstraintTypeMapper) -> dict[str, Constraint]:
+@oracle_catalog_plan
+def fetch_oracle_constraints(
+    constraint_type_mapper: ConstraintTypeMapper,
+    *,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, Constraint]]:
     """
     Fetch the list of constraints from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
         constraint_type_mapper (ConstraintTypeMapper): The mapper to convert native constraint types to DBConstraintType.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Constraint]: A dictionary of Constraint objects representing the constraints in the database.
     """
-    select_constraints = """
+    select_constraints = f"""
         SELECT
             C.constraint_name,
             C.constraint_type,
             C.table_name,
             C.delete_rule,
-            C.search_condition,
+            C.search_condition_vc, -- search_condition is a LONG, which would be fetched one row at a time
             CC.column_name,
             C.owner
         FROM all_constraints C
@@ -507,17 +847,12 @@ def fetch_oracle_constraints(cursor: cursor.Cursor, constraint_type_mapper: Cons
                     AND C.constraint_name = CC.constraint_name
                     AND C.table_name = CC.table_name)
         WHERE C.constraint_name NOT LIKE '%$%'
-            AND C.owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "C.owner", "C.table_name")}
             AND C.table_name NOT LIKE '%$%'
             AND C.constraint_name NOT LIKE '%SYS_%'
         ORDER BY C.owner, C.table_name, C.constraint_name, CC.position
     """
-    cursor.execute(select_constraints)
-    constraint_rows = cursor.fetchall()
+    constraint_rows = yield CatalogQuery(select_constraints, _owner_binds(owner_scope, select_constraints), ExpectedRows.MANY_PER_OBJECT)
     constraints: dict[str, Constraint] = {}
 
     for row in constraint_rows:
@@ -528,7 +863,7 @@ def fetch_oracle_constraints(cursor: cursor.Cursor, constraint_type_mapper: Cons
         # so we need to aggregate them into a single Constraint object.
         if constraint_name not in constraints:
             constraints[constraint_name] = Constraint(
-                table_name=row[2],
+                table_name=intern_identifier(row[2]),
                 constraint_type=constraint_type_mapper.map(row[1]),
                 rule=row[3] if row[3] else None,
                 condition=row[4] if row[4] else None,
@@ -536,21 +871,22 @@ def fetch_oracle_constraints(cursor: cursor.Cursor, constraint_type_mapper: Cons
             )
 
         if row[5]:  # column_name can be None for some constraint types
-            constraints[constraint_name].columns.add(row[5])
+            constraints[constraint_name].columns.add(intern_identifier(row[5]))
     return constraints
 
 
-def fetch_oracle_sequences(cursor: cursor.Cursor) -> dict[str, Sequence]:
+@oracle_catalog_plan
+def fetch_oracle_sequences(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, Sequence]]:
     """
     Fetch the list of sequences from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Sequence]: A dictionary of Sequence objects representing the sequences in the database.
     """
-    select_sequences = """
+    select_sequences = f"""
         SELECT
             sequence_name,
             min_value,
@@ -560,15 +896,10 @@ def fetch_oracle_sequences(cursor: cursor.Cursor) -> dict[str, Sequence]:
             last_number
         FROM all_sequences
         WHERE sequence_name NOT LIKE '%$%'
-            AND sequence_owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "sequence_owner", "sequence_name", incremental=False)}
         ORDER BY sequence_owner, sequence_name
     """
-    cursor.execute(select_sequences)
-    sequence_rows = cursor.fetchall()
+    sequence_rows = yield CatalogQuery(select_sequences, _owner_binds(owner_scope, select_sequences), ExpectedRows.ONE_PER_OBJECT)
     sequences: dict[str, Sequence] = {
         f"{row[4]}.{row[0]}": Sequence(definition=f"min_value: {row[1]}, max_value: {row[2]}, increment_by: {row[3]}, last_number: {row[5]}")
         for row in sequence_rows
@@ -576,17 +907,18 @@ def fetch_oracle_sequences(cursor: cursor.Cursor) -> dict[str, Sequence]:
     return sequences
 
 
-def fetch_oracle_synonyms(cursor: cursor.Cursor) -> dict[str, Synonym]:
+@oracle_catalog_plan
+def fetch_oracle_synonyms(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, Synonym]]:
     """
     Fetch the list of synonyms from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Synonym]: A dictionary of Synonym objects representing the synonyms in the database.
     """
-    select_synonyms = """
+    select_synonyms = f"""
         SELECT
             synonym_name,
             table_owner,
@@ -594,52 +926,62 @@ def fetch_oracle_synonyms(cursor: cursor.Cursor) -> dict[str, Synonym]:
             owner
         FROM all_synonyms
         WHERE synonym_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "synonym_name")}
             AND table_name NOT LIKE '%$%'
-            AND table_owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_excluded_owners_filter(owner_scope, "table_owner")}
         ORDER BY owner, synonym_name
     """
-    cursor.execute(select_synonyms)
-    synonym_rows = cursor.fetchall()
+    synonym_rows = yield CatalogQuery(select_synonyms, _owner_binds(owner_scope, select_synonyms), ExpectedRows.ONE_PER_OBJECT)
     synonyms: dict[str, Synonym] = {
         f"{row[3]}.{row[0]}": Synonym(definition=f"from: {row[1]}.{row[2]}, to: {row[3]}.{row[0]}") for row in synonym_rows
     }
     return synonyms
 
 
-def fetch_oracle_functions(cursor: cursor.Cursor) -> dict[str, Function]:
+@oracle_catalog_plan
+def fetch_oracle_functions(
+    *,
+    server_side_hashing: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    ddl_source: OracleDDLSource = OracleDDLSource.DBMS_METADATA,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, Function]]:
     """
     Fetch the list of functions from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        server_side_hashing (bool): Whether to hash the DDL in the database so that only the digest crosses the network.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the DDL with on the client.
+        ddl_source (OracleDDLSource): Where to read the source of the functions from.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Function]: A dictionary of Function objects representing the functions in the database.
     """
     # Fetch all functions and their DDL definitions using the helper function
-    functions: dict[str, Function] = _get_db_object_and_ddl(cursor, "FUNCTION")
-
-    # For each function, fetch its arguments and append them to the definition
-    for func_name, func in functions.items():
-        function_arguments = _get_obj_arguments(cursor, func_name.split(".")[1])  # Extract object name without schema
-
-        for arg in function_arguments:
-            func.definition += f"{arg[0] if arg[0] else '----'} {arg[2]} {arg[3]}, "  # argument_name data_type in_out
-        func.definition = func.definition.rstrip(", ")  # Remove trailing comma and space
+    functions: dict[str, Function] = yield from _get_db_object_and_ddl(
+        "FUNCTION",
+        server_side_hashing=server_side_hashing,
+        hash_algorithm=hash_algorithm,
+        ddl_source=ddl_source,
+        owner_scope=owner_scope,
+    )
+
+    # Fetch the arguments of all functions at once and append them to each definition
+    arguments = yield from _get_obj_arguments("FUNCTION", owner_scope)
+    _append_arguments_to_definitions(functions, arguments)
 
     return functions
 
 
-def _get_db_object_and_ddl(cursor: cursor.Cursor, object_type: str) -> dict[str, DatabaseObjectWithHashedBody]:
+def _get_db_object_and_ddl(
+    object_type: str,
+    *,
+    server_side_hashing: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    ddl_source: OracleDDLSource = OracleDDLSource.DBMS_METADATA,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, DatabaseObjectWithHashedBody]]:
     """
     Fetch database objects (functions, procedures, packages, etc.) and their DDL definitions from the Oracle database.
 
@@ -649,100 +991,348 @@ def _get_db_object_and_ddl(cursor: cursor.Cursor, object_type: str) -> dict[str,
         and hide the fact that the body is actually missing.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
         object_type (str): The type of database object to fetch (e.g., 'FUNCTION', 'PROCEDURE').
+        server_side_hashing (bool): Whether to hash the DDL in the database so that only the digest crosses the network.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the DDL with on the client.
+        ddl_source (OracleDDLSource): Where to read the source of the objects from.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, DatabaseObjectWithHashedBody]: A dictionary mapping object names to DatabaseObjectWithHashedBody instances.
     """
+    if ddl_source is OracleDDLSource.ALL_SOURCE:
+        digests = yield from _get_db_object_source_digests(
+            ALL_SOURCE_PARTS[object_type],
+            server_side_hashing=server_side_hashing,
+            hash_algorithm=hash_algorithm,
+            owner_scope=owner_scope,
+        )
+        return {obj_name: DatabaseObjectWithHashedBody(definition="", body=parts["body"] or "") for obj_name, parts in digests.items()}
+
+    if not server_side_hashing:
+        object_rows = yield from _get_db_object_ddl_rows(object_type, owner_scope)
+        # Long DDL is hashed chunk by chunk as its LOB is read. Fetched as a string instead (`fetch_lobs=False`), large DDL
+        # is hashed in a worker thread while the next objects are read
+        digests = hash_bodies(((f"{row[0]}.{row[1]}", _read_ddl(row[2], row[3])) for row in object_rows), hash_algorithm)
+        return {obj_name: DatabaseObjectWithHashedBody(definition="", body=digest or "") for obj_name, digest in digests.items()}
+
+    ddl = f"dbms_metadata.get_ddl('{object_type}', object_name, owner)"
     select_objects = f"""
+        {SERVER_SIDE_DDL_DIGEST_FUNCTIONS}
         SELECT
             owner,
             object_name,
-            dbms_metadata.get_ddl('{object_type}', object_name, owner) AS ddl
+            ddl_digest({ddl}) AS ddl
         FROM all_objects
         WHERE object_type = '{object_type}'
             AND object_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "object_name")}
         ORDER BY owner, object_name
     """
-    cursor.execute(select_objects)
-    object_rows = cursor.fetchall()
-    objects: dict[str, DatabaseObjectWithHashedBody] = {
-        f"{row[0]}.{row[1]}": DatabaseObjectWithHashedBody(
-            definition="",
-            body=hash_body(row[2].read()) if row[2] else "",
-            # body=row[2].read() if row[2] else "",  # noqa: ERA001 Keep this for debugging purposes to see unhashed DDL in case of issues with hashing
+    object_rows = yield CatalogQuery(select_objects, _owner_binds(owner_scope, select_objects), ExpectedRows.ONE_PER_OBJECT)
+    return {f"{row[0]}.{row[1]}": DatabaseObjectWithHashedBody(definition="", body=row[2] or "") for row in object_rows}
+
+
+def _get_db_object_ddl_rows(object_type: str, owner_scope: OracleOwnerScope | None) -> CatalogPlan[Iterable["Row"]]:
+    """
+    Fetch the DDL of every object of a type, to be hashed on the client.
+
+    Args:
+        object_type (str): The type of database object to fetch (e.g., 'FUNCTION', 'PACKAGE').
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the query, if already resolved for this session.
+
+    Returns:
+        Iterable[Row]: The owner, name, DDL as a string when it fits in a VARCHAR2 (else NULL), and DDL as a CLOB otherwise
+            (else NULL) of every object.
+    """
+    select_ddl = f"""
+        {DDL_AS_VARCHAR2_FUNCTION}
+        SELECT
+            owner,
+            object_name,
+            ddl_vc(ddl) AS ddl_text,
+            CASE WHEN ddl_vc(ddl) IS NULL THEN ddl END AS ddl
+        FROM (
+            -- Not merged into the outer query, so that dbms_metadata.get_ddl runs once per object
+            SELECT /*+ NO_MERGE */
+                owner,
+                object_name,
+                dbms_metadata.get_ddl('{object_type}', object_name, owner) AS ddl
+            FROM all_objects
+            WHERE object_type = '{object_type}'
+                AND object_name NOT LIKE '%$%'
+                AND {_owner_filter(owner_scope, "owner", "object_name")}
         )
-        for row in object_rows
-    }
-    return objects
+        ORDER BY owner, object_name
+    """
+    return (yield CatalogQuery(select_ddl, _owner_binds(owner_scope, select_ddl), ExpectedRows.ONE_PER_OBJECT))
+
+
+def _read_ddl(ddl_text: str | None, ddl_lob: LOB | str | None) -> str | Iterator[str] | None:
+    """
+    Read the DDL of an object, as fetched by `_get_db_object_ddl_rows`.
+
+    Args:
+        ddl_text (str | None): The DDL, when it was short enough to be fetched inline.
+        ddl_lob (LOB | str | None): The LOB locator of longer DDL, or the DDL itself when the LOBs were fetched as strings (`fetch_lobs=False`).
+
+    Returns:
+        str | Iterator[str] | None: The DDL, or the chunks of it read one at a time from its LOB; None when there is no DDL.
+    """
+    if ddl_lob is None or isinstance(ddl_lob, str):
+        return ddl_text if ddl_lob is None else ddl_lob
+    return _read_lob_chunks(ddl_lob)
+
+
+def _read_lob_chunks(lob: LOB) -> Iterator[str]:
+    """
+    Read the text of a CLOB in consecutive pieces of a whole number of its chunks, one round-trip each.
+
+    Args:
+        lob (LOB): The LOB locator.
+
+    Yields:
+        str: The next piece of the text.
+    """
+    chunk_size = lob.getchunksize()
+    read_length = max(1, LOB_READ_LENGTH // chunk_size) * chunk_size
+    for offset in range(1, lob.size() + 1, read_length):  # LOB offsets start at 1
+        yield lob.read(offset, read_length)
+
 
+def _partition_chunks(chunks: Iterator[str], separator: str) -> tuple[Iterator[str], Iterator[str]]:
+    """
+    Split a text read in chunks at the first separator, like `str.partition` but without ever joining the chunks.
+
+    Args:
+        chunks (Iterator[str]): The consecutive chunks of the text.
+        separator (str): The separator to split at, which may straddle two chunks.
 
-def _get_obj_arguments(cursor: cursor.Cursor, object_name: str) -> list[Row]:
+    Returns:
+        tuple[Iterator[str], Iterator[str]]: The chunks up to and including the separator (all of them if it is not found),
+            and the chunks after it. The second iterator goes on reading where the first one stopped, so read it after the first.
+    """
+    after_separator: list[str] = []
+
+    def up_to_separator() -> Iterator[str]:
+        carry = ""  # The end of the text read so far, which could be the start of a separator
+        for chunk in chunks:
+            before, found, after = (carry + chunk).partition(separator)
+            if found:
+                yield before + found
+                after_separator.append(after)
+                return
+            carried_from = max(0, len(before) - len(separator) + 1)
+            if carried_from:
+                yield before[:carried_from]
+            carry = before[carried_from:]
+        yield carry
+
+    def from_separator() -> Iterator[str]:
+        yield from after_separator
+        yield from chunks
+
+    return up_to_separator(), from_separator()
+
+
+def _get_db_object_source_digests(
+    parts: dict[str, tuple[str, ...]],
+    *,
+    server_side_hashing: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, dict[str, str | None]]]:
+    """
+    Fetch the source of database objects from ALL_SOURCE and hash it, instead of calling dbms_metadata.get_ddl per object.
+
+    Client-side, the source of all objects is read with a single scan ordered by owner, name, type and line,
+    and the lines of each object are joined back together before hashing.
+
+    Args:
+        parts (dict[str, tuple[str, ...]]): The ALL_SOURCE types that make up each hashed part (see `ALL_SOURCE_PARTS`).
+        server_side_hashing (bool): Whether to rebuild and hash the source in the database so that only the digests cross the network.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the source with on the client.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
+
+    Returns:
+        dict[str, dict[str, str | None]]: The digest of every part of every object, keyed by "owner.object_name".
+            A part is None when the object has no source of its types (e.g. a package without a body).
     """
-    Fetch the arguments of a database object (function, procedure) from the Oracle database.
+    source_types = [source_type for part_types in parts.values() for source_type in part_types]
+    source_filter = f"""
+        type IN ({", ".join(f"'{source_type}'" for source_type in source_types)})
+            AND name NOT LIKE '%$%'
+            AND {_owner_filter(owner_scope, "owner", "name")}
+    """
+
+    if server_side_hashing:
+        quoted_part_types = (", ".join(f"'{source_type}'" for source_type in part_types) for part_types in parts.values())
+        part_digests = ",\n".join(f"source_digest(owner, name, {source_types})" for source_types in quoted_part_types)
+        select_digests = f"""
+            {SERVER_SIDE_DDL_DIGEST_FUNCTIONS}
+            SELECT
+                owner,
+                name,
+                {part_digests}
+            FROM (
+                SELECT DISTINCT owner, name
+                FROM all_source
+                WHERE {source_filter}
+            )
+            ORDER BY owner, name
+        """
+        digest_rows = yield CatalogQuery(select_digests, _owner_binds(owner_scope, select_digests), ExpectedRows.ONE_PER_OBJECT)
+        return {f"{row[0]}.{row[1]}": dict(zip(parts, row[2:], strict=True)) for row in digest_rows}
+
+    select_source = f"""
+        SELECT
+            owner,
+            name,
+            type,
+            text
+        FROM all_source
+        WHERE {source_filter}
+        ORDER BY owner, name, type, line
+    """
+    source_rows = yield CatalogQuery(select_source, _owner_binds(owner_scope, select_source), ExpectedRows.MANY_PER_OBJECT)
+
+    # The source comes back one row per line, so we need to join the lines of each object and type back together
+    sources: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+    for owner, name, source_type, text in source_rows:
+        sources[f"{owner}.{name}"][source_type].append(text or "")
+
+    part_sources = (
+        ((obj_name, part), "".join(lines) if lines else None)
+        for obj_name, source_lines in sources.items()
+        for part, part_types in parts.items()
+        for lines in [[line for source_type in part_types for line in source_lines.get(source_type, [])]]
+    )
+    digests: dict[str, dict[str, str | None]] = defaultdict(dict)
+    for (obj_name, part), digest in hash_bodies(part_sources, hash_algorithm).items():
+        digests[obj_name][part] = digest
+
+    return dict(digests)
+
+
+def _get_obj_arguments(object_type: str, owner_scope: OracleOwnerScope | None) -> CatalogPlan[dict[str, list["Row"]]]:
+    """
+    Fetch the arguments of all standalone database objects of a type (functions, procedures) from the Oracle database.
+
+    All arguments are fetched with a single query and grouped in memory,
+    instead of querying `all_arguments` once per object.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
-        object_name (str): The name of the database object to fetch arguments for.
+        object_type (str): The type of database object to fetch arguments for (e.g., 'FUNCTION', 'PROCEDURE').
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
-        list[Row]: A list of rows representing the arguments of the specified database object.
+        dict[str, list[Row]]: The argument rows (argument_name, position, data_type, in_out) of every object,
+            ordered by position and keyed by "owner.object_name".
     """
-    select_arguments = """
+    select_arguments = f"""
         SELECT
-            argument_name,
-            position,
-            data_type,
-            in_out
-        FROM all_arguments
-        WHERE object_name = :object_name
-        ORDER BY position
+            aa.owner,
+            aa.object_name,
+            aa.argument_name,
+            aa.position,
+            aa.data_type,
+            aa.in_out
+        FROM all_arguments aa
+            JOIN all_objects ao
+                ON ao.object_id = aa.object_id
+                AND ao.owner = aa.owner -- Different owners can have objects with the same name
+        WHERE ao.object_type = '{object_type}'
+            AND aa.package_name IS NULL -- Skip package members that share the name of a standalone object
+            AND ao.object_name NOT LIKE '%$%'
+            AND {_owner_filter(owner_scope, "ao.owner", "ao.object_name")}
+        ORDER BY aa.owner, aa.object_name, aa.position, aa.sequence
     """
-    cursor.execute(select_arguments, object_name=object_name)
-    return cursor.fetchall()
+    argument_rows = yield CatalogQuery(select_arguments, _owner_binds(owner_scope, select_arguments), ExpectedRows.MANY_PER_OBJECT)
 
+    arguments: dict[str, list[Row]] = defaultdict(list)
+    for row in argument_rows:
+        arguments[f"{row[0]}.{row[1]}"].append(row[2:])
 
-def fetch_oracle_stored_procedures(cursor: cursor.Cursor) -> dict[str, StoredProcedure]:
+    return arguments
+
+
+def _append_arguments_to_definitions(objects: dict[str, DatabaseObjectWithHashedBody], arguments: dict[str, list["Row"]]) -> None:
+    """
+    Append the arguments of each object to its definition.
+
+    Args:
+        objects (dict[str, DatabaseObjectWithHashedBody]): The objects keyed by "owner.object_name".
+        arguments (dict[str, list[Row]]): The argument rows of each object, as returned by `_get_obj_arguments`.
+    """
+    for obj_name, obj in objects.items():
+        for arg in arguments.get(obj_name, []):
+            obj.definition += f"{arg[0] if arg[0] else '----'} {arg[2]} {arg[3]}, "  # argument_name data_type in_out
+        obj.definition = obj.definition.rstrip(", ")  # Remove trailing comma and space
+
+
+@oracle_catalog_plan
+def fetch_oracle_stored_procedures(
+    *,
+    server_side_hashing: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    ddl_source: OracleDDLSource = OracleDDLSource.DBMS_METADATA,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, StoredProcedure]]:
     """
     Fetch the list of stored procedures from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        server_side_hashing (bool): Whether to hash the DDL in the database so that only the digest crosses the network.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the DDL with on the client.
+        ddl_source (OracleDDLSource): Where to read the source of the procedures from.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, StoredProcedure]: A dictionary of StoredProcedure objects representing the stored procedures in the database.
     """
     # Fetch all procedures and their DDL definitions using the helper function
-    procedures: dict[str, StoredProcedure] = _get_db_object_and_ddl(cursor, "PROCEDURE")
-
-    # For each procedure, fetch its arguments and append them to the definition
-    for proc_name, proc in procedures.items():
-        procedure_arguments = _get_obj_arguments(cursor, proc_name.split(".")[1])  # Extract object name without schema
-
-        for arg in procedure_arguments:
-            proc.definition += f"{arg[0] if arg[0] else '----'} {arg[2]} {arg[3]}, "  # argument_name data_type in_out
-        proc.definition = proc.definition.rstrip(", ")  # Remove trailing comma and space
+    procedures: dict[str, StoredProcedure] = yield from _get_db_object_and_ddl(
+        "PROCEDURE",
+        server_side_hashing=server_side_hashing,
+        hash_algorithm=hash_algorithm,
+        ddl_source=ddl_source,
+        owner_scope=owner_scope,
+    )
+
+    # Fetch the arguments of all procedures at once and append them to each definition
+    arguments = yield from _get_obj_arguments("PROCEDURE", owner_scope)
+    _append_arguments_to_definitions(procedures, arguments)
 
     return procedures
 
 
-def fetch_oracle_types(cursor: cursor.Cursor) -> dict[str, Type]:
+@oracle_catalog_plan
+def fetch_oracle_types(
+    *,
+    server_side_hashing: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    ddl_source: OracleDDLSource = OracleDDLSource.DBMS_METADATA,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, Type]]:
     """
     Fetch the list of custom types from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        server_side_hashing (bool): Whether to hash the DDL in the database so that only the digest crosses the network.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the DDL with on the client.
+        ddl_source (OracleDDLSource): Where to read the source of the types (specification and body) from.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Type]: A dictionary of Type objects representing the custom types in the database.
     """
-    non_formatted_types: dict[str, DatabaseObjectWithHashedBody] = _get_db_object_and_ddl(cursor, "TYPE")
+    non_formatted_types: dict[str, DatabaseObjectWithHashedBody] = yield from _get_db_object_and_ddl(
+        "TYPE",
+        server_side_hashing=server_side_hashing,
+        hash_algorithm=hash_algorithm,
+        ddl_source=ddl_source,
+        owner_scope=owner_scope,
+    )
     types: dict[str, Type] = {
         type_name: Type(
             definition=obj.body,  # For types, we want to hash the body (which contains the type definition) instead of the DDL
@@ -752,85 +1342,127 @@ def fetch_oracle_types(cursor: cursor.Cursor) -> dict[str, Type]:
     return types
 
 
-def fetch_oracle_directories(cursor: cursor.Cursor) -> dict[str, Directory]:
+@oracle_catalog_plan
+def fetch_oracle_directories(*, owner_scope: OracleOwnerScope | None = None) -> CatalogPlan[dict[str, Directory]]:
     """
     Fetch the list of directories from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Directory]: A dictionary of Directory objects representing the directories in the database.
     """
-    select_directories = """
+    select_directories = f"""
         SELECT
             owner,
             directory_name,
             directory_path
         FROM all_directories
         WHERE directory_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "directory_name", incremental=False)}
     """
 
-    cursor.execute(select_directories)
-    directory_rows = cursor.fetchall()
+    directory_rows = yield CatalogQuery(select_directories, _owner_binds(owner_scope, select_directories), ExpectedRows.FEW)
     directories: dict[str, Directory] = {f"{row[0]}.{row[1]}": Directory(definition=f"path: {row[2]}") for row in directory_rows}
 
     return directories
 
 
-def fetch_oracle_packages(cursor: cursor.Cursor) -> dict[str, Package]:
+@oracle_catalog_plan
+def fetch_oracle_packages(
+    *,
+    server_side_hashing: bool = False,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+    ddl_source: OracleDDLSource = OracleDDLSource.DBMS_METADATA,
+    owner_scope: OracleOwnerScope | None = None,
+) -> CatalogPlan[dict[str, Package]]:
     """
     Fetch the list of packages from the Oracle database available to the connected user.
 
     Args:
-        cursor (cursor.Cursor): The Oracle database cursor.
+        server_side_hashing (bool): Whether to split and hash the DDL in the database so that only the digests cross the network.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the DDL with on the client.
+        ddl_source (OracleDDLSource): Where to read the source of the packages from.
+            ALL_SOURCE returns the specification and the body as separate units, so no DDL splitting is needed.
+        owner_scope (OracleOwnerScope | None): The owners to leave out of the queries, if already resolved for this session.
 
     Returns:
         dict[str, Package]: A dictionary of Package objects representing the packages in the database.
     """
-    select_packages = """
+    if ddl_source is OracleDDLSource.ALL_SOURCE:
+        digests = yield from _get_db_object_source_digests(
+            ALL_SOURCE_PARTS["PACKAGE"],
+            server_side_hashing=server_side_hashing,
+            hash_algorithm=hash_algorithm,
+            owner_scope=owner_scope,
+        )
+        return {
+            package_name: Package(
+                definition=parts["definition"] or hash_body("", hash_algorithm),
+                body=parts["body"] or hash_body("", hash_algorithm),
+            )
+            for package_name, parts in digests.items()
+        }
+
+    if not server_side_hashing:
+        package_rows = yield from _get_db_object_ddl_rows("PACKAGE", owner_scope)
+        digests = hash_bodies(_split_package_ddls(package_rows), hash_algorithm)
+        packages: dict[str, Package] = {
+            package_name: Package(definition=digests[package_name, "definition"], body=digests[package_name, "body"])
+            for package_name, part in digests
+            if part == "definition"
+        }
+        return packages
+
+    ddl = "dbms_metadata.get_ddl('PACKAGE', object_name, owner)"
+    select_packages = f"""
+        {SERVER_SIDE_DDL_DIGEST_FUNCTIONS}
         SELECT
             owner,
             object_name,
-            dbms_metadata.get_ddl('PACKAGE', object_name, owner) AS ddl
+            package_ddl_digests({ddl}, object_name) AS ddl
         FROM all_objects
         WHERE object_type = 'PACKAGE'
             AND object_name NOT LIKE '%$%'
-            AND owner NOT IN (
-                SELECT DISTINCT username
-                FROM all_users
-                WHERE ORACLE_MAINTAINED = 'Y'
-            )
+            AND {_owner_filter(owner_scope, "owner", "object_name")}
         ORDER BY owner, object_name
     """
-    cursor.execute(select_packages)
-    package_rows = cursor.fetchall()
+    package_rows = yield CatalogQuery(select_packages, _owner_binds(owner_scope, select_packages), ExpectedRows.ONE_PER_OBJECT)
+
+    # The digests come back as "spec_digest,body_digest", where an empty part stands for an empty string
+    server_digests = ((f"{row[0]}.{row[1]}", (row[2] or ",").split(",")) for row in package_rows)
+    return {
+        package_name: Package(
+            definition=spec_digest or hash_body(""),
+            body=body_digest or hash_body(""),
+        )
+        for package_name, (spec_digest, body_digest) in server_digests
+    }
+
+
+def _split_package_ddls(package_rows: Iterable["Row"]) -> Iterator[tuple[tuple[str, str], str | Iterator[str]]]:
+    """
+    Split the DDL of every package into its specification and its body, which are hashed separately to tell changes of one from the other.
 
-    packages: dict[str, Package] = {}
+    Args:
+        package_rows (Iterable[Row]): The rows of `_get_db_object_ddl_rows` for packages.
+            The DDL returned by dbms_metadata.get_ddl for packages includes both the package specification and body.
 
+    Yields:
+        tuple[tuple[str, str], str | Iterator[str]]: The specification and then the body of every package, keyed by "owner.object_name"
+            and "definition" or "body". A package whose DDL cannot be split has its whole DDL as specification and an empty body.
+            DDL read from a LOB is split as its chunks are read, so the body chunks must be read after the specification ones.
+    """
     for row in package_rows:
         package_name = f"{row[0]}.{row[1]}"  # owner.object_name
-
-        # the ddl returned by dbms_metadata.get_ddl for packages includes both the package specification and body
-        # we need to split them and hash them separately to be able to detect changes in spec vs body
-        pkg_name: str = row[1]
-        ddl_splitter = f"END {pkg_name.lower()};"  # The package specification ends with "END package_name;"
-        ddl: str = row[2].read()
-        if ddl_splitter in ddl:
-            spec, body = ddl.split(ddl_splitter, 1)
-            spec += ddl_splitter  # add the splitter back to the end of the spec
+        ddl_splitter = f"END {row[1].lower()};"  # The package specification ends with "END package_name;"
+        ddl = _read_ddl(row[2], row[3]) or ""
+        if isinstance(ddl, str):
+            spec, found, body = ddl.partition(ddl_splitter)
+            yield (package_name, "definition"), spec + found  # The splitter stays at the end of the spec
+            yield (package_name, "body"), body
         else:
-            spec = ddl  # If we can't split, just use the whole DDL as spec and leave body empty
-            body = ""
-
-        packages[package_name] = Package(
-            definition=hash_body(spec),
-            body=hash_body(body),
-        )
-
-    return packages
+            spec_chunks, body_chunks = _partition_chunks(ddl, ddl_splitter)
+            yield (package_name, "definition"), spec_chunks
+            yield (package_name, "body"), body_chunks
@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, TypeVar
+
+import oracledb
+
+from db_drift.db.strategies.oracle import NAME_LIST_TYPE, NameList, bind_name_lists
+from db_drift.db.strategies.utils import CatalogPlan, CatalogQuery
+
+T = TypeVar("T")
+
+
+class AsyncCatalogSession:
+    """Runs catalog plans on an asyncio connection."""
+
+    def __init__(self, connection: oracledb.AsyncConnection) -> None:
+        self.connection = connection
+        self.cursor = connection.cursor()
+        self._name_list_type: oracledb.DbObjectType | None = None
+
+    async def run(self, plan: CatalogPlan[T]) -> T:
+        """
+        Run a catalog plan on the connection, one query at a time.
+
+        The plan runs in a worker thread, so that what it does with the rows (such as hashing bodies) never blocks
+        the event loop and the other connections on it. Its rows are streamed to it `expected_rows` at a time,
+        each batch fetched on the event loop, and CLOBs are fetched as strings, so the plan never waits on a LOB read.
+
+        Args:
+            plan (CatalogPlan[T]): The plan to run.
+
+        Returns:
+            T: What the plan returns.
+        """
+        loop = asyncio.get_running_loop()
+        rows: Iterable[Any] | None = None
+        while True:
+            finished, query = await asyncio.to_thread(_send_rows, plan, rows)
+            if finished:
+                return query
+
+            self.cursor.arraysize = query.expected_rows
+            self.cursor.prefetchrows = query.expected_rows
+            await self.cursor.execute(query.statement, await self.bind_parameters(query.parameters), fetch_lobs=False)
+            rows = self._stream_rows(loop)
+
+    def _stream_rows(self, loop: asyncio.AbstractEventLoop) -> Iterator[Any]:
+        """
+        Yield the rows of the last executed query to a plan running in a worker thread, fetching `arraysize` rows at a time.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop of the connection, where every batch is fetched.
+
+        Yields:
+            Any: The rows of the query. Only one batch of rows is held in memory at a time.
+        """
+        while rows := asyncio.run_coroutine_threadsafe(self.cursor.fetchmany(), loop).result():
+            yield from rows
+
+    async def run_pipelined(self, plans: Sequence[CatalogPlan[Any]]) -> list[Any]:
+        """
+        Run catalog plans side by side, sending the next query of every plan to the database in a single pipeline.
+
+        Each round-trip carries one query of every plan that is not finished yet, so the number of round-trips
+        follows the plan with the most queries instead of the total number of queries.
+
+        Args:
+            plans (Sequence[CatalogPlan[Any]]): The plans to run.
+
+        Returns:
+            list[Any]: What each plan returns, in the order of the plans.
+
+        Raises:
+            oracledb.Error: If any query of the pipeline fails.
+        """
+        results: list[Any] = [None] * len(plans)
+        rows: dict[int, list[Any] | None] = dict.fromkeys(range(len(plans)))
+
+        while rows:
+            queries: dict[int, CatalogQuery] = {}
+            for index, plan_rows in rows.items():
+                # Like in `run`, the plan consumes its rows in a worker thread, off the event loop
+                finished, query = await asyncio.to_thread(_send_rows, plans[index], plan_rows)
+                if finished:
+                    results[index] = query
+                else:
+                    queries[index] = query
+
+            if not queries:
+                break
+
+            pipeline = oracledb.create_pipeline()
+            for query in queries.values():
+                pipeline.add_fetchall(
+                    query.statement,
+                    await self.bind_parameters(query.parameters),
+                    arraysize=query.expected_rows,
+                    fetch_lobs=False,
+                )
+
+            # The first failing query raises, like it would when the plans run one query at a time
+            operation_results = await self.connection.run_pipeline(pipeline)
+            rows = {index: operation_result.rows for index, operation_result in zip(queries, operation_results, strict=True)}
+
+        return results
+
+    async def bind_parameters(self, parameters: tuple | dict | None) -> tuple | dict | None:
+        """
+        Turn the owner lists in the parameters of a catalog query into collections the driver can bind.
+
+        Args:
+            parameters (tuple | dict | None): The parameters of the query.
+
+        Returns:
+            tuple | dict | None: The parameters, with every `NameList` replaced by a collection.
+        """
+        if not isinstance(parameters, dict) or not any(isinstance(value, NameList) for value in parameters.values()):
+            return parameters
+
+        if self._name_list_type is None:
+            # Only the first query of the connection pays the round-trip of the lookup
+            self._name_list_type = await self.connection.gettype(NAME_LIST_TYPE)
+        return bind_name_lists(parameters, self._name_list_type)
+
+
+def _send_rows(plan: CatalogPlan[T], rows: Iterable[Any] | None) -> tuple[bool, Any]:
+    """
+    Send the rows of its last query to a catalog plan.
+
+    StopIteration cannot cross from a worker thread to the event loop, so the end of the plan is returned instead.
+
+    Args:
+        plan (CatalogPlan[T]): The plan.
+        rows (Iterable[Any] | None): The rows of its last query, or None to start it.
+
+    Returns:
+        tuple[bool, Any]: True and what the plan returns once it is finished, otherwise False and its next query.
+    """
+    try:
+        return False, plan.send(rows)
+    except StopIteration as finished:
+        return True, finished.value
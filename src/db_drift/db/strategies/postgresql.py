@@ -0,0 +1,494 @@
+from typing import Any, TypeVar
+
+import psycopg
+
+from db_drift.db.filters import ObjectFilter, glob_to_like
+from db_drift.db.mappers.constraint_types.base import ConstraintTypeMapper
+from db_drift.db.strategies.utils import CatalogFetcher, CatalogPlan, CatalogQuery, ExpectedRows, run_catalog_plan
+from db_drift.models import Column, Constraint, Function, Index, MaterializedView, Sequence, StoredProcedure, Table, Trigger, View
+from db_drift.utils.string import intern_identifier
+
+T = TypeVar("T")
+
+# The pg_class kinds of the relations behind each table-like model
+TABLE_RELKINDS = ("r", "p")  # Ordinary and partitioned tables
+VIEW_RELKINDS = ("v",)
+MATERIALIZED_VIEW_RELKINDS = ("m",)
+
+# The pg_constraint types that are compared. NOT NULL constraints are compared as the nullability of their columns.
+CONSTRAINT_TYPES = ("p", "f", "u", "c", "x")
+
+# The SHA-256 digest of a text, the same as `hash_body` computes with its default algorithm, so that only digests cross the network (PostgreSQL 11+)
+SQL_DIGEST = "encode(sha256(convert_to({}, 'UTF8')), 'hex')"
+
+# Turns a catalog plan function into a fetch function that runs on a psycopg cursor
+postgresql_catalog_plan = CatalogFetcher
+
+
+def run_catalog_plans_pipelined(connection: psycopg.Connection, plans: list[CatalogPlan[Any]]) -> list[Any]:
+    """
+    Run catalog plans side by side, sending the next query of every plan to the database in a single pipeline.
+
+    Each round-trip carries one query of every plan that is not finished yet, so the number of round-trips
+    follows the plan with the most queries instead of the total number of queries. The PostgreSQL plans need
+    a single query each, so a full catalog scan is sent and read back in one round-trip.
+
+    Falls back to running the plans one query at a time when libpq does not support pipeline mode (before version 14).
+
+    Args:
+        connection (psycopg.Connection): The connection to run the plans on.
+        plans (list[CatalogPlan[Any]]): The plans to run.
+
+    Returns:
+        list[Any]: What each plan returns, in the order of the plans.
+
+    Raises:
+        psycopg.Error: If any query of the pipeline fails.
+    """
+    if not psycopg.Pipeline.is_supported():
+        cursor = connection.cursor()
+        return [run_catalog_plan(cursor, plan) for plan in plans]
+
+    results: list[Any] = [None] * len(plans)
+    rows: dict[int, list[Any] | None] = dict.fromkeys(range(len(plans)))
+
+    while rows:
+        queries: dict[int, CatalogQuery] = {}
+        for index, plan_rows in rows.items():
+            try:
+                queries[index] = plans[index].send(plan_rows)
+            except StopIteration as finished:  # noqa: PERF203 # Once per plan and round-trip
+                results[index] = finished.value
+
+        if not queries:
+            break
+
+        cursors = {index: connection.cursor() for index in queries}
+        # Leaving the pipeline block sends a single Sync and reads every result back;
+        # the first failing query raises, like it would when the plans run one query at a time
+        with connection.pipeline():
+            for index, query in queries.items():
+                cursors[index].execute(query.statement, query.parameters)
+        rows = {index: cursor.fetchall() for index, cursor in cursors.items()}
+
+    return results
+
+
+def _object_filter(
+    object_filter: ObjectFilter | None,
+    schema_column: str,
+    name_column: str,
+    object_catalog: str,
+    oid_column: str,
+) -> tuple[str, dict[str, list[str]]]:
+    """
+    Build the conditions that leave system schemas, extension members and the objects left out by the object filter out of a catalog query.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+        schema_column (str): The schema name column.
+        name_column (str): The object name column.
+        object_catalog (str): The system catalog the objects are stored in (e.g. "pg_class"), to find the extension members.
+        oid_column (str): The object OID column.
+
+    Returns:
+        tuple[str, dict[str, list[str]]]: The conditions, joined with AND, and their parameters. Names are matched with LIKE,
+            whose default escape character is `LIKE_ESCAPE`.
+    """
+    conditions = [
+        # Schemas starting with pg_ are reserved for the system (pg_catalog, pg_toast, the temporary schemas, ...)
+        f"{schema_column} NOT LIKE 'pg\\_%%'",
+        f"{schema_column} <> 'information_schema'",
+        # The objects of extensions (e.g. the functions of pgcrypto) come with the extension, not with the schema
+        f"""NOT EXISTS (
+                SELECT 1
+                FROM pg_depend d
+                WHERE d.classid = '{object_catalog}'::regclass
+                    AND d.objid = {oid_column}
+                    AND d.deptype = 'e'
+            )""",
+    ]
+    parameters: dict[str, list[str]] = {}
+    object_filter = object_filter or ObjectFilter()
+
+    if object_filter.include_schemas:
+        conditions.append(f"{schema_column} = ANY(%(included_schemas)s)")
+        parameters["included_schemas"] = list(object_filter.include_schemas)
+    if object_filter.exclude_schemas:
+        conditions.append(f"{schema_column} <> ALL(%(excluded_schemas)s)")
+        parameters["excluded_schemas"] = list(object_filter.exclude_schemas)
+    if object_filter.include_names:
+        conditions.append(f"{name_column} LIKE ANY(%(included_names)s)")
+        parameters["included_names"] = [glob_to_like(pattern) for pattern in object_filter.include_names]
+    if object_filter.exclude_names:
+        conditions.append(f"NOT ({name_column} LIKE ANY(%(excluded_names)s))")
+        parameters["excluded_names"] = [glob_to_like(pattern) for pattern in object_filter.exclude_names]
+
+    return "\n            AND ".join(conditions), parameters
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_tables(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, Table]]:
+    """
+    Fetch the tables (and partitioned tables) of the PostgreSQL database, with their columns.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, Table]: A dictionary of Table objects keyed by "schema.table_name".
+    """
+    return (yield from _fetch_postgresql_relations(TABLE_RELKINDS, Table, object_filter))
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_views(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, View]]:
+    """
+    Fetch the views of the PostgreSQL database, with their columns.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, View]: A dictionary of View objects keyed by "schema.view_name".
+    """
+    return (yield from _fetch_postgresql_relations(VIEW_RELKINDS, View, object_filter))
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_materialized_views(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, MaterializedView]]:
+    """
+    Fetch the materialized views of the PostgreSQL database, with their columns.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, MaterializedView]: A dictionary of MaterializedView objects keyed by "schema.view_name".
+    """
+    return (yield from _fetch_postgresql_relations(MATERIALIZED_VIEW_RELKINDS, MaterializedView, object_filter))
+
+
+def _fetch_postgresql_relations(
+    relkinds: tuple[str, ...],
+    model_factory: type[T],
+    object_filter: ObjectFilter | None,
+) -> CatalogPlan[dict[str, T]]:
+    """
+    Fetch table-like relations and their columns in a single query over pg_class and pg_attribute.
+
+    Args:
+        relkinds (tuple[str, ...]): The pg_class kinds of the relations to fetch.
+        model_factory (type[T]): The model of the relations (Table, View or MaterializedView).
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, T]: The relations keyed by "schema.relation_name", with their columns in column order.
+    """
+    filter_condition, filter_parameters = _object_filter(object_filter, "n.nspname", "c.relname", "pg_class", "c.oid")
+    select_relations = f"""
+        SELECT
+            n.nspname,
+            c.relname,
+            obj_description(c.oid, 'pg_class'),
+            a.attname,
+            format_type(a.atttypid, a.atttypmod),
+            a.attnotnull,
+            col_description(c.oid, a.attnum)
+        FROM pg_class c
+            JOIN pg_namespace n
+                ON n.oid = c.relnamespace
+            LEFT JOIN pg_attribute a
+                ON a.attrelid = c.oid
+                AND a.attnum > 0
+                AND NOT a.attisdropped
+        WHERE c.relkind IN ({", ".join(f"'{relkind}'" for relkind in relkinds)})
+            AND {filter_condition}
+        ORDER BY n.nspname, c.relname, a.attnum
+    """
+    relation_rows = yield CatalogQuery(select_relations, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    relations: dict[str, T] = {}
+
+    for schema, relation_name, doc, column_name, data_type, not_null, column_doc in relation_rows:
+        key = f"{schema}.{relation_name}"
+        if key not in relations:
+            relations[key] = model_factory(doc=doc, columns={})
+
+        if column_name is not None:  # Relations without columns still get one row
+            relations[key].columns[intern_identifier(column_name)] = Column(
+                doc=column_doc,
+                data_type=intern_identifier(data_type),
+                is_nullable=not not_null,
+            )
+
+    return relations
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_indexes(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, Index]]:
+    """
+    Fetch the indexes of the PostgreSQL database, with their key and included columns.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, Index]: A dictionary of Index objects keyed by "schema.index_name". Expression columns are named by their expression.
+    """
+    filter_condition, filter_parameters = _object_filter(object_filter, "n.nspname", "i.relname", "pg_class", "i.oid")
+    select_indexes = f"""
+        SELECT
+            n.nspname,
+            i.relname,
+            t.relname,
+            x.indisunique,
+            ts.spcname,
+            pg_get_indexdef(x.indexrelid, k.position, true)
+        FROM pg_index x
+            JOIN pg_class i
+                ON i.oid = x.indexrelid
+            JOIN pg_class t
+                ON t.oid = x.indrelid
+            JOIN pg_namespace n
+                ON n.oid = i.relnamespace
+            LEFT JOIN pg_tablespace ts
+                ON ts.oid = i.reltablespace -- 0 for the default tablespace of the database
+            CROSS JOIN LATERAL generate_series(1, x.indnatts) AS k(position)
+        WHERE {filter_condition}
+        ORDER BY n.nspname, t.relname, i.relname, k.position
+    """
+    index_rows = yield CatalogQuery(select_indexes, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    indexes: dict[str, Index] = {}
+
+    for schema, index_name, table_name, is_unique, tablespace, column in index_rows:
+        # The above query returns one row per indexed column,
+        # so we need to aggregate them into a single Index object.
+        key = f"{schema}.{index_name}"
+        if key not in indexes:
+            indexes[key] = Index(
+                table_name=intern_identifier(table_name),
+                uniqueness="UNIQUE" if is_unique else "NONUNIQUE",
+                tablespace=tablespace,
+                columns=set(),
+            )
+
+        indexes[key].columns.add(intern_identifier(column))
+
+    return indexes
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_constraints(
+    constraint_type_mapper: ConstraintTypeMapper,
+    *,
+    object_filter: ObjectFilter | None = None,
+) -> CatalogPlan[dict[str, Constraint]]:
+    """
+    Fetch the table constraints of the PostgreSQL database.
+
+    Constraint names are only unique per table in PostgreSQL, so the constraints are keyed by "schema.table_name.constraint_name".
+
+    Args:
+        constraint_type_mapper (ConstraintTypeMapper): The mapper to convert native constraint types to DBConstraintType.
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+            Constraints are matched on the name of their table.
+
+    Returns:
+        dict[str, Constraint]: A dictionary of Constraint objects representing the constraints in the database.
+    """
+    filter_condition, filter_parameters = _object_filter(object_filter, "n.nspname", "t.relname", "pg_constraint", "con.oid")
+    select_constraints = f"""
+        SELECT
+            n.nspname,
+            t.relname,
+            con.conname,
+            con.contype,
+            CASE con.confdeltype
+                WHEN 'a' THEN 'NO ACTION'
+                WHEN 'r' THEN 'RESTRICT'
+                WHEN 'c' THEN 'CASCADE'
+                WHEN 'n' THEN 'SET NULL'
+                WHEN 'd' THEN 'SET DEFAULT'
+            END,
+            CASE WHEN con.contype IN ('c', 'x') THEN pg_get_constraintdef(con.oid, true) END,
+            a.attname
+        FROM pg_constraint con
+            JOIN pg_class t
+                ON t.oid = con.conrelid
+            JOIN pg_namespace n
+                ON n.oid = t.relnamespace
+            LEFT JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, position)
+                ON true
+            LEFT JOIN pg_attribute a
+                ON a.attrelid = con.conrelid
+                AND a.attnum = k.attnum
+        WHERE con.contype IN ({", ".join(f"'{constraint_type}'" for constraint_type in CONSTRAINT_TYPES)})
+            AND {filter_condition}
+        ORDER BY n.nspname, t.relname, con.conname, k.position
+    """
+    constraint_rows = yield CatalogQuery(select_constraints, filter_parameters, ExpectedRows.MANY_PER_OBJECT)
+    constraints: dict[str, Constraint] = {}
+
+    for schema, table_name, constraint_name, constraint_type, delete_rule, condition, column_name in constraint_rows:
+        # The above query returns multiple rows per constraint (one per column),
+        # so we need to aggregate them into a single Constraint object.
+        key = f"{schema}.{table_name}.{constraint_name}"
+        if key not in constraints:
+            constraints[key] = Constraint(
+                table_name=intern_identifier(table_name),
+                constraint_type=constraint_type_mapper.map(constraint_type),
+                rule=delete_rule,
+                condition=condition,
+                columns=set(),
+            )
+
+        if column_name:  # Constraints on expressions have no columns
+            constraints[key].columns.add(intern_identifier(column_name))
+
+    return constraints
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_sequences(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, Sequence]]:
+    """
+    Fetch the sequences of the PostgreSQL database.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, Sequence]: A dictionary of Sequence objects keyed by "schema.sequence_name".
+    """
+    filter_condition, filter_parameters = _object_filter(object_filter, "n.nspname", "c.relname", "pg_class", "c.oid")
+    select_sequences = f"""
+        SELECT
+            n.nspname,
+            c.relname,
+            s.seqmin,
+            s.seqmax,
+            s.seqincrement,
+            -- NULL without the privilege to read the sequence, like pg_sequences.last_value
+            CASE WHEN has_sequence_privilege(c.oid, 'SELECT,USAGE') THEN pg_sequence_last_value(c.oid) END
+        FROM pg_sequence s
+            JOIN pg_class c
+                ON c.oid = s.seqrelid
+            JOIN pg_namespace n
+                ON n.oid = c.relnamespace
+        WHERE {filter_condition}
+        ORDER BY n.nspname, c.relname
+    """
+    sequence_rows = yield CatalogQuery(select_sequences, filter_parameters, ExpectedRows.ONE_PER_OBJECT)
+    return {
+        f"{row[0]}.{row[1]}": Sequence(definition=f"min_value: {row[2]}, max_value: {row[3]}, increment_by: {row[4]}, last_value: {row[5]}")
+        for row in sequence_rows
+    }
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_triggers(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, Trigger]]:
+    """
+    Fetch the triggers of the PostgreSQL database, leaving out the internal triggers behind foreign keys.
+
+    Trigger names are only unique per table in PostgreSQL, so the triggers are keyed by "schema.table_name.trigger_name".
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, Trigger]: A dictionary of Trigger objects, whose body is the digest of the trigger definition.
+    """
+    filter_condition, filter_parameters = _object_filter(object_filter, "n.nspname", "tg.tgname", "pg_trigger", "tg.oid")
+    select_triggers = f"""
+        SELECT
+            n.nspname,
+            c.relname,
+            tg.tgname,
+            {SQL_DIGEST.format("pg_get_triggerdef(tg.oid, true)")}
+        FROM pg_trigger tg
+            JOIN pg_class c
+                ON c.oid = tg.tgrelid
+            JOIN pg_namespace n
+                ON n.oid = c.relnamespace
+        WHERE NOT tg.tgisinternal
+            AND {filter_condition}
+        ORDER BY n.nspname, c.relname, tg.tgname
+    """
+    trigger_rows = yield CatalogQuery(select_triggers, filter_parameters, ExpectedRows.ONE_PER_OBJECT)
+    return {
+        f"{schema}.{table_name}.{trigger_name}": Trigger(body=digest, definition=f"table: {table_name}")
+        for schema, table_name, trigger_name, digest in trigger_rows
+    }
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_functions(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, Function]]:
+    """
+    Fetch the functions of the PostgreSQL database (leaving out aggregate and window functions).
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, Function]: A dictionary of Function objects keyed by "schema.function_name(argument types)", as functions can be overloaded.
+    """
+    return (yield from _fetch_postgresql_routines("f", Function, object_filter))
+
+
+@postgresql_catalog_plan
+def fetch_postgresql_stored_procedures(*, object_filter: ObjectFilter | None = None) -> CatalogPlan[dict[str, StoredProcedure]]:
+    """
+    Fetch the procedures of the PostgreSQL database.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, StoredProcedure]: A dictionary of StoredProcedure objects keyed by "schema.procedure_name(argument types)".
+    """
+    return (yield from _fetch_postgresql_routines("p", StoredProcedure, object_filter))
+
+
+def _fetch_postgresql_routines(prokind: str, model_factory: type[T], object_filter: ObjectFilter | None) -> CatalogPlan[dict[str, T]]:
+    """
+    Fetch the functions or procedures of the database in a single query over pg_proc.
+
+    The full definition (from `pg_get_functiondef`) is hashed in the database, so only its digest crosses the network.
+
+    Args:
+        prokind (str): The pg_proc kind of the routines to fetch ("f" for functions, "p" for procedures).
+        model_factory (type[T]): The model of the routines (Function or StoredProcedure).
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+
+    Returns:
+        dict[str, T]: The routines keyed by "schema.routine_name(argument types)".
+    """
+    filter_condition, filter_parameters = _object_filter(object_filter, "n.nspname", "p.proname", "pg_proc", "p.oid")
+    select_routines = f"""
+        SELECT
+            n.nspname,
+            p.proname,
+            pg_get_function_identity_arguments(p.oid),
+            pg_get_function_arguments(p.oid),
+            pg_get_function_result(p.oid),
+            l.lanname,
+            {SQL_DIGEST.format("pg_get_functiondef(p.oid)")}
+        FROM pg_proc p
+            JOIN pg_namespace n
+                ON n.oid = p.pronamespace
+            JOIN pg_language l
+                ON l.oid = p.prolang
+        WHERE p.prokind = '{prokind}'
+            AND {filter_condition}
+        ORDER BY n.nspname, p.proname, 3
+    """
+    routine_rows = yield CatalogQuery(select_routines, filter_parameters, ExpectedRows.ONE_PER_OBJECT)
+    routines: dict[str, T] = {}
+
+    for schema, routine_name, identity_arguments, arguments, result, language, digest in routine_rows:
+        returns = f" RETURNS {result}" if result else ""  # Procedures return nothing
+        routines[f"{schema}.{routine_name}({identity_arguments})"] = model_factory(
+            body=digest,
+            definition=f"({arguments}){returns} LANGUAGE {language}",
+        )
+
+    return routines
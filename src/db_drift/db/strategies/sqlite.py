@@ -2,126 +2,135 @@ import sqlite3
 from collections.abc import Callable
 from typing import TypeVar
 
+from db_drift.db.filters import ObjectFilter, escape_glob_classes
+from db_drift.db.strategies.utils import ExpectedRows, execute_and_stream
 from db_drift.models import Column, Index, Table, Trigger, View
-from db_drift.utils.string import hash_body
+from db_drift.utils.constants import HashAlgorithm
+from db_drift.utils.string import hash_body, intern_identifier
 
-PRAGMA_TABLE_INFO_NAME_INDEX = 1
-PRAGMA_TABLE_INFO_TYPE_INDEX = 2
-PRAGMA_TABLE_INFO_NOT_NULL_INDEX = 3
-PRAGMA_TABLE_INFO_PRIMARY_KEY_INDEX = 5
-PRAGMA_TABLE_XINFO_HIDDEN_INDEX = 6
-PRAGMA_TABLE_XINFO_MIN_LENGTH = 7
+PRAGMA_TABLE_XINFO_HIDDEN_COLUMN = 1  # Hidden columns of virtual tables (generated columns use 2 and 3)
+SQLITE_SCHEMA = "main"  # The schema of the database file opened by the connection
 
 TableLike = TypeVar("TableLike", Table, View)
 
 
-def fetch_sqlite_tables(cursor: sqlite3.Cursor) -> dict[str, Table]:
+def fetch_sqlite_tables(cursor: sqlite3.Cursor, *, object_filter: ObjectFilter | None = None) -> dict[str, Table]:
     """
     Fetch SQLite tables from the database catalog.
 
     Args:
         cursor (sqlite3.Cursor): The SQLite database cursor.
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
 
     Returns:
         dict[str, Table]: A dictionary of Table objects keyed by table name.
     """
-    return _fetch_sqlite_table_like_objects(cursor, object_type="table", model_factory=Table)
+    return _fetch_sqlite_table_like_objects(cursor, object_type="table", model_factory=Table, object_filter=object_filter)
 
 
-def fetch_sqlite_views(cursor: sqlite3.Cursor) -> dict[str, View]:
+def fetch_sqlite_views(cursor: sqlite3.Cursor, *, object_filter: ObjectFilter | None = None) -> dict[str, View]:
     """
     Fetch SQLite views from the database catalog.
 
     Args:
         cursor (sqlite3.Cursor): The SQLite database cursor.
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
 
     Returns:
         dict[str, View]: A dictionary of View objects keyed by view name.
     """
-    return _fetch_sqlite_table_like_objects(cursor, object_type="view", model_factory=View)
+    return _fetch_sqlite_table_like_objects(cursor, object_type="view", model_factory=View, object_filter=object_filter)
 
 
-def fetch_sqlite_indexes(cursor: sqlite3.Cursor) -> dict[str, Index]:
+def fetch_sqlite_indexes(cursor: sqlite3.Cursor, *, object_filter: ObjectFilter | None = None) -> dict[str, Index]:
     """
     Fetch SQLite indexes from the database catalog.
 
     Args:
         cursor (sqlite3.Cursor): The SQLite database cursor.
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
 
     Returns:
         dict[str, Index]: A dictionary of Index objects keyed by index name.
     """
-    select_indexes = """
+    filter_condition, filter_parameters = _object_filter_condition(object_filter, "m.name")
+    # One joined query over the pragma table-valued functions instead of
+    # a PRAGMA index_list + PRAGMA index_info pair for every index
+    select_indexes = f"""
         SELECT
-            name,
-            tbl_name
-        FROM sqlite_master
-        WHERE type = 'index'
-        ORDER BY tbl_name, name
+            m.name,
+            m.tbl_name,
+            il."unique",
+            ii.name
+        FROM sqlite_master m
+            LEFT JOIN pragma_index_list(m.tbl_name) il
+                ON il.name = m.name
+            LEFT JOIN pragma_index_info(m.name) ii
+        WHERE m.type = 'index'{filter_condition}
+        ORDER BY m.tbl_name, m.name, ii.seqno
     """
-    cursor.execute(select_indexes)
-    index_rows = cursor.fetchall()
+    index_rows = execute_and_stream(cursor, select_indexes, filter_parameters, expected_rows=ExpectedRows.MANY_PER_OBJECT)
     indexes: dict[str, Index] = {}
 
-    for index_name, table_name in index_rows:
-        cursor.execute(f"PRAGMA index_list('{_escape_sqlite_name(table_name)}')")
-        index_list_rows = cursor.fetchall()
-        uniqueness = next(
-            ("UNIQUE" if row[2] else "NONUNIQUE" for row in index_list_rows if row[1] == index_name),
-            "NONUNIQUE",
-        )
+    for index_name, table_name, is_unique, column_name in index_rows:
+        # The above query returns one row per indexed column,
+        # so we need to aggregate them into a single Index object.
+        if index_name not in indexes:
+            indexes[index_name] = Index(
+                table_name=intern_identifier(table_name),
+                uniqueness="UNIQUE" if is_unique else "NONUNIQUE",
+                columns=set(),
+            )
 
-        cursor.execute(f"PRAGMA index_info('{_escape_sqlite_name(index_name)}')")
-        index_info_rows = cursor.fetchall()
-        indexes[index_name] = Index(
-            table_name=table_name,
-            uniqueness=uniqueness,
-            columns={row[2] for row in index_info_rows if row[2] is not None},
-        )
+        if column_name is not None:  # Expression columns have no name
+            indexes[index_name].columns.add(intern_identifier(column_name))
 
     return indexes
 
 
-def fetch_sqlite_triggers(cursor: sqlite3.Cursor) -> dict[str, Trigger]:
+def fetch_sqlite_triggers(
+    cursor: sqlite3.Cursor,
+    *,
+    object_filter: ObjectFilter | None = None,
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+) -> dict[str, Trigger]:
     """
     Fetch SQLite triggers from the database catalog.
 
     Args:
         cursor (sqlite3.Cursor): The SQLite database cursor.
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+        hash_algorithm (HashAlgorithm): The algorithm to hash the trigger bodies with.
 
     Returns:
         dict[str, Trigger]: A dictionary of Trigger objects keyed by trigger name.
     """
-    select_triggers = """
+    filter_condition, filter_parameters = _object_filter_condition(object_filter, "name")
+    select_triggers = f"""
         SELECT
             name,
             tbl_name,
             sql
         FROM sqlite_master
-        WHERE type = 'trigger'
+        WHERE type = 'trigger'{filter_condition}
         ORDER BY tbl_name, name
     """
-    cursor.execute(select_triggers)
-    trigger_rows = cursor.fetchall()
+    trigger_rows = execute_and_stream(cursor, select_triggers, filter_parameters, expected_rows=ExpectedRows.ONE_PER_OBJECT)
 
     return {
         row[0]: Trigger(
-            body=hash_body(row[2] or ""),
+            body=hash_body(row[2] or "", hash_algorithm),
             definition=f"table: {row[1]}",
         )
         for row in trigger_rows
     }
 
 
-def _escape_sqlite_name(name: str) -> str:
-    """Escape single quotes in SQLite identifiers used in PRAGMA string arguments."""
-    return name.replace("'", "''")
-
-
 def _fetch_sqlite_table_like_objects(
     cursor: sqlite3.Cursor,
     object_type: str,
     model_factory: Callable[..., TableLike],
+    object_filter: ObjectFilter | None = None,
 ) -> dict[str, TableLike]:
     """
     Fetch table-like SQLite objects and their columns from the database catalog.
@@ -130,37 +139,79 @@ def _fetch_sqlite_table_like_objects(
         cursor (sqlite3.Cursor): The SQLite database cursor.
         object_type (str): The type of object to fetch ('table' or 'view').
         model_factory (Callable[..., TableLike]): A factory function to create the appropriate model (Table or View).
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
 
     Returns:
         dict[str, TableLike]: A dictionary of TableLike objects keyed by object name.
     """
+    filter_condition, filter_parameters = _object_filter_condition(object_filter, "m.name")
+    # One joined query over pragma_table_xinfo() instead of a PRAGMA table_xinfo per object
     select_objects = f"""
         SELECT
-            name
-        FROM sqlite_master
-        WHERE type = '{object_type}'
-            AND name NOT LIKE 'sqlite_%'
-        ORDER BY name
+            m.name,
+            c.name,
+            c.type,
+            c."notnull",
+            c.pk,
+            c.hidden
+        FROM sqlite_master m
+            LEFT JOIN pragma_table_xinfo(m.name) c
+        WHERE m.type = ?
+            AND m.name NOT LIKE 'sqlite_%'{filter_condition}
+        ORDER BY m.name, c.cid
     """
-    cursor.execute(select_objects)
-    object_rows = cursor.fetchall()
+    column_rows = execute_and_stream(cursor, select_objects, (object_type, *filter_parameters), expected_rows=ExpectedRows.MANY_PER_OBJECT)
     objects: dict[str, TableLike] = {}
 
-    for (object_name,) in object_rows:
-        cursor.execute(f"PRAGMA table_xinfo('{_escape_sqlite_name(object_name)}')")
-        column_rows = cursor.fetchall()
-        objects[object_name] = model_factory(doc="", columns={})
-
-        for column in column_rows:
-            hidden = column[PRAGMA_TABLE_XINFO_HIDDEN_INDEX] if len(column) >= PRAGMA_TABLE_XINFO_MIN_LENGTH else 0
-            if hidden == 1:
-                continue
-
-            is_primary_key = column[PRAGMA_TABLE_INFO_PRIMARY_KEY_INDEX] > 0
-            objects[object_name].columns[column[PRAGMA_TABLE_INFO_NAME_INDEX]] = Column(
-                doc="",
-                data_type=column[PRAGMA_TABLE_INFO_TYPE_INDEX] or "",
-                is_nullable=(False if is_primary_key else not bool(column[PRAGMA_TABLE_INFO_NOT_NULL_INDEX])),
-            )
+    for object_name, column_name, data_type, not_null, primary_key, hidden in column_rows:
+        if object_name not in objects:
+            objects[object_name] = model_factory(doc="", columns={})
+
+        if column_name is None or hidden == PRAGMA_TABLE_XINFO_HIDDEN_COLUMN:
+            continue
+
+        is_primary_key = primary_key > 0
+        objects[object_name].columns[intern_identifier(column_name)] = Column(
+            doc="",
+            data_type=intern_identifier(data_type or ""),
+            is_nullable=(False if is_primary_key else not bool(not_null)),
+        )
 
     return objects
+
+
+def _object_filter_condition(object_filter: ObjectFilter | None, name_column: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Build the conditions that leave the objects left out by the object filter out of a catalog query.
+
+    The connection only reads the `main` schema, so the schema filter either keeps or drops every object,
+    and object names are matched with SQLite's own (case-sensitive) GLOB operator.
+
+    Args:
+        object_filter (ObjectFilter | None): The schemas and object names to fetch, or None to fetch all.
+        name_column (str): The object name column.
+
+    Returns:
+        tuple[str, tuple[str, ...]]: The conditions (each prefixed with AND, empty if there are none) and their parameters.
+    """
+    if object_filter is None:
+        return "", ()
+
+    conditions: list[str] = []
+    parameters: list[str] = []
+
+    if object_filter.include_schemas:
+        conditions.append(f"'{SQLITE_SCHEMA}' IN ({', '.join('?' for _ in object_filter.include_schemas)})")
+        parameters.extend(object_filter.include_schemas)
+    if object_filter.exclude_schemas:
+        conditions.append(f"'{SQLITE_SCHEMA}' NOT IN ({', '.join('?' for _ in object_filter.exclude_schemas)})")
+        parameters.extend(object_filter.exclude_schemas)
+
+    if object_filter.include_names:
+        conditions.append(f"({' OR '.join(f'{name_column} GLOB ?' for _ in object_filter.include_names)})")
+        parameters.extend(escape_glob_classes(pattern) for pattern in object_filter.include_names)
+    if object_filter.exclude_names:
+        conditions.append(f"NOT ({' OR '.join(f'{name_column} GLOB ?' for _ in object_filter.exclude_names)})")
+        parameters.extend(escape_glob_classes(pattern) for pattern in object_filter.exclude_names)
+
+    return "".join(f"\n            AND {condition}" for condition in conditions), tuple(parameters)
@@ -0,0 +1,166 @@
+import functools
+from collections.abc import Callable, Generator, Iterable, Iterator
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Concatenate, Generic, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class ExpectedRows(IntEnum):
+    """
+    The expected size of a catalog query result, used as the number of rows fetched per round-trip.
+
+    Larger batches mean fewer round-trips, smaller batches mean a smaller buffer per query.
+    """
+
+    FEW = 100  # A handful of rows per database (editions, directories, ...), fetched in a single round-trip
+    ONE_PER_OBJECT = 1_000  # One row per table, view, trigger, sequence, ...
+    MANY_PER_OBJECT = 10_000  # One row per column, argument, index column or source line
+
+
+def execute_and_stream(
+    cursor: Any,  # noqa: ANN401 # Any DB-API cursor (oracledb, sqlite3, ...)
+    statement: str,
+    parameters: tuple | dict | None = None,
+    *,
+    expected_rows: ExpectedRows = ExpectedRows.ONE_PER_OBJECT,
+) -> Iterator[Any]:
+    """
+    Execute a catalog query and stream its rows in batches, instead of materializing them with `fetchall()`.
+
+    The statement is executed eagerly, so consecutive calls on the same cursor are safe
+    as long as each stream is consumed before the next call.
+
+    Args:
+        cursor (Any): The DB-API cursor to execute the query on.
+        statement (str): The query to execute.
+        parameters (tuple | dict | None): The bind parameters of the query, if any.
+        expected_rows (ExpectedRows): The expected size of the result, used as the fetch batch size.
+
+    Returns:
+        Iterator[Any]: The rows of the query. Only one batch of rows is held in memory at a time.
+    """
+    cursor.arraysize = expected_rows
+    if hasattr(cursor, "prefetchrows"):
+        # python-oracledb: also return the first batch with the execute round-trip
+        cursor.prefetchrows = expected_rows
+
+    if parameters is None:
+        cursor.execute(statement)
+    else:
+        cursor.execute(statement, parameters)
+
+    return _stream_rows(cursor)
+
+
+def _stream_rows(cursor: Any) -> Iterator[Any]:  # noqa: ANN401
+    """
+    Yield the rows of the last executed query, fetching `cursor.arraysize` rows at a time.
+
+    Args:
+        cursor (Any): The DB-API cursor the query was executed on.
+
+    Yields:
+        Any: The rows of the query.
+    """
+    while rows := cursor.fetchmany():
+        yield from rows
+
+
+@dataclass(frozen=True)
+class CatalogQuery:
+    """A catalog query whose rows a catalog plan needs."""
+
+    statement: str
+    parameters: tuple | dict | None = None
+    expected_rows: ExpectedRows = ExpectedRows.ONE_PER_OBJECT
+
+
+# A catalog plan yields the queries it needs one at a time, is sent the rows of each one,
+# and returns the fetched objects. Keeping the I/O out of the plans lets the same plan run on a
+# blocking cursor (where the rows are streamed), on an asyncio connection or in a pipeline.
+# A plan must consume the rows of a query before it yields the next one.
+CatalogPlan = Generator[CatalogQuery, Iterable[Any], T]
+
+
+def run_catalog_plan(
+    cursor: Any,  # noqa: ANN401 # Any DB-API cursor (oracledb, sqlite3, ...)
+    plan: CatalogPlan[T],
+    bind_parameters: Callable[[Any, tuple | dict | None], tuple | dict | None] | None = None,
+) -> T:
+    """
+    Run a catalog plan on a blocking DB-API cursor, streaming the rows of every query into it.
+
+    Args:
+        cursor (Any): The DB-API cursor to execute the queries on.
+        plan (CatalogPlan[T]): The plan to run.
+        bind_parameters (Callable | None): Converts the parameters of a query into values the driver can bind, given the cursor.
+
+    Returns:
+        T: What the plan returns.
+    """
+    rows = None
+    while True:
+        try:
+            query = plan.send(rows)
+        except StopIteration as finished:
+            return finished.value
+
+        parameters = bind_parameters(cursor, query.parameters) if bind_parameters else query.parameters
+        rows = execute_and_stream(cursor, query.statement, parameters, expected_rows=query.expected_rows)
+
+
+class CatalogFetcher(Generic[P, T]):
+    """
+    A fetch function built from a catalog plan.
+
+    Calling it with a cursor (followed by the arguments of the plan) runs the plan on that cursor,
+    like any other fetch function of a registry. `plan` creates the plan itself, for other drivers.
+    """
+
+    def __init__(
+        self,
+        plan: Callable[P, CatalogPlan[T]],
+        bind_parameters: Callable[[Any, tuple | dict | None], tuple | dict | None] | None = None,
+    ) -> None:
+        """
+        Wrap a catalog plan function.
+
+        Args:
+            plan (Callable[P, CatalogPlan[T]]): Creates the plan.
+            bind_parameters (Callable | None): Converts the parameters of a query into values the driver can bind, given the cursor.
+        """
+        functools.update_wrapper(self, plan)
+        self.plan = plan
+        self.bind_parameters = bind_parameters
+
+    def __call__(self, cursor: Any, *args: P.args, **kwargs: P.kwargs) -> T:  # noqa: ANN401
+        return run_catalog_plan(cursor, self.plan(*args, **kwargs), self.bind_parameters)
+
+
+def create_catalog_plan(fetch_function: Callable[Concatenate[Any, ...], T]) -> CatalogPlan[T]:
+    """
+    Create the catalog plan behind a registry fetch function.
+
+    Args:
+        fetch_function (Callable): A `CatalogFetcher`, or a `functools.partial` of one that binds some of its arguments.
+
+    Returns:
+        CatalogPlan[T]: The plan, with the bound arguments applied.
+
+    Raises:
+        TypeError: If the fetch function is not built from a catalog plan.
+    """
+    args: tuple = ()
+    kwargs: dict[str, Any] = {}
+    if isinstance(fetch_function, functools.partial):
+        args, kwargs = fetch_function.args, fetch_function.keywords
+        fetch_function = fetch_function.func
+
+    if not isinstance(fetch_function, CatalogFetcher):
+        msg = f"{fetch_function!r} is not built from a catalog plan."
+        raise TypeError(msg)
+
+    return fetch_function.plan(*args, **kwargs)
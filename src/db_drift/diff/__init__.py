@@ -0,0 +1,47 @@
+"""Structured differences between two schema structures."""
+
+from db_drift.diff.compare import (
+    ADDED,
+    MODIFIED,
+    REMOVED,
+    FieldChange,
+    ObjectDiff,
+    ObjectDrift,
+    ObjectTypeDiff,
+    StructureDiff,
+    comparison_plan,
+    diff_object,
+    diff_objects,
+    diff_structures,
+    iter_drift,
+)
+from db_drift.diff.fingerprint import (
+    ObjectTypeFingerprint,
+    SchemaFingerprint,
+    StructureFingerprint,
+    fingerprint_object,
+    fingerprint_structure,
+    object_schema,
+)
+
+__all__ = [
+    "ADDED",
+    "MODIFIED",
+    "REMOVED",
+    "FieldChange",
+    "ObjectDiff",
+    "ObjectDrift",
+    "ObjectTypeDiff",
+    "ObjectTypeFingerprint",
+    "SchemaFingerprint",
+    "StructureDiff",
+    "StructureFingerprint",
+    "comparison_plan",
+    "diff_object",
+    "diff_objects",
+    "diff_structures",
+    "fingerprint_object",
+    "fingerprint_structure",
+    "iter_drift",
+    "object_schema",
+]
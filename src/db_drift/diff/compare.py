@@ -0,0 +1,272 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from typing import Any, Literal
+
+from db_drift.diff.fingerprint import StructureFingerprint, object_schema
+from db_drift.models import Column, DatabaseObject
+
+# The field of the models that holds their columns: a dict of Column (tables, views, ...) or a set of column names (indexes, constraints)
+COLUMNS_FIELD = "columns"
+
+# The ways an object can drift
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """A field whose value differs between the source and the target version of an object (or column)."""
+
+    field: str
+    source: Any
+    target: Any
+
+
+@dataclass
+class ObjectDiff:
+    """The differences between the source and the target version of an object."""
+
+    changes: list[FieldChange] = field(default_factory=list)  # Of every field but the columns
+    added_columns: list[str] = field(default_factory=list)
+    removed_columns: list[str] = field(default_factory=list)
+    # Only for objects with column details (tables, views, ...): the changed fields of every modified column
+    modified_columns: dict[str, list[FieldChange]] = field(default_factory=dict)
+
+
+@dataclass
+class ObjectTypeDiff:
+    """The objects of one object type that were added, removed or modified in the target."""
+
+    added: dict[str, DatabaseObject] = field(default_factory=dict)  # Only in the target
+    removed: dict[str, DatabaseObject] = field(default_factory=dict)  # Only in the source
+    modified: dict[str, ObjectDiff] = field(default_factory=dict)
+    unchanged: int = 0
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+@dataclass(frozen=True)
+class ObjectDrift:
+    """An object added to, removed from or modified in the target, as yielded by `iter_drift`."""
+
+    object_type: str
+    name: str  # The key of the object in the structure
+    change: Literal["added", "removed", "modified"]
+    diff: ObjectDiff | None = None  # Only for modified objects
+
+
+@dataclass
+class StructureDiff:
+    """The differences between two schema structures, by object type."""
+
+    object_types: dict[str, ObjectTypeDiff] = field(default_factory=dict)
+
+    @property
+    def has_drift(self) -> bool:
+        return any(object_type_diff.has_drift for object_type_diff in self.object_types.values())
+
+
+def diff_structures(
+    source: dict[str, dict[str, DatabaseObject]],
+    target: dict[str, dict[str, DatabaseObject]],
+    source_fingerprint: StructureFingerprint | None = None,
+    target_fingerprint: StructureFingerprint | None = None,
+) -> StructureDiff:
+    """
+    Compare two schema structures, as returned by `fetch_schema_structure`.
+
+    Identical objects are skipped after a single equality check: bodies and definitions are stored as SHA-256 digests,
+    so comparing them takes constant time however long the source code is. Only the objects that differ are compared
+    field by field, and only the columns of those.
+
+    With the fingerprints of both structures, equal root digests mean no object is compared at all, and otherwise
+    only the objects of the schemas and object types whose digests differ are.
+
+    Args:
+        source (dict[str, dict[str, DatabaseObject]]): The schema structure of the source database.
+        target (dict[str, dict[str, DatabaseObject]]): The schema structure of the target database.
+        source_fingerprint (StructureFingerprint | None): The fingerprint of the source structure, if known.
+        target_fingerprint (StructureFingerprint | None): The fingerprint of the target structure, if known.
+
+    Returns:
+        StructureDiff: The differences of every object type of either structure, in the order of the source
+            (followed by the object types only the target has).
+    """
+    structure_diff = StructureDiff()
+    for obj_type, source_objects, target_objects, unchanged in comparison_plan(source, target, source_fingerprint, target_fingerprint):
+        object_type_diff = diff_objects(source_objects, target_objects) if source_objects or target_objects else ObjectTypeDiff()
+        object_type_diff.unchanged += unchanged
+        structure_diff.object_types[obj_type] = object_type_diff
+    return structure_diff
+
+
+def iter_drift(
+    source: dict[str, dict[str, DatabaseObject]],
+    target: dict[str, dict[str, DatabaseObject]],
+    source_fingerprint: StructureFingerprint | None = None,
+    target_fingerprint: StructureFingerprint | None = None,
+) -> Iterator[ObjectDrift]:
+    """
+    Compare two schema structures like `diff_structures`, yielding every drifted object as soon as it is found.
+
+    Nothing is kept once yielded, so the differences can be written out while the comparison goes on.
+
+    Args:
+        source (dict[str, dict[str, DatabaseObject]]): The schema structure of the source database.
+        target (dict[str, dict[str, DatabaseObject]]): The schema structure of the target database.
+        source_fingerprint (StructureFingerprint | None): The fingerprint of the source structure, if known.
+        target_fingerprint (StructureFingerprint | None): The fingerprint of the target structure, if known.
+
+    Yields:
+        ObjectDrift: The added, removed and modified objects, by object type: the removed and modified ones in the order
+            of the source, then the added ones in the order of the target.
+    """
+    for obj_type, source_objects, target_objects, _ in comparison_plan(source, target, source_fingerprint, target_fingerprint):
+        for name, source_obj in source_objects.items():
+            target_obj = target_objects.get(name)
+            if target_obj is None:
+                yield ObjectDrift(obj_type, name, REMOVED)
+            elif source_obj != target_obj:
+                yield ObjectDrift(obj_type, name, MODIFIED, diff_object(source_obj, target_obj))
+
+        yield from (ObjectDrift(obj_type, name, ADDED) for name in target_objects if name not in source_objects)
+
+
+def comparison_plan(
+    source: dict[str, dict[str, DatabaseObject]],
+    target: dict[str, dict[str, DatabaseObject]],
+    source_fingerprint: StructureFingerprint | None,
+    target_fingerprint: StructureFingerprint | None,
+) -> Iterator[tuple[str, dict[str, DatabaseObject], dict[str, DatabaseObject], int]]:
+    """
+    Decide which objects of every object type have to be compared, using the fingerprints of both structures if known.
+
+    Args:
+        source (dict[str, dict[str, DatabaseObject]]): The schema structure of the source database.
+        target (dict[str, dict[str, DatabaseObject]]): The schema structure of the target database.
+        source_fingerprint (StructureFingerprint | None): The fingerprint of the source structure, if known.
+        target_fingerprint (StructureFingerprint | None): The fingerprint of the target structure, if known.
+
+    Yields:
+        tuple[str, dict[str, DatabaseObject], dict[str, DatabaseObject], int]: Every object type of either structure, with
+            the source and target objects to compare and the number of objects known to be unchanged without comparing them.
+    """
+    object_types = dict.fromkeys([*source, *target])
+    if source_fingerprint is None or target_fingerprint is None:
+        yield from ((obj_type, source.get(obj_type, {}), target.get(obj_type, {}), 0) for obj_type in object_types)
+        return
+
+    if source_fingerprint.digest == target_fingerprint.digest:
+        yield from ((obj_type, {}, {}, len(source.get(obj_type, {}))) for obj_type in object_types)
+        return
+
+    unchanged = dict.fromkeys(object_types, 0)
+    # The schemas of every object type whose digests differ
+    differing_schemas: dict[str, set[str]] = {}
+    for schema in dict.fromkeys([*source_fingerprint.schemas, *target_fingerprint.schemas]):
+        source_schema, target_schema = source_fingerprint.schemas.get(schema), target_fingerprint.schemas.get(schema)
+        source_groups = source_schema.object_types if source_schema else {}
+        target_groups = target_schema.object_types if target_schema else {}
+        schema_unchanged = source_schema is not None and target_schema is not None and source_schema.digest == target_schema.digest
+
+        for obj_type in dict.fromkeys([*source_groups, *target_groups]):
+            source_group, target_group = source_groups.get(obj_type), target_groups.get(obj_type)
+            if schema_unchanged or (source_group is not None and source_group == target_group):
+                unchanged[obj_type] += source_group.object_count
+            else:
+                differing_schemas.setdefault(obj_type, set()).add(schema)
+
+    for obj_type in object_types:
+        schemas = differing_schemas.get(obj_type, set())
+        yield (
+            obj_type,
+            {name: obj for name, obj in source.get(obj_type, {}).items() if object_schema(name) in schemas} if schemas else {},
+            {name: obj for name, obj in target.get(obj_type, {}).items() if object_schema(name) in schemas} if schemas else {},
+            unchanged[obj_type],
+        )
+
+
+def diff_objects(source: dict[str, DatabaseObject], target: dict[str, DatabaseObject]) -> ObjectTypeDiff:
+    """
+    Compare the objects of one object type.
+
+    Args:
+        source (dict[str, DatabaseObject]): The objects of the source database, by name.
+        target (dict[str, DatabaseObject]): The objects of the target database, by name.
+
+    Returns:
+        ObjectTypeDiff: The added, removed and modified objects, with the removed and modified ones in the order of the source
+            and the added ones in the order of the target.
+    """
+    object_type_diff = ObjectTypeDiff()
+
+    for name, source_obj in source.items():
+        target_obj = target.get(name)
+        if target_obj is None:
+            object_type_diff.removed[name] = source_obj
+        elif source_obj == target_obj:
+            object_type_diff.unchanged += 1
+        else:
+            object_type_diff.modified[name] = diff_object(source_obj, target_obj)
+
+    if len(target) > len(source) - len(object_type_diff.removed):  # Some names are only in the target
+        object_type_diff.added = {name: target_obj for name, target_obj in target.items() if name not in source}
+
+    return object_type_diff
+
+
+def diff_object(source: DatabaseObject, target: DatabaseObject) -> ObjectDiff:
+    """
+    Compare the source and the target version of an object, field by field.
+
+    Args:
+        source (DatabaseObject): The source version.
+        target (DatabaseObject): The target version.
+
+    Returns:
+        ObjectDiff: The changed fields, and the added, removed and modified columns.
+    """
+    if type(source) is not type(target):
+        return ObjectDiff(changes=[FieldChange("model", type(source).__name__, type(target).__name__)])
+
+    object_diff = ObjectDiff()
+    for model_field in fields(source):
+        source_value, target_value = getattr(source, model_field.name), getattr(target, model_field.name)
+        if source_value == target_value:
+            continue
+
+        if model_field.name == COLUMNS_FIELD and isinstance(source_value, dict) and isinstance(target_value, dict):
+            _diff_column_details(source_value, target_value, object_diff)
+        elif model_field.name == COLUMNS_FIELD and isinstance(source_value, set) and isinstance(target_value, set):
+            object_diff.added_columns = sorted(target_value - source_value)
+            object_diff.removed_columns = sorted(source_value - target_value)
+        else:
+            object_diff.changes.append(FieldChange(model_field.name, source_value, target_value))
+
+    return object_diff
+
+
+def _diff_column_details(source: dict[str, Column], target: dict[str, Column], object_diff: ObjectDiff) -> None:
+    """
+    Compare the columns of the source and the target version of an object, in column order.
+
+    Args:
+        source (dict[str, Column]): The source columns, by name.
+        target (dict[str, Column]): The target columns, by name.
+        object_diff (ObjectDiff): The differences of the object, to add the column differences to.
+    """
+    for name, source_column in source.items():
+        target_column = target.get(name)
+        if target_column is None:
+            object_diff.removed_columns.append(name)
+        elif source_column != target_column:
+            object_diff.modified_columns[name] = [
+                FieldChange(column_field.name, getattr(source_column, column_field.name), getattr(target_column, column_field.name))
+                for column_field in fields(source_column)
+                if getattr(source_column, column_field.name) != getattr(target_column, column_field.name)
+            ]
+
+    object_diff.added_columns = [name for name in target if name not in source]
@@ -0,0 +1,209 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from functools import cache, lru_cache
+from typing import Any
+
+from db_drift.models import DatabaseObject
+from db_drift.utils.string import hash_body
+
+
+@dataclass(frozen=True)
+class ObjectTypeFingerprint:
+    """The digest of the objects of one object type in one schema."""
+
+    digest: str
+    object_count: int
+
+
+@dataclass
+class SchemaFingerprint:
+    """The digest of the objects of one schema, over the digests of its object types."""
+
+    digest: str
+    object_types: dict[str, ObjectTypeFingerprint] = field(default_factory=dict)
+
+
+@dataclass
+class StructureFingerprint:
+    """
+    A Merkle tree over a schema structure: columns, objects, object types, schemas and the whole database.
+
+    Every level is the digest of the level below, so two structures with the same root digest are identical,
+    and a comparison only has to descend into the schemas and object types whose digests differ.
+    Only the levels above the objects are kept: the objects of a differing object type are compared directly.
+    """
+
+    digest: str
+    schemas: dict[str, SchemaFingerprint] = field(default_factory=dict)
+
+    def restricted_to(self, object_types: Iterable[str]) -> "StructureFingerprint":
+        """
+        Derive the fingerprint of the structure with only some of its object types, from the digests of those object types.
+
+        Args:
+            object_types (Iterable[str]): The object types to keep.
+
+        Returns:
+            StructureFingerprint: The fingerprint of the smaller structure. No object is hashed again.
+        """
+        object_types = set(object_types)
+        return _combine(
+            {
+                schema: {obj_type: group for obj_type, group in schema_fingerprint.object_types.items() if obj_type in object_types}
+                for schema, schema_fingerprint in self.schemas.items()
+            },
+        )
+
+
+def object_schema(name: str) -> str:
+    """
+    Find the schema of an object from its key in the structure.
+
+    Args:
+        name (str): The key, e.g. "name" (SQLite), "schema.name", "schema.table.name" or "schema.name(argument types)".
+
+    Returns:
+        str: The schema, or "" for keys without one.
+    """
+    return name.partition(".")[0] if "." in name.split("(")[0] else ""
+
+
+def fingerprint_structure(structure: dict[str, dict[str, DatabaseObject]]) -> StructureFingerprint:
+    """
+    Compute the fingerprint of a schema structure.
+
+    Args:
+        structure (dict[str, dict[str, DatabaseObject]]): The schema structure, as returned by `fetch_schema_structure`.
+
+    Returns:
+        StructureFingerprint: The digests of the structure, its schemas and the object types of every schema.
+    """
+    object_digests: dict[str, dict[str, list[str]]] = {}
+    for obj_type, objects in structure.items():
+        for name, obj in objects.items():
+            object_digests.setdefault(object_schema(name), {}).setdefault(obj_type, []).append(f"{name}={fingerprint_object(obj)}")
+
+    return _combine(
+        {
+            schema: {obj_type: ObjectTypeFingerprint(_digest(digests), len(digests)) for obj_type, digests in schema_digests.items()}
+            for schema, schema_digests in object_digests.items()
+        },
+    )
+
+
+def fingerprint_object(obj: DatabaseObject) -> str:
+    """
+    Compute the digest of an object, over the digests of its columns.
+
+    Two objects have the same digest exactly when they are equal: columns are combined in name order (like the comparison
+    of two dicts), sets are sorted, and the model class is part of the digest.
+
+    Args:
+        obj (DatabaseObject): The object.
+
+    Returns:
+        str: The SHA-256 digest of the object, from `hash_body`.
+    """
+    return hash_body(repr((type(obj).__name__, *[_canonical(getattr(obj, name)) for name in _field_names(type(obj))])))
+
+
+def _fingerprint_column(column: DatabaseObject) -> str:
+    """
+    Compute the digest of a column.
+
+    Columns repeat a lot (the same type, nullability and no comment), so their digests are cached by their field values.
+
+    Args:
+        column (DatabaseObject): The column, e.g. a `Column`.
+
+    Returns:
+        str: The SHA-256 digest of the column.
+    """
+    values = tuple(getattr(column, name) for name in _field_names(type(column)))
+    try:
+        return _fingerprint_values(type(column).__name__, values)
+    except TypeError:  # A field holds an unhashable value
+        return fingerprint_object(column)
+
+
+@lru_cache(maxsize=65_536)
+def _fingerprint_values(model_name: str, values: tuple) -> str:
+    """
+    Compute the digest of an object from the values of its fields, like `fingerprint_object`.
+
+    Args:
+        model_name (str): The name of the model class of the object.
+        values (tuple): The values of its fields, all hashable.
+
+    Returns:
+        str: The SHA-256 digest of the object.
+    """
+    return hash_body(repr((model_name, *[_canonical(value) for value in values])))
+
+
+@cache
+def _field_names(model: type) -> tuple[str, ...]:
+    """
+    List the fields of a model class, once per class rather than once per object.
+
+    Args:
+        model (type): The model class.
+
+    Returns:
+        tuple[str, ...]: The names of its fields, in declaration order.
+    """
+    return tuple(model_field.name for model_field in fields(model))
+
+
+def _canonical(value: Any) -> Any:  # noqa: ANN401
+    """
+    Turn the value of a field into a value whose repr only depends on what the field compares equal on.
+
+    Args:
+        value (Any): The value of a field.
+
+    Returns:
+        Any: Columns become their digests by name, sets sorted tuples and enums their qualified name.
+    """
+    if value is None or type(value) in (str, bool, int):  # Most fields, checked first
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted((name, _fingerprint_column(column) if is_dataclass(column) else column) for name, column in value.items()))
+    if isinstance(value, set | frozenset):
+        return tuple(sorted(value))
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    return value
+
+
+def _combine(object_types_by_schema: dict[str, dict[str, ObjectTypeFingerprint]]) -> StructureFingerprint:
+    """
+    Build the upper levels of a fingerprint from the digests of the object types of every schema.
+
+    Args:
+        object_types_by_schema (dict[str, dict[str, ObjectTypeFingerprint]]): The object type digests, by schema.
+
+    Returns:
+        StructureFingerprint: The fingerprint. Schemas and object types without objects are left out,
+            so that they do not tell two structures apart.
+    """
+    schemas = {
+        schema: SchemaFingerprint(_digest(f"{obj_type}={group.digest}" for obj_type, group in object_types.items()), dict(object_types))
+        for schema, object_types in object_types_by_schema.items()
+        if object_types
+    }
+    return StructureFingerprint(_digest(f"{schema}={schema_fingerprint.digest}" for schema, schema_fingerprint in schemas.items()), schemas)
+
+
+def _digest(entries: Iterable[str]) -> str:
+    """
+    Compute the digest of a level of the tree from the named digests of the level below.
+
+    Args:
+        entries (Iterable[str]): The "name=digest" entries, in any order.
+
+    Returns:
+        str: The SHA-256 digest of the sorted entries.
+    """
+    return hash_body("\n".join(sorted(entries)))
@@ -1,6 +1,6 @@
-from db_drift.models.abstract_models import DatabaseObject, DatabaseObjectWithDefinition, DatabaseObjectWithDoc, DatabaseObjectWithHashedBody
+from db_drift.models.abstract_models import DatabaseObject, DatabaseObjectWithHashedBody
 from db_drift.models.column import Column
-from db_drift.models.complex_abstract_models import DatabaseObjectIndexLike, DatabaseObjectWithColumns
+from db_drift.models.complex_abstract_models import DatabaseObjectIndexLike
 from db_drift.models.constraint import Constraint
 from db_drift.models.directory import Directory
 from db_drift.models.edition import Edition
@@ -24,9 +24,6 @@ __all__ = [
     "Constraint",
     "DatabaseObject",
     "DatabaseObjectIndexLike",
-    "DatabaseObjectWithColumns",
-    "DatabaseObjectWithDefinition",
-    "DatabaseObjectWithDoc",
     "DatabaseObjectWithHashedBody",
     "Directory",
     "Edition",
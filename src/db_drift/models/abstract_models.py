@@ -1,7 +1,12 @@
 from dataclasses import dataclass
 
+# The models are slotted: a catalog can hold millions of them, and slots take a fraction of the memory of a __dict__.
+# The bases that the models combine (e.g. a table has both a doc and columns) declare their fields without storage
+# (`__slots__ = ()`), as several bases with slots cannot be combined, and the models themselves add the slots.
+# Those bases are therefore abstract: they have nowhere to store their fields, and are not exported by `db_drift.models`.
 
-@dataclass
+
+@dataclass(slots=True)
 class DatabaseObject:
     """Base class for all database objects."""
 
@@ -10,10 +15,12 @@ class DatabaseObject:
 class DatabaseObjectWithDoc(DatabaseObject):
     """Database object that can have documentation/comments."""
 
+    __slots__ = ()
+
     doc: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseObjectWithHashedBody(DatabaseObject):
     """Database object with executable code (functions, procedures, etc.)."""
 
@@ -25,9 +32,11 @@ class DatabaseObjectWithHashedBody(DatabaseObject):
 class DatabaseObjectWithDefinition(DatabaseObject):
     """Database object defined by a simple definition string."""
 
+    __slots__ = ()
+
     definition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseObjectWithDefinitionAndDoc(DatabaseObjectWithDefinition, DatabaseObjectWithDoc):
     """Database object that has both a definition and documentation."""
@@ -8,17 +8,19 @@ from db_drift.models.column import Column
 class DatabaseObjectWithColumns(DatabaseObject):
     """Database object that contains columns (tables, views, etc.)."""
 
+    __slots__ = ()  # Combined with DatabaseObjectWithDoc, see abstract_models
+
     columns: dict[str, Column]
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseObjectWithColumnsNoDetails(DatabaseObject):
     """Database object that contains columns (indexes, constraints, etc.) without column details."""
 
     columns: set[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseObjectIndexLike(DatabaseObjectWithColumnsNoDetails):
     """Base class for index-like objects (indexes, constraints)."""
 
@@ -4,7 +4,7 @@ from db_drift.models.complex_abstract_models import DatabaseObjectIndexLike
 from db_drift.utils.constants import DBConstraintTypeEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint(DatabaseObjectIndexLike):
     constraint_type: DBConstraintTypeEnum | str
     rule: str | None = None  # For FOREIGN KEY constraints
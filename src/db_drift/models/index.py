@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from db_drift.models.complex_abstract_models import DatabaseObjectIndexLike
 
 
-@dataclass
+@dataclass(slots=True)
 class Index(DatabaseObjectIndexLike):
     uniqueness: str
     tablespace: str | None = None
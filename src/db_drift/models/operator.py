@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from db_drift.models.abstract_models import DatabaseObjectWithDoc
 
 
-@dataclass
+@dataclass(slots=True)
 class Operator(DatabaseObjectWithDoc):
     """Represents a database operator with comprehensive metadata."""
 
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from db_drift.models.abstract_models import DatabaseObjectWithDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class Sequence(DatabaseObjectWithDefinition): ...
 
 
@@ -4,7 +4,7 @@ from db_drift.models.abstract_models import DatabaseObjectWithDoc
 from db_drift.models.complex_abstract_models import DatabaseObjectWithColumns
 
 
-@dataclass
+@dataclass(slots=True)
 class View(
     DatabaseObjectWithDoc,
     DatabaseObjectWithColumns,
@@ -1,25 +1,214 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from html import escape
 from pathlib import Path
 
+from db_drift.diff import FieldChange, ObjectDiff, StructureFingerprint, comparison_plan, diff_object
+from db_drift.models import DatabaseObject
+
+# Large enough that writing the report takes a few hundred system calls rather than one per line
+REPORT_BUFFER_SIZE = 1024 * 1024
+# Browsers skip laying out the sections out of view until they are scrolled to, so long reports open quickly
+REPORT_STYLE = "section{content-visibility:auto;contain-intrinsic-size:auto 40em}"
+
+
+@dataclass(frozen=True, slots=True)
+class _DriftCounts:
+    """The number of objects of one object type that were added, removed, modified in the target or left unchanged."""
+
+    added: int
+    removed: int
+    modified: int
+    unchanged: int
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
 
 def generate_drift_report(
     db_structure_source: dict,
     db_structure_target: dict,
     output_filename: str,
+    skipped_object_types: Iterable[str] = (),
+    fingerprints: tuple[StructureFingerprint | None, StructureFingerprint | None] = (None, None),
 ) -> None:
     """
     Generate a drift report comparing two database structures.
 
+    Only the differences are written: the objects added to, removed from and modified in the target,
+    with the changed fields and columns of the modified ones. Unchanged objects are only counted.
+    The report is streamed to the file a section at a time, and every modified object is diffed while its entry
+    is written, so neither the report nor the differences are ever held in memory whole.
+
     Args:
         db_structure_source (dict): Schema structure of the source database
         db_structure_target (dict): Schema structure of the target database
         output_filename (str): Filename to save the generated report
+        skipped_object_types (Iterable[str]): Object types that were not compared, so that a partial scan is reported as such
+        fingerprints (tuple[StructureFingerprint | None, StructureFingerprint | None]): The fingerprints of the source and target
+            structures, if known, so that only the schemas and object types whose digests differ are compared
+    """
+    with Path.open(output_filename, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as report_file:
+        report_file.writelines(_render_report(db_structure_source, db_structure_target, list(skipped_object_types), fingerprints))
+
+
+def _render_report(
+    source: dict[str, dict[str, DatabaseObject]],
+    target: dict[str, dict[str, DatabaseObject]],
+    skipped_object_types: list[str],
+    fingerprints: tuple[StructureFingerprint | None, StructureFingerprint | None],
+) -> Iterator[str]:
+    """
+    Render the drift report, a line at a time.
+
+    The drift of every object type is counted first, for the summaries at the top of the report and of its sections,
+    then the sections are rendered one object type and one object at a time.
+
+    Args:
+        source (dict[str, dict[str, DatabaseObject]]): Schema structure of the source database.
+        target (dict[str, dict[str, DatabaseObject]]): Schema structure of the target database.
+        skipped_object_types (list[str]): Object types that were not compared.
+        fingerprints (tuple[StructureFingerprint | None, StructureFingerprint | None]): The fingerprints of both structures, if known.
+
+    Yields:
+        str: The lines of the HTML report.
+    """
+    drift_counts = {
+        obj_type: _count_drift(source_objects, target_objects, unchanged)
+        for obj_type, source_objects, target_objects, unchanged in comparison_plan(source, target, *fingerprints)
+    }
+
+    yield f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Database Drift Report</title><style>{REPORT_STYLE}</style></head><body>\n'
+    yield "<h1>Database Drift Report</h1>\n"
+    yield f"<p>Compared object types: {escape(', '.join(drift_counts)) or 'none'}</p>\n"
+    if skipped_object_types:
+        yield f"<p><strong>Partial scan.</strong> Not compared: {escape(', '.join(skipped_object_types))}</p>\n"
+    if not any(counts.has_drift for counts in drift_counts.values()):
+        yield "<p>No drift detected.</p>\n"
+
+    for (obj_type, source_objects, target_objects, _), counts in zip(
+        comparison_plan(source, target, *fingerprints),
+        drift_counts.values(),
+        strict=True,
+    ):
+        yield from _render_object_type(obj_type, source_objects, target_objects, counts)
+
+    yield "</body></html>\n"
+
+
+def _count_drift(source: dict[str, DatabaseObject], target: dict[str, DatabaseObject], unchanged: int) -> _DriftCounts:
+    """
+    Count the drift of one object type, comparing the objects without diffing the modified ones.
+
+    Args:
+        source (dict[str, DatabaseObject]): The objects of the source database to compare, by name.
+        target (dict[str, DatabaseObject]): The objects of the target database to compare, by name.
+        unchanged (int): The number of objects known to be unchanged without comparing them.
+
+    Returns:
+        _DriftCounts: The number of added, removed, modified and unchanged objects.
+    """
+    removed = modified = 0
+    for name, source_obj in source.items():
+        target_obj = target.get(name)
+        if target_obj is None:
+            removed += 1
+        elif source_obj == target_obj:
+            unchanged += 1
+        else:
+            modified += 1
+    return _DriftCounts(added=len(target) - (len(source) - removed), removed=removed, modified=modified, unchanged=unchanged)
+
+
+def _render_object_type(
+    obj_type: str,
+    source: dict[str, DatabaseObject],
+    target: dict[str, DatabaseObject],
+    counts: _DriftCounts,
+) -> Iterator[str]:
+    """
+    Render the differences of one object type, diffing its modified objects one at a time.
+
+    Args:
+        obj_type (str): The object type.
+        source (dict[str, DatabaseObject]): The objects of the source database to compare, by name.
+        target (dict[str, DatabaseObject]): The objects of the target database to compare, by name.
+        counts (_DriftCounts): The drift of the object type, as counted by `_count_drift`.
+
+    Yields:
+        str: The lines of the section.
+    """
+    yield (
+        f"<section>\n<h2>{escape(obj_type)}</h2>\n"
+        f"<p>{counts.added} added, {counts.removed} removed, {counts.modified} modified, {counts.unchanged} unchanged</p>\n"
+    )
+
+    added_names = (name for name in target if name not in source)
+    removed_names = (name for name in source if name not in target)
+    for title, count, names in (("Added", counts.added, added_names), ("Removed", counts.removed, removed_names)):
+        if count:
+            yield f"<h3>{title}</h3>\n<ul>\n"
+            yield from (f"<li>{escape(name)}</li>\n" for name in names)
+            yield "</ul>\n"
+
+    if counts.modified:
+        yield "<h3>Modified</h3>\n<ul>\n"
+        for name, source_obj in source.items():
+            target_obj = target.get(name)
+            if target_obj is None or source_obj == target_obj:
+                continue
+            yield f"<li>{escape(name)}\n<ul>\n"
+            yield from _render_object_diff(diff_object(source_obj, target_obj))
+            yield "</ul>\n</li>\n"
+        yield "</ul>\n"
+
+    yield "</section>\n"
+
+
+def _render_object_diff(object_diff: ObjectDiff) -> Iterator[str]:
+    """
+    Render the differences of a modified object.
+
+    Args:
+        object_diff (ObjectDiff): Its differences.
+
+    Yields:
+        str: A list item per changed field and per added, removed or modified column.
+    """
+    yield from (f"<li>{_render_change(change)}</li>\n" for change in object_diff.changes)
+    yield from (f"<li>Column added: {escape(column)}</li>\n" for column in object_diff.added_columns)
+    yield from (f"<li>Column removed: {escape(column)}</li>\n" for column in object_diff.removed_columns)
+    for column, changes in object_diff.modified_columns.items():
+        yield f"<li>Column {escape(column)}: {'; '.join(_render_change(change) for change in changes)}</li>\n"
+
+
+def _render_change(change: FieldChange) -> str:
+    """
+    Render a changed field.
+
+    Args:
+        change (FieldChange): The changed field.
+
+    Returns:
+        str: The field with its source and target values, HTML-escaped.
+    """
+    return f"{escape(change.field)}: {escape(_render_value(change.source))} &rarr; {escape(_render_value(change.target))}"
+
+
+def _render_value(value: object) -> str:
+    """
+    Render the value of a field for the report.
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        str: Enums as their value, sets as sorted lists and anything else as `str`.
     """
-    # Placeholder implementation
-    with Path.open(output_filename, "w") as report_file:
-        report_file.write("<html><body>\n")
-        report_file.write("<h1>Database Drift Report</h1>\n")
-        report_file.write("<h2>Source Database Structure</h2>\n")
-        report_file.write(f"<pre>{db_structure_source}</pre>\n")
-        report_file.write("<h2>Target Database Structure</h2>\n")
-        report_file.write(f"<pre>{db_structure_target}</pre>\n")
-        report_file.write("</body></html>\n")
+    if isinstance(value, set):
+        return ", ".join(sorted(map(str, value)))
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
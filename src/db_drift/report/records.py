@@ -0,0 +1,157 @@
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from enum import Enum
+from pathlib import Path
+from typing import Any, TextIO
+
+from db_drift.diff import MODIFIED, FieldChange, ObjectDrift, StructureFingerprint, iter_drift
+from db_drift.utils.constants import ReportFormat
+
+# Written to standard output instead of a file
+STDOUT_FILENAME = "-"
+# The `record_type` of the first NDJSON line, which carries the metadata of the JSON document instead of a drifted object
+METADATA_RECORD_TYPE = "metadata"
+
+
+def write_drift_records(  # noqa: PLR0913
+    db_structure_source: dict,
+    db_structure_target: dict,
+    output_filename: str,
+    report_format: ReportFormat,
+    skipped_object_types: Iterable[str] = (),
+    fingerprints: tuple[StructureFingerprint | None, StructureFingerprint | None] = (None, None),
+) -> None:
+    """
+    Write the drift between two database structures as JSON records, one per drifted object.
+
+    Every record is written as soon as its object has been compared, on a line of its own, so no more than one record
+    is held in memory. On standard output (e.g. a pipe) every record is also flushed, so downstream tools can consume
+    the output while the comparison goes on; a file is only flushed once, when it is closed.
+    The records come after the compared and skipped object types and the fingerprints of both structures, so that
+    a partial scan without drift is not mistaken for a full comparison without drift.
+
+    Args:
+        db_structure_source (dict): Schema structure of the source database
+        db_structure_target (dict): Schema structure of the target database
+        output_filename (str): Filename to write the records to, or "-" for standard output
+        report_format (ReportFormat): `ReportFormat.NDJSON` for a metadata record followed by the bare records,
+            `ReportFormat.JSON` for a document with the same metadata and the list of records
+        skipped_object_types (Iterable[str]): Object types that were not compared
+        fingerprints (tuple[StructureFingerprint | None, StructureFingerprint | None]): The fingerprints of the source and target
+            structures, if known, so that only the schemas and object types whose digests differ are compared
+    """
+    drift = iter_drift(db_structure_source, db_structure_target, *fingerprints)
+    metadata = {
+        "compared_object_types": list(dict.fromkeys([*db_structure_source, *db_structure_target])),
+        "skipped_object_types": list(skipped_object_types),
+        # The root digests, equal when both structures are identical
+        "fingerprints": {side: fingerprint and fingerprint.digest for side, fingerprint in zip(("source", "target"), fingerprints, strict=True)},
+    }
+
+    # Flushing every record of a file would cost a write system call per record, for nobody reading the file yet
+    streamed = output_filename == STDOUT_FILENAME
+
+    with _open_output(output_filename) as output:
+        if report_format is ReportFormat.NDJSON:
+            output.write(f"{_dumps({'record_type': METADATA_RECORD_TYPE, **metadata})}\n")
+            if streamed:
+                output.flush()
+            for line in _render_records(drift):
+                output.write(f"{line}\n")
+                if streamed:
+                    output.flush()
+            return
+
+        # The list of records is left open, to be written a record at a time
+        output.write(_dumps({**metadata, "drift": []}).removesuffix("]}"))
+        for i, line in enumerate(_render_records(drift)):
+            output.write(f"{',' if i else ''}\n{line}")
+            if streamed:
+                output.flush()
+        output.write("\n]}\n")
+
+
+@contextmanager
+def _open_output(output_filename: str) -> Iterator[TextIO]:
+    """
+    Open the output of the records.
+
+    Args:
+        output_filename (str): The filename, or "-" for standard output (which is left open).
+
+    Yields:
+        TextIO: The output.
+    """
+    with nullcontext(sys.stdout) if output_filename == STDOUT_FILENAME else Path.open(output_filename, "w", encoding="utf-8") as output:
+        yield output
+
+
+def _render_records(drift: Iterable[ObjectDrift]) -> Iterator[str]:
+    """
+    Render the record of every drifted object.
+
+    Args:
+        drift (Iterable[ObjectDrift]): The drifted objects.
+
+    Yields:
+        str: A single-line JSON object per drifted object.
+    """
+    for object_drift in drift:
+        record: dict[str, Any] = {"object_type": object_drift.object_type, "key": object_drift.name, "change": object_drift.change}
+        if object_drift.change == MODIFIED and object_drift.diff is not None:
+            record["changes"] = [_render_change(change) for change in object_drift.diff.changes]
+            record["added_columns"] = object_drift.diff.added_columns
+            record["removed_columns"] = object_drift.diff.removed_columns
+            record["modified_columns"] = {
+                column: [_render_change(change) for change in changes] for column, changes in object_drift.diff.modified_columns.items()
+            }
+        yield _dumps(record)
+
+
+def _render_change(change: FieldChange) -> dict[str, Any]:
+    """
+    Render a changed field.
+
+    Args:
+        change (FieldChange): The changed field.
+
+    Returns:
+        dict[str, Any]: The field with its source and target values.
+    """
+    return {"field": change.field, "source": change.source, "target": change.target}
+
+
+def _dumps(value: object) -> str:
+    """
+    Serialize a value as compact, single-line JSON.
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        str: The JSON text.
+    """
+    return json.dumps(value, separators=(",", ":"), default=_to_json)
+
+
+def _to_json(value: object) -> object:
+    """
+    Convert the field values that JSON has no type for.
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        object: Enums as their value and sets as sorted lists.
+
+    Raises:
+        TypeError: If the value cannot be converted.
+    """
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    if isinstance(value, Enum):
+        return value.value
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
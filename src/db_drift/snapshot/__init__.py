@@ -0,0 +1,13 @@
+"""Schema structures saved to files, to compare against later without introspecting the database again."""
+
+from db_drift.snapshot.files import SNAPSHOT_FORMAT_VERSION, Snapshot, read_snapshot, write_snapshot
+from db_drift.snapshot.serialization import structure_from_dict, structure_to_dict
+
+__all__ = [
+    "SNAPSHOT_FORMAT_VERSION",
+    "Snapshot",
+    "read_snapshot",
+    "structure_from_dict",
+    "structure_to_dict",
+    "write_snapshot",
+]
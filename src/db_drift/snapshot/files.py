@@ -0,0 +1,98 @@
+import gzip
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from db_drift.diff.fingerprint import StructureFingerprint, fingerprint_structure
+from db_drift.models import DatabaseObject
+from db_drift.snapshot.serialization import fingerprint_from_dict, fingerprint_to_dict, structure_from_dict, structure_to_dict
+from db_drift.utils.constants import HashAlgorithm
+
+SNAPSHOT_FORMAT = "db-drift-snapshot"
+# Bump whenever the layout of the files changes, so that older files are rejected instead of misread
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass
+class Snapshot:
+    """A schema structure saved to a file, with any metadata its writer needs to use it again."""
+
+    structure: dict[str, dict[str, DatabaseObject]]
+    metadata: dict[str, Any] = field(default_factory=dict)
+    # Computed when the snapshot is written. None for files written before snapshots had one
+    fingerprint: StructureFingerprint | None = None
+    # The algorithm the bodies and definitions of the structure were hashed with. Files that do not record one were hashed with SHA-256
+    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256
+
+
+def write_snapshot(path: Path, snapshot: Snapshot) -> None:
+    """
+    Write a snapshot to a gzip-compressed JSON file.
+
+    Args:
+        path (Path): The snapshot file. It is replaced if it exists.
+        snapshot (Snapshot): The snapshot to write. Its fingerprint is computed if it has none.
+    """
+    if snapshot.fingerprint is None:
+        snapshot.fingerprint = fingerprint_structure(snapshot.structure)
+
+    content = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "metadata": snapshot.metadata,
+        "hash_algorithm": snapshot.hash_algorithm.value,
+        "fingerprint": fingerprint_to_dict(snapshot.fingerprint),
+        "structure": structure_to_dict(snapshot.structure),
+    }
+
+    # Write to a temporary file first, so that readers never see a half-written snapshot
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    # Serialized in one go, as json.dump would hand the compressor thousands of tiny chunks
+    temporary_path.write_bytes(gzip.compress(json.dumps(content, separators=(",", ":")).encode(), compresslevel=6))
+    temporary_path.replace(path)
+
+
+def read_snapshot(path: Path) -> Snapshot:
+    """
+    Read a snapshot written by `write_snapshot`.
+
+    Args:
+        path (Path): The snapshot file.
+
+    Returns:
+        Snapshot: The snapshot.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a snapshot, was written in another version of the format, or with an unknown hash algorithm.
+    """
+    try:
+        content = json.loads(gzip.decompress(path.read_bytes()))
+    except (gzip.BadGzipFile, EOFError, ValueError) as e:  # JSONDecodeError and UnicodeDecodeError are ValueErrors
+        msg = f"{path} is not a db-drift snapshot: {e}"
+        raise ValueError(msg) from e
+
+    if not isinstance(content, dict) or content.get("format") != SNAPSHOT_FORMAT:
+        msg = f"{path} is not a db-drift snapshot."
+        raise ValueError(msg)
+
+    if content.get("version") != SNAPSHOT_FORMAT_VERSION:
+        msg = (
+            f"{path} was written in version {content.get('version')} of the snapshot format, but only version {SNAPSHOT_FORMAT_VERSION} can be read."
+        )
+        raise ValueError(msg)
+
+    try:
+        # Files written before snapshots had a fingerprint are still read, without one
+        fingerprint = fingerprint_from_dict(content["fingerprint"]) if content.get("fingerprint") is not None else None
+        return Snapshot(
+            structure=structure_from_dict(content["structure"]),
+            metadata=content["metadata"],
+            fingerprint=fingerprint,
+            hash_algorithm=HashAlgorithm(content.get("hash_algorithm", HashAlgorithm.SHA256.value)),
+        )
+    except (KeyError, TypeError, AttributeError) as e:
+        msg = f"{path} is not a valid db-drift snapshot: {e!r}"
+        raise ValueError(msg) from e
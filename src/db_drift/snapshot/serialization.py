@@ -0,0 +1,225 @@
+import types
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import cache
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from db_drift import models
+from db_drift.diff.fingerprint import ObjectTypeFingerprint, SchemaFingerprint, StructureFingerprint
+from db_drift.models import DatabaseObject
+
+
+def structure_to_dict(structure: dict[str, dict[str, DatabaseObject]]) -> dict[str, Any]:
+    """
+    Convert a schema structure into JSON-serializable data.
+
+    The model class is stored once per object type rather than once per object, to keep the data compact.
+
+    Args:
+        structure (dict[str, dict[str, DatabaseObject]]): The schema structure, as returned by `fetch_schema_structure`.
+
+    Returns:
+        dict[str, Any]: The objects of every object type, with the name of their model class.
+
+    Raises:
+        TypeError: If the objects of an object type are not all instances of the same model class.
+    """
+    data: dict[str, Any] = {}
+    for obj_type, objects in structure.items():
+        model_names = {type(obj).__name__ for obj in objects.values()}
+        if len(model_names) > 1:
+            msg = f"The {obj_type} of the schema structure mix several model classes: {', '.join(sorted(model_names))}."
+            raise TypeError(msg)
+
+        data[obj_type] = {
+            "model": model_names.pop() if model_names else None,
+            "objects": {name: _to_data(obj) for name, obj in objects.items()},
+        }
+    return data
+
+
+def structure_from_dict(data: dict[str, Any]) -> dict[str, dict[str, DatabaseObject]]:
+    """
+    Rebuild a schema structure from the data of `structure_to_dict`.
+
+    Args:
+        data (dict[str, Any]): The objects of every object type, with the name of their model class.
+
+    Returns:
+        dict[str, dict[str, DatabaseObject]]: The schema structure.
+
+    Raises:
+        ValueError: If the data names a model class that does not exist.
+    """
+    structure: dict[str, dict[str, DatabaseObject]] = {}
+    for obj_type, entry in data.items():
+        if entry["model"] is None:
+            structure[obj_type] = {}
+            continue
+
+        if entry["model"] not in models.__all__:
+            msg = f"Unknown model class '{entry['model']}' for the {obj_type} of the snapshot."
+            raise ValueError(msg)
+
+        model = getattr(models, entry["model"])
+        structure[obj_type] = {name: _from_data(model, obj) for name, obj in entry["objects"].items()}
+    return structure
+
+
+def fingerprint_to_dict(fingerprint: StructureFingerprint) -> dict[str, Any]:
+    """
+    Convert the fingerprint of a schema structure into JSON-serializable data.
+
+    Args:
+        fingerprint (StructureFingerprint): The fingerprint.
+
+    Returns:
+        dict[str, Any]: The root digest, and the digest of every schema with the digest and object count of its object types.
+    """
+    return {
+        "digest": fingerprint.digest,
+        "schemas": {
+            schema: {
+                "digest": schema_fingerprint.digest,
+                "object_types": {obj_type: [group.digest, group.object_count] for obj_type, group in schema_fingerprint.object_types.items()},
+            }
+            for schema, schema_fingerprint in fingerprint.schemas.items()
+        },
+    }
+
+
+def fingerprint_from_dict(data: dict[str, Any]) -> StructureFingerprint:
+    """
+    Rebuild the fingerprint of a schema structure from the data of `fingerprint_to_dict`.
+
+    Args:
+        data (dict[str, Any]): The digests of the fingerprint.
+
+    Returns:
+        StructureFingerprint: The fingerprint.
+    """
+    return StructureFingerprint(
+        digest=data["digest"],
+        schemas={
+            schema: SchemaFingerprint(
+                digest=schema_data["digest"],
+                object_types={
+                    obj_type: ObjectTypeFingerprint(digest, object_count) for obj_type, (digest, object_count) in schema_data["object_types"].items()
+                },
+            )
+            for schema, schema_data in data["schemas"].items()
+        },
+    )
+
+
+def _to_data(value: Any) -> Any:  # noqa: ANN401, PLR0911
+    """
+    Convert a model (or one of its field values) into JSON-serializable data.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: Dataclasses become dicts of their fields, enums their values and sets sorted lists.
+    """
+    if value is None or isinstance(value, str | int | float):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {key: _to_data(item) for key, item in value.items()}
+    if isinstance(value, set | frozenset):
+        # Sorted, so that the same structure always gives the same data
+        return sorted((_to_data(item) for item in value), key=str)
+    if isinstance(value, list | tuple):
+        return [_to_data(item) for item in value]
+    if is_dataclass(value):
+        return {name: _to_data(getattr(value, name)) for name in _field_names(type(value))}
+    return value
+
+
+@cache
+def _field_names(model: type) -> tuple[str, ...]:
+    return tuple(field.name for field in fields(model))
+
+
+def _from_data(hint: Any, value: Any) -> Any:  # noqa: ANN401
+    """
+    Rebuild a model (or one of its field values) from its data, guided by its type hint.
+
+    Args:
+        hint (Any): The type hint of the value (e.g. a model class or `dict[str, Column]`).
+        value (Any): The data of the value.
+
+    Returns:
+        Any: The rebuilt value.
+    """
+    return _decoder(hint)(value)
+
+
+@cache
+def _decoder(hint: Any) -> Callable[[Any], Any]:  # noqa: ANN401
+    """
+    Build the function that rebuilds the values of a type hint from their data.
+
+    The type hints are only inspected once per hint rather than once per value, which keeps loading large snapshots fast.
+
+    Args:
+        hint (Any): The type hint of the values (e.g. a model class or `dict[str, Column]`).
+
+    Returns:
+        Callable[[Any], Any]: Rebuilds a value from its data. None is returned as is.
+    """
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        return _union_decoder(get_args(hint))
+    if origin is dict:
+        _, item_hint = get_args(hint)
+        decode_item = _decoder(item_hint)
+        return lambda value: None if value is None else {key: decode_item(item) for key, item in value.items()}
+    if origin in (set, frozenset, list, tuple):
+        (item_hint, *_) = get_args(hint) or (Any,)
+        decode_item = _decoder(item_hint)
+        return lambda value: None if value is None else origin(decode_item(item) for item in value)
+    if isinstance(hint, type) and is_dataclass(hint):
+        field_hints = get_type_hints(hint)
+        field_decoders = tuple((name, _decoder(field_hints[name])) for name in _field_names(hint))
+        return lambda value: None if value is None else hint(**{name: decode(value[name]) for name, decode in field_decoders if name in value})
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return lambda value: None if value is None else hint(value)
+    return _identity
+
+
+def _union_decoder(hints: tuple[Any, ...]) -> Callable[[Any], Any]:
+    """
+    Build the function that rebuilds the values of a union type hint (e.g. `DBConstraintTypeEnum | str`) from their data.
+
+    Args:
+        hints (tuple[Any, ...]): The members of the union.
+
+    Returns:
+        Callable[[Any], Any]: Rebuilds a value as the first member of the union it fits, trying enums before plain values.
+    """
+    candidates = [hint for hint in hints if hint is not type(None)]
+    if len(candidates) == 1:  # An optional value
+        return _decoder(candidates[0])
+
+    def decode(value: Any) -> Any:  # noqa: ANN401
+        for hint in candidates:
+            if get_origin(hint) is not None:
+                continue
+            if isinstance(hint, type) and issubclass(hint, Enum):
+                try:
+                    return hint(value)
+                except ValueError:
+                    continue
+            if isinstance(hint, type) and is_dataclass(hint) and isinstance(value, dict):
+                return _decoder(hint)(value)
+        return value
+
+    return decode
+
+
+def _identity(value: Any) -> Any:  # noqa: ANN401
+    return value
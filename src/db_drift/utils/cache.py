@@ -0,0 +1,81 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("db-drift")
+
+# The source and target sides can share a cache file and update it at the same time
+_cache_file_lock = threading.Lock()
+
+
+def load_cached_value(path: Path, key: str, max_age: timedelta) -> Any | None:  # noqa: ANN401
+    """
+    Load a value from a JSON cache file.
+
+    Args:
+        path (Path): The cache file.
+        key (str): The key the value was stored under.
+        max_age (timedelta): How long a stored value stays valid.
+
+    Returns:
+        Any | None: The stored value, or None if it is missing, expired or the cache file cannot be read.
+    """
+    with _cache_file_lock:
+        entry = _read_cache_file(path).get(key)
+
+    if entry is None:
+        return None
+
+    stored_at = datetime.fromisoformat(entry["stored_at"])
+    if datetime.now(timezone.utc) - stored_at > max_age:
+        logger.debug(f"Cached value '{key}' in {path} has expired.")
+        return None
+
+    return entry["value"]
+
+
+def store_cached_value(path: Path, key: str, value: Any) -> None:  # noqa: ANN401
+    """
+    Store a value in a JSON cache file, keeping the other values in it.
+
+    Args:
+        path (Path): The cache file. It is created if it does not exist.
+        key (str): The key to store the value under.
+        value (Any): The JSON-serializable value to store.
+    """
+    with _cache_file_lock:
+        entries = _read_cache_file(path)
+        entries[key] = {
+            "stored_at": datetime.now(timezone.utc).isoformat(),
+            "value": value,
+        }
+
+        # Write to a temporary file first, so that readers never see a half-written cache
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.tmp")
+        temporary_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        temporary_path.replace(path)
+
+
+def _read_cache_file(path: Path) -> dict[str, Any]:
+    """
+    Read all entries of a JSON cache file.
+
+    Args:
+        path (Path): The cache file.
+
+    Returns:
+        dict[str, Any]: The entries of the cache, or an empty dict if the file is missing or unreadable.
+    """
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return {}
+
+    return entries if isinstance(entries, dict) else {}
@@ -1,3 +1,4 @@
+from collections.abc import Iterator, Mapping
 from enum import Enum, unique
 from importlib import import_module
 from typing import TYPE_CHECKING
@@ -20,26 +21,67 @@ class ExitCode(Enum):
     SIGINT = 130
 
 
-def get_supported_dbms_registry() -> dict[str, type["BaseDBConnector"]]:
+# The connector class of every supported DBMS, as "module:class". An easy-to-update registry pattern:
+# connectors are only imported once chosen, so that e.g. --help does not load every database driver.
+SUPPORTED_DBMS_CONNECTORS: dict[str, str] = {
+    "sqlite": "db_drift.db.connectors.sqlite:SQLiteConnector",
+    "oracle": "db_drift.db.connectors.oracle:OracleConnector",
+    "postgresql": "db_drift.db.connectors.postgresql:PostgresConnector",
+    "mysql": "db_drift.db.connectors.mysql:MySQLConnector",
+    "snapshot": "db_drift.db.connectors.snapshot:SnapshotConnector",  # A file written by `db-drift snapshot`
+}
+
+
+class _LazyConnectorRegistry(Mapping[str, type["BaseDBConnector"]]):
+    """The supported DBMS connector classes, each imported the first time it is looked up."""
+
+    def __getitem__(self, dbms: str) -> type["BaseDBConnector"]:
+        module_name, class_name = SUPPORTED_DBMS_CONNECTORS[dbms].split(":")
+        return getattr(import_module(module_name), class_name)
+
+    def __contains__(self, dbms: object) -> bool:
+        return dbms in SUPPORTED_DBMS_CONNECTORS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(SUPPORTED_DBMS_CONNECTORS)
+
+    def __len__(self) -> int:
+        return len(SUPPORTED_DBMS_CONNECTORS)
+
+
+def get_supported_dbms_registry() -> Mapping[str, type["BaseDBConnector"]]:
     """
     Return supported DBMS connector classes.
 
-    Imports are kept inside this function to avoid circular imports at module load time.
+    The connector modules are only imported when a connector class is looked up, which also avoids circular imports at module load time.
+    Listing the supported DBMS (e.g. for the choices of --dbms) imports none of them.
     """
-    sqlite_module = import_module("db_drift.db.connectors.sqlite")
-    oracle_module = import_module("db_drift.db.connectors.oracle")
-
-    sqlite_connector = sqlite_module.SQLiteConnector
-    oracle_connector = oracle_module.OracleConnector
-
-    # An easy-to-update registry pattern for supported DBMS connectors
-    return {
-        "sqlite": sqlite_connector,
-        "oracle": oracle_connector,
-        # As we add more connectors, uncomment the lines below
-        # "postgresql": PostgresConnector,  # noqa: ERA001
-        # "mysql": MySQLConnector,  # noqa: ERA001
-    }
+    return _LazyConnectorRegistry()
+
+
+@unique
+class OracleDDLSource(Enum):
+    """Where the source of PL/SQL units and types is read from before it is hashed."""
+
+    DBMS_METADATA = "dbms_metadata"  # One dbms_metadata.get_ddl call (and XML transform) per object
+    ALL_SOURCE = "all_source"  # One ordered scan of ALL_SOURCE for all objects
+
+
+@unique
+class HashAlgorithm(Enum):
+    """The hashlib algorithm that bodies and definitions are hashed with. Digests of different algorithms are never comparable."""
+
+    SHA256 = "sha256"  # The algorithm of the digests computed in the database (MySQL, PostgreSQL, Oracle with DBMS_CRYPTO)
+    BLAKE2B = "blake2b"  # With a 32-byte digest, as long as a SHA-256 one
+
+
+@unique
+class ReportFormat(Enum):
+    """How the drift found by a comparison is written out."""
+
+    HTML = "html"  # A report to read in a browser
+    JSON = "json"  # A JSON document, with a record per drifted object
+    NDJSON = "ndjson"  # A JSON record per drifted object and per line
 
 
 @unique
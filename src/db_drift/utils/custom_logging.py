@@ -36,6 +36,7 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         filename=Path(LOGFILES_DIR_NAME) / f"{name}.log",
         maxBytes=5 * 1024 * 1024,  # 5 MB
         backupCount=5,  # Keep up to 5 backup log files
+        delay=True,  # Only open the file once something is logged
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)  # File handler logs everything from DEBUG and above
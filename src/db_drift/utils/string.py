@@ -1,14 +1,121 @@
 import hashlib
+import os
+import sys
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
 
+from db_drift.utils.constants import HashAlgorithm
 
-def hash_body(body: str) -> str:
+StringOrNone = TypeVar("StringOrNone", str, None)
+K = TypeVar("K", bound=Hashable)
+
+# The hashlib constructor of every algorithm
+HASH_FUNCTIONS: dict[HashAlgorithm, Callable[..., Any]] = {
+    HashAlgorithm.SHA256: hashlib.sha256,
+    HashAlgorithm.BLAKE2B: partial(hashlib.blake2b, digest_size=32),
+}
+
+# Bodies of at least this many characters are hashed in worker threads by `hash_bodies`: hashlib releases the GIL
+# while it hashes them, so the caller goes on fetching meanwhile. Handing a shorter body over would cost more than hashing it.
+PARALLEL_HASH_MIN_LENGTH = 256 * 1024
+HASH_WORKERS = min(4, os.cpu_count() or 1)
+# Bodies handed over but not hashed yet, per worker. Past that the caller waits, so a fast fetch does not pile them up in memory
+PENDING_BODIES_PER_WORKER = 2
+
+
+def hash_body(body: str, algorithm: HashAlgorithm = HashAlgorithm.SHA256) -> str:
     """
-    Generate a SHA-256 hash of the given body string.
+    Generate a hash of the given body string.
 
     Args:
         body (str): The body string to hash.
+        algorithm (HashAlgorithm): The algorithm to hash it with.
+
+    Returns:
+        str: The hexadecimal digest of the UTF-8 encoded body.
+    """
+    return HASH_FUNCTIONS[algorithm](body.encode("utf-8")).hexdigest()
+
+
+def hash_chunks(chunks: Iterable[str], algorithm: HashAlgorithm = HashAlgorithm.SHA256) -> str:
+    """
+    Generate the hash of a body read in chunks, one chunk at a time, so that the whole body is never held in memory.
+
+    Args:
+        chunks (Iterable[str]): The consecutive chunks of the body.
+        algorithm (HashAlgorithm): The algorithm to hash it with.
+
+    Returns:
+        str: The hexadecimal digest of the UTF-8 encoded body, the same as `hash_body` of the joined chunks.
+    """
+    hasher = HASH_FUNCTIONS[algorithm]()
+    for chunk in chunks:
+        hasher.update(chunk.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def hash_bodies(
+    bodies: Iterable[tuple[K, str | Iterator[str] | None]],
+    algorithm: HashAlgorithm = HashAlgorithm.SHA256,
+) -> dict[K, str | None]:
+    """
+    Hash many bodies, the large ones in worker threads while the next ones are read from `bodies`.
+
+    `bodies` can be a generator that reads them from the database one at a time, so the fetch of the next bodies
+    overlaps the hashing of the large ones. Small bodies are hashed at once, on the calling thread.
+    A body can also be an iterator of its chunks (e.g. read from a LOB), which is hashed on the calling thread
+    as the chunks are read, before the next body is read.
+
+    Args:
+        bodies (Iterable[tuple[K, str | Iterator[str] | None]]): The bodies, or the chunks of the bodies, to hash by key.
+        algorithm (HashAlgorithm): The algorithm to hash them with.
+
+    Returns:
+        dict[K, str | None]: The digest of every body (None for a None body), by key and in the order of `bodies`.
+    """
+    digests: dict[K, str | None] = {}
+    handed_over: list[tuple[K, Future[str]]] = []
+    pending: deque[Future[str]] = deque()
+
+    # The threads are only started once a large body is handed over
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="db-drift-hash") as executor:
+        for key, body in bodies:
+            if body is None:
+                digests[key] = None
+                continue
+            if not isinstance(body, str):
+                digests[key] = hash_chunks(body, algorithm)
+                continue
+            if len(body) < PARALLEL_HASH_MIN_LENGTH:
+                digests[key] = hash_body(body, algorithm)
+                continue
+
+            if len(pending) >= HASH_WORKERS * PENDING_BODIES_PER_WORKER:
+                pending.popleft().result()
+            digests[key] = None  # Keeps the key in the order of the bodies until the digest is in
+            future = executor.submit(hash_body, body, algorithm)
+            handed_over.append((key, future))
+            pending.append(future)
+
+    for key, future in handed_over:
+        digests[key] = future.result()
+    return digests
+
+
+def intern_identifier(value: StringOrNone) -> StringOrNone:
+    """
+    Intern a string read from a catalog that repeats across objects, like a column name, data type or owner.
+
+    The drivers return a new string for every row, so a catalog of millions of columns would otherwise hold
+    millions of copies of "ID" or "VARCHAR2".
+
+    Args:
+        value (str | None): The string, or None.
 
     Returns:
-        str: The SHA-256 hash of the body.
+        str | None: The single shared copy of the string, or None.
     """
-    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return value if value is None else sys.intern(value)
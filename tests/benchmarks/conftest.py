@@ -0,0 +1,11 @@
+import gc
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _collect_garbage() -> Iterator[None]:
+    yield
+    # Benchmarks build many long-lived objects. Their garbage triggers a full collection, which must not land in the timing of a later benchmark.
+    gc.collect()
@@ -0,0 +1,299 @@
+"""Local stand-ins for database drivers used by the benchmarks."""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from types import SimpleNamespace
+from typing import Any
+
+
+class FakeLob:
+    """Stand-in for an oracledb LOB locator of a CLOB, whose every read is a round-trip."""
+
+    chunk_size = 8132  # The chunk size of a CLOB in an 8 KB block tablespace
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.reads = 0
+
+    def getchunksize(self) -> int:
+        return self.chunk_size
+
+    def size(self) -> int:
+        return len(self.text)
+
+    def read(self, offset: int = 1, amount: int | None = None) -> str:
+        self.reads += 1
+        return self.text[offset - 1 : None if amount is None else offset - 1 + amount]
+
+
+class RoundTripCountingCursor:
+    """
+    Stand-in for an oracledb cursor that answers catalog queries with canned rows.
+
+    Every `execute` call is one round-trip to the database.
+    Fetching the rows takes one round-trip per `arraysize` rows, or one per row when the statement
+    selects a LONG column (the driver cannot array fetch those).
+    Rows are produced lazily, so only the fetched batch is held in memory.
+    """
+
+    # The python-oracledb defaults
+    arraysize = 100
+    prefetchrows = 2
+
+    def __init__(
+        self,
+        respond: Callable[[str, dict[str, Any]], Iterable[tuple]],
+        selects_long_column: Callable[[str], bool] = lambda _statement: False,
+    ) -> None:
+        """
+        Initialize the cursor.
+
+        Args:
+            respond: Returns the rows for a statement and its bind parameters
+            selects_long_column: Tells whether a statement selects a LONG column
+        """
+        self.respond = respond
+        self.selects_long_column = selects_long_column
+        self.executed: list[str] = []
+        self.fetch_round_trips = 0
+        self.connection = SimpleNamespace(gettype=lambda _name: FakeCollectionType())
+        self._rows: Iterator[tuple] = iter(())
+
+    @property
+    def round_trips(self) -> int:
+        return len(self.executed)
+
+    def execute(self, statement: str, parameters: dict[str, Any] | None = None, **kw_parameters: Any) -> None:  # noqa: ANN401
+        self.executed.append(statement)
+        self._rows = iter(self.respond(statement, {**(parameters or {}), **kw_parameters}))
+
+    def fetchmany(self, size: int | None = None) -> list[tuple]:
+        rows = list(islice(self._rows, size or self.arraysize))
+        if rows:
+            self.fetch_round_trips += len(rows) if self.selects_long_column(self.executed[-1]) else 1
+        return rows
+
+
+class FakeCollectionType:
+    """Stand-in for an oracledb DbObjectType of a collection, whose objects are plain lists."""
+
+    def newobject(self, values: list) -> list:
+        return list(values)
+
+
+class LatencyInjectingAsyncConnection:
+    """
+    Stand-in for an oracledb AsyncConnection that answers catalog queries with canned rows over a slow network.
+
+    Every round-trip sleeps for `latency` seconds: an execute (which also returns the first `prefetchrows` rows),
+    every further `arraysize` rows, a type lookup, and a whole pipeline (plus every further `arraysize` rows of each of its results).
+    """
+
+    def __init__(self, respond: Callable[[str, dict[str, Any]], Iterable[tuple]], latency: float = 0.0) -> None:
+        """
+        Initialize the connection.
+
+        Args:
+            respond: Returns the rows for a statement and its bind parameters
+            latency: The seconds every round-trip takes
+        """
+        self.respond = respond
+        self.latency = latency
+        self.executed: list[str] = []
+        self.round_trips = 0
+        self.pipelines_run = 0
+
+    async def __aenter__(self) -> "LatencyInjectingAsyncConnection":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def cursor(self) -> "LatencyInjectingAsyncCursor":
+        return LatencyInjectingAsyncCursor(self)
+
+    async def gettype(self, _name: str) -> FakeCollectionType:
+        await self.round_trip()
+        return FakeCollectionType()
+
+    async def run_pipeline(self, pipeline: Any, continue_on_error: bool = False) -> list[SimpleNamespace]:  # noqa: ANN401, ARG002, FBT001, FBT002
+        self.pipelines_run += 1
+        await self.round_trip()
+
+        results = []
+        for operation in pipeline.operations:
+            rows = self.query(operation.statement, operation.parameters)
+            for _ in range(1, math.ceil(len(rows) / operation.arraysize)):
+                await self.round_trip()
+            results.append(SimpleNamespace(rows=rows, error=None))
+        return results
+
+    def query(self, statement: str, parameters: dict[str, Any] | None) -> list[tuple]:
+        self.executed.append(statement)
+        return list(self.respond(statement, parameters or {}))
+
+    async def round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+
+class LatencyInjectingAsyncCursor:
+    """Stand-in for an oracledb AsyncCursor on a `LatencyInjectingAsyncConnection`."""
+
+    # The python-oracledb defaults
+    arraysize = 100
+    prefetchrows = 2
+
+    def __init__(self, connection: LatencyInjectingAsyncConnection) -> None:
+        self.connection = connection
+        self._rows: list[tuple] = []
+        self._fetched = 0  # Rows handed out by fetchmany
+        self._received = 0  # Rows sent by the database so far
+
+    async def execute(self, statement: str, parameters: dict[str, Any] | None = None, **_options: Any) -> None:  # noqa: ANN401
+        await self.connection.round_trip()
+        self._rows = self.connection.query(statement, parameters)
+        self._fetched = 0
+        self._received = min(self.prefetchrows, len(self._rows))  # Returned with the execute
+
+    async def fetchmany(self, size: int | None = None) -> list[tuple]:
+        batch_end = min(self._fetched + (size or self.arraysize), len(self._rows))
+        while self._received < batch_end:
+            await self.connection.round_trip()
+            self._received = min(self._received + self.arraysize, len(self._rows))
+        rows, self._fetched = self._rows[self._fetched : batch_end], batch_end
+        return rows
+
+
+class LatencyInjectingPipelineConnection:
+    """
+    Stand-in for a psycopg Connection that answers catalog queries with canned rows over a slow network.
+
+    Every round-trip sleeps for `latency` seconds: an execute outside a pipeline, or a whole pipeline.
+    psycopg reads whole results at once, so fetching rows costs no further round-trips.
+    """
+
+    def __init__(self, respond: Callable[[str, dict[str, Any]], Iterable[tuple]], latency: float = 0.0) -> None:
+        """
+        Initialize the connection.
+
+        Args:
+            respond: Returns the rows for a statement and its bind parameters
+            latency: The seconds every round-trip takes
+        """
+        self.respond = respond
+        self.latency = latency
+        self.executed: list[str] = []
+        self.parameters: list[dict[str, Any] | None] = []
+        self.round_trips = 0
+        self.pipelines_run = 0
+        self.in_pipeline = False
+
+    def __enter__(self) -> "LatencyInjectingPipelineConnection":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def cursor(self) -> "LatencyInjectingPipelineCursor":
+        return LatencyInjectingPipelineCursor(self)
+
+    @contextmanager
+    def pipeline(self) -> Iterator[None]:
+        self.in_pipeline = True
+        try:
+            yield
+        finally:
+            self.in_pipeline = False
+        # Leaving the block syncs the pipeline
+        self.pipelines_run += 1
+        self.round_trip()
+
+    def query(self, statement: str, parameters: dict[str, Any] | None) -> list[tuple]:
+        self.executed.append(statement)
+        self.parameters.append(parameters)
+        if not self.in_pipeline:
+            self.round_trip()
+        return list(self.respond(statement, parameters or {}))
+
+    def round_trip(self) -> None:
+        self.round_trips += 1
+        time.sleep(self.latency)
+
+
+class LatencyInjectingPipelineCursor:
+    """Stand-in for a psycopg Cursor on a `LatencyInjectingPipelineConnection`."""
+
+    arraysize = 1  # The psycopg default
+
+    def __init__(self, connection: LatencyInjectingPipelineConnection) -> None:
+        self.connection = connection
+        self._rows: list[tuple] = []
+
+    def execute(self, statement: str, parameters: dict[str, Any] | None = None) -> None:
+        self._rows = self.connection.query(statement, parameters)
+
+    def fetchall(self) -> list[tuple]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size: int | None = None) -> list[tuple]:
+        rows, self._rows = self._rows[: size or self.arraysize], self._rows[size or self.arraysize :]
+        return rows
+
+
+class FakeMySQLConnection:
+    """
+    Stand-in for a PyMySQL Connection that answers catalog queries with canned rows.
+
+    With `buffered`, every result is read whole into the client when the query is executed (like `pymysql.cursors.Cursor`).
+    Otherwise the rows are only produced as they are fetched (like the unbuffered `pymysql.cursors.SSCursor`).
+    """
+
+    def __init__(self, respond: Callable[[str, dict[str, Any]], Iterable[tuple]], *, buffered: bool = False) -> None:
+        """
+        Initialize the connection.
+
+        Args:
+            respond: Returns the rows for a statement and its bind parameters
+            buffered: Whether results are read whole when the query is executed
+        """
+        self.respond = respond
+        self.buffered = buffered
+        self.executed: list[str] = []
+        self.parameters: list[dict[str, Any] | None] = []
+
+    def __enter__(self) -> "FakeMySQLConnection":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def cursor(self) -> "FakeMySQLCursor":
+        return FakeMySQLCursor(self)
+
+
+class FakeMySQLCursor:
+    """Stand-in for a PyMySQL cursor on a `FakeMySQLConnection`."""
+
+    arraysize = 1  # The PyMySQL default
+
+    def __init__(self, connection: FakeMySQLConnection) -> None:
+        self.connection = connection
+        self._rows: Iterator[tuple] = iter(())
+
+    def execute(self, statement: str, parameters: dict[str, Any] | None = None) -> None:
+        self.connection.executed.append(statement)
+        self.connection.parameters.append(parameters)
+        rows = self.connection.respond(statement, parameters or {})
+        self._rows = iter(list(rows) if self.connection.buffered else rows)
+
+    def fetchmany(self, size: int | None = None) -> list[tuple]:
+        return list(islice(self._rows, size or self.arraysize))
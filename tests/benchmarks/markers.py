@@ -0,0 +1,15 @@
+"""Shared markers for the benchmarks."""
+
+import os
+
+import pytest
+
+BENCHMARKS_ENV_VAR = "DB_DRIFT_RUN_LARGE_BENCHMARKS"
+# Wall-clock ratios swing with the load of the machine, so the default run only prints them
+# and they are asserted along with the large benchmarks
+RUN_LARGE_BENCHMARKS = bool(os.getenv(BENCHMARKS_ENV_VAR))
+
+large_benchmark = pytest.mark.skipif(
+    not RUN_LARGE_BENCHMARKS,
+    reason=f"Large-scale benchmarks take minutes to set up; set {BENCHMARKS_ENV_VAR}=1 to run them.",
+)
@@ -0,0 +1,89 @@
+"""Micro-benchmark for hashing bodies of 1 KiB to 10 MiB, with every algorithm, serially and overlapped with their fetch."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+from db_drift.utils import string
+from db_drift.utils.constants import HashAlgorithm
+from db_drift.utils.string import PARALLEL_HASH_MIN_LENGTH, hash_bodies, hash_body
+
+from tests.benchmarks.markers import RUN_LARGE_BENCHMARKS
+
+BODY_SIZES = [2**10, 100 * 2**10, 2**20, 10 * 2**20]
+HASHED_BYTES = 32 * 2**20  # Per measurement, in bodies of the same size
+
+
+def _body(size: int) -> str:
+    line = "    l_total := l_total + p_amount; -- accumulate\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+def _best_seconds(run: Callable[[], object], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.parametrize("algorithm", list(HashAlgorithm))
+@pytest.mark.parametrize("size", BODY_SIZES)
+def test_hash_bodies_overlaps_hashing_large_bodies_with_their_fetch(size: int, algorithm: HashAlgorithm) -> None:
+    body, count = _body(size), max(4, HASHED_BYTES // size)
+    hash_seconds = _best_seconds(lambda: hash_body(body, algorithm))
+    # The bodies of a real fetch arrive over the network, as fast as they are hashed here
+    fetch_seconds = hash_seconds if size >= PARALLEL_HASH_MIN_LENGTH else 0
+
+    def fetch_bodies() -> Iterator[tuple[int, str]]:
+        for i in range(count):
+            if fetch_seconds:
+                time.sleep(fetch_seconds)
+            yield i, body
+
+    serial_seconds = _best_seconds(lambda: {i: hash_body(fetched_body, algorithm) for i, fetched_body in fetch_bodies()})
+    overlapped_seconds = _best_seconds(lambda: hash_bodies(fetch_bodies(), algorithm))
+
+    print(  # noqa: T201
+        f"{count} bodies of {size // 2**10} KiB with {algorithm.value}: {size / hash_seconds / 2**20:.0f} MiB/s, "
+        f"fetched and hashed in {serial_seconds:.3f} s serially, {overlapped_seconds:.3f} s with hash_bodies",
+    )
+    assert hash_bodies([(0, body)], algorithm) == {0: hash_body(body, algorithm)}
+    if not RUN_LARGE_BENCHMARKS:
+        return
+    if size >= PARALLEL_HASH_MIN_LENGTH:
+        # The next body is fetched while the previous one is hashed in a worker thread. Hiding all of the hashing would halve
+        # the time, the margin is for the thread hand-offs and for timers on busy machines
+        assert overlapped_seconds < 0.85 * serial_seconds
+    else:
+        # Small bodies are hashed on the spot, handing them over would cost more than hashing them
+        assert overlapped_seconds < 1.5 * serial_seconds
+
+
+def test_hash_bodies_hands_large_bodies_to_the_workers_while_the_next_one_is_fetched(monkeypatch: pytest.MonkeyPatch) -> None:
+    small_body, large_body = _body(2**10), _body(PARALLEL_HASH_MIN_LENGTH)
+    next_body_fetched = threading.Event()
+    hashing_threads: dict[int, str] = {}
+    overlapped: list[bool] = []
+
+    def recording_hash_body(body: str, algorithm: HashAlgorithm) -> str:
+        hashing_threads[len(body)] = threading.current_thread().name
+        if body is large_body:
+            # Only returns True if the next body is fetched while this one is being hashed
+            overlapped.append(next_body_fetched.wait(timeout=5))
+        return hash_body(body, algorithm)
+
+    def fetch_bodies() -> Iterator[tuple[int, str]]:
+        yield 0, large_body
+        next_body_fetched.set()
+        yield 1, small_body
+
+    monkeypatch.setattr(string, "hash_body", recording_hash_body)
+    digests = hash_bodies(fetch_bodies())
+
+    assert digests == {0: hash_body(large_body), 1: hash_body(small_body)}
+    assert hashing_threads[len(large_body)].startswith("db-drift-hash")
+    assert hashing_threads[len(small_body)] == threading.current_thread().name
+    assert overlapped == [True]
@@ -0,0 +1,60 @@
+"""Memory benchmark for streaming the catalog rows instead of materializing them with `fetchall()`."""
+
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from db_drift.db.strategies.oracle import fetch_oracle_tables
+
+from tests.benchmarks.fakes import RoundTripCountingCursor
+from tests.benchmarks.markers import large_benchmark
+
+COLUMNS_PER_TABLE = 20
+COLUMN_COUNTS = [
+    50_000,
+    pytest.param(1_000_000, marks=large_benchmark),
+]
+
+
+class FetchAllCursor(RoundTripCountingCursor):
+    """Hands out every remaining row in one batch, the way `fetchall()` used to materialize them."""
+
+    def fetchmany(self, size: int | None = None) -> list[tuple]:  # noqa: ARG002
+        return super().fetchmany(size=sys.maxsize)
+
+
+def _catalog(cursor_class: type[RoundTripCountingCursor], column_count: int) -> RoundTripCountingCursor:
+    def respond(statement: str, _parameters: dict[str, Any]) -> Iterator[tuple]:
+        table_count = column_count // COLUMNS_PER_TABLE
+        if "all_col_comments" in statement:
+            for i in range(column_count):
+                yield (f"TABLE_{i // COLUMNS_PER_TABLE}", f"COLUMN_{i % COLUMNS_PER_TABLE}", None, "HR", "VARCHAR2", "Y", 4000)
+        else:
+            for i in range(table_count):
+                yield (f"TABLE_{i}", None, "HR")
+
+    return cursor_class(respond)
+
+
+def _peak_traced_memory(cursor: RoundTripCountingCursor) -> tuple[dict, int]:
+    tracemalloc.start()
+    try:
+        tables = fetch_oracle_tables(cursor)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return tables, peak
+
+
+@pytest.mark.parametrize("column_count", COLUMN_COUNTS)
+def test_streaming_the_catalog_lowers_peak_memory(column_count: int) -> None:
+    streamed_tables, streamed_peak = _peak_traced_memory(_catalog(RoundTripCountingCursor, column_count))
+    materialized_tables, materialized_peak = _peak_traced_memory(_catalog(FetchAllCursor, column_count))
+
+    assert streamed_tables == materialized_tables
+    assert sum(len(table.columns) for table in streamed_tables.values()) == column_count
+    print(f"{column_count} columns: peak {streamed_peak / 2**20:.0f} MiB streamed vs {materialized_peak / 2**20:.0f} MiB materialized")  # noqa: T201
+    # Only one batch of rows is alive at a time, instead of every row next to the models built from them
+    assert streamed_peak < 0.8 * materialized_peak
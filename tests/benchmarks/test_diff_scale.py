@@ -0,0 +1,144 @@
+"""Benchmark for comparing schema structures of 100k objects, where only a few objects differ."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from db_drift.diff import compare, comparison_plan, diff_structures, fingerprint_structure
+from db_drift.models import Column, DatabaseObject, Function, Index, Table
+from db_drift.report.generate import generate_drift_report
+from db_drift.utils.string import hash_body
+
+from tests.benchmarks.markers import RUN_LARGE_BENCHMARKS, large_benchmark
+
+COLUMNS_PER_TABLE = 5
+CHANGED_EVERY = 100  # One object in a hundred differs
+OBJECT_COUNTS = [
+    100_000,
+    pytest.param(1_000_000, marks=large_benchmark),
+]
+
+
+def _structure(object_count: int, *, changed: bool = False) -> dict[str, dict[str, DatabaseObject]]:
+    """Build a structure of tables, indexes and functions, with every `CHANGED_EVERY`th object of each type altered if `changed`."""
+
+    def altered(i: int) -> bool:
+        return changed and i % CHANGED_EVERY == 0
+
+    table_count, index_count = object_count * 2 // 5, object_count * 3 // 10
+    return {
+        "tables": {
+            f"APP.T_{i}": Table(
+                doc=None,
+                columns={
+                    f"C_{column}": Column(doc=None, data_type="DATE" if altered(i) and column == 0 else "NUMBER", is_nullable=True)
+                    for column in range(COLUMNS_PER_TABLE)
+                },
+            )
+            for i in range(table_count)
+        },
+        "indexes": {
+            f"APP.IX_{i}": Index(columns={"C_0", "C_1"} | ({"C_2"} if altered(i) else set()), table_name=f"T_{i}", uniqueness="NONUNIQUE")
+            for i in range(index_count)
+        },
+        "functions": {
+            f"APP.F_{i}": Function(body=hash_body(f"RETURN {i + altered(i)};"), definition="() RETURNS NUMBER")
+            for i in range(object_count - table_count - index_count)
+        },
+    }
+
+
+def _write_placeholder_report(source: dict, target: dict, output_filename: Path) -> None:
+    """Write both structures whole, the way the report did before it was built from a diff."""
+    with Path.open(output_filename, "w") as report_file:
+        report_file.write(f"<pre>{source}</pre>\n<pre>{target}</pre>\n")
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+def test_diff_only_drills_into_the_objects_that_differ(object_count: int) -> None:
+    source, target = _structure(object_count), _structure(object_count, changed=True)
+
+    with patch.object(compare, "diff_object", wraps=compare.diff_object) as diff_object:
+        start = time.perf_counter()
+        structure_diff = diff_structures(source, target)
+        diff_seconds = time.perf_counter() - start
+
+    modified_count = sum(len(object_type_diff.modified) for object_type_diff in structure_diff.object_types.values())
+    unchanged_count = sum(object_type_diff.unchanged for object_type_diff in structure_diff.object_types.values())
+    print(f"{object_count} objects: diff in {diff_seconds:.2f} s, {modified_count} modified")  # noqa: T201
+    assert modified_count + unchanged_count == object_count
+    assert modified_count == sum(len(range(0, len(objects), CHANGED_EVERY)) for objects in source.values())
+    # Identical objects are skipped after one comparison, only the modified ones are compared field by field
+    assert diff_object.call_count == modified_count
+    assert structure_diff.object_types["tables"].modified["APP.T_0"].modified_columns["C_0"][0].target == "DATE"
+    assert structure_diff.object_types["indexes"].modified["APP.IX_0"].added_columns == ["C_2"]
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+def test_drift_report_is_faster_and_smaller_than_writing_both_structures(object_count: int, tmp_path: Path) -> None:
+    source, target = _structure(object_count), _structure(object_count, changed=True)
+
+    start = time.perf_counter()
+    generate_drift_report(source, target, str(tmp_path / "report.html"))
+    report_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _write_placeholder_report(source, target, tmp_path / "placeholder.html")
+    placeholder_seconds = time.perf_counter() - start
+
+    report_size, placeholder_size = (tmp_path / "report.html").stat().st_size, (tmp_path / "placeholder.html").stat().st_size
+    print(f"{object_count} objects: report in {report_seconds:.2f} s ({report_size} bytes) vs {placeholder_seconds:.2f} s ({placeholder_size} bytes)")  # noqa: T201
+    # Only the differences are written
+    assert report_size * 100 < placeholder_size
+    if RUN_LARGE_BENCHMARKS:
+        assert report_seconds * 3 < placeholder_seconds
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+def test_equal_fingerprints_skip_the_comparison_of_identical_structures(object_count: int) -> None:
+    source, target = _structure(object_count), _structure(object_count)
+    # Computed once, when the snapshots are written
+    source_fingerprint, target_fingerprint = fingerprint_structure(source), fingerprint_structure(target)
+
+    start = time.perf_counter()
+    structure_diff = diff_structures(source, target)
+    diff_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fingerprinted_diff = diff_structures(source, target, source_fingerprint, target_fingerprint)
+    fingerprinted_seconds = time.perf_counter() - start
+
+    print(f"{object_count} identical objects: diff in {diff_seconds:.3f} s, with fingerprints in {fingerprinted_seconds:.6f} s")  # noqa: T201
+    assert fingerprinted_diff == structure_diff
+    assert not fingerprinted_diff.has_drift
+    if RUN_LARGE_BENCHMARKS:
+        assert fingerprinted_seconds * 100 < diff_seconds
+
+
+def test_equal_root_digests_compare_zero_objects(monkeypatch: pytest.MonkeyPatch) -> None:
+    source, target = _structure(1_000), _structure(1_000)
+    source_fingerprint, target_fingerprint = fingerprint_structure(source), fingerprint_structure(target)
+    compared_objects: list[DatabaseObject] = []
+
+    def counting_eq(model_eq: Callable[[object, object], bool]) -> Callable[[object, object], bool]:
+        def eq(self: DatabaseObject, other: object) -> bool:
+            compared_objects.append(self)
+            return model_eq(self, other)
+
+        return eq
+
+    for model in (Table, Index, Function):
+        monkeypatch.setattr(model, "__eq__", counting_eq(model.__eq__))
+
+    plan = list(comparison_plan(source, target, source_fingerprint, target_fingerprint))
+    structure_diff = diff_structures(source, target, source_fingerprint, target_fingerprint)
+
+    # Every object is counted as unchanged from the root digests alone, none is handed over for comparison
+    assert plan == [(obj_type, {}, {}, len(objects)) for obj_type, objects in source.items()]
+    assert compared_objects == []
+    assert not structure_diff.has_drift
+    # Without the fingerprints, every object is compared
+    diff_structures(source, target)
+    assert len(compared_objects) == sum(len(objects) for objects in source.values())
@@ -0,0 +1,60 @@
+"""Startup benchmark: importing db-drift (and printing --help) must not load any database driver."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Loading every connector used to take ~0.65 s, over half of it importing SQLAlchemy and oracledb
+STARTUP_BUDGET_SECONDS = 0.4
+HEAVY_MODULES = ("oracledb", "sqlalchemy", "sqlmodel", "psycopg", "pymysql", "db_drift.db.connectors.oracle", "db_drift.db.strategies.oracle")
+
+
+def _run_python(code: str, cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+
+
+def _import_seconds(importtime_output: str, module: str) -> float:
+    # Lines look like "import time: self [us] | cumulative | imported package"
+    (cumulative,) = re.findall(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", importtime_output, flags=re.MULTILINE)
+    return int(cumulative) / 1_000_000
+
+
+def _imported_heavy_modules(code: str, cwd: Path) -> list[str]:
+    result = _run_python(f"{code}\nimport sys\nprint(sorted(sys.modules))", cwd)
+    return [module for module in HEAVY_MODULES if f"'{module}'" in result.stdout]
+
+
+def test_importing_db_drift_loads_no_database_driver(tmp_path: Path) -> None:
+    assert _imported_heavy_modules("import db_drift", tmp_path) == []
+    # Importing must not create log files either
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_help_loads_no_database_driver(tmp_path: Path) -> None:
+    code = "import sys\nfrom db_drift.cli.cli import cli_arg_parse\nsys.argv = ['db-drift', '--help']\ntry:\n    cli_arg_parse()\nexcept SystemExit:\n    pass"
+    assert _imported_heavy_modules(code, tmp_path) == []
+
+
+def test_choosing_a_dbms_only_loads_its_connector(tmp_path: Path) -> None:
+    loaded = _imported_heavy_modules("from db_drift.db.factory import get_connector\nget_connector('sqlite')", tmp_path)
+    assert loaded == []
+
+    loaded = _imported_heavy_modules("from db_drift.db.factory import get_connector\nget_connector('oracle')", tmp_path)
+    assert "db_drift.db.connectors.oracle" in loaded
+
+
+def test_importing_db_drift_is_within_the_startup_budget(tmp_path: Path) -> None:
+    # Best of a few runs, so that a busy machine does not fail the gate
+    import_seconds = min(_import_seconds(_run_python("import db_drift", tmp_path).stderr, "db_drift") for _ in range(3))
+
+    assert import_seconds < STARTUP_BUDGET_SECONDS
@@ -0,0 +1,84 @@
+"""Memory benchmark for the models of a large synthetic catalog, reported in bytes per table and per column."""
+
+import gc
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import fields
+from typing import Any
+
+import pytest
+from db_drift import models
+from db_drift.db.strategies.mysql import MySQLSchemaScope, fetch_mysql_tables
+from db_drift.models import Edition, Table
+from db_drift.models.abstract_models import DatabaseObjectWithDefinition, DatabaseObjectWithDoc
+from db_drift.models.complex_abstract_models import DatabaseObjectWithColumns
+
+from tests.benchmarks.fakes import FakeMySQLConnection
+from tests.benchmarks.markers import large_benchmark
+
+COLUMNS_PER_TABLE = 20
+DATA_TYPES = ("int", "bigint", "varchar(64)", "varchar(255)", "datetime", "decimal(10,2)")
+# About 190 and 80 bytes with slotted models and interned names and types, against 230 and 215 with a __dict__ per model
+# and a copy of every name and type
+BYTES_PER_TABLE_BUDGET = 210
+BYTES_PER_COLUMN_BUDGET = 100
+TABLE_COUNTS = [
+    20_000,
+    pytest.param(200_000, marks=large_benchmark),
+]
+
+
+def _catalog(table_count: int, columns_per_table: int) -> FakeMySQLConnection:
+    def respond(_statement: str, _parameters: dict[str, Any]) -> Iterator[tuple]:
+        # Every value is a new string, like the ones a driver decodes from the wire
+        for table in range(table_count):
+            if not columns_per_table:
+                yield ("app", f"table_{table}", None, None, None, None, None)
+            for column in range(columns_per_table):
+                data_type = DATA_TYPES[column % len(DATA_TYPES)]
+                yield ("app", f"table_{table}", None, f"column_{column}", f"{data_type} ".rstrip(), "YES", None)
+
+    return FakeMySQLConnection(respond)
+
+
+def _traced_bytes(table_count: int, columns_per_table: int) -> int:
+    """Measure the memory held by the fetched tables of a catalog."""
+    connection = _catalog(table_count, columns_per_table)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tables = fetch_mysql_tables(connection.cursor(), schema_scope=MySQLSchemaScope(schemas=["app"]))
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(tables) == table_count
+    return current
+
+
+@pytest.mark.parametrize("table_count", TABLE_COUNTS)
+def test_bytes_per_table_and_per_column(table_count: int) -> None:
+    table_bytes = _traced_bytes(table_count, 0)
+    column_bytes = _traced_bytes(table_count, COLUMNS_PER_TABLE) - table_bytes
+    bytes_per_table, bytes_per_column = table_bytes / table_count, column_bytes / (table_count * COLUMNS_PER_TABLE)
+
+    print(f"{table_count} tables of {COLUMNS_PER_TABLE} columns: {bytes_per_table:.0f} bytes per table, {bytes_per_column:.0f} bytes per column")  # noqa: T201
+    assert bytes_per_table < BYTES_PER_TABLE_BUDGET
+    assert bytes_per_column < BYTES_PER_COLUMN_BUDGET
+
+
+@pytest.mark.parametrize("base", [DatabaseObjectWithDoc, DatabaseObjectWithDefinition, DatabaseObjectWithColumns])
+def test_storageless_model_bases_are_abstract(base: type) -> None:
+    # The bases without slots of their own only declare fields for the slotted models that combine them
+    assert base.__name__ not in models.__all__
+    with pytest.raises(AttributeError):
+        base(*[""] * len(fields(base)))
+
+
+def test_models_that_combine_storageless_bases_are_slotted() -> None:
+    table = Table(columns={}, doc="Employees")
+    edition = Edition(definition="ORA$BASE", doc="")
+
+    assert (table.doc, edition.definition) == ("Employees", "ORA$BASE")
+    assert not hasattr(table, "__dict__")
+    assert not hasattr(edition, "__dict__")
@@ -0,0 +1,47 @@
+"""Memory benchmark for streaming the MySQL column list through an unbuffered (server-side) cursor."""
+
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from db_drift.db.strategies.mysql import MySQLSchemaScope, fetch_mysql_tables
+
+from tests.benchmarks.fakes import FakeMySQLConnection
+from tests.benchmarks.markers import large_benchmark
+
+COLUMNS_PER_TABLE = 20
+COLUMN_COUNTS = [
+    50_000,
+    pytest.param(1_000_000, marks=large_benchmark),
+]
+
+
+def _catalog(column_count: int, *, buffered: bool) -> FakeMySQLConnection:
+    def respond(_statement: str, _parameters: dict[str, Any]) -> Iterator[tuple]:
+        for i in range(column_count):
+            yield ("app", f"table_{i // COLUMNS_PER_TABLE}", None, f"column_{i % COLUMNS_PER_TABLE}", "varchar(255)", "YES", None)
+
+    return FakeMySQLConnection(respond, buffered=buffered)
+
+
+def _peak_traced_memory(connection: FakeMySQLConnection) -> tuple[dict, int]:
+    tracemalloc.start()
+    try:
+        tables = fetch_mysql_tables(connection.cursor(), schema_scope=MySQLSchemaScope(schemas=["app"]))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return tables, peak
+
+
+@pytest.mark.parametrize("column_count", COLUMN_COUNTS)
+def test_unbuffered_cursor_lowers_peak_memory(column_count: int) -> None:
+    streamed_tables, streamed_peak = _peak_traced_memory(_catalog(column_count, buffered=False))
+    buffered_tables, buffered_peak = _peak_traced_memory(_catalog(column_count, buffered=True))
+
+    assert streamed_tables == buffered_tables
+    assert sum(len(table.columns) for table in streamed_tables.values()) == column_count
+    print(f"{column_count} columns: peak {streamed_peak / 2**20:.0f} MiB unbuffered vs {buffered_peak / 2**20:.0f} MiB buffered")  # noqa: T201
+    # Only one batch of rows is alive at a time, instead of the whole result next to the models built from it
+    assert streamed_peak < 0.8 * buffered_peak
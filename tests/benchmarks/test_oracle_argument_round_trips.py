@@ -0,0 +1,38 @@
+"""Round-trip benchmark for the argument lookups of Oracle functions and procedures."""
+
+from typing import Any
+
+import pytest
+from db_drift.db.strategies.oracle import fetch_oracle_functions, fetch_oracle_stored_procedures
+
+from tests.benchmarks.fakes import FakeLob, RoundTripCountingCursor
+
+OBJECT_COUNTS = [10, 100, 1_000, 5_000]
+ARGUMENTS_PER_OBJECT = 3
+
+
+def _catalog(object_count: int) -> RoundTripCountingCursor:
+    def respond(statement: str, _parameters: dict[str, Any]) -> list[tuple]:
+        if "all_arguments" in statement:
+            return [
+                ("HR", f"UNIT_{i}", f"P_ARG_{position}", position, "VARCHAR2", "IN")
+                for i in range(object_count)
+                for position in range(1, ARGUMENTS_PER_OBJECT + 1)
+            ]
+        return [("HR", f"UNIT_{i}", None, FakeLob(f"CREATE OR REPLACE UNIT_{i} ...")) for i in range(object_count)]
+
+    return RoundTripCountingCursor(respond)
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+@pytest.mark.parametrize("fetch_function", [fetch_oracle_functions, fetch_oracle_stored_procedures])
+def test_argument_lookup_round_trips_are_constant_in_the_number_of_objects(object_count: int, fetch_function: Any) -> None:  # noqa: ANN401
+    cursor = _catalog(object_count)
+
+    objects = fetch_function(cursor)
+
+    assert len(objects) == object_count
+    assert objects["HR.UNIT_0"].definition == "P_ARG_1 VARCHAR2 IN, P_ARG_2 VARCHAR2 IN, P_ARG_3 VARCHAR2 IN"
+    # One query for the objects and their DDL plus one for all of their arguments: O(1) instead of O(objects)
+    assert cursor.round_trips == 2  # noqa: PLR2004
+    assert sum("all_arguments" in statement for statement in cursor.executed) == 1
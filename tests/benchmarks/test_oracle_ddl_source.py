@@ -0,0 +1,63 @@
+"""Benchmark of the two sources for the DDL of Oracle PL/SQL units and types."""
+
+import os
+import time
+from typing import Any
+
+import pytest
+from db_drift.db.connectors.oracle import OracleConnector
+from db_drift.db.strategies.oracle import OracleDDLSource, fetch_oracle_packages
+
+from tests.benchmarks.fakes import FakeLob, RoundTripCountingCursor
+
+ORACLE_TEST_CONN_ENV_VAR = "DB_DRIFT_ORACLE_TEST_CONN_STRING"
+PACKAGE_COUNTS = [10, 1_000]
+LINES_PER_UNIT = 20
+
+
+def _catalog(package_count: int) -> RoundTripCountingCursor:
+    def respond(statement: str, _parameters: dict[str, Any]) -> list[tuple]:
+        if "all_source" in statement:
+            return [
+                ("HR", f"PKG_{i}", source_type, f"-- line {line} of pkg_{i}\n")
+                for i in range(package_count)
+                for source_type in ("PACKAGE", "PACKAGE BODY")
+                for line in range(LINES_PER_UNIT)
+            ]
+        return [
+            (
+                "HR",
+                f"PKG_{i}",
+                None,
+                FakeLob(f"CREATE OR REPLACE PACKAGE pkg_{i} AS END pkg_{i}; CREATE OR REPLACE PACKAGE BODY pkg_{i} AS END pkg_{i};"),
+            )
+            for i in range(package_count)
+        ]
+
+    return RoundTripCountingCursor(respond)
+
+
+@pytest.mark.parametrize("package_count", PACKAGE_COUNTS)
+@pytest.mark.parametrize("ddl_source", list(OracleDDLSource))
+def test_both_ddl_sources_fetch_every_package_in_one_round_trip(package_count: int, ddl_source: OracleDDLSource) -> None:
+    cursor = _catalog(package_count)
+
+    packages = fetch_oracle_packages(cursor, ddl_source=ddl_source)
+
+    assert len(packages) == package_count
+    assert cursor.round_trips == 1
+    # dbms_metadata.get_ddl runs (and renders XML) once per object inside that round-trip; ALL_SOURCE is a plain scan
+    assert ("get_ddl" in cursor.executed[0]) is (ddl_source is OracleDDLSource.DBMS_METADATA)
+
+
+@pytest.mark.skipif(not os.getenv(ORACLE_TEST_CONN_ENV_VAR), reason=f"Requires {ORACLE_TEST_CONN_ENV_VAR}.")
+def test_all_source_is_not_slower_than_dbms_metadata_on_a_live_database() -> None:
+    durations = {}
+    for ddl_source in OracleDDLSource:
+        connector = OracleConnector(os.environ[ORACLE_TEST_CONN_ENV_VAR], ddl_source=ddl_source)
+        started = time.perf_counter()
+        schema = connector.fetch_schema_structure()
+        durations[ddl_source] = time.perf_counter() - started
+        print(f"{ddl_source.value}: {durations[ddl_source]:.2f}s for {sum(map(len, schema.values()))} objects")  # noqa: T201
+
+    assert durations[OracleDDLSource.ALL_SOURCE] <= durations[OracleDDLSource.DBMS_METADATA]
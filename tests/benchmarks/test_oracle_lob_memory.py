@@ -0,0 +1,45 @@
+"""Memory benchmark for hashing the DDL of Oracle packages of 20 to 50 MB, read from their LOBs."""
+
+import gc
+import tracemalloc
+
+import pytest
+from db_drift.db.strategies.oracle import LOB_READ_LENGTH, fetch_oracle_packages
+from db_drift.utils.string import hash_body
+
+from tests.benchmarks.fakes import FakeLob, RoundTripCountingCursor
+from tests.benchmarks.markers import large_benchmark
+
+# The read pieces, the text carried between them and their UTF-8 copies, against twice the DDL when it is read whole
+PEAK_BYTES_BUDGET = 8 * LOB_READ_LENGTH
+DDL_SIZES = [
+    20 * 2**20,
+    pytest.param(50 * 2**20, marks=large_benchmark),
+]
+
+
+def _package_ddl(size: int) -> str:
+    spec = "CREATE OR REPLACE PACKAGE hr.generated AS\n  PROCEDURE run;\nEND generated;\n"
+    line = "  PROCEDURE run IS BEGIN l_total := l_total + 1; END;\n"
+    return spec + "CREATE OR REPLACE PACKAGE BODY hr.generated AS\n" + line * ((size - len(spec)) // len(line)) + "END generated;"
+
+
+@pytest.mark.parametrize("size", DDL_SIZES)
+def test_package_ddl_is_hashed_without_reading_the_whole_lob(size: int) -> None:
+    lob = FakeLob(_package_ddl(size))
+    cursor = RoundTripCountingCursor(lambda _statement, _parameters: [("HR", "GENERATED", None, lob)])
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        packages = fetch_oracle_packages(cursor)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(f"Package DDL of {size // 2**20} MiB: {peak / 2**20:.1f} MiB peak in {lob.reads} LOB reads")  # noqa: T201
+    spec, found, body = lob.text.partition("END generated;")
+    assert packages["HR.GENERATED"].definition == hash_body(spec + found)
+    assert packages["HR.GENERATED"].body == hash_body(body)
+    assert peak < PEAK_BYTES_BUDGET
+    assert lob.reads == -(-len(lob.text) // (LOB_READ_LENGTH // lob.chunk_size * lob.chunk_size))
@@ -0,0 +1,73 @@
+"""
+Round-trip benchmark for the LONG columns of Oracle triggers and constraints.
+
+Only client round-trips are counted. On the server, array fetching the trigger bodies as VARCHAR2 still costs
+a switch to PL/SQL and a lookup in ALL_TRIGGERS per trigger row; the LONG fallback does not repeat it.
+"""
+
+import math
+import re
+from typing import Any
+
+import pytest
+from db_drift.db.mappers.constraint_types.oracle import ORACLE_CONSTRAINT_MAPPER
+from db_drift.db.strategies.oracle import LONG_TRIGGERS_BIND, MAX_SQL_VARCHAR2_BYTES, fetch_oracle_constraints, fetch_oracle_triggers
+from db_drift.db.strategies.utils import ExpectedRows
+from db_drift.utils.string import hash_body
+
+from tests.benchmarks.fakes import RoundTripCountingCursor
+
+OBJECT_COUNTS = [100, 10_000, 50_000]
+LONG_COLUMNS = ("trigger_body", "search_condition")
+
+
+def _selects_long_column(statement: str) -> bool:
+    # Only look at the select list of the main query, not at the PL/SQL declared in its WITH clause or at comments
+    select_list = re.sub(r"--.*", "", statement.rsplit("END;", 1)[-1].split("FROM", 1)[0])
+    return any(re.search(rf"\b{column}\b", select_list) for column in LONG_COLUMNS)
+
+
+def _trigger_body(i: int) -> str:
+    # Every 100th trigger is too long to be handed back to SQL as a VARCHAR2
+    return "BEGIN NULL; END;" if i % 100 else "x" * (MAX_SQL_VARCHAR2_BYTES + 1)
+
+
+def _catalog(object_count: int) -> RoundTripCountingCursor:
+    def respond(statement: str, parameters: dict[str, Any]) -> list[tuple]:
+        if LONG_TRIGGERS_BIND in parameters:  # The LONG fallback for the bodies that do not fit in a VARCHAR2
+            return [("HR", name.split(".")[1], _trigger_body(int(name.rsplit("_", 1)[1]))) for name in parameters[LONG_TRIGGERS_BIND]]
+        if "all_triggers" in statement:
+            return [(f"TRG_{i}", "BEFORE EACH ROW", "EMPLOYEES", None, _trigger_body(i) if i % 100 else None, "HR") for i in range(object_count)]
+        return [(f"CHK_{i}", "C", "EMPLOYEES", None, f'"COLUMN_{i}" IS NOT NULL', f"COLUMN_{i}", "HR") for i in range(object_count)]
+
+    return RoundTripCountingCursor(respond, _selects_long_column)
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+def test_trigger_bodies_are_array_fetched(object_count: int) -> None:
+    cursor = _catalog(object_count)
+
+    triggers = fetch_oracle_triggers(cursor)
+
+    assert len(triggers) == object_count
+    assert triggers["HR.TRG_0"].body == hash_body(_trigger_body(0))
+    assert triggers["HR.TRG_1"].body == hash_body(_trigger_body(1))
+    # Array fetch for all triggers plus one round-trip per trigger whose body only fits in a LONG,
+    # instead of one round-trip per trigger
+    long_body_count = object_count // 100
+    assert cursor.fetch_round_trips == math.ceil(object_count / ExpectedRows.ONE_PER_OBJECT) + long_body_count
+    # The LONG fallback looks up the long bodies by name instead of calling the PL/SQL function on every trigger again
+    assert cursor.round_trips == 2  # noqa: PLR2004
+    assert "trigger_body_vc" not in cursor.executed[1]
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+def test_constraint_conditions_are_array_fetched(object_count: int) -> None:
+    cursor = _catalog(object_count)
+
+    constraints = fetch_oracle_constraints(cursor, ORACLE_CONSTRAINT_MAPPER)
+
+    assert len(constraints) == object_count
+    assert constraints["HR.CHK_0"].condition == '"COLUMN_0" IS NOT NULL'
+    assert cursor.round_trips == 1
+    assert cursor.fetch_round_trips == math.ceil(object_count / ExpectedRows.MANY_PER_OBJECT)
@@ -0,0 +1,65 @@
+"""Round-trip and wall-clock benchmark for pipelining the Oracle catalog scan over a high-latency link."""
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from db_drift.db.connectors.oracle import OracleConnector
+from db_drift.db.connectors.oracle_async import AsyncOracleConnector
+
+from tests.benchmarks.fakes import LatencyInjectingAsyncConnection
+from tests.benchmarks.markers import RUN_LARGE_BENCHMARKS
+
+CONNECTION_STRING = "user/password@remote-region:1521/testpdb"
+LATENCY_SECONDS = 0.02  # A cross-region round-trip
+OBJECT_COUNTS = [10, 1_000]
+
+
+def _catalog(object_count: int) -> LatencyInjectingAsyncConnection:
+    """Stand in for a database with `object_count` tables, views and sequences, and three columns per table and view."""
+
+    def respond(statement: str, _parameters: dict[str, Any]) -> list[tuple]:
+        if "ORDER BY username" in statement:
+            return [("SYS",), ("SYSTEM",)]
+        if "FROM all_tab_comments" in statement:
+            return [(f"T_{i}", None, "HR") for i in range(object_count)]
+        if "FROM all_col_comments" in statement:
+            return [(f"T_{i}", f"C_{column}", None, "HR", "NUMBER", "Y", 22) for i in range(object_count) for column in range(3)]
+        if "FROM all_sequences" in statement:
+            return [(f"S_{i}", 1, 999, 1, "HR", 20) for i in range(object_count)]
+        return []
+
+    return LatencyInjectingAsyncConnection(respond, latency=LATENCY_SECONDS)
+
+
+def _fetch(connector: OracleConnector, connection: LatencyInjectingAsyncConnection) -> tuple[dict, float]:
+    with patch.object(connector.connection_library, "connect_async", return_value=connection):
+        start = time.perf_counter()
+        schema = asyncio.run(connector.fetch_schema_structure_async())
+        return schema, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("object_count", OBJECT_COUNTS)
+def test_pipelined_catalog_scan_takes_a_handful_of_round_trips(object_count: int) -> None:
+    serial_connection = _catalog(object_count)
+    pipelined_connection = _catalog(object_count)
+
+    serial_schema, serial_seconds = _fetch(AsyncOracleConnector(CONNECTION_STRING), serial_connection)
+    pipelined_schema, pipelined_seconds = _fetch(AsyncOracleConnector(CONNECTION_STRING, pipeline=True), pipelined_connection)
+
+    assert pipelined_schema == serial_schema
+    assert len(pipelined_schema["tables"]) == object_count
+    assert sorted(pipelined_connection.executed) == sorted(serial_connection.executed)
+
+    # Serially every catalog query costs at least one round-trip; pipelined, every round-trip
+    # carries one query of every object type: the owner lookup, the collection type lookup and
+    # one pipeline per query of the longest plan (plus the extra batches of the large results)
+    assert serial_connection.round_trips >= len(serial_connection.executed)
+    assert pipelined_connection.pipelines_run <= 3  # noqa: PLR2004
+    assert pipelined_connection.round_trips * 3 < serial_connection.round_trips
+    print(f"{object_count} objects: {serial_seconds:.3f} s serially, {pipelined_seconds:.3f} s pipelined")  # noqa: T201
+    if RUN_LARGE_BENCHMARKS:
+        # Latency dominates the run time, so the wall-clock time follows the round-trips
+        assert pipelined_seconds * 2 < serial_seconds
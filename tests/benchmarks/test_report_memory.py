@@ -0,0 +1,116 @@
+"""Memory benchmarks for streaming the drift report of schemas of growing size, and the JSON records of growing drift."""
+
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from db_drift.models import Column, DatabaseObject, Table
+from db_drift.report.generate import generate_drift_report
+from db_drift.report.records import write_drift_records
+from db_drift.utils.constants import ReportFormat
+
+from tests.benchmarks.markers import large_benchmark
+
+COLUMNS_PER_TABLE = 5
+CHANGED_TABLES = 100
+SMALL_TABLE_COUNT = 5_000
+TABLE_COUNTS = [
+    50_000,
+    pytest.param(500_000, marks=large_benchmark),
+]
+
+
+def _structure(table_count: int, *, changed: bool = False) -> dict[str, dict[str, DatabaseObject]]:
+    """Build a structure of tables, with the first `CHANGED_TABLES` given an extra column if `changed`."""
+    return {
+        "tables": {
+            f"APP.T_{i}": Table(
+                doc=None,
+                columns={
+                    f"C_{column}": Column(doc=None, data_type="NUMBER", is_nullable=True)
+                    for column in range(COLUMNS_PER_TABLE + (changed and i < CHANGED_TABLES))
+                },
+            )
+            for i in range(table_count)
+        },
+    }
+
+
+def _write_placeholder_report(source: dict, target: dict, output_filename: Path) -> None:
+    """Write both structures whole, the way the report did before it was streamed."""
+    with Path.open(output_filename, "w") as report_file:
+        report_file.write(f"<pre>{source}</pre>\n<pre>{target}</pre>\n")
+
+
+def _peak_traced_memory(write_report: Callable[[dict, dict, Path], None], table_count: int, output_filename: Path) -> int:
+    source, target = _structure(table_count), _structure(table_count, changed=True)
+    tracemalloc.start()
+    try:
+        write_report(source, target, output_filename)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _write_report(source: dict, target: dict, output_filename: Path) -> None:
+    generate_drift_report(source, target, str(output_filename))
+
+
+@pytest.mark.parametrize("table_count", TABLE_COUNTS)
+def test_report_peak_memory_stays_flat_as_the_schema_grows(table_count: int, tmp_path: Path) -> None:
+    small_peak = _peak_traced_memory(_write_report, SMALL_TABLE_COUNT, tmp_path / "small.html")
+    large_peak = _peak_traced_memory(_write_report, table_count, tmp_path / "large.html")
+    placeholder_peak = _peak_traced_memory(_write_placeholder_report, table_count, tmp_path / "placeholder.html")
+
+    print(  # noqa: T201
+        f"{table_count} tables: peak {large_peak / 2**20:.1f} MiB ({SMALL_TABLE_COUNT} tables: {small_peak / 2**20:.1f} MiB) "
+        f"vs {placeholder_peak / 2**20:.0f} MiB for the placeholder",
+    )
+    assert (tmp_path / "large.html").read_text(encoding="utf-8") == (tmp_path / "small.html").read_text(encoding="utf-8").replace(
+        f"{SMALL_TABLE_COUNT - CHANGED_TABLES} unchanged",
+        f"{table_count - CHANGED_TABLES} unchanged",
+    )
+    # The report only holds the differences and a write buffer, however many objects are unchanged
+    assert large_peak < 2 * small_peak
+    assert large_peak * 20 < placeholder_peak
+
+
+@pytest.mark.parametrize("table_count", TABLE_COUNTS)
+def test_records_and_report_peak_memory_stay_flat_as_the_drift_grows(table_count: int, tmp_path: Path) -> None:
+    # Every table of the source is dropped from the target
+    def write_records(source: dict, _target: dict, output_filename: Path) -> None:
+        write_drift_records(source, {"tables": {}}, str(output_filename), ReportFormat.NDJSON)
+
+    def write_report(source: dict, _target: dict, output_filename: Path) -> None:
+        generate_drift_report(source, {"tables": {}}, str(output_filename))
+
+    small_peak = _peak_traced_memory(write_records, SMALL_TABLE_COUNT, tmp_path / "small.ndjson")
+    large_peak = _peak_traced_memory(write_records, table_count, tmp_path / "large.ndjson")
+    small_report_peak = _peak_traced_memory(write_report, SMALL_TABLE_COUNT, tmp_path / "small.html")
+    large_report_peak = _peak_traced_memory(write_report, table_count, tmp_path / "large.html")
+
+    print(  # noqa: T201
+        f"{table_count} dropped tables: records peak {large_peak / 2**10:.0f} KiB ({SMALL_TABLE_COUNT} tables: {small_peak / 2**10:.0f} KiB), "
+        f"HTML report peak {large_report_peak / 2**10:.0f} KiB ({SMALL_TABLE_COUNT} tables: {small_report_peak / 2**10:.0f} KiB)",
+    )
+    assert len((tmp_path / "large.ndjson").read_text(encoding="utf-8").splitlines()) == 1 + table_count  # And the metadata
+    assert (tmp_path / "large.html").read_text(encoding="utf-8").count("<li>") == table_count
+    # A record is written and dropped before the next one is produced
+    assert large_peak < 2 * small_peak
+    # The report holds its write buffer, and no more than the object being written
+    assert large_report_peak < 2 * small_report_peak
+
+
+def test_report_peak_memory_stays_flat_as_the_modified_objects_grow(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    table_count = TABLE_COUNTS[0]
+    monkeypatch.setattr(f"{__name__}.CHANGED_TABLES", table_count)  # Every table has an extra column in the target
+
+    small_peak = _peak_traced_memory(_write_report, SMALL_TABLE_COUNT, tmp_path / "small.html")
+    large_peak = _peak_traced_memory(_write_report, table_count, tmp_path / "large.html")
+
+    print(f"{table_count} modified tables: peak {large_peak / 2**10:.0f} KiB ({SMALL_TABLE_COUNT} tables: {small_peak / 2**10:.0f} KiB)")  # noqa: T201
+    assert (tmp_path / "large.html").read_text(encoding="utf-8").count(f"Column added: C_{COLUMNS_PER_TABLE}") == table_count
+    # Only the diff of the object being written is held
+    assert large_peak < 2 * small_peak
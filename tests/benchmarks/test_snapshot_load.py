@@ -0,0 +1,58 @@
+"""Wall-clock benchmark for comparing against a saved snapshot instead of introspecting the database again."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from db_drift.db.connectors.oracle_async import AsyncOracleConnector
+from db_drift.db.connectors.snapshot import SnapshotConnector
+from db_drift.snapshot import Snapshot, write_snapshot
+
+from tests.benchmarks.fakes import LatencyInjectingAsyncConnection
+from tests.benchmarks.markers import RUN_LARGE_BENCHMARKS
+
+CONNECTION_STRING = "user/password@remote-region:1521/prodpdb"
+LATENCY_SECONDS = 0.02  # A cross-region round-trip
+TABLE_COUNT = 2_000
+COLUMNS_PER_TABLE = 10
+
+
+def _respond(statement: str, _parameters: dict[str, Any]) -> list[tuple]:
+    if "ORDER BY username" in statement:
+        return [("SYS",)]
+    if "FROM all_tab_comments" in statement and "table_type = 'TABLE'" in statement:
+        return [(f"T_{i}", None, "HR") for i in range(TABLE_COUNT)]
+    if "FROM all_col_comments" in statement and "table_type = 'TABLE'" in statement:
+        return [(f"T_{i}", f"C_{column}", None, "HR", "NUMBER", "Y", 22) for i in range(TABLE_COUNT) for column in range(COLUMNS_PER_TABLE)]
+    return []
+
+
+def test_loading_a_snapshot_is_far_faster_than_introspecting_the_database(tmp_path: Path) -> None:
+    connector = AsyncOracleConnector(CONNECTION_STRING)
+    connection = LatencyInjectingAsyncConnection(_respond, latency=LATENCY_SECONDS)
+
+    with patch.object(connector.connection_library, "connect_async", return_value=connection):
+        start = time.perf_counter()
+        schema = asyncio.run(connector.fetch_schema_structure_async())
+        fetch_seconds = time.perf_counter() - start
+
+    snapshot_path = tmp_path / "prod.json.gz"
+    write_snapshot(snapshot_path, Snapshot(structure=schema))
+
+    introspection_round_trips = connection.round_trips
+    # Any connection attempt while loading the snapshot fails the test
+    with patch.object(connector.connection_library, "connect_async", side_effect=AssertionError("the snapshot connected to the database")):
+        start = time.perf_counter()
+        loaded_schema = SnapshotConnector(str(snapshot_path)).fetch_schema_structure()
+        load_seconds = time.perf_counter() - start
+
+    assert loaded_schema == schema
+    # The snapshot replaces every round-trip of the introspection
+    assert introspection_round_trips > 0
+    assert connection.round_trips == introspection_round_trips
+    assert len(loaded_schema["tables"]) == TABLE_COUNT
+    print(f"{TABLE_COUNT} tables: introspected in {fetch_seconds:.3f} s, loaded from a snapshot in {load_seconds:.3f} s")  # noqa: T201
+    if RUN_LARGE_BENCHMARKS:
+        assert load_seconds * 5 < fetch_seconds
@@ -0,0 +1,64 @@
+"""Scale benchmark for the SQLite catalog introspection."""
+
+import sqlite3
+import time
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+import pytest
+from db_drift.db.strategies.sqlite import fetch_sqlite_indexes, fetch_sqlite_tables, fetch_sqlite_views
+
+from tests.benchmarks.markers import large_benchmark
+
+INDEXES_PER_TABLE = 3
+VIEW_EVERY_N_TABLES = 10
+MAX_SECONDS_PER_OBJECT_TYPE = 10
+
+TABLE_COUNTS = [
+    100,
+    pytest.param(10_000, marks=large_benchmark),
+]
+
+
+@cache  # Creating 10k tables takes minutes, so the catalog is shared by all object types
+def _create_catalog(table_count: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    statements = ["BEGIN;"]
+    for i in range(table_count):
+        statements.append(f"CREATE TABLE t_{i} (id INTEGER PRIMARY KEY, name TEXT NOT NULL, a TEXT, b TEXT);")
+        statements.extend(f"CREATE INDEX t_{i}_ix_{j} ON t_{i} (name, {'ab'[j % 2]});" for j in range(INDEXES_PER_TABLE))
+        if i % VIEW_EVERY_N_TABLES == 0:
+            statements.append(f"CREATE VIEW v_{i} AS SELECT id, name FROM t_{i};")
+    statements.append("COMMIT;")
+    connection.executescript("\n".join(statements))
+    return connection
+
+
+@pytest.mark.parametrize("table_count", TABLE_COUNTS)
+@pytest.mark.parametrize(
+    ("fetch_function", "objects_per_table"),
+    [
+        (fetch_sqlite_tables, 1),
+        (fetch_sqlite_views, 1 / VIEW_EVERY_N_TABLES),
+        (fetch_sqlite_indexes, INDEXES_PER_TABLE),
+    ],
+)
+def test_sqlite_catalog_is_read_with_one_statement_per_object_type(
+    table_count: int,
+    fetch_function: Callable[[sqlite3.Cursor], dict[str, Any]],
+    objects_per_table: float,
+) -> None:
+    connection = _create_catalog(table_count)
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+
+    started = time.perf_counter()
+    objects = fetch_function(connection.cursor())
+    elapsed = time.perf_counter() - started
+
+    assert len(objects) == int(table_count * objects_per_table)
+    # A single joined query, no matter how many tables (and indexes per table) there are.
+    # The trace also reports every table-valued pragma invocation of that query as an SQL comment.
+    assert len([statement for statement in statements if not statement.startswith("--")]) == 1
+    assert elapsed < MAX_SECONDS_PER_OBJECT_TYPE
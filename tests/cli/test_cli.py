@@ -1,10 +1,17 @@
 """Tests for CLI argument parsing and validation."""
 
 import argparse
+import json
+import sqlite3
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-from db_drift.cli.cli import cli_arg_parse
+from db_drift.__main__ import main
+from db_drift.cli.cli import COMPARE_COMMAND, SNAPSHOT_COMMAND, cli_arg_parse
+from db_drift.cli.utils import get_connector_options, get_object_filter
+from db_drift.db.filters import ObjectFilter
+from db_drift.utils.constants import ExitCode
 from db_drift.utils.exceptions import CliArgumentError, CliUsageError
 
 
@@ -60,3 +67,173 @@ def test_malformed_connection_string_handling(mock_parse_args: Mock) -> None:
         # Should raise an IndexError when trying to split on "://" and access [0]
         with pytest.raises((IndexError, CliArgumentError)):
             cli_arg_parse()
+
+
+@pytest.mark.parametrize("jobs", ["0", "-3", "many"])
+def test_jobs_argument_rejects_non_positive_values(jobs: str) -> None:
+    """Test that --jobs only accepts integers greater than zero."""
+    with (
+        patch("sys.argv", ["db-drift", "--source", "source.db", "--target", "target.db", "--jobs", jobs]),
+        pytest.raises(CliArgumentError, match="--jobs"),
+    ):
+        cli_arg_parse()
+
+
+def test_jobs_argument_defaults_to_serial_fetching() -> None:
+    """Test that --jobs defaults to 1 and accepts positive integers."""
+    with patch("sys.argv", ["db-drift", "--source", "source.db", "--target", "target.db"]):
+        assert cli_arg_parse().jobs == 1
+
+    with patch("sys.argv", ["db-drift", "--source", "source.db", "--target", "target.db", "-j", "4"]):
+        assert cli_arg_parse().jobs == 4  # noqa: PLR2004
+
+
+def test_connector_options_only_include_options_of_the_chosen_dbms() -> None:
+    """Test that DBMS-prefixed options are passed to the connector of that DBMS only."""
+    argv = ["db-drift", "--source", "source", "--target", "target", "--oracle-server-side-hashing"]
+
+    with patch("sys.argv", [*argv, "--dbms", "oracle"]):
+        assert get_connector_options(cli_arg_parse()) == {
+            "server_side_hashing": True,
+            "ddl_source": "dbms_metadata",
+            "owner_cache": None,
+            "pipeline": False,
+            "incremental_dir": None,
+        }
+
+    with patch("sys.argv", [*argv, "--dbms", "sqlite"]):
+        assert get_connector_options(cli_arg_parse()) == {}
+
+
+def test_connector_options_follow_the_dbms_of_each_side() -> None:
+    """Test that --source-dbms and --target-dbms override --dbms for one side, with the options of their own DBMS."""
+    argv = ["db-drift", "--source", "prod.json.gz", "--target", "ci", "--dbms", "oracle", "--source-dbms", "snapshot", "--oracle-pipeline"]
+
+    with patch("sys.argv", argv):
+        args = cli_arg_parse()
+
+    assert args.command == COMPARE_COMMAND
+    assert (args.source_dbms, args.target_dbms) == ("snapshot", None)
+    assert get_connector_options(args, "snapshot") == {}
+    assert get_connector_options(args)["pipeline"] is True
+
+
+def test_snapshot_command_parses_the_options_of_a_single_database() -> None:
+    """Test that `db-drift snapshot` takes a single database and writes to a snapshot file by default."""
+    with patch("sys.argv", ["db-drift", SNAPSHOT_COMMAND, "--dbms", "oracle", "--source", "prod", "-j", "4", "--oracle-pipeline"]):
+        args = cli_arg_parse()
+
+    assert args.command == SNAPSHOT_COMMAND
+    assert (args.dbms, args.source, args.output, args.jobs) == ("oracle", "prod", "schema_snapshot.json.gz", 4)
+    assert get_connector_options(args)["pipeline"] is True
+
+
+def test_snapshot_command_does_not_take_a_target() -> None:
+    """Test that `db-drift snapshot` rejects comparison-only arguments."""
+    with (
+        patch("sys.argv", ["db-drift", SNAPSHOT_COMMAND, "--source", "prod", "--target", "ci"]),
+        pytest.raises(CliArgumentError, match="--target"),
+    ):
+        cli_arg_parse()
+
+
+def test_object_filter_options_can_be_repeated() -> None:
+    """Test that the object filter options are collected into the object filter of the connectors."""
+    argv = ["db-drift", "--source", "source", "--target", "target", "--include-schema", "HR", "--include-schema", "PAYROLL"]
+    argv += ["--exclude-object", "*_TMP", "--include-object", "EMP*"]
+
+    with patch("sys.argv", argv):
+        assert get_object_filter(cli_arg_parse()) == ObjectFilter(
+            include_schemas=("HR", "PAYROLL"),
+            include_names=("EMP*",),
+            exclude_names=("*_TMP",),
+        )
+
+    with patch("sys.argv", ["db-drift", "--source", "source", "--target", "target"]):
+        assert get_object_filter(cli_arg_parse()) == ObjectFilter()
+
+
+def test_object_type_options_take_several_object_types() -> None:
+    """Test that --types and --skip-types collect the object types to fetch and to skip."""
+    argv = ["db-drift", "--source", "source", "--target", "target", "--types", "tables", "indexes", "--skip-types", "indexes"]
+
+    with patch("sys.argv", argv):
+        args = cli_arg_parse()
+
+    assert (args.types, args.skip_types) == (["tables", "indexes"], ["indexes"])
+
+
+def test_partial_scans_are_reported_as_such(tmp_path: Path) -> None:
+    """Test that the drift report lists the object types that were not compared."""
+    for name in ("source", "target"):
+        connection = sqlite3.connect(tmp_path / f"{name}.db")
+        connection.execute("CREATE TABLE employees (employee_id INTEGER PRIMARY KEY)")
+        connection.close()
+    report_path = tmp_path / "report.html"
+    argv = ["db-drift", "--source", str(tmp_path / "source.db"), "--target", str(tmp_path / "target.db"), "-o", str(report_path)]
+
+    with patch("sys.argv", [*argv, "--skip-types", "views", "triggers"]):
+        main()
+
+    report = report_path.read_text()
+    assert "Compared object types: tables, indexes" in report
+    assert "<strong>Partial scan.</strong> Not compared: views, triggers" in report
+
+    with patch("sys.argv", argv):
+        main()
+
+    assert "Partial scan" not in report_path.read_text()
+
+
+def test_format_ndjson_writes_a_record_per_drifted_object(tmp_path: Path) -> None:
+    """Test that --format ndjson writes the drift as JSON records instead of the HTML report."""
+    for name, columns in (("source", "employee_id INTEGER PRIMARY KEY"), ("target", "employee_id INTEGER PRIMARY KEY, name TEXT")):
+        connection = sqlite3.connect(tmp_path / f"{name}.db")
+        connection.execute(f"CREATE TABLE employees ({columns})")
+        connection.close()
+    output_path = tmp_path / "drift.ndjson"
+    argv = ["db-drift", "--source", str(tmp_path / "source.db"), "--target", str(tmp_path / "target.db"), "-o", str(output_path)]
+
+    with patch("sys.argv", [*argv, "--format", "ndjson", "--types", "tables"]):
+        main()
+
+    metadata, record = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    # A partial scan is told apart from a full one by the metadata record that comes first
+    assert (metadata["compared_object_types"], metadata["skipped_object_types"]) == (["tables"], ["views", "indexes", "triggers"])
+    assert (record["object_type"], record["key"], record["change"], record["added_columns"]) == ("tables", "employees", "modified", ["name"])
+
+
+def test_digests_of_different_hash_algorithms_are_not_compared(tmp_path: Path) -> None:
+    """Test that a snapshot can only be compared with a database hashed with the same --hash-algorithm."""
+    connection = sqlite3.connect(tmp_path / "source.db")
+    connection.execute("CREATE TABLE employees (employee_id INTEGER PRIMARY KEY)")
+    connection.execute("CREATE TRIGGER employees_ai AFTER INSERT ON employees BEGIN SELECT 1; END")
+    connection.close()
+    snapshot_path, output_path = tmp_path / "source.json.gz", tmp_path / "drift.ndjson"
+    with patch(
+        "sys.argv",
+        ["db-drift", SNAPSHOT_COMMAND, "--source", str(tmp_path / "source.db"), "-o", str(snapshot_path), "--hash-algorithm", "blake2b"],
+    ):
+        main()
+    argv = ["db-drift", "--source-dbms", "snapshot", "--source", str(snapshot_path), "--target", str(tmp_path / "source.db")]
+
+    with patch("sys.argv", [*argv, "-o", str(output_path), "--format", "ndjson"]), pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == ExitCode.USAGE_ERROR.value
+    assert not output_path.exists()
+
+    with patch("sys.argv", [*argv, "-o", str(output_path), "--format", "ndjson", "--hash-algorithm", "blake2b"]):
+        main()
+
+    assert [json.loads(line)["record_type"] for line in output_path.read_text(encoding="utf-8").splitlines()] == ["metadata"]
+
+
+def test_hash_algorithms_the_database_does_not_hash_with_are_rejected() -> None:
+    """Test that --hash-algorithm is checked against the connectors that hash in the database."""
+    argv = ["db-drift", "--dbms", "oracle", "--source", "user/password@source", "--target", "user/password@target"]
+
+    with patch("sys.argv", [*argv, "--oracle-server-side-hashing", "--hash-algorithm", "blake2b"]), pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == ExitCode.USAGE_ERROR.value
@@ -0,0 +1,204 @@
+import asyncio
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from db_drift.db.connectors.sqlite import SQLiteConnector
+from db_drift.db.fetch import fetch_schema_structures, fetch_schema_structures_async
+from db_drift.utils.exceptions import DatabaseConnectionError, DatabaseError
+
+
+def _create_database(path: Path, ddl: str) -> str:
+    connection = sqlite3.connect(path)
+    connection.executescript(ddl)
+    connection.commit()
+    connection.close()
+    return str(path)
+
+
+def _mock_connector(fetch: Mock) -> Mock:
+    connector = Mock()
+    connector.connection_library = sqlite3
+    connector.connection_string = "mock.db"
+    connector.fetch_schema_structure = fetch
+    connector.fetch_schema_structure_async = AsyncMock(side_effect=fetch.side_effect, return_value=fetch.return_value)
+    return connector
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_fetch_schema_structures_returns_source_and_target_in_order(tmp_path: Path, concurrent: bool) -> None:  # noqa: FBT001
+    source_path = _create_database(tmp_path / "source.db", "CREATE TABLE employees (employee_id INTEGER PRIMARY KEY);")
+    target_path = _create_database(tmp_path / "target.db", "CREATE TABLE departments (department_id INTEGER PRIMARY KEY);")
+
+    source, target = fetch_schema_structures(
+        SQLiteConnector(source_path),
+        SQLiteConnector(target_path),
+        concurrent=concurrent,
+    )
+
+    assert set(source["tables"]) == {"employees"}
+    assert set(target["tables"]) == {"departments"}
+
+
+def test_fetch_schema_structures_concurrent_fetches_both_sides_at_the_same_time() -> None:
+    # Both fetches must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch(jobs: int) -> dict:
+        assert jobs == 1
+        barrier.wait()
+        return {}
+
+    source, target = fetch_schema_structures(
+        _mock_connector(Mock(side_effect=fetch)),
+        _mock_connector(Mock(side_effect=fetch)),
+        concurrent=True,
+    )
+
+    assert source == {}
+    assert target == {}
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_fetch_schema_structures_names_failing_side_in_database_errors(concurrent: bool) -> None:  # noqa: FBT001
+    source = _mock_connector(Mock(return_value={}))
+    target = _mock_connector(Mock(side_effect=DatabaseConnectionError("Connection refused")))
+
+    # The original exception type is kept so that its exit code and suggestions still apply
+    with pytest.raises(DatabaseConnectionError, match="^Target database: Database connection failed: Connection refused$"):
+        fetch_schema_structures(source, target, concurrent=concurrent)
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_fetch_schema_structures_wraps_driver_errors_as_database_errors(concurrent: bool) -> None:  # noqa: FBT001
+    source = _mock_connector(Mock(side_effect=sqlite3.OperationalError("unable to open database file")))
+    target = _mock_connector(Mock(return_value={}))
+
+    with pytest.raises(DatabaseError, match="^Source database: unable to open database file$") as exc_info:
+        fetch_schema_structures(source, target, concurrent=concurrent)
+
+    assert isinstance(exc_info.value.__cause__, sqlite3.OperationalError)
+
+
+def test_fetch_schema_structures_concurrent_reports_source_first_when_both_sides_fail() -> None:
+    source = _mock_connector(Mock(side_effect=DatabaseError("source is down")))
+    target = _mock_connector(Mock(side_effect=DatabaseError("target is down")))
+
+    with pytest.raises(DatabaseError, match="^Source database: source is down$"):
+        fetch_schema_structures(source, target, concurrent=True)
+
+
+def test_fetch_schema_structures_re_raises_unexpected_errors_unchanged() -> None:
+    source = _mock_connector(Mock(side_effect=KeyError("boom")))
+    target = _mock_connector(Mock(return_value={}))
+
+    with pytest.raises(KeyError, match="boom"):
+        fetch_schema_structures(source, target)
+
+
+def test_fetch_schema_structures_passes_jobs_to_both_connectors() -> None:
+    source = _mock_connector(Mock(return_value={}))
+    target = _mock_connector(Mock(return_value={}))
+
+    fetch_schema_structures(source, target, jobs=4)
+
+    source.fetch_schema_structure.assert_called_once_with(jobs=4)
+    target.fetch_schema_structure.assert_called_once_with(jobs=4)
+
+
+def test_fetch_schema_structures_async_runs_blocking_connectors_off_the_event_loop(tmp_path: Path) -> None:
+    source_path = _create_database(tmp_path / "source.db", "CREATE TABLE employees (employee_id INTEGER PRIMARY KEY);")
+    target_path = _create_database(tmp_path / "target.db", "CREATE TABLE departments (department_id INTEGER PRIMARY KEY);")
+
+    source, target = asyncio.run(fetch_schema_structures_async(SQLiteConnector(source_path), SQLiteConnector(target_path)))
+
+    assert set(source["tables"]) == {"employees"}
+    assert set(target["tables"]) == {"departments"}
+
+
+def test_fetch_schema_structures_async_fetches_both_sides_at_the_same_time() -> None:
+    both_started = asyncio.Event()
+    started = []
+
+    async def fetch(jobs: int) -> dict:
+        assert jobs == 2  # noqa: PLR2004
+        started.append(True)
+        if len(started) == len(("source", "target")):
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        return {}
+
+    source = _mock_connector(Mock())
+    target = _mock_connector(Mock())
+    source.fetch_schema_structure_async = AsyncMock(side_effect=fetch)
+    target.fetch_schema_structure_async = AsyncMock(side_effect=fetch)
+
+    assert asyncio.run(fetch_schema_structures_async(source, target, jobs=2)) == ({}, {})
+
+
+def test_fetch_schema_structures_async_reports_source_first_when_both_sides_fail() -> None:
+    source = _mock_connector(Mock(side_effect=DatabaseError("source is down")))
+    target = _mock_connector(Mock(side_effect=sqlite3.OperationalError("target is down")))
+
+    with pytest.raises(DatabaseError, match="^Source database: source is down$"):
+        asyncio.run(fetch_schema_structures_async(source, target))
+
+    with pytest.raises(DatabaseError, match="^Target database: target is down$"):
+        asyncio.run(fetch_schema_structures_async(_mock_connector(Mock(return_value={})), target))
+
+
+ONE_SIDED_FAILURE_SCRIPT = """
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+from db_drift.db.fetch import fetch_schema_structures
+from db_drift.utils.exceptions import DatabaseError
+
+target_finished = threading.Event()
+
+
+def fetch_target(jobs):
+    time.sleep(float(sys.argv[1]))
+    target_finished.set()
+    return {}
+
+
+try:
+    fetch_schema_structures(
+        Mock(fetch_schema_structure=Mock(side_effect=DatabaseError("source is down"))),
+        Mock(fetch_schema_structure=Mock(side_effect=fetch_target)),
+        concurrent=True,
+    )
+except DatabaseError as error:
+    print(error, "target finished:", target_finished.is_set())
+    sys.exit(1)
+"""
+
+
+def test_fetch_schema_structures_concurrent_one_sided_failure_still_waits_for_the_other_side_at_exit() -> None:
+    target_seconds = 1.0
+
+    started = time.perf_counter()
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", ONE_SIDED_FAILURE_SCRIPT, str(target_seconds)],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    exit_seconds = time.perf_counter() - started
+
+    # The failure reaches the caller while the other side is still fetching...
+    assert result.returncode == 1, result.stderr
+    assert result.stdout.strip() == "Source database: source is down target finished: False"
+    # ...but the process only exits once the other side's fetch has run to completion
+    assert exit_seconds >= target_seconds
@@ -0,0 +1,34 @@
+import pytest
+from db_drift.db.filters import ObjectFilter, glob_to_like
+
+
+@pytest.mark.parametrize(
+    ("pattern", "like_pattern"),
+    [
+        ("EMP*", "EMP%"),
+        ("EMP_?", "EMP\\__"),
+        ("100%_DONE", "100\\%\\_DONE"),
+        ("C:\\TMP*", "C:\\\\TMP%"),
+        ("[A]*", "[A]%"),
+    ],
+)
+def test_glob_to_like_matches_the_glob_wildcards_only(pattern: str, like_pattern: str) -> None:
+    assert glob_to_like(pattern) == like_pattern
+
+
+def test_object_filter_matches_schemas_and_name_globs() -> None:
+    object_filter = ObjectFilter(
+        include_schemas=("HR", "PAYROLL"),
+        exclude_schemas=("PAYROLL",),
+        include_names=("EMP*", "[A]"),
+        exclude_names=("*_TMP",),
+    )
+
+    assert object_filter.matches("HR", "EMPLOYEES")
+    assert object_filter.matches("HR", "[A]")
+    assert not object_filter.matches("HR", "A")
+    assert not object_filter.matches("HR", "EMPLOYEES_TMP")
+    assert not object_filter.matches("HR", "DEPARTMENTS")
+    assert not object_filter.matches("PAYROLL", "EMPLOYEES")
+    assert not object_filter.matches("SALES", "EMPLOYEES")
+    assert ObjectFilter().matches("ANY", "THING")
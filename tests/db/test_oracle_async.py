@@ -0,0 +1,269 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from db_drift.db.connectors.oracle import OracleConnector
+from db_drift.db.connectors.oracle_async import AsyncOracleConnector
+from db_drift.db.strategies.oracle import EXCLUDED_OWNERS_BIND, NAME_LIST_TYPE
+from db_drift.db.strategies.oracle_async import AsyncCatalogSession
+from db_drift.db.strategies.utils import CatalogPlan, CatalogQuery, ExpectedRows
+
+from tests.benchmarks.fakes import FakeLob, LatencyInjectingAsyncConnection, RoundTripCountingCursor
+
+CONNECTION_STRING = "user/password@localhost:1521/testpdb"
+PACKAGE_DDL = "CREATE OR REPLACE PACKAGE hr.payroll AS END payroll;\nCREATE OR REPLACE PACKAGE BODY hr.payroll AS END payroll;"
+
+
+def _respond(statement: str, *, lob: Callable[[str], Any] = str) -> list[tuple]:
+    """Answer the catalog queries of a database with one table and one package."""
+    if "ORDER BY username" in statement:
+        return [("SYS",)]
+    if "FROM all_tab_comments" in statement and "table_type = 'TABLE'" in statement:
+        return [("EMPLOYEES", "Employee table", "HR")]
+    if "FROM all_col_comments" in statement and "table_type = 'TABLE'" in statement:
+        return [("EMPLOYEES", "EMPLOYEE_ID", "PK", "HR", "NUMBER", "N", 22)]
+    if "dbms_metadata.get_ddl('PACKAGE'" in statement:
+        return [("HR", "PAYROLL", None, lob(PACKAGE_DDL))]
+    return []
+
+
+class _FakeAsyncCursor:
+    """Stand-in for an oracledb AsyncCursor."""
+
+    def __init__(self, connection: "_FakeAsyncConnection") -> None:
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self._rows: list[tuple] = []
+
+    async def execute(self, statement: str, parameters: dict | None = None, **options: Any) -> None:  # noqa: ANN401
+        self.connection.executed.append((statement, parameters, options))
+        await asyncio.sleep(0)  # Let the other object types run in the meantime
+        self._rows = self.connection.respond(statement)
+
+    async def fetchmany(self, size: int | None = None) -> list[tuple]:
+        rows, self._rows = self._rows[: size or self.arraysize], self._rows[size or self.arraysize :]
+        return rows
+
+
+class _FakeAsyncConnection:
+    """Stand-in for an oracledb AsyncConnection, usable as an async context manager."""
+
+    def __init__(self, respond: Callable[[str], list[tuple]]) -> None:
+        self.respond = respond
+        self.executed: list[tuple[str, dict | None, dict]] = []
+        self.name_list_type = Mock()
+        self.gettype_calls: list[str] = []
+
+    def cursor(self) -> _FakeAsyncCursor:
+        return _FakeAsyncCursor(self)
+
+    async def gettype(self, name: str) -> Mock:
+        self.gettype_calls.append(name)
+        return self.name_list_type
+
+    async def __aenter__(self) -> "_FakeAsyncConnection":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _FakeAsyncPool:
+    """Stand-in for an oracledb AsyncConnectionPool that tracks how many sessions are in use at once."""
+
+    def __init__(self, respond: Callable[[str], list[tuple]]) -> None:
+        self.respond = respond
+        self.acquired: list[_FakeAsyncConnection] = []
+        self.in_use = 0
+        self.max_in_use = 0
+        self.closed_with: list[dict] = []
+
+    def acquire(self) -> "_FakeAsyncPool._Session":
+        return self._Session(self)
+
+    async def close(self, **options: Any) -> None:  # noqa: ANN401
+        self.closed_with.append(options)
+
+    class _Session:
+        def __init__(self, pool: "_FakeAsyncPool") -> None:
+            self.pool = pool
+
+        async def __aenter__(self) -> _FakeAsyncConnection:
+            self.pool.in_use += 1
+            self.pool.max_in_use = max(self.pool.max_in_use, self.pool.in_use)
+            connection = _FakeAsyncConnection(self.pool.respond)
+            self.pool.acquired.append(connection)
+            return connection
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            self.pool.in_use -= 1
+
+
+def _fetch_blocking_schema() -> dict:
+    cursor = RoundTripCountingCursor(lambda statement, _parameters: _respond(statement, lob=FakeLob))
+    cursor.connection = Mock()
+    connector = OracleConnector(CONNECTION_STRING)
+
+    with patch.object(connector.connection_library, "connect") as mock_connect:
+        mock_connect.return_value.__enter__.return_value.cursor.return_value = cursor
+        return connector.fetch_schema_structure()
+
+
+def test_async_oracle_connector_fetches_the_same_schema_as_the_blocking_connector() -> None:
+    connector = AsyncOracleConnector(CONNECTION_STRING)
+    connection = _FakeAsyncConnection(_respond)
+
+    with patch.object(connector.connection_library, "connect_async", return_value=connection) as mock_connect_async:
+        schema = asyncio.run(connector.fetch_schema_structure_async())
+
+    mock_connect_async.assert_called_once_with(CONNECTION_STRING)
+    assert schema == _fetch_blocking_schema()
+    assert list(schema) == list(connector.SUPPORTED_OBJECTS_REGISTRY)
+    assert list(schema["tables"]) == ["HR.EMPLOYEES"]
+    assert schema["packages"]["HR.PAYROLL"].body
+
+
+def test_async_oracle_connector_binds_the_excluded_owners_and_fetches_lobs_as_strings() -> None:
+    connector = AsyncOracleConnector(CONNECTION_STRING)
+    connection = _FakeAsyncConnection(_respond)
+
+    with patch.object(connector.connection_library, "connect_async", return_value=connection):
+        asyncio.run(connector.fetch_schema_structure_async())
+
+    assert connector.owner_scope.excluded_owners == ["SYS"]
+    # The collection type is looked up once per connection
+    assert connection.gettype_calls == [NAME_LIST_TYPE]
+    connection.name_list_type.newobject.assert_called_with(["SYS"])
+    for statement, parameters, options in connection.executed[1:]:
+        assert options == {"fetch_lobs": False}
+        if "all_editions" not in statement:  # Editions are not owned by a schema
+            assert parameters == {EXCLUDED_OWNERS_BIND: connection.name_list_type.newobject.return_value}
+
+
+def test_async_catalog_session_streams_the_rows_into_the_plan_a_batch_at_a_time() -> None:
+    connection = LatencyInjectingAsyncConnection(lambda _statement, _parameters: [(i,) for i in range(250)])
+
+    def plan() -> CatalogPlan[list[int]]:
+        rows = yield CatalogQuery("SELECT n FROM numbers", expected_rows=ExpectedRows.FEW)
+        return [connection.round_trips for _ in rows]
+
+    round_trips_when_read = asyncio.run(AsyncCatalogSession(connection).run(plan()))
+
+    assert len(round_trips_when_read) == 250  # noqa: PLR2004
+    # The execute returns the first batch, each further batch of 100 rows is fetched once the plan has read the previous one
+    assert [round_trips_when_read[i] for i in (0, 99, 100, 199, 200, 249)] == [1, 1, 2, 2, 3, 3]
+
+
+def test_async_catalog_session_runs_the_plan_off_the_event_loop() -> None:
+    # Set by another task on the event loop while the plan waits for it, which it could not do if the plan blocked the loop
+    loop_is_free = threading.Event()
+
+    def plan() -> CatalogPlan[bool]:
+        rows = yield CatalogQuery("SELECT n FROM numbers")
+        list(rows)
+        return loop_is_free.wait(timeout=5)
+
+    async def run_beside_another_task() -> bool:
+        async def free_the_plan() -> None:
+            await asyncio.sleep(0.01)
+            loop_is_free.set()
+
+        connection = LatencyInjectingAsyncConnection(lambda _statement, _parameters: [(1,)])
+        result, _ = await asyncio.gather(AsyncCatalogSession(connection).run(plan()), free_the_plan())
+        return result
+
+    assert asyncio.run(run_beside_another_task())
+
+
+def test_async_oracle_connector_parallel_fetch_runs_object_types_on_pooled_sessions() -> None:
+    connector = AsyncOracleConnector(CONNECTION_STRING)
+    pool = _FakeAsyncPool(_respond)
+
+    with patch.object(connector.connection_library, "create_pool_async", return_value=pool) as mock_create_pool:
+        schema = asyncio.run(connector.fetch_schema_structure_async(jobs=4))
+
+    mock_create_pool.assert_called_once_with(CONNECTION_STRING, min=1, max=4, increment=1)
+    # One session resolves the excluded owners, then one session per object type
+    assert len(pool.acquired) == len(connector.SUPPORTED_OBJECTS_REGISTRY) + 1
+    assert pool.max_in_use > 1
+    assert pool.closed_with == [{"force": True}]
+    assert schema == _fetch_blocking_schema()
+    assert list(schema) == list(connector.SUPPORTED_OBJECTS_REGISTRY)
+
+
+def test_async_oracle_connector_parallel_fetch_closes_pool_on_failure() -> None:
+    def respond(statement: str) -> list[tuple]:
+        if "FROM all_sequences" in statement:
+            msg = "ORA-00942: table or view does not exist"
+            raise RuntimeError(msg)
+        return _respond(statement)
+
+    connector = AsyncOracleConnector(CONNECTION_STRING)
+    pool = _FakeAsyncPool(respond)
+
+    with (
+        patch.object(connector.connection_library, "create_pool_async", return_value=pool),
+        pytest.raises(RuntimeError, match="ORA-00942"),
+    ):
+        asyncio.run(connector.fetch_schema_structure_async(jobs=2))
+
+    assert pool.closed_with == [{"force": True}]
+    assert pool.in_use == 0
+
+
+@pytest.mark.parametrize("connector_class", [OracleConnector, AsyncOracleConnector])
+def test_oracle_connector_pipeline_fetches_the_same_schema_in_a_few_round_trips(connector_class: type[OracleConnector]) -> None:
+    connector = connector_class(CONNECTION_STRING, pipeline=True)
+    connection = LatencyInjectingAsyncConnection(lambda statement, _parameters: _respond(statement))
+
+    with patch.object(connector.connection_library, "connect_async", return_value=connection) as mock_connect_async:
+        if connector_class is AsyncOracleConnector:
+            schema = asyncio.run(connector.fetch_schema_structure_async(jobs=4))
+        else:
+            schema = connector.fetch_schema_structure(jobs=4)
+
+    # Pipelining runs over a single connection, whatever the number of jobs
+    mock_connect_async.assert_called_once_with(CONNECTION_STRING)
+    assert schema == _fetch_blocking_schema()
+    assert list(schema) == list(connector.SUPPORTED_OBJECTS_REGISTRY)
+    # One pipeline per query of the longest plan, instead of one round-trip per query
+    assert connection.pipelines_run <= 3  # noqa: PLR2004
+    assert len(connection.executed) > len(connector.SUPPORTED_OBJECTS_REGISTRY)
+
+
+def test_oracle_connector_pipeline_binds_the_excluded_owners() -> None:
+    seen_parameters = []
+
+    def respond(statement: str, parameters: dict) -> list[tuple]:
+        seen_parameters.append((statement, parameters))
+        return _respond(statement)
+
+    connector = OracleConnector(CONNECTION_STRING, pipeline=True)
+    connection = LatencyInjectingAsyncConnection(respond)
+
+    with patch.object(connector.connection_library, "connect_async", return_value=connection):
+        connector.fetch_schema_structure()
+
+    for statement, parameters in seen_parameters[1:]:
+        if "all_editions" not in statement:  # Editions are not owned by a schema
+            assert parameters == {EXCLUDED_OWNERS_BIND: ["SYS"]}
+
+
+def test_oracle_connector_pipeline_raises_the_first_failing_query() -> None:
+    def respond(statement: str, _parameters: dict) -> list[tuple]:
+        if "FROM all_sequences" in statement:
+            msg = "ORA-00942: table or view does not exist"
+            raise RuntimeError(msg)
+        return _respond(statement)
+
+    connector = OracleConnector(CONNECTION_STRING, pipeline=True)
+
+    with (
+        patch.object(connector.connection_library, "connect_async", return_value=LatencyInjectingAsyncConnection(respond)),
+        pytest.raises(RuntimeError, match="ORA-00942"),
+    ):
+        connector.fetch_schema_structure()
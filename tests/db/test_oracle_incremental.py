@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from db_drift.db.connectors.oracle import OracleConnector
+from db_drift.db.connectors.oracle_incremental import find_changed_objects, merge_structures
+from db_drift.db.strategies.oracle import CHANGED_OBJECTS_BIND
+from db_drift.models import Column, Constraint, Sequence, Table
+from db_drift.snapshot import read_snapshot, write_snapshot
+
+from tests.benchmarks.fakes import LatencyInjectingAsyncConnection
+
+CONNECTION_STRING = "user/password@localhost:1521/testpdb"
+
+
+class _Catalog:
+    """Answer the catalog queries of a database of tables, honouring the changed objects bind like Oracle would."""
+
+    def __init__(self, tables: dict[str, tuple[str, list[str]]]) -> None:
+        self.tables = tables  # "owner.table_name" -> (last DDL time, column names)
+        self.table_queries: list[list[str] | None] = []  # The changed objects bound into every table query
+
+    def respond(self, statement: str, parameters: dict[str, Any]) -> list[tuple]:
+        if "ORDER BY username" in statement:
+            return [("SYS",)]
+        if "FROM all_objects" in statement and "last_ddl_time" in statement:
+            return [("TABLE", *name.split("."), ddl_time) for name, (ddl_time, _) in self.tables.items()]
+
+        names = [name for name in self.tables if name in parameters.get(CHANGED_OBJECTS_BIND, self.tables)]
+        if "FROM all_tab_comments" in statement and "table_type = 'TABLE'" in statement:
+            self.table_queries.append(parameters.get(CHANGED_OBJECTS_BIND))
+            return [(name.split(".")[1], None, name.split(".")[0]) for name in names]
+        if "FROM all_col_comments" in statement and "table_type = 'TABLE'" in statement:
+            return [(name.split(".")[1], column, None, name.split(".")[0], "NUMBER", "Y", 22) for name in names for column in self.tables[name][1]]
+        return []
+
+    def fetch(self, connector: OracleConnector) -> dict:
+        self.table_queries.clear()
+        connection = LatencyInjectingAsyncConnection(self.respond)
+        with patch.object(connector.connection_library, "connect_async", return_value=connection):
+            return connector.fetch_schema_structure()
+
+
+def test_find_changed_objects_finds_created_dropped_and_altered_objects() -> None:
+    previous_ddl_times = {"TABLE": {"HR.KEPT": "2026-01-01T00:00:00", "HR.ALTERED": "2026-01-01T00:00:00", "HR.DROPPED": "2026-01-01T00:00:00"}}
+    ddl_times = {"TABLE": {"HR.KEPT": "2026-01-01T00:00:00", "HR.ALTERED": "2026-01-03T00:00:00", "HR.CREATED": "2026-01-03T00:00:00"}}
+    # The newest previous DDL time is always treated as changed, as it may have been read mid-second
+    previous_ddl_times["VIEW"] = {"HR.NEWEST": "2026-01-02T00:00:00"}
+    ddl_times["VIEW"] = {"HR.NEWEST": "2026-01-02T00:00:00"}
+
+    assert find_changed_objects(previous_ddl_times, ddl_times) == {
+        "TABLE": {"HR.ALTERED", "HR.DROPPED", "HR.CREATED"},
+        "VIEW": {"HR.NEWEST"},
+    }
+
+
+def test_merge_structures_replaces_changed_objects_and_their_constraints() -> None:
+    def table(*columns: str) -> Table:
+        return Table(doc=None, columns={column: Column(doc=None, data_type="NUMBER", is_nullable=True) for column in columns})
+
+    previous_structure = {
+        "tables": {"HR.KEPT": table("ID"), "HR.ALTERED": table("ID"), "HR.DROPPED": table("ID")},
+        "constraints": {
+            "HR.KEPT_PK": Constraint(columns={"ID"}, table_name="KEPT", constraint_type="P"),
+            "HR.DROPPED_PK": Constraint(columns={"ID"}, table_name="DROPPED", constraint_type="P"),
+        },
+        "sequences": {"HR.OLD_SEQ": Sequence(definition="1")},
+    }
+    fetched_structure = {
+        "tables": {"HR.ALTERED": table("ID", "NAME")},
+        "constraints": {"HR.ALTERED_PK": Constraint(columns={"ID"}, table_name="ALTERED", constraint_type="P")},
+        "sequences": {"HR.NEW_SEQ": Sequence(definition="1")},
+    }
+
+    merged = merge_structures(previous_structure, fetched_structure, {"TABLE": {"HR.ALTERED", "HR.DROPPED"}})
+
+    assert merged == {
+        "tables": {"HR.KEPT": table("ID"), "HR.ALTERED": table("ID", "NAME")},
+        "constraints": {
+            "HR.KEPT_PK": previous_structure["constraints"]["HR.KEPT_PK"],
+            "HR.ALTERED_PK": fetched_structure["constraints"]["HR.ALTERED_PK"],
+        },
+        # Sequences are always fetched in full
+        "sequences": {"HR.NEW_SEQ": Sequence(definition="1")},
+    }
+
+
+def test_oracle_connector_incremental_fetch_only_queries_changed_objects(tmp_path: Path) -> None:
+    catalog = _Catalog(
+        {
+            "HR.KEPT": ("2026-01-01T00:00:00", ["ID"]),
+            "HR.ALTERED": ("2026-01-02T00:00:00", ["ID"]),
+            "HR.DROPPED": ("2026-01-01T00:00:00", ["ID"]),
+        },
+    )
+
+    first_schema = catalog.fetch(OracleConnector(CONNECTION_STRING, pipeline=True, incremental_dir=tmp_path))
+
+    assert list(first_schema["tables"]) == ["HR.KEPT", "HR.ALTERED", "HR.DROPPED"]
+    assert catalog.table_queries == [None]  # A full fetch
+    (snapshot_file,) = tmp_path.iterdir()
+    assert "password" not in snapshot_file.name
+
+    catalog.tables["HR.ALTERED"] = ("2026-01-03T00:00:00", ["ID", "NAME"])
+    catalog.tables["HR.CREATED"] = ("2026-01-03T00:00:00", ["ID"])
+    del catalog.tables["HR.DROPPED"]
+
+    second_schema = catalog.fetch(OracleConnector(CONNECTION_STRING, pipeline=True, incremental_dir=tmp_path))
+
+    assert catalog.table_queries == [["HR.ALTERED", "HR.CREATED", "HR.DROPPED"]]
+    assert second_schema == catalog.fetch(OracleConnector(CONNECTION_STRING, pipeline=True))
+    assert read_snapshot(snapshot_file).structure == second_schema
+
+
+def test_oracle_connector_incremental_fetch_fetches_everything_again_after_a_day(tmp_path: Path) -> None:
+    catalog = _Catalog({"HR.KEPT": ("2026-01-01T00:00:00", ["ID"]), "HR.NEWEST": ("2026-01-02T00:00:00", ["ID"])})
+    connector = OracleConnector(CONNECTION_STRING, pipeline=True, incremental_dir=tmp_path)
+    catalog.fetch(connector)
+    catalog.fetch(connector)
+    assert catalog.table_queries == [["HR.NEWEST"]]
+
+    (snapshot_file,) = tmp_path.iterdir()
+    snapshot = read_snapshot(snapshot_file)
+    snapshot.metadata["full_fetch_at"] = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+    write_snapshot(snapshot_file, snapshot)
+    catalog.fetch(connector)
+
+    assert catalog.table_queries == [None]
+    assert datetime.fromisoformat(read_snapshot(snapshot_file).metadata["full_fetch_at"]) > datetime.now(timezone.utc) - timedelta(minutes=1)
+
+
+def test_oracle_connector_incremental_fetch_ignores_unreadable_snapshots(tmp_path: Path) -> None:
+    catalog = _Catalog({"HR.KEPT": ("2026-01-01T00:00:00", ["ID"])})
+    connector = OracleConnector(CONNECTION_STRING, pipeline=True, incremental_dir=tmp_path)
+    catalog.fetch(connector)
+    (snapshot_file,) = tmp_path.iterdir()
+    snapshot_file.write_text("not a snapshot")
+
+    assert list(catalog.fetch(connector)["tables"]) == ["HR.KEPT"]
+    assert catalog.table_queries == [None]
@@ -1,14 +1,41 @@
 import os
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 from db_drift.db.connectors.oracle import OracleConnector
-from db_drift.db.strategies.oracle import fetch_oracle_tables, fetch_oracle_views
+from db_drift.db.filters import LIKE_ESCAPE, ObjectFilter
+from db_drift.db.strategies.oracle import (
+    EXCLUDED_NAMES_BIND,
+    EXCLUDED_OWNERS_BIND,
+    EXCLUDED_SCHEMAS_BIND,
+    INCLUDED_NAMES_BIND,
+    INCLUDED_SCHEMAS_BIND,
+    OracleDDLSource,
+    OracleOwnerScope,
+    fetch_oracle_functions,
+    fetch_oracle_packages,
+    fetch_oracle_synonyms,
+    fetch_oracle_tables,
+    fetch_oracle_types,
+    fetch_oracle_views,
+)
 from db_drift.models.column import Column
+from db_drift.utils.constants import HashAlgorithm
+from db_drift.utils.string import hash_body
+
+from tests.benchmarks.fakes import FakeCollectionType, FakeLob
 
 ORACLE_TEST_CONN_ENV_VAR = "DB_DRIFT_ORACLE_TEST_CONN_STRING"
 
 
+def _mock_cursor(*results: list[tuple]) -> Mock:
+    """Mock a cursor that returns the rows of each result in a single batch, then an empty batch."""
+    cursor = Mock()
+    cursor.fetchmany.side_effect = [batch for rows in results for batch in (rows, [])]
+    return cursor
+
+
 @pytest.fixture(scope="module")
 def oracle_connector_from_env() -> OracleConnector:
     conn_str = os.getenv(ORACLE_TEST_CONN_ENV_VAR)
@@ -64,7 +91,10 @@ def test_oracle_connector_fetch_schema_structure_executes_registered_fetchers()
     mock_connection = Mock()
     mock_connection.cursor.return_value = mock_cursor
 
-    with patch.object(connector.connection_library, "connect") as mock_connect:
+    with (
+        patch.object(connector.connection_library, "connect") as mock_connect,
+        patch("db_drift.db.connectors.oracle.resolve_oracle_excluded_owners", return_value=["SYS"]),
+    ):
         mock_connect.return_value.__enter__.return_value = mock_connection
 
         schema = connector.fetch_schema_structure()
@@ -74,6 +104,167 @@ def test_oracle_connector_fetch_schema_structure_executes_registered_fetchers()
     assert set(schema.keys()) == {"tables", "views"}
 
 
+def test_oracle_connector_parallel_fetch_uses_one_pooled_session_per_object_type() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb")
+    fetch_tables = Mock(return_value={"HR.EMPLOYEES": Mock()})
+    fetch_views = Mock(return_value={"HR.ACTIVE_EMPLOYEES": Mock()})
+    fetch_sequences = Mock(return_value={})
+    connector.SUPPORTED_OBJECTS_REGISTRY = {
+        "tables": fetch_tables,
+        "views": fetch_views,
+        "sequences": fetch_sequences,
+    }
+
+    with (
+        patch.object(connector.connection_library, "create_pool") as mock_create_pool,
+        patch("db_drift.db.connectors.oracle.resolve_oracle_excluded_owners", return_value=["SYS"]),
+    ):
+        mock_pool = mock_create_pool.return_value
+        schema = connector.fetch_schema_structure(jobs=8)
+
+    mock_create_pool.assert_called_once_with(connector.connection_string, min=1, max=3, increment=1)
+    # One session resolves the excluded owners, then one session per object type
+    assert mock_pool.acquire.call_count == len(connector.SUPPORTED_OBJECTS_REGISTRY) + 1
+    mock_pool.close.assert_called_once_with(force=True)
+    assert list(schema) == ["tables", "views", "sequences"]
+    assert schema["tables"] is fetch_tables.return_value
+    fetch_tables.assert_called_once()
+    fetch_views.assert_called_once()
+    fetch_sequences.assert_called_once()
+
+
+def test_oracle_connector_parallel_fetch_closes_pool_on_failure() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb")
+    connector.SUPPORTED_OBJECTS_REGISTRY = {
+        "tables": Mock(side_effect=RuntimeError("ORA-00942: table or view does not exist")),
+        "views": Mock(return_value={}),
+    }
+
+    with (
+        patch.object(connector.connection_library, "create_pool") as mock_create_pool,
+        patch("db_drift.db.connectors.oracle.resolve_oracle_excluded_owners", return_value=["SYS"]),
+        pytest.raises(RuntimeError, match="ORA-00942"),
+    ):
+        connector.fetch_schema_structure(jobs=2)
+
+    mock_create_pool.return_value.close.assert_called_once_with(force=True)
+
+
+def test_oracle_catalog_queries_bind_the_resolved_excluded_owners() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb")
+    connector.owner_scope.excluded_owners = ["SYS", "SYSTEM"]
+    cursor = Mock()
+    cursor.fetchmany.return_value = []
+
+    for fetch_function in connector.SUPPORTED_OBJECTS_REGISTRY.values():
+        fetch_function(cursor)
+
+    owner_list_type = cursor.connection.gettype.return_value
+    owner_list_type.newobject.assert_called_with(["SYS", "SYSTEM"])
+    for execute_call in cursor.execute.call_args_list:
+        statement = execute_call.args[0]
+        if "all_editions" in statement:  # Editions are not owned by a schema
+            continue
+        assert "all_users" not in statement
+        assert f"TABLE(:{EXCLUDED_OWNERS_BIND})" in statement
+        assert execute_call.args[1] == {EXCLUDED_OWNERS_BIND: owner_list_type.newobject.return_value}
+
+
+def test_oracle_catalog_query_results_do_not_depend_on_how_owners_are_excluded() -> None:
+    rows = [[("EMPLOYEES", "Employee table", "HR")], [("EMPLOYEES", "EMPLOYEE_ID", "PK", "HR", "NUMBER", "N", 22)]]
+    inline_cursor = _mock_cursor(*rows)
+    bound_cursor = _mock_cursor(*rows)
+
+    inline_tables = fetch_oracle_tables(inline_cursor)
+    bound_tables = fetch_oracle_tables(bound_cursor, owner_scope=OracleOwnerScope(excluded_owners=["SYS"]))
+
+    assert bound_tables == inline_tables
+    # Without resolved owners, every query still filters out the Oracle-maintained users on its own
+    assert all("ORACLE_MAINTAINED = 'Y'" in call.args[0] for call in inline_cursor.execute.call_args_list)
+    assert all(len(call.args) == 1 for call in inline_cursor.execute.call_args_list)
+
+
+def test_oracle_catalog_queries_bind_the_object_filter() -> None:
+    object_filter = ObjectFilter(
+        include_schemas=("HR", "PAYROLL"),
+        exclude_schemas=("HR_ARCHIVE",),
+        include_names=("EMP_*",),
+        exclude_names=("*_TMP",),
+    )
+    connector = OracleConnector("user/password@localhost:1521/testpdb", object_filter=object_filter)
+    connector.owner_scope.excluded_owners = ["SYS"]
+    cursor = Mock()
+    cursor.fetchmany.return_value = []
+    cursor.connection.gettype.return_value = FakeCollectionType()
+
+    for fetch_function in connector.SUPPORTED_OBJECTS_REGISTRY.values():
+        fetch_function(cursor)
+
+    for execute_call in cursor.execute.call_args_list:
+        statement = execute_call.args[0]
+        if "all_editions" in statement:  # Editions are not owned by a schema
+            continue
+        assert execute_call.args[1] == {
+            EXCLUDED_OWNERS_BIND: ["SYS"],
+            INCLUDED_SCHEMAS_BIND: ["HR", "PAYROLL"],
+            EXCLUDED_SCHEMAS_BIND: ["HR_ARCHIVE"],
+            # Object names are matched in the query, with the globs turned into LIKE patterns
+            INCLUDED_NAMES_BIND: ["EMP\\_%"],
+            EXCLUDED_NAMES_BIND: ["%\\_TMP"],
+        }
+        assert f"LIKE column_value ESCAPE '{LIKE_ESCAPE}'" in statement
+
+
+def test_oracle_object_filter_only_applies_to_the_owner_of_each_object() -> None:
+    cursor = _mock_cursor([])
+    cursor.connection.gettype.return_value = FakeCollectionType()
+    owner_scope = OracleOwnerScope(excluded_owners=["SYS"], object_filter=ObjectFilter(include_schemas=("HR",)))
+
+    fetch_oracle_synonyms(cursor, owner_scope=owner_scope)
+
+    # Synonyms of HR can point to the objects of other schemas
+    statement = cursor.execute.call_args.args[0]
+    assert f"AND owner IN (SELECT column_value FROM TABLE(:{INCLUDED_SCHEMAS_BIND}))" in statement
+    assert f"table_owner IN (SELECT column_value FROM TABLE(:{INCLUDED_SCHEMAS_BIND}))" not in statement
+
+
+def test_oracle_connector_resolves_excluded_owners_once_per_fetch() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb")
+    seen_owners = []
+    connector.SUPPORTED_OBJECTS_REGISTRY = {
+        "tables": lambda _cursor: seen_owners.append(connector.owner_scope.excluded_owners) or {},
+        "views": lambda _cursor: seen_owners.append(connector.owner_scope.excluded_owners) or {},
+    }
+
+    with (
+        patch.object(connector.connection_library, "connect"),
+        patch("db_drift.db.connectors.oracle.resolve_oracle_excluded_owners", return_value=["SYS"]) as mock_resolve,
+    ):
+        connector.fetch_schema_structure()
+
+    mock_resolve.assert_called_once()
+    assert seen_owners == [["SYS"], ["SYS"]]
+
+
+def test_oracle_connector_caches_excluded_owners_across_runs(tmp_path: Path) -> None:
+    owner_cache = tmp_path / "owners.json"
+    connection_string = "user/secret-password@localhost:1521/testpdb"
+
+    for _ in range(2):
+        connector = OracleConnector(connection_string, owner_cache=owner_cache)
+        connector.SUPPORTED_OBJECTS_REGISTRY = {}
+        with (
+            patch.object(connector.connection_library, "connect"),
+            patch("db_drift.db.connectors.oracle.resolve_oracle_excluded_owners", return_value=["SYS"]) as mock_resolve,
+        ):
+            connector.fetch_schema_structure()
+        assert connector.owner_scope.excluded_owners == ["SYS"]
+
+    # Only the first run looked the owners up
+    mock_resolve.assert_not_called()
+    assert "secret-password" not in owner_cache.read_text()
+
+
 def test_fetch_oracle_tables_maps_rows_to_table_models() -> None:
     cursor = Mock()
     table_rows = [
@@ -84,7 +275,7 @@ def test_fetch_oracle_tables_maps_rows_to_table_models() -> None:
         ("EMPLOYEES", "NAME", "Full name", "HR", "VARCHAR2", "Y", 200),
         ("NOT_FETCHED", "IGNORED", "ignored", "HR", "VARCHAR2", "Y", 10),
     ]
-    cursor.fetchall.side_effect = [table_rows, column_rows]
+    cursor.fetchmany.side_effect = [table_rows, [], column_rows, []]
 
     tables = fetch_oracle_tables(cursor)
 
@@ -111,7 +302,7 @@ def test_fetch_oracle_views_maps_rows_to_view_models() -> None:
     column_rows = [
         ("ACTIVE_EMPLOYEES", "EMPLOYEE_ID", "PK", "HR", "NUMBER", "N", 22),
     ]
-    cursor.fetchall.side_effect = [view_rows, column_rows]
+    cursor.fetchmany.side_effect = [view_rows, [], column_rows, []]
 
     views = fetch_oracle_views(cursor)
 
@@ -120,6 +311,193 @@ def test_fetch_oracle_views_maps_rows_to_view_models() -> None:
     assert views["HR.ACTIVE_EMPLOYEES"].columns["EMPLOYEE_ID"].is_nullable is False
 
 
+def test_fetch_oracle_functions_groups_arguments_by_owner_and_name() -> None:
+    cursor = Mock()
+    function_rows = [
+        ("HR", "GET_SALARY", "CREATE FUNCTION hr.get_salary ...", None),
+        ("PAYROLL", "GET_SALARY", None, FakeLob("CREATE FUNCTION payroll.get_salary ...")),
+        ("PAYROLL", "NO_ARGS", "CREATE FUNCTION payroll.no_args ...", None),
+    ]
+    argument_rows = [
+        ("HR", "GET_SALARY", None, 0, "NUMBER", "OUT"),
+        ("HR", "GET_SALARY", "P_EMPLOYEE_ID", 1, "NUMBER", "IN"),
+        ("PAYROLL", "GET_SALARY", None, 0, "NUMBER", "OUT"),
+        ("PAYROLL", "GET_SALARY", "P_RUN_ID", 1, "NUMBER", "IN"),
+        ("PAYROLL", "GET_SALARY", "P_AS_OF", 2, "DATE", "IN"),
+    ]
+    cursor.fetchmany.side_effect = [function_rows, [], argument_rows, []]
+
+    functions = fetch_oracle_functions(cursor)
+
+    assert functions["HR.GET_SALARY"].definition == "---- NUMBER OUT, P_EMPLOYEE_ID NUMBER IN"
+    assert functions["PAYROLL.GET_SALARY"].definition == "---- NUMBER OUT, P_RUN_ID NUMBER IN, P_AS_OF DATE IN"
+    assert functions["PAYROLL.NO_ARGS"].definition == ""
+    assert cursor.execute.call_count == 2  # noqa: PLR2004
+
+
+def test_oracle_connector_passes_server_side_hashing_to_ddl_fetchers() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb", server_side_hashing=True)
+
+    for obj_type in ("functions", "procedures", "packages", "types"):
+        assert connector.SUPPORTED_OBJECTS_REGISTRY[obj_type].keywords == {
+            "server_side_hashing": True,
+            "hash_algorithm": HashAlgorithm.SHA256,
+            "ddl_source": OracleDDLSource.DBMS_METADATA,
+            "owner_scope": connector.owner_scope,
+        }
+
+
+def test_oracle_connector_accepts_ddl_source_by_name() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb", ddl_source="all_source")
+
+    assert connector.ddl_source is OracleDDLSource.ALL_SOURCE
+    assert connector.SUPPORTED_OBJECTS_REGISTRY["packages"].keywords["ddl_source"] is OracleDDLSource.ALL_SOURCE
+
+
+def test_oracle_connector_hashes_with_the_chosen_algorithm() -> None:
+    connector = OracleConnector("user/password@localhost:1521/testpdb", hash_algorithm="blake2b")
+
+    for obj_type in ("triggers", "functions", "procedures", "packages", "types"):
+        assert connector.SUPPORTED_OBJECTS_REGISTRY[obj_type].keywords["hash_algorithm"] is HashAlgorithm.BLAKE2B
+    # DBMS_CRYPTO only hashes with SHA-256 here
+    with pytest.raises(ValueError, match="Server-side hashing only hashes with sha256"):
+        OracleConnector("user/password@localhost:1521/testpdb", server_side_hashing=True, hash_algorithm=HashAlgorithm.BLAKE2B)
+
+
+def test_fetch_oracle_packages_hashes_large_ddl_with_the_chosen_algorithm() -> None:
+    spec = "CREATE OR REPLACE PACKAGE hr.payroll AS\n  PROCEDURE run;\nEND payroll;"
+    # Read from its LOB in several pieces
+    body = "\nCREATE OR REPLACE PACKAGE BODY hr.payroll AS\n" + "  PROCEDURE run IS BEGIN NULL; END;\n" * 10_000 + "END payroll;"
+    cursor = _mock_cursor([("HR", "PAYROLL", None, FakeLob(spec + body)), ("HR", "SPEC_ONLY", spec.replace("payroll", "spec_only"), None)])
+
+    packages = fetch_oracle_packages(cursor, hash_algorithm=HashAlgorithm.BLAKE2B)
+
+    assert packages["HR.PAYROLL"].definition == hash_body(spec, HashAlgorithm.BLAKE2B)
+    assert packages["HR.PAYROLL"].body == hash_body(body, HashAlgorithm.BLAKE2B)
+    assert packages["HR.SPEC_ONLY"].body == hash_body("", HashAlgorithm.BLAKE2B)
+
+
+@pytest.mark.parametrize("padding", range(5))
+def test_fetch_oracle_packages_splits_lob_ddl_chunk_by_chunk_like_the_whole_ddl(monkeypatch: pytest.MonkeyPatch, padding: int) -> None:
+    monkeypatch.setattr("db_drift.db.strategies.oracle.LOB_READ_LENGTH", 1)  # Read one chunk at a time
+    spec = " " * padding + "CREATE OR REPLACE PACKAGE hr.payroll AS\n  PROCEDURE run;\nEND payroll;"
+    body = "\nCREATE OR REPLACE PACKAGE BODY hr.payroll AS\n  PROCEDURE run IS BEGIN NULL; END;\nEND payroll;"
+    # The splitter straddles two or three chunks of 5 characters, depending on the padding
+    lob, unsplit_lob = FakeLob(spec + body), FakeLob(spec.replace("payroll;", "other;"))
+    lob.chunk_size = unsplit_lob.chunk_size = 5
+    cursor = _mock_cursor([("HR", "PAYROLL", None, lob), ("HR", "UNSPLIT", None, unsplit_lob)])
+
+    packages = fetch_oracle_packages(cursor)
+
+    assert packages["HR.PAYROLL"].definition == hash_body(spec)
+    assert packages["HR.PAYROLL"].body == hash_body(body)
+    assert packages["HR.UNSPLIT"].definition == hash_body(spec.replace("payroll;", "other;"))
+    assert packages["HR.UNSPLIT"].body == hash_body("")
+    assert lob.reads == -(-len(spec + body) // 5)
+
+
+def test_fetch_oracle_functions_reads_only_long_ddl_from_lobs() -> None:
+    lob = FakeLob("CREATE FUNCTION hr.long_one ..." + " " * 10_000)
+    cursor = _mock_cursor(
+        [("HR", "LONG_ONE", None, lob), ("HR", "SHORT_ONE", "CREATE FUNCTION hr.short_one ...", None), ("HR", "NO_DDL", None, None)],
+        [],
+    )
+
+    functions = fetch_oracle_functions(cursor)
+
+    statement = cursor.execute.call_args_list[0].args[0]
+    # DDL that fits in a VARCHAR2 comes inline with its row, only the rest is fetched as a LOB
+    assert "ddl_vc(ddl) AS ddl_text" in statement
+    assert "CASE WHEN ddl_vc(ddl) IS NULL THEN ddl END AS ddl" in statement
+    assert functions["HR.LONG_ONE"].body == hash_body(lob.text)
+    assert functions["HR.SHORT_ONE"].body == hash_body("CREATE FUNCTION hr.short_one ...")
+    assert functions["HR.NO_DDL"].body == ""
+    assert lob.reads == 1
+
+
+def test_fetch_oracle_packages_from_all_source_hashes_spec_and_body_separately() -> None:
+    cursor = _mock_cursor(
+        [
+            ("HR", "EMP_PKG", "PACKAGE", "PACKAGE emp_pkg AS\n"),
+            ("HR", "EMP_PKG", "PACKAGE", "END emp_pkg;\n"),
+            ("HR", "EMP_PKG", "PACKAGE BODY", "PACKAGE BODY emp_pkg AS\n"),
+            ("HR", "EMP_PKG", "PACKAGE BODY", "END emp_pkg;\n"),
+            ("HR", "SPEC_ONLY", "PACKAGE", "PACKAGE spec_only AS END;\n"),
+        ],
+    )
+
+    packages = fetch_oracle_packages(cursor, ddl_source=OracleDDLSource.ALL_SOURCE)
+
+    assert packages["HR.EMP_PKG"].definition == hash_body("PACKAGE emp_pkg AS\nEND emp_pkg;\n")
+    assert packages["HR.EMP_PKG"].body == hash_body("PACKAGE BODY emp_pkg AS\nEND emp_pkg;\n")
+    assert packages["HR.SPEC_ONLY"].body == hash_body("")
+    # A single ordered scan of ALL_SOURCE, no per-object dbms_metadata calls
+    cursor.execute.assert_called_once()
+    statement = cursor.execute.call_args.args[0]
+    assert "all_source" in statement
+    assert "get_ddl" not in statement
+    assert "ORDER BY owner, name, type, line" in statement
+
+
+def test_fetch_oracle_types_from_all_source_hashes_spec_and_body_together() -> None:
+    cursor = _mock_cursor(
+        [
+            ("HR", "ADDRESS_T", "TYPE", "TYPE address_t AS OBJECT (street VARCHAR2(100));\n"),
+            ("HR", "ADDRESS_T", "TYPE BODY", "TYPE BODY address_t AS END;\n"),
+        ],
+    )
+
+    types = fetch_oracle_types(cursor, ddl_source=OracleDDLSource.ALL_SOURCE)
+
+    assert types["HR.ADDRESS_T"].definition == hash_body("TYPE address_t AS OBJECT (street VARCHAR2(100));\nTYPE BODY address_t AS END;\n")
+
+
+def test_fetch_oracle_packages_from_all_source_with_server_side_hashing_only_fetches_digests() -> None:
+    cursor = _mock_cursor([("HR", "EMP_PKG", "ab12", None)])
+
+    packages = fetch_oracle_packages(cursor, server_side_hashing=True, ddl_source=OracleDDLSource.ALL_SOURCE)
+
+    assert packages["HR.EMP_PKG"].definition == "ab12"
+    assert packages["HR.EMP_PKG"].body == hash_body("")
+    statement = cursor.execute.call_args.args[0]
+    assert "source_digest(owner, name, 'PACKAGE')" in statement
+    assert "source_digest(owner, name, 'PACKAGE BODY')" in statement
+
+
+def test_fetch_oracle_types_with_server_side_hashing_only_fetches_digests() -> None:
+    digest = hash_body("CREATE OR REPLACE TYPE hr.address_t AS OBJECT (street VARCHAR2(100))")
+    cursor = _mock_cursor([("HR", "ADDRESS_T", digest), ("HR", "EMPTY_T", None)])
+
+    types = fetch_oracle_types(cursor, server_side_hashing=True)
+
+    statement = cursor.execute.call_args.args[0]
+    assert "dbms_crypto.hash" in statement
+    assert "ddl_digest(dbms_metadata.get_ddl('TYPE', object_name, owner))" in statement
+    assert types["HR.ADDRESS_T"].definition == digest
+    assert types["HR.EMPTY_T"].definition == ""
+
+
+def test_fetch_oracle_packages_server_side_digests_match_client_side_hashes() -> None:
+    spec = "CREATE OR REPLACE PACKAGE hr.payroll AS\n  PROCEDURE run;\nEND payroll;"
+    body = "\nCREATE OR REPLACE PACKAGE BODY hr.payroll AS\n  PROCEDURE run IS BEGIN NULL; END;\nEND payroll;"
+
+    client_cursor = _mock_cursor([("HR", "PAYROLL", None, FakeLob(spec + body))])
+    client_packages = fetch_oracle_packages(client_cursor)
+
+    # The database splits the DDL the same way and returns "spec_digest,body_digest"
+    server_cursor = _mock_cursor(
+        [
+            ("HR", "PAYROLL", f"{hash_body(spec)},{hash_body(body)}"),
+            ("HR", "SPEC_ONLY", f"{hash_body(spec)},"),
+        ],
+    )
+    server_packages = fetch_oracle_packages(server_cursor, server_side_hashing=True)
+
+    assert "package_ddl_digests(dbms_metadata.get_ddl('PACKAGE', object_name, owner), object_name)" in server_cursor.execute.call_args.args[0]
+    assert server_packages["HR.PAYROLL"] == client_packages["HR.PAYROLL"]
+    assert server_packages["HR.SPEC_ONLY"].body == hash_body("")
+
+
 @pytest.mark.skipif(
     not os.getenv(ORACLE_TEST_CONN_ENV_VAR),
     reason=(
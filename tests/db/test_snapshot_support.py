@@ -0,0 +1,146 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from db_drift.db.connectors.snapshot import SnapshotConnector
+from db_drift.db.connectors.sqlite import SQLiteConnector
+from db_drift.db.factory import get_connector
+from db_drift.db.fetch import fetch_schema_structures, restrict_to_common_object_types, snapshot_schema_structure
+from db_drift.db.filters import ObjectFilter
+from db_drift.models import Constraint, Function, Table, Trigger
+from db_drift.snapshot import Snapshot, write_snapshot
+from db_drift.utils.exceptions import DatabaseSchemaError
+
+
+def _create_database(path: Path) -> None:
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE employees (employee_id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+        CREATE INDEX employees_name_ix ON employees (name);
+        CREATE VIEW employee_names AS SELECT name FROM employees;
+        CREATE TRIGGER employees_ai AFTER INSERT ON employees BEGIN SELECT 1; END;
+        """,
+    )
+    connection.close()
+
+
+def test_snapshot_dbms_loads_the_snapshot_connector() -> None:
+    assert get_connector("snapshot") is SnapshotConnector
+
+
+def test_snapshot_connector_loads_the_structure_saved_by_snapshot_schema_structure(tmp_path: Path) -> None:
+    database_path = tmp_path / "source.db"
+    snapshot_path = tmp_path / "source.json.gz"
+    _create_database(database_path)
+
+    snapshot = snapshot_schema_structure(SQLiteConnector(str(database_path)), snapshot_path, metadata={"dbms": "sqlite"})
+    database_path.unlink()  # Loading the snapshot must not touch the database
+
+    assert SnapshotConnector(str(snapshot_path)).fetch_schema_structure() == snapshot.structure
+    assert list(snapshot.structure["tables"]) == ["employees"]
+    assert snapshot.metadata == {"dbms": "sqlite"}
+
+
+def test_snapshot_can_be_compared_with_a_live_database(tmp_path: Path) -> None:
+    _create_database(tmp_path / "source.db")
+    _create_database(tmp_path / "target.db")
+    snapshot_schema_structure(SQLiteConnector(str(tmp_path / "source.db")), tmp_path / "source.json.gz")
+
+    source_structure, target_structure = fetch_schema_structures(
+        SnapshotConnector(str(tmp_path / "source.json.gz")),
+        SQLiteConnector(str(tmp_path / "target.db")),
+    )
+
+    assert source_structure == target_structure
+
+
+@pytest.mark.parametrize("content", [b"SQLite format 3\x00", b""])
+def test_snapshot_connector_rejects_files_that_are_not_snapshots(tmp_path: Path, content: bytes) -> None:
+    path = tmp_path / "source.db"
+    path.write_bytes(content)
+
+    with pytest.raises(DatabaseSchemaError, match="is not a db-drift snapshot"):
+        SnapshotConnector(str(path)).fetch_schema_structure()
+
+
+def test_snapshot_connector_applies_the_object_filter_to_the_loaded_objects(tmp_path: Path) -> None:
+    path = tmp_path / "prod.json.gz"
+    write_snapshot(
+        path,
+        Snapshot(
+            structure={
+                "tables": {"HR.EMPLOYEES": Table(doc=None, columns={}), "SALES.EMPLOYEES": Table(doc=None, columns={})},
+                "constraints": {"HR.PK_1": Constraint(columns={"ID"}, table_name="EMPLOYEES", constraint_type="P")},
+            },
+        ),
+    )
+
+    structure = SnapshotConnector(str(path), object_filter=ObjectFilter(include_schemas=("HR",), include_names=("EMP*",))).fetch_schema_structure()
+
+    # Like the Oracle catalog queries, constraints are matched on the name of their table
+    assert {obj_type: list(objects) for obj_type, objects in structure.items()} == {"tables": ["HR.EMPLOYEES"], "constraints": ["HR.PK_1"]}
+
+
+def test_snapshot_connector_only_loads_the_selected_object_types(tmp_path: Path) -> None:
+    _create_database(tmp_path / "source.db")
+    snapshot_schema_structure(SQLiteConnector(str(tmp_path / "source.db")), tmp_path / "source.json.gz")
+
+    connector = SnapshotConnector(str(tmp_path / "source.json.gz"))
+    connector.select_object_types(["tables", "views", "indexes"], skip_object_types=["views"])
+
+    assert list(connector.fetch_schema_structure()) == ["tables", "indexes"]
+
+
+def test_snapshot_connector_rejects_object_types_the_snapshot_was_not_taken_with(tmp_path: Path) -> None:
+    _create_database(tmp_path / "source.db")
+    source = SQLiteConnector(str(tmp_path / "source.db"))
+    source.select_object_types(["tables"])
+    snapshot_schema_structure(source, tmp_path / "source.json.gz")
+
+    connector = SnapshotConnector(str(tmp_path / "source.json.gz"))
+    connector.select_object_types(["tables", "indexes"])
+
+    # A partial snapshot must not pass for a database without indexes
+    with pytest.raises(DatabaseSchemaError, match="does not contain the indexes object type"):
+        connector.fetch_schema_structure()
+
+
+def test_object_types_fetched_by_one_side_only_are_not_compared(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    _create_database(tmp_path / "source.db")
+    _create_database(tmp_path / "target.db")
+    source = SQLiteConnector(str(tmp_path / "source.db"))
+    source.select_object_types(skip_object_types=["triggers"])
+    snapshot_schema_structure(source, tmp_path / "source.json.gz")
+
+    source_structure, target_structure, one_sided_object_types = restrict_to_common_object_types(
+        *fetch_schema_structures(SnapshotConnector(str(tmp_path / "source.json.gz")), SQLiteConnector(str(tmp_path / "target.db"))),
+    )
+
+    assert one_sided_object_types == ["triggers"]
+    assert list(source_structure) == list(target_structure) == ["tables", "views", "indexes"]
+    assert "Not comparing the object types only one database was fetched with: triggers." in caplog.text
+
+
+def test_snapshot_connector_matches_the_object_filter_against_postgresql_keys(tmp_path: Path) -> None:
+    path = tmp_path / "app.json.gz"
+    write_snapshot(
+        path,
+        Snapshot(
+            structure={
+                "triggers": {"hr.employees.audit": Trigger(body="", definition=""), "hr.employees.log": Trigger(body="", definition="")},
+                "functions": {
+                    "hr.audit(integer, public.payload)": Function(body="", definition=""),
+                    "sales.audit()": Function(body="", definition=""),
+                },
+            },
+        ),
+    )
+
+    structure = SnapshotConnector(str(path), object_filter=ObjectFilter(include_schemas=("hr",), include_names=("audit",))).fetch_schema_structure()
+
+    # Triggers are keyed by "schema.table.trigger", routines by "schema.routine(argument types)"
+    assert {obj_type: list(objects) for obj_type, objects in structure.items()} == {
+        "triggers": ["hr.employees.audit"],
+        "functions": ["hr.audit(integer, public.payload)"],
+    }
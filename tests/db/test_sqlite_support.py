@@ -1,7 +1,9 @@
 import sqlite3
 from pathlib import Path
 
+import pytest
 from db_drift.db.connectors.sqlite import SQLiteConnector
+from db_drift.db.filters import ObjectFilter
 from db_drift.db.strategies.sqlite import fetch_sqlite_indexes, fetch_sqlite_tables, fetch_sqlite_triggers, fetch_sqlite_views
 from db_drift.models.column import Column
 from db_drift.models.index import Index
@@ -114,6 +116,35 @@ def test_fetch_sqlite_indexes_maps_rows_to_index_models() -> None:
     }
 
 
+def test_fetch_sqlite_catalog_handles_quoted_names_and_expression_indexes() -> None:
+    connection = sqlite3.connect(":memory:")
+    cursor = connection.cursor()
+    cursor.executescript(
+        """
+        CREATE TABLE "employee's data" (
+            employee_id INTEGER PRIMARY KEY,
+            email TEXT NOT NULL,
+            full_name TEXT GENERATED ALWAYS AS (upper(email)) VIRTUAL
+        );
+
+        CREATE INDEX "employee's email ix"
+        ON "employee's data" (lower(email), employee_id);
+        """,
+    )
+
+    tables = fetch_sqlite_tables(cursor)
+    indexes = fetch_sqlite_indexes(cursor)
+
+    assert set(tables["employee's data"].columns) == {"employee_id", "email", "full_name"}
+    assert indexes == {
+        "employee's email ix": Index(
+            table_name="employee's data",
+            uniqueness="NONUNIQUE",
+            columns={"employee_id"},  # The lower(email) expression has no column name
+        ),
+    }
+
+
 def test_fetch_sqlite_triggers_maps_rows_to_trigger_models() -> None:
     connection = sqlite3.connect(":memory:")
     cursor = connection.cursor()
@@ -192,3 +223,112 @@ def test_sqlite_connector_fetch_schema_structure_returns_triggers(tmp_path: Path
     assert "employees" in schema["tables"]
     assert "employees_touch_updated_at" in schema["triggers"]
     assert "employee_directory" in schema["views"]
+
+
+def test_sqlite_connector_parallel_fetch_matches_serial_fetch(tmp_path: Path) -> None:
+    database_path = tmp_path / "sqlite_parallel_test.db"
+    setup_connection = sqlite3.connect(database_path)
+    setup_connection.executescript(
+        """
+        CREATE TABLE departments (
+            department_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        );
+
+        CREATE TABLE employees (
+            employee_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            department_id INTEGER REFERENCES departments (department_id),
+            updated_at TEXT
+        );
+
+        CREATE INDEX employees_department_ix
+        ON employees (department_id);
+
+        CREATE TRIGGER employees_touch_updated_at
+        AFTER UPDATE ON employees
+        FOR EACH ROW
+        BEGIN
+            UPDATE employees
+            SET updated_at = CURRENT_TIMESTAMP
+            WHERE employee_id = NEW.employee_id;
+        END;
+
+        CREATE VIEW employee_directory AS
+        SELECT e.name, d.name AS department
+        FROM employees e
+        JOIN departments d ON d.department_id = e.department_id;
+        """,
+    )
+    setup_connection.commit()
+    setup_connection.close()
+
+    connector = SQLiteConnector(str(database_path))
+    serial_schema = connector.fetch_schema_structure()
+    parallel_schema = connector.fetch_schema_structure(jobs=4)
+
+    assert parallel_schema == serial_schema
+    assert list(parallel_schema) == list(connector.SUPPORTED_OBJECTS_REGISTRY)
+    # The connector hands out a fresh structure on every call instead of mutating the previous one
+    assert parallel_schema is not serial_schema
+    assert connector.fetch_schema_structure(jobs=2) == serial_schema
+
+
+def test_sqlite_object_filter_is_applied_by_the_catalog_queries() -> None:
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(
+        """
+        CREATE TABLE app_users (id INTEGER PRIMARY KEY);
+        CREATE TABLE app_users_tmp (id INTEGER PRIMARY KEY);
+        CREATE TABLE "app[1]" (id INTEGER PRIMARY KEY);
+        CREATE TABLE audit_log (id INTEGER PRIMARY KEY);
+        CREATE INDEX app_users_ix ON app_users (id);
+        CREATE INDEX audit_log_ix ON audit_log (id);
+        """,
+    )
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    object_filter = ObjectFilter(include_names=("app*",), exclude_names=("*_tmp",))
+
+    assert list(fetch_sqlite_tables(connection.cursor(), object_filter=object_filter)) == ["app[1]", "app_users"]
+    assert list(fetch_sqlite_indexes(connection.cursor(), object_filter=object_filter)) == ["app_users_ix"]
+    assert list(fetch_sqlite_tables(connection.cursor(), object_filter=ObjectFilter(include_names=("app[1]",)))) == ["app[1]"]
+    # Filtered by the database, not after the rows were read
+    catalog_statements = [statement for statement in statements if "FROM sqlite_master" in statement]
+    assert len(catalog_statements) == 3  # noqa: PLR2004
+    assert all("GLOB" in statement for statement in catalog_statements)
+
+    assert fetch_sqlite_tables(connection.cursor(), object_filter=ObjectFilter(include_schemas=("main",))).keys() == {
+        "app_users",
+        "app_users_tmp",
+        "app[1]",
+        "audit_log",
+    }
+    assert fetch_sqlite_tables(connection.cursor(), object_filter=ObjectFilter(exclude_schemas=("main",))) == {}
+
+
+def test_select_object_types_prunes_the_registry_in_its_order(tmp_path: Path) -> None:
+    database_path = tmp_path / "catalog.db"
+    connection = sqlite3.connect(database_path)
+    connection.executescript(
+        """
+        CREATE TABLE employees (employee_id INTEGER PRIMARY KEY, name TEXT);
+        CREATE INDEX employees_name_ix ON employees (name);
+        """,
+    )
+    connection.close()
+
+    connector = SQLiteConnector(str(database_path))
+    connector.select_object_types(["triggers", "indexes", "tables"], skip_object_types=["tables"])
+
+    # Indexes are fetched on their own, without their tables
+    assert list(connector.SUPPORTED_OBJECTS_REGISTRY) == ["indexes", "triggers"]
+    assert list(connector.fetch_schema_structure()) == ["indexes", "triggers"]
+    assert list(connector.fetch_schema_structure()["indexes"]) == ["employees_name_ix"]
+
+
+def test_select_object_types_rejects_unknown_object_types() -> None:
+    connector = SQLiteConnector("unused.db")
+
+    with pytest.raises(ValueError, match="Unknown object type\\(s\\) packages. Supported object types: tables, views, indexes, triggers"):
+        connector.select_object_types(skip_object_types=["packages"])
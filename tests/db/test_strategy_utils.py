@@ -0,0 +1,31 @@
+import sqlite3
+
+from db_drift.db.strategies.utils import ExpectedRows, execute_and_stream
+
+
+def test_execute_and_stream_fetches_in_batches_of_the_expected_size() -> None:
+    connection = sqlite3.connect(":memory:")
+    cursor = connection.cursor()
+    row_count = ExpectedRows.FEW * 2 + 1
+
+    rows = execute_and_stream(
+        cursor,
+        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?) SELECT i FROM n",
+        (row_count,),
+        expected_rows=ExpectedRows.FEW,
+    )
+
+    assert cursor.arraysize == ExpectedRows.FEW
+    assert [row[0] for row in rows] == list(range(1, row_count + 1))
+    connection.close()
+
+
+def test_execute_and_stream_executes_eagerly() -> None:
+    connection = sqlite3.connect(":memory:")
+    cursor = connection.cursor()
+
+    # The statement runs before the first row is requested, like a plain cursor.execute()
+    execute_and_stream(cursor, "CREATE TABLE employees (employee_id INTEGER PRIMARY KEY)")
+
+    assert connection.execute("SELECT name FROM sqlite_master").fetchall() == [("employees",)]
+    connection.close()
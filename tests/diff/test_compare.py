@@ -0,0 +1,133 @@
+from pathlib import Path
+
+from db_drift.diff import FieldChange, ObjectDiff, ObjectDrift, diff_object, diff_objects, diff_structures, iter_drift
+from db_drift.models import Column, Constraint, Function, Index, Sequence, Table
+from db_drift.report.generate import generate_drift_report
+from db_drift.utils.constants import DBConstraintTypeEnum
+from db_drift.utils.string import hash_body
+
+
+def _employees(**columns: Column) -> Table:
+    return Table(
+        doc="Staff",
+        columns={
+            "ID": Column(doc=None, data_type="NUMBER", is_nullable=False),
+            "NAME": Column(doc=None, data_type="VARCHAR2(100)", is_nullable=True),
+            **columns,
+        },
+    )
+
+
+def test_diff_objects_sorts_objects_into_added_removed_modified_and_unchanged() -> None:
+    source = {"HR.A": Sequence(definition="1"), "HR.B": Sequence(definition="2"), "HR.C": Sequence(definition="3")}
+    target = {"HR.D": Sequence(definition="4"), "HR.C": Sequence(definition="30"), "HR.A": Sequence(definition="1")}
+
+    object_type_diff = diff_objects(source, target)
+
+    assert object_type_diff.added == {"HR.D": Sequence(definition="4")}
+    assert object_type_diff.removed == {"HR.B": Sequence(definition="2")}
+    assert object_type_diff.modified == {"HR.C": ObjectDiff(changes=[FieldChange("definition", "3", "30")])}
+    assert object_type_diff.unchanged == 1
+    assert object_type_diff.has_drift
+
+
+def test_diff_object_compares_hashed_bodies_by_their_digest() -> None:
+    source = Function(body=hash_body("RETURN 1;"), definition="(a NUMBER) RETURNS NUMBER")
+    target = Function(body=hash_body("RETURN 2;"), definition="(a NUMBER) RETURNS NUMBER")
+
+    assert diff_object(source, target) == ObjectDiff(changes=[FieldChange("body", hash_body("RETURN 1;"), hash_body("RETURN 2;"))])
+
+
+def test_diff_object_drills_into_the_columns_of_tables() -> None:
+    source = _employees(SALARY=Column(doc=None, data_type="NUMBER", is_nullable=True))
+    target = _employees(HIRED=Column(doc=None, data_type="DATE", is_nullable=True))
+    target.doc = "Employees"
+    target.columns["NAME"] = Column(doc="Full name", data_type="VARCHAR2(200)", is_nullable=True)
+
+    assert diff_object(source, target) == ObjectDiff(
+        changes=[FieldChange("doc", "Staff", "Employees")],
+        added_columns=["HIRED"],
+        removed_columns=["SALARY"],
+        modified_columns={"NAME": [FieldChange("doc", None, "Full name"), FieldChange("data_type", "VARCHAR2(100)", "VARCHAR2(200)")]},
+    )
+
+
+def test_diff_object_compares_the_column_sets_of_indexes_and_constraints() -> None:
+    source = Constraint(columns={"A", "B"}, table_name="T", constraint_type=DBConstraintTypeEnum.UNIQUE)
+    target = Constraint(columns={"B", "C"}, table_name="T", constraint_type=DBConstraintTypeEnum.PRIMARY_KEY)
+
+    assert diff_object(source, target) == ObjectDiff(
+        changes=[FieldChange("constraint_type", DBConstraintTypeEnum.UNIQUE, DBConstraintTypeEnum.PRIMARY_KEY)],
+        added_columns=["C"],
+        removed_columns=["A"],
+    )
+    # Same columns, in any order
+    assert (
+        diff_object(Index(columns={"A", "B"}, table_name="T", uniqueness="UNIQUE"), Index(columns={"B", "A"}, table_name="T", uniqueness="UNIQUE"))
+        == ObjectDiff()
+    )
+
+
+def test_diff_structures_covers_the_object_types_of_either_structure() -> None:
+    source = {"tables": {"HR.EMPLOYEES": _employees()}, "sequences": {"HR.S": Sequence(definition="1")}}
+    target = {"tables": {"HR.EMPLOYEES": _employees()}, "functions": {"HR.F": Function(body="x", definition="()")}}
+
+    structure_diff = diff_structures(source, target)
+
+    assert list(structure_diff.object_types) == ["tables", "sequences", "functions"]
+    assert not structure_diff.object_types["tables"].has_drift
+    assert structure_diff.object_types["tables"].unchanged == 1
+    assert list(structure_diff.object_types["sequences"].removed) == ["HR.S"]
+    assert list(structure_diff.object_types["functions"].added) == ["HR.F"]
+    assert structure_diff.has_drift
+    assert not diff_structures(source, source).has_drift
+
+
+def test_drift_report_lists_only_the_differences(tmp_path: Path) -> None:
+    source = {"tables": {"HR.EMPLOYEES": _employees(), "HR.<OLD>": Table(doc=None, columns={})}}
+    target = {"tables": {"HR.EMPLOYEES": _employees(HIRED=Column(doc=None, data_type="DATE", is_nullable=True))}}
+    report_path = tmp_path / "report.html"
+
+    generate_drift_report(source, target, str(report_path))
+
+    report = report_path.read_text()
+    assert "<p>0 added, 1 removed, 1 modified, 0 unchanged</p>" in report
+    assert "<li>HR.&lt;OLD&gt;</li>" in report
+    assert "<li>Column added: HIRED</li>" in report
+    # Unchanged columns are not written
+    assert "VARCHAR2(100)" not in report
+
+
+def test_drift_report_says_when_nothing_changed(tmp_path: Path) -> None:
+    structure = {"tables": {"HR.EMPLOYEES": _employees()}}
+    report_path = tmp_path / "report.html"
+
+    generate_drift_report(structure, structure, str(report_path))
+
+    assert "No drift detected." in report_path.read_text()
+
+
+def test_drift_report_is_utf8_html_with_every_name_escaped(tmp_path: Path) -> None:
+    source = {"tables<x>": {"HR.ÉMPLOYÉS": Table(doc=None, columns={})}}
+    report_path = tmp_path / "report.html"
+
+    generate_drift_report(source, {"tables<x>": {}}, str(report_path), skipped_object_types=["a&b"])
+
+    report = report_path.read_text(encoding="utf-8")
+    assert report.startswith('<!DOCTYPE html>\n<html><head><meta charset="utf-8">')
+    assert "Compared object types: tables&lt;x&gt;</p>" in report
+    assert "Not compared: a&amp;b</p>" in report
+    assert "<li>HR.ÉMPLOYÉS</li>" in report
+    assert report.count("<section>") == report.count("</section>") == 1
+
+
+def test_iter_drift_yields_the_drifted_objects_of_diff_structures() -> None:
+    source = {"sequences": {"HR.A": Sequence(definition="1"), "HR.B": Sequence(definition="2"), "HR.C": Sequence(definition="3")}}
+    target = {"sequences": {"HR.D": Sequence(definition="4"), "HR.C": Sequence(definition="30"), "HR.A": Sequence(definition="1")}}
+
+    assert list(iter_drift(source, target)) == [
+        ObjectDrift("sequences", "HR.B", "removed"),
+        ObjectDrift("sequences", "HR.C", "modified", ObjectDiff(changes=[FieldChange("definition", "3", "30")])),
+        ObjectDrift("sequences", "HR.D", "added"),
+    ]
+    assert list(iter_drift(source, source)) == []
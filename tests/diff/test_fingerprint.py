@@ -0,0 +1,131 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from db_drift.db.connectors.snapshot import SnapshotConnector
+from db_drift.db.filters import ObjectFilter
+from db_drift.diff import compare, diff_structures, fingerprint_object, fingerprint_structure, object_schema
+from db_drift.models import Column, Constraint, Function, Sequence, Table
+from db_drift.snapshot import Snapshot, read_snapshot, write_snapshot
+from db_drift.snapshot.serialization import fingerprint_from_dict, fingerprint_to_dict
+from db_drift.utils.constants import DBConstraintTypeEnum
+
+
+def _structure(**sequences: Sequence) -> dict:
+    return {
+        "tables": {
+            "HR.EMPLOYEES": Table(doc=None, columns={"ID": Column(doc=None, data_type="NUMBER", is_nullable=False)}),
+            "SALES.ORDERS": Table(doc=None, columns={"ID": Column(doc=None, data_type="NUMBER", is_nullable=False)}),
+        },
+        "constraints": {
+            "HR.EMP_UK": Constraint(columns={"A", "B"}, table_name="EMPLOYEES", constraint_type=DBConstraintTypeEnum.UNIQUE),
+        },
+        "sequences": {"HR.S": Sequence(definition="1"), "SALES.S": Sequence(definition="1"), **sequences},
+        "functions": {"HR.F(integer)": Function(body="x", definition="(a integer)")},
+    }
+
+
+def test_object_digests_follow_equality() -> None:
+    columns = {"A": Column(doc=None, data_type="NUMBER", is_nullable=True), "B": Column(doc=None, data_type="DATE", is_nullable=True)}
+    # Column order and set order do not matter, like for ==
+    assert fingerprint_object(Table(doc=None, columns=columns)) == fingerprint_object(Table(doc=None, columns=dict(reversed(columns.items()))))
+    assert fingerprint_object(Constraint(columns={"A", "B"}, table_name="T", constraint_type=DBConstraintTypeEnum.UNIQUE)) == fingerprint_object(
+        Constraint(columns={"B", "A"}, table_name="T", constraint_type=DBConstraintTypeEnum.UNIQUE),
+    )
+    # Any column detail, the enum members and the model class do
+    assert fingerprint_object(Table(doc=None, columns=columns)) != fingerprint_object(
+        Table(doc=None, columns={**columns, "B": Column(doc=None, data_type="DATE", is_nullable=False)}),
+    )
+    assert fingerprint_object(Constraint(columns=set(), table_name="T", constraint_type=DBConstraintTypeEnum.CHECK)) != fingerprint_object(
+        Constraint(columns=set(), table_name="T", constraint_type="CHECK"),
+    )
+    assert fingerprint_object(Sequence(definition="1")) != fingerprint_object(Function(body=None, definition="1"))
+
+
+def test_object_schema_is_read_from_the_key() -> None:
+    assert object_schema("EMPLOYEES") == ""
+    assert object_schema("HR.EMPLOYEES") == "HR"
+    assert object_schema("HR.EMPLOYEES.EMP_AI") == "HR"
+    assert object_schema("F(public.t)") == ""
+    assert object_schema("HR.F(public.t)") == "HR"
+
+
+def test_structure_fingerprint_has_a_digest_per_schema_and_object_type() -> None:
+    fingerprint = fingerprint_structure(_structure())
+
+    assert fingerprint == fingerprint_structure(_structure())
+    assert list(fingerprint.schemas) == ["HR", "SALES"]
+    assert fingerprint.schemas["HR"].object_types["sequences"].object_count == 1
+    assert "constraints" not in fingerprint.schemas["SALES"].object_types
+
+    changed = fingerprint_structure(_structure(**{"SALES.S": Sequence(definition="2")}))
+    assert changed.digest != fingerprint.digest
+    assert changed.schemas["HR"] == fingerprint.schemas["HR"]
+    assert changed.schemas["SALES"].object_types["tables"] == fingerprint.schemas["SALES"].object_types["tables"]
+    assert changed.schemas["SALES"].object_types["sequences"] != fingerprint.schemas["SALES"].object_types["sequences"]
+
+
+def test_restricted_fingerprint_matches_the_fingerprint_of_the_restricted_structure() -> None:
+    structure = _structure()
+
+    restricted = fingerprint_structure(structure).restricted_to(["tables", "sequences"])
+
+    assert restricted == fingerprint_structure({"tables": structure["tables"], "sequences": structure["sequences"], "views": {}})
+
+
+def test_equal_root_digests_skip_every_object() -> None:
+    source, target = _structure(), _structure()
+
+    with patch.object(compare, "diff_objects", wraps=compare.diff_objects) as diff_objects:
+        structure_diff = diff_structures(source, target, fingerprint_structure(source), fingerprint_structure(target))
+
+    diff_objects.assert_not_called()
+    assert not structure_diff.has_drift
+    assert {obj_type: object_type_diff.unchanged for obj_type, object_type_diff in structure_diff.object_types.items()} == {
+        "tables": 2,
+        "constraints": 1,
+        "sequences": 2,
+        "functions": 1,
+    }
+
+
+def test_only_the_differing_schemas_and_object_types_are_compared() -> None:
+    source = _structure()
+    target = _structure(**{"SALES.S": Sequence(definition="2"), "SALES.T": Sequence(definition="1")})
+
+    with patch.object(compare, "diff_objects", wraps=compare.diff_objects) as diff_objects:
+        structure_diff = diff_structures(source, target, fingerprint_structure(source), fingerprint_structure(target))
+
+    # Only the sequences of SALES were compared
+    diff_objects.assert_called_once_with(
+        {"SALES.S": Sequence(definition="1")},
+        {"SALES.S": Sequence(definition="2"), "SALES.T": Sequence(definition="1")},
+    )
+    assert structure_diff == diff_structures(source, target)
+    assert structure_diff.object_types["sequences"].unchanged == 1
+
+
+def test_snapshot_files_keep_the_fingerprint(tmp_path: Path) -> None:
+    structure = _structure()
+    fingerprint = fingerprint_structure(structure)
+
+    write_snapshot(tmp_path / "snapshot.json.gz", Snapshot(structure=structure))
+
+    assert fingerprint_from_dict(json.loads(json.dumps(fingerprint_to_dict(fingerprint)))) == fingerprint
+    snapshot = read_snapshot(tmp_path / "snapshot.json.gz")
+    assert snapshot.fingerprint == fingerprint
+    # The digests still match the objects read back
+    assert fingerprint_structure(snapshot.structure) == fingerprint
+
+
+def test_snapshot_connector_only_has_a_fingerprint_without_an_object_filter(tmp_path: Path) -> None:
+    write_snapshot(tmp_path / "snapshot.json.gz", Snapshot(structure=_structure()))
+
+    connector = SnapshotConnector(str(tmp_path / "snapshot.json.gz"))
+    connector.select_object_types(skip_object_types=["functions"])
+    schema_structure = connector.fetch_schema_structure()
+    assert connector.schema_fingerprint == fingerprint_structure(schema_structure)
+
+    connector = SnapshotConnector(str(tmp_path / "snapshot.json.gz"), object_filter=ObjectFilter(include_schemas=("HR",)))
+    connector.fetch_schema_structure()
+    assert connector.schema_fingerprint is None
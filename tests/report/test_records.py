@@ -0,0 +1,144 @@
+import io
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from db_drift.diff import ObjectDrift, fingerprint_structure, iter_drift
+from db_drift.models import Column, Constraint, Table
+from db_drift.report import records
+from db_drift.report.records import write_drift_records
+from db_drift.utils.constants import DBConstraintTypeEnum, ReportFormat
+
+SOURCE = {
+    "tables": {
+        "HR.EMPLOYEES": Table(doc="Staff", columns={"ID": Column(doc=None, data_type="NUMBER", is_nullable=False)}),
+        "HR.OLD": Table(doc=None, columns={}),
+    },
+    "constraints": {"HR.EMP_UK": Constraint(columns={"ID"}, table_name="EMPLOYEES", constraint_type=DBConstraintTypeEnum.UNIQUE)},
+}
+TARGET = {
+    "tables": {
+        "HR.EMPLOYEES": Table(
+            doc="Staff",
+            columns={"ID": Column(doc=None, data_type="NUMBER(10)", is_nullable=False), "NAME": Column(doc=None, data_type="TEXT", is_nullable=True)},
+        ),
+    },
+    "constraints": {"HR.EMP_UK": Constraint(columns={"ID", "NAME"}, table_name="EMPLOYEES", constraint_type=DBConstraintTypeEnum.PRIMARY_KEY)},
+}
+RECORDS = [
+    {
+        "object_type": "tables",
+        "key": "HR.EMPLOYEES",
+        "change": "modified",
+        "changes": [],
+        "added_columns": ["NAME"],
+        "removed_columns": [],
+        "modified_columns": {"ID": [{"field": "data_type", "source": "NUMBER", "target": "NUMBER(10)"}]},
+    },
+    {"object_type": "tables", "key": "HR.OLD", "change": "removed"},
+    {
+        "object_type": "constraints",
+        "key": "HR.EMP_UK",
+        "change": "modified",
+        "changes": [{"field": "constraint_type", "source": "UNIQUE", "target": "PRIMARY KEY"}],
+        "added_columns": ["NAME"],
+        "removed_columns": [],
+        "modified_columns": {},
+    },
+]
+NDJSON_METADATA = {
+    "record_type": "metadata",
+    "compared_object_types": ["tables", "constraints"],
+    "skipped_object_types": [],
+    "fingerprints": {"source": None, "target": None},
+}
+
+
+def test_ndjson_writes_a_record_per_line(tmp_path: Path) -> None:
+    output_path = tmp_path / "drift.ndjson"
+
+    write_drift_records(SOURCE, TARGET, str(output_path), ReportFormat.NDJSON)
+
+    assert [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()] == [NDJSON_METADATA, *RECORDS]
+
+
+def test_ndjson_tells_no_drift_from_nothing_compared(tmp_path: Path) -> None:
+    output_path = tmp_path / "drift.ndjson"
+    fingerprint = fingerprint_structure(SOURCE)
+
+    write_drift_records({}, {}, str(output_path), ReportFormat.NDJSON, skipped_object_types=["tables"])
+    (nothing_compared,) = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    write_drift_records(SOURCE, SOURCE, str(output_path), ReportFormat.NDJSON, fingerprints=(fingerprint, fingerprint))
+    (no_drift,) = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+
+    assert nothing_compared == {
+        "record_type": "metadata",
+        "compared_object_types": [],
+        "skipped_object_types": ["tables"],
+        "fingerprints": {"source": None, "target": None},
+    }
+    assert no_drift == {
+        **NDJSON_METADATA,
+        "fingerprints": {"source": fingerprint.digest, "target": fingerprint.digest},
+    }
+
+
+def test_json_writes_a_document_with_the_compared_object_types(tmp_path: Path) -> None:
+    output_path = tmp_path / "drift.json"
+
+    write_drift_records(SOURCE, TARGET, str(output_path), ReportFormat.JSON, skipped_object_types=["views"])
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {
+        "compared_object_types": ["tables", "constraints"],
+        "skipped_object_types": ["views"],
+        "fingerprints": {"source": None, "target": None},
+        "drift": RECORDS,
+    }
+    write_drift_records(SOURCE, SOURCE, str(output_path), ReportFormat.JSON)
+    assert json.loads(output_path.read_text(encoding="utf-8"))["drift"] == []
+
+
+@pytest.mark.parametrize("report_format", [ReportFormat.JSON, ReportFormat.NDJSON])
+def test_records_are_flushed_to_standard_output_as_they_are_produced(report_format: ReportFormat, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Like a pipe, only what has been flushed out of the text buffer can be read on the other side
+    pipe = io.BytesIO()
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(pipe, encoding="utf-8"))
+    written_before_next_record: list[str] = []
+
+    def drift(*args: object) -> Iterator[ObjectDrift]:
+        for object_drift in iter_drift(*args):
+            written_before_next_record.append(pipe.getvalue().decode())
+            yield object_drift
+
+    with patch.object(records, "iter_drift", drift):
+        write_drift_records(SOURCE, TARGET, "-", report_format)
+
+    # Every record is out before the next object is compared
+    assert [text.count('"key":') for text in written_before_next_record] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("report_format", [ReportFormat.JSON, ReportFormat.NDJSON])
+def test_records_are_not_flushed_to_a_file_one_at_a_time(report_format: ReportFormat, tmp_path: Path) -> None:
+    output_path = tmp_path / "drift.out"
+    written_before_next_record: list[str] = []
+
+    def drift(*args: object) -> Iterator[ObjectDrift]:
+        for object_drift in iter_drift(*args):
+            written_before_next_record.append(output_path.read_text(encoding="utf-8"))
+            yield object_drift
+
+    with patch.object(records, "iter_drift", drift):
+        write_drift_records(SOURCE, TARGET, str(output_path), report_format)
+
+    # The few small records stay in the file buffer until the file is closed
+    assert written_before_next_record == ["", "", ""]
+    assert output_path.read_text(encoding="utf-8").count('"key":') == len(RECORDS)
+
+
+def test_dash_writes_to_standard_output(capsys: pytest.CaptureFixture[str]) -> None:
+    write_drift_records(SOURCE, TARGET, "-", ReportFormat.NDJSON)
+
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == [NDJSON_METADATA, *RECORDS]
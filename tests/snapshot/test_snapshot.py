@@ -0,0 +1,83 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from db_drift.models import Column, Constraint, Sequence, Table
+from db_drift.snapshot import SNAPSHOT_FORMAT_VERSION, Snapshot, read_snapshot, structure_from_dict, structure_to_dict, write_snapshot
+from db_drift.utils.constants import DBConstraintTypeEnum, HashAlgorithm
+
+
+def _structure() -> dict:
+    return {
+        "tables": {
+            "HR.EMPLOYEES": Table(
+                doc="Employee table",
+                columns={"EMPLOYEE_ID": Column(doc="PK", data_type="NUMBER", is_nullable=False)},
+            ),
+        },
+        "constraints": {
+            "HR.EMP_PK": Constraint(columns={"EMPLOYEE_ID"}, table_name="EMPLOYEES", constraint_type=DBConstraintTypeEnum.PRIMARY_KEY),
+            "HR.EMP_CUSTOM": Constraint(columns={"B", "A"}, table_name="EMPLOYEES", constraint_type="CUSTOM", condition="A > B"),
+        },
+        "sequences": {},
+    }
+
+
+def test_structure_round_trips_through_its_dict() -> None:
+    structure = _structure()
+
+    data = structure_to_dict(structure)
+
+    assert structure_from_dict(json.loads(json.dumps(data))) == structure
+    assert data["tables"]["model"] == "Table"
+    assert data["constraints"]["objects"]["HR.EMP_CUSTOM"]["columns"] == ["A", "B"]
+
+
+def test_structure_to_dict_rejects_object_types_mixing_models() -> None:
+    structure = {"tables": {"HR.A": Table(doc=None, columns={}), "HR.S": Sequence(definition="START WITH 1")}}
+
+    with pytest.raises(TypeError, match="mix several model classes"):
+        structure_to_dict(structure)
+
+
+def test_structure_from_dict_rejects_unknown_models() -> None:
+    with pytest.raises(ValueError, match="Unknown model class 'Sandwich'"):
+        structure_from_dict({"tables": {"model": "Sandwich", "objects": {}}})
+
+
+def test_snapshot_round_trips_through_a_file(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "snapshot.json.gz"
+    snapshot = Snapshot(structure=_structure(), metadata={"fetched_at": "2026-01-01T00:00:00+00:00"})
+
+    write_snapshot(path, snapshot)
+
+    assert read_snapshot(path) == snapshot
+    assert [file.name for file in path.parent.iterdir()] == ["snapshot.json.gz"]
+
+
+def test_read_snapshot_rejects_other_format_versions(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.json.gz"
+    write_snapshot(path, Snapshot(structure={}))
+    with gzip.open(path, "rt", encoding="utf-8") as snapshot_file:
+        content = json.load(snapshot_file)
+    with gzip.open(path, "wt", encoding="utf-8") as snapshot_file:
+        json.dump({**content, "version": SNAPSHOT_FORMAT_VERSION + 1}, snapshot_file)
+
+    with pytest.raises(ValueError, match="only version"):
+        read_snapshot(path)
+
+
+def test_snapshot_records_the_hash_algorithm_of_its_digests(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.json.gz"
+    write_snapshot(path, Snapshot(structure={}, hash_algorithm=HashAlgorithm.BLAKE2B))
+
+    assert read_snapshot(path).hash_algorithm is HashAlgorithm.BLAKE2B
+
+    # Files written before the algorithm was recorded were all hashed with SHA-256
+    with gzip.open(path, "rt", encoding="utf-8") as snapshot_file:
+        content = json.load(snapshot_file)
+    with gzip.open(path, "wt", encoding="utf-8") as snapshot_file:
+        json.dump({name: value for name, value in content.items() if name != "hash_algorithm"}, snapshot_file)
+
+    assert read_snapshot(path).hash_algorithm is HashAlgorithm.SHA256
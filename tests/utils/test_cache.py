@@ -0,0 +1,31 @@
+from datetime import timedelta
+from pathlib import Path
+
+from db_drift.utils.cache import load_cached_value, store_cached_value
+
+
+def test_cached_values_round_trip_and_keep_other_keys(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache" / "db-drift.json"
+
+    store_cached_value(cache_file, "source", ["SYS"])
+    store_cached_value(cache_file, "target", ["SYS", "SYSTEM"])
+
+    assert load_cached_value(cache_file, "source", timedelta(hours=1)) == ["SYS"]
+    assert load_cached_value(cache_file, "target", timedelta(hours=1)) == ["SYS", "SYSTEM"]
+    assert load_cached_value(cache_file, "missing", timedelta(hours=1)) is None
+
+
+def test_expired_cached_values_are_ignored(tmp_path: Path) -> None:
+    cache_file = tmp_path / "db-drift.json"
+    store_cached_value(cache_file, "source", ["SYS"])
+
+    assert load_cached_value(cache_file, "source", timedelta(seconds=-1)) is None
+
+
+def test_unreadable_cache_files_are_ignored(tmp_path: Path) -> None:
+    cache_file = tmp_path / "db-drift.json"
+    cache_file.write_text("not json")
+
+    assert load_cached_value(cache_file, "source", timedelta(hours=1)) is None
+    store_cached_value(cache_file, "source", ["SYS"])
+    assert load_cached_value(cache_file, "source", timedelta(hours=1)) == ["SYS"]
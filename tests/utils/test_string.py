@@ -0,0 +1,94 @@
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+from db_drift.utils import string
+from db_drift.utils.constants import HashAlgorithm
+from db_drift.utils.string import HASH_WORKERS, PENDING_BODIES_PER_WORKER, hash_bodies, hash_body, hash_chunks
+
+LARGE_BODY_LENGTH = 1_000
+
+
+@pytest.fixture
+def large_bodies_in_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(string, "PARALLEL_HASH_MIN_LENGTH", LARGE_BODY_LENGTH)
+
+
+def test_hash_body_hashes_the_utf8_body_with_the_chosen_algorithm() -> None:
+    assert hash_body("") == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    assert hash_body("é") == hash_body("é", HashAlgorithm.SHA256) != hash_body("é", HashAlgorithm.BLAKE2B)
+    # As long as a SHA-256 digest
+    assert len(hash_body("é", HashAlgorithm.BLAKE2B)) == len(hash_body("é"))
+
+
+@pytest.mark.usefixtures("large_bodies_in_threads")
+@pytest.mark.parametrize("algorithm", list(HashAlgorithm))
+def test_hash_bodies_matches_hash_body_in_the_order_of_the_bodies(algorithm: HashAlgorithm) -> None:
+    bodies = [("small", "BEGIN NULL; END;"), ("missing", None), ("large", "x" * LARGE_BODY_LENGTH), ("empty", "")]
+
+    digests = hash_bodies(bodies, algorithm)
+
+    assert digests == {key: None if body is None else hash_body(body, algorithm) for key, body in bodies}
+    assert list(digests) == ["small", "missing", "large", "empty"]
+
+
+@pytest.mark.parametrize("algorithm", list(HashAlgorithm))
+def test_hash_chunks_matches_hash_body_of_the_joined_chunks(algorithm: HashAlgorithm) -> None:
+    chunks = ["CREATE OR REPLACE ", "PACKAGE BODY é", "", " AS END;"]
+
+    assert hash_chunks(chunks, algorithm) == hash_body("".join(chunks), algorithm)
+    assert hash_chunks([], algorithm) == hash_body("", algorithm)
+
+
+def test_hash_bodies_reads_chunked_bodies_before_the_next_body() -> None:
+    read: list[str] = []
+
+    def chunks(name: str) -> Iterator[str]:
+        for i in range(3):
+            read.append(f"{name}{i}")
+            yield f"{name}{i}"
+
+    def read_bodies() -> Iterator[tuple[str, str | Iterator[str]]]:
+        yield "first", chunks("a")
+        read.append("second")
+        yield "second", "b"
+
+    assert hash_bodies(read_bodies()) == {"first": hash_body("a0a1a2"), "second": hash_body("b")}
+    assert read == ["a0", "a1", "a2", "second"]
+
+
+@pytest.mark.usefixtures("large_bodies_in_threads")
+def test_hash_bodies_only_hands_the_large_bodies_over_to_worker_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    hashing_threads: dict[str, str] = {}
+
+    def record_thread(body: str, algorithm: HashAlgorithm) -> str:
+        hashing_threads[body[0]] = threading.current_thread().name
+        return hash_body(body, algorithm)
+
+    monkeypatch.setattr(string, "hash_body", record_thread)
+    hash_bodies([("small", "s"), ("large", "l" * LARGE_BODY_LENGTH)])
+
+    assert hashing_threads["s"] == threading.current_thread().name
+    assert hashing_threads["l"].startswith("db-drift-hash")
+
+
+@pytest.mark.usefixtures("large_bodies_in_threads")
+def test_hash_bodies_bounds_the_bodies_waiting_to_be_hashed(monkeypatch: pytest.MonkeyPatch) -> None:
+    hashed: list[str] = []
+    waiting_when_read: list[int] = []
+
+    def slow_hash(body: str, algorithm: HashAlgorithm) -> str:
+        time.sleep(0.005)  # Much slower than reading the next body
+        hashed.append(body)
+        return hash_body(body, algorithm)
+
+    def read_bodies() -> Iterator[tuple[int, str]]:
+        for i in range(20):
+            waiting_when_read.append(i - len(hashed))
+            yield i, "x" * LARGE_BODY_LENGTH
+
+    monkeypatch.setattr(string, "hash_body", slow_hash)
+
+    assert len(hash_bodies(read_bodies())) == 20  # noqa: PLR2004
+    assert max(waiting_when_read) == HASH_WORKERS * PENDING_BODIES_PER_WORKER